@@ -1,10 +1,55 @@
 # LibAlexandria
 from .libAlexItem import LibAlexItem
+from .libAlexLazyItem import LibAlexLazyItem
 from .libAlexRelatedFile import LibAlexRelatedFile
 from .libAlexSemanticVersion import SemanticVersion
+from .libAlexScanner import LibAlexScanner
+from .libAlexProcessLoader import LibAlexProcessLoader
+from .libAlexScanReport import LibAlexScanError, LibAlexScanReport
+from .libAlexCheckpoint import LibAlexScanCheckpoint
+from .libAlexCatalogCache import LibAlexCatalogCache
+from .libAlexFlagIndex import LibAlexFlagIndex
+from .libAlexPathValidator import LibAlexPathValidator
+from .libAlexColumns import LibAlexColumns
+from .libAlexPathTrie import LibAlexFlagTrie
+from .libAlexTextIndex import LibAlexTextIndex
+from .libAlexVersionIndex import LibAlexVersionIndex
+from .libAlexDateIndex import LibAlexDateIndex
+from .libAlexQuery import LibAlexQuery, LibAlexQueryTerm, LibAlexQueryPlanner, LibAlexQueryResult
+from .libAlexMigrate import LibAlexMigrator, LibAlexMigrationReport
+from .libAlexLibrary import LibAlexLibrary, LibAlexLibraryEvent
+from .libAlexContentHash import LibAlexContentHasher, LibAlexDuplicateGroup
+from .libAlexSqliteStore import LibAlexSqliteStore
+from .libAlexSnapshot import LibAlexSnapshot
 
 __all__ = [
     "LibAlexItem",
+    "LibAlexLazyItem",
     "LibAlexRelatedFile",
-    "SemanticVersion"
+    "SemanticVersion",
+    "LibAlexScanner",
+    "LibAlexProcessLoader",
+    "LibAlexScanError",
+    "LibAlexScanReport",
+    "LibAlexScanCheckpoint",
+    "LibAlexCatalogCache",
+    "LibAlexFlagIndex",
+    "LibAlexPathValidator",
+    "LibAlexColumns",
+    "LibAlexFlagTrie",
+    "LibAlexTextIndex",
+    "LibAlexVersionIndex",
+    "LibAlexDateIndex",
+    "LibAlexQuery",
+    "LibAlexQueryTerm",
+    "LibAlexQueryPlanner",
+    "LibAlexQueryResult",
+    "LibAlexMigrator",
+    "LibAlexMigrationReport",
+    "LibAlexLibrary",
+    "LibAlexLibraryEvent",
+    "LibAlexContentHasher",
+    "LibAlexDuplicateGroup",
+    "LibAlexSqliteStore",
+    "LibAlexSnapshot"
 ]
@@ -0,0 +1,208 @@
+# LibAlexandria: Benchmark Suite
+# Measures the throughput and latency of the hot paths of the bindings on a synthetic library.
+
+# Imports
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import warnings
+from typing import Callable, Iterable, Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import libAlexDefaults as laShared
+import libAlexInstrumentation as laInst
+from libAlexItem import LibAlexItem
+from libAlexLazyItem import LibAlexLazyItem
+from libAlexScanner import LibAlexScanner
+from libAlexProcessLoader import LibAlexProcessLoader
+from libAlexPathTrie import LibAlexFlagTrie
+from libAlexSemanticVersion import SemanticVersion
+from libAlexSnapshot import LibAlexSnapshot
+from libAlexSynthetic import generateLibrary
+
+# Functions
+def percentile(samples: list[int], fraction: float) -> int:
+    """
+    Returns the provided percentile of sorted samples using the nearest rank.
+
+    samples: The sorted samples.
+    fraction: The percentile as a fraction between `0` and `1`.
+    """
+    return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+def timeCalls(func: Callable, inputs: Iterable[Any]) -> dict[str, float]:
+    """
+    Calls the provided function once per input and summarizes the timings.
+
+    func: The function to time.
+    inputs: The argument of each call.
+
+    Returns a dictionary of the call count, throughput, and latency percentiles in microseconds.
+    """
+    # Time each call
+    samples = []
+    clock = time.perf_counter_ns
+    for value in inputs:
+        start = clock()
+        func(value)
+        samples.append(clock() - start)
+
+    # Summarize
+    samples.sort()
+    total = sum(samples)
+    return {
+        "calls": len(samples),
+        "opsPerSec": (len(samples) / (total / 1e9) if total else 0.0),
+        "p50us": percentile(samples, 0.50) / 1e3,
+        "p90us": percentile(samples, 0.90) / 1e3,
+        "p99us": percentile(samples, 0.99) / 1e3
+    }
+
+def timeScan(rootPath: str, workers: int) -> dict[str, float]:
+    """
+    Times a full scan of the library.
+
+    rootPath: The library root.
+    workers: The number of scanner threads.
+
+    Returns a dictionary of the item count and throughput.
+    """
+    start = time.perf_counter()
+    count = sum(1 for _ in LibAlexScanner(rootPath, workers=workers))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "calls": count,
+        "opsPerSec": count / elapsed
+    }
+
+def timeProcessLoad(rootPath: str, processes: int) -> dict[str, float]:
+    """
+    Times a full load of the library with worker processes.
+
+    rootPath: The library root.
+    processes: The number of worker processes.
+
+    Returns a dictionary of the item count and throughput.
+    """
+    start = time.perf_counter()
+    count = sum(1 for _ in LibAlexProcessLoader(rootPath, processes=processes))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "calls": count,
+        "opsPerSec": count / elapsed
+    }
+
+def runSuite(rootPath: str, metaPaths: list[str], workers: int, processes: int) -> dict[str, dict[str, float]]:
+    """
+    Runs every benchmark against a generated library.
+
+    rootPath: The library root.
+    metaPaths: The meta filepaths of the library.
+    workers: The number of scanner threads.
+    processes: The number of loader processes.
+
+    Returns a dictionary of benchmark names to results.
+    """
+    results = {}
+
+    # Loading
+    items = []
+    results["fromMetaFile"] = timeCalls(lambda p: items.append(LibAlexItem.fromMetaFile(p)), metaPaths)
+    results["LibAlexLazyItem.fromMetaFile"] = timeCalls(LibAlexLazyItem.fromMetaFile, metaPaths)
+    results["scan"] = timeScan(rootPath, workers)
+    results["LibAlexProcessLoader"] = timeProcessLoad(rootPath, processes)
+
+    # Snapshots
+    with tempfile.TemporaryDirectory() as snapshotDir:
+        snapshotPath = os.path.join(snapshotDir, "library.snapshot")
+        LibAlexSnapshot.write(items, snapshotPath)
+        results["LibAlexSnapshot"] = timeCalls(lambda p: LibAlexSnapshot(p).close(), [snapshotPath] * 100)
+        with LibAlexSnapshot(snapshotPath) as snapshot:
+            results["LibAlexSnapshot.item"] = timeCalls(snapshot.item, range(len(snapshot)))
+
+    # Item functions
+    results["getAllFlags"] = timeCalls(LibAlexItem.getAllFlags, items)
+    results["toJson"] = timeCalls(LibAlexItem.toJson, items)
+
+    # Shared functions
+    components = [c for item in items for c in item.directory.split(os.sep)[1:]]
+    results["slugify"] = timeCalls(laShared.slugify, components)
+    results["LibAlexFlagTrie.resolveFlags"] = timeCalls(LibAlexFlagTrie().resolveFlags, [item.directory for item in items])
+
+    versions = [item.version.string for item in items]
+    results["SemanticVersion"] = timeCalls(SemanticVersion, versions)
+    results["SemanticVersion.fromString"] = timeCalls(SemanticVersion.fromString, versions)
+
+    return results
+
+def printResults(results: dict[str, dict[str, float]]):
+    """
+    Prints the results as a table.
+
+    results: The results of `runSuite(...)`.
+    """
+    print(f"{'Benchmark':<30}{'Calls':>10}{'Ops/s':>14}{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}")
+    for name, result in results.items():
+        latencies = "".join(f"{result[k]:>10.1f}" if k in result else f"{'-':>10}" for k in ("p50us", "p90us", "p99us"))
+        print(f"{name:<30}{result['calls']:>10,}{result['opsPerSec']:>14,.0f}{latencies}")
+
+def main():
+    """
+    Runs the benchmark suite from the command line.
+    """
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Measures the hot paths of the LibAlexandria bindings on a synthetic library.")
+    parser.add_argument("--items", type=int, default=10_000, help="The number of items in the synthetic library.")
+    parser.add_argument("--depth", type=int, default=2, help="The number of shelf directory levels above each item.")
+    parser.add_argument("--fanout", type=int, default=10, help="The number of shelf directories per level.")
+    parser.add_argument("--v1-ratio", type=float, default=0.1, help="The fraction of items written as v1 meta files.")
+    parser.add_argument("--related", type=int, default=2, help="The number of related files per v2 item.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed of the synthetic library.")
+    parser.add_argument("--workers", type=int, default=laShared.DEF_SCAN_WORKERS, help="The number of scanner threads.")
+    parser.add_argument("--processes", type=int, default=laShared.DEF_LOAD_PROCESSES, help="The number of loader processes.")
+    parser.add_argument("--phases", action="store_true", help="Also break a scan down into the phases of item loading.")
+    parser.add_argument("--json", dest="jsonPath", default=None, help="A path to also write the results to as JSON.")
+    args = parser.parse_args()
+
+    # The v1 deprecation warning would flood the output
+    warnings.simplefilter("ignore")
+
+    with tempfile.TemporaryDirectory() as rootPath:
+        # Build the library
+        start = time.perf_counter()
+        metaPaths = generateLibrary(
+            rootPath,
+            itemCount=args.items,
+            depth=args.depth,
+            fanout=args.fanout,
+            v1Ratio=args.v1_ratio,
+            relatedFileCount=args.related,
+            seed=args.seed
+        )
+        print(f"Generated {len(metaPaths):,} items in {time.perf_counter() - start:.1f}s\n")
+
+        # Run the suite
+        results = runSuite(rootPath, metaPaths, args.workers, args.processes)
+
+        # Break a scan into phases
+        if args.phases:
+            with laInst.collect() as stats:
+                timeScan(rootPath, args.workers)
+
+    # Report
+    printResults(results)
+    if args.phases:
+        print(f"\n{stats.report()}")
+    if args.jsonPath is not None:
+        with open(args.jsonPath, "w") as resultsFile:
+            json.dump({"args": vars(args), "results": results}, resultsFile, indent=4)
+
+# Console Execution
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# LibAlexandria: JSON Backend Benchmark
+# Compares the installed JSON backends on a synthetic library of meta files.
+
+# Imports
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import libAlexJson as laJson
+from libAlexItem import LibAlexItem
+from libAlexSynthetic import buildMetaJson
+
+# Functions
+def buildMetaFiles(count: int, seed: int = 0) -> list[bytes]:
+    """
+    Builds the raw contents of a synthetic library of `v2.*` meta files.
+
+    count: The number of meta files to build.
+    seed: The seed of the synthetic library.
+
+    Returns a list of encoded meta files.
+    """
+    rng = random.Random(seed)
+    return [laJson.dumps(buildMetaJson(i, rng), indent=4).encode("utf-8") for i in range(count)]
+
+def timeBackend(backend: str, metaFiles: list[bytes]) -> tuple[float, float]:
+    """
+    Times decoding and item construction with the provided backend.
+
+    backend: The name of the backend.
+    metaFiles: The raw meta files.
+
+    Returns the seconds taken to decode, and to decode and build items.
+    """
+    laJson.setBackend(backend)
+
+    # Decode only
+    start = time.perf_counter()
+    for data in metaFiles:
+        laJson.loads(data)
+    decodeTime = time.perf_counter() - start
+
+    # Decode and build
+    start = time.perf_counter()
+    for data in metaFiles:
+        LibAlexItem.fromJson(laJson.loads(data), directory="/library/item", deferValidation=True)
+    buildTime = time.perf_counter() - start
+
+    return decodeTime, buildTime
+
+def main():
+    """
+    Runs the benchmark from the command line.
+    """
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Compares the installed JSON backends.")
+    parser.add_argument("--count", type=int, default=200_000, help="The number of meta files in the synthetic library.")
+    args = parser.parse_args()
+
+    # Measure each backend
+    metaFiles = buildMetaFiles(args.count)
+    print(f"Meta files: {args.count:,}")
+    for backend in laJson.availableBackends():
+        decodeTime, buildTime = timeBackend(backend, metaFiles)
+        print(f"{backend:>8}: decode {args.count / decodeTime:>12,.0f} files/s, decode and build {args.count / buildTime:>12,.0f} items/s")
+
+# Console Execution
+if __name__ == "__main__":
+    main()
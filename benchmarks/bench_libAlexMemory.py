@@ -0,0 +1,133 @@
+# LibAlexandria: Memory Benchmark
+# Measures the bytes used per LibAlexandria Item for a synthetic in-memory library.
+
+# Imports
+import os
+import sys
+import argparse
+import tracemalloc
+from typing import Callable
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from libAlexItem import LibAlexItem
+from libAlexRelatedFile import LibAlexRelatedFile
+from libAlexSemanticVersion import SemanticVersion
+
+# Classes
+class DictSemanticVersion:
+    """
+    A stand-in for `SemanticVersion` that stores its state in a per-instance `__dict__`.
+    """
+    def __init__(self, s: str):
+        major, minor, patch = s.split(".")
+        self.string = s
+        self.isValid = True
+        self.major = int(major)
+        self.minor = int(minor)
+        self.patch = int(patch)
+        self.preRelease = ""
+        self.metaData = ""
+
+class DictRelatedFile:
+    """
+    A stand-in for `LibAlexRelatedFile` that stores its state in a per-instance `__dict__`.
+    """
+    def __init__(self, label: str, path: str, description: str, id: str = None):
+        self.label = label
+        self.path = path
+        self.description = description
+        self.id = id
+
+class DictItem:
+    """
+    A stand-in for `LibAlexItem` that stores its state in a per-instance `__dict__`.
+    """
+    def __init__(self, **kwargs):
+        self.version = kwargs["version"]
+        self.title = kwargs["title"]
+        self.author = kwargs["author"]
+        self.date = kwargs["date"]
+        self.description = kwargs["description"]
+        self.directory = kwargs["directory"]
+        self.sourceFile = kwargs["sourceFile"]
+        self.relatedFiles = kwargs["relatedFiles"]
+        self.metaFilepath = kwargs["metaFilepath"]
+        self.classification = kwargs["classification"]
+        self.flags = kwargs["flags"]
+        self.resolvedFlags = kwargs["resolvedFlags"]
+
+# Functions
+def buildLibrary(count: int, relatedCount: int, itemCls: type, relatedCls: Callable, versionCls: Callable) -> list:
+    """
+    Builds a synthetic in-memory library.
+
+    count: The number of items to build.
+    relatedCount: The number of related files per item.
+    itemCls: The item class to build.
+    relatedCls: A callable building a related file.
+    versionCls: A callable building a version.
+
+    Returns a list of items.
+    """
+    items = []
+    for i in range(count):
+        directory = f"/library/shelf{i % 100}/item{i}"
+        items.append(itemCls(
+            version=versionCls("2.0.0"),
+            title=f"Title {i}",
+            author=f"Author {i % 1000}",
+            date="1984-04-01",
+            description=f"Description of item {i}.",
+            directory=directory,
+            sourceFile=f"{directory}/source.txt",
+            relatedFiles=[relatedCls(f"Related {r}", f"{directory}/related{r}.txt", "") for r in range(relatedCount)],
+            metaFilepath=f"{directory}/meta.json",
+            classification="PR",
+            flags=["text", "prose"],
+            resolvedFlags=["library", f"shelf{i % 100}", f"item{i}"]
+        ))
+
+    return items
+
+def measure(count: int, relatedCount: int, itemCls: type, relatedCls: Callable, versionCls: Callable) -> float:
+    """
+    Measures the traced memory used by a synthetic library.
+
+    Returns the number of bytes per item.
+    """
+    tracemalloc.start()
+    items = buildLibrary(count, relatedCount, itemCls, relatedCls, versionCls)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del items
+    return current / count
+
+def main():
+    """
+    Runs the benchmark from the command line.
+    """
+    # Parse the arguments
+    parser = argparse.ArgumentParser(description="Measures the bytes used per LibAlexandria Item.")
+    parser.add_argument("--count", type=int, default=1_000_000, help="The number of items in the synthetic library.")
+    parser.add_argument("--related", type=int, default=2, help="The number of related files per item.")
+    args = parser.parse_args()
+
+    # Measure each layout with a new version per item, then the slotted layout with shared versions
+    slottedRelated = lambda label, path, desc: LibAlexRelatedFile(label, path, desc, validate=False)
+    before = measure(args.count, args.related, DictItem, DictRelatedFile, DictSemanticVersion)
+    slotted = measure(args.count, args.related, LibAlexItem, slottedRelated, SemanticVersion)
+    interned = measure(args.count, args.related, LibAlexItem, slottedRelated, SemanticVersion.fromString)
+
+    # Report
+    print(f"Items: {args.count:,} with {args.related} related files each")
+    print(f"Before (__dict__): {before:,.0f} bytes per item")
+    print(f"After (__slots__): {slotted:,.0f} bytes per item")
+    print(f"After (__slots__, interned versions): {interned:,.0f} bytes per item")
+    print(f"Saved by __slots__: {before - slotted:,.0f} bytes per item ({(1 - (slotted / before)) * 100:.1f}%)")
+    print(f"Saved by interning versions: {slotted - interned:,.0f} bytes per item ({(1 - (interned / slotted)) * 100:.1f}%)")
+
+# Console Execution
+if __name__ == "__main__":
+    main()
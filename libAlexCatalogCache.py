@@ -0,0 +1,288 @@
+# LibAlexandria: LibAlexandria Catalog Cache
+# A persistent cache of parsed LibAlexandria Items keyed by the stat signatures of their files.
+
+# Imports
+import os
+import shutil
+import tempfile
+import threading
+from typing import Optional, Any, Iterable
+
+import libAlexDefaults as laShared
+import libAlexJson as laJson
+from libAlexItem import LibAlexItem
+
+# Variables
+_RECORD_FIELDS = 12
+
+# Classes
+class LibAlexCatalogCache:
+    """
+    A persistent cache of parsed LibAlexandria Items.
+
+    Each entry records the parsed fields of an item along with the `(device, inode, mtime_ns, size)` signature of its meta file, source file, and related files.
+    An entry is only reused while every one of those signatures is unchanged.
+    """
+    # Constructors
+    def __init__(self, cachePath: Optional[str] = None):
+        """
+        Creates a new catalog cache and loads any existing cache file.
+        A cache file that cannot be parsed is discarded, so the cache starts empty and is rebuilt by the next scan.
+
+        cachePath: The path to the cache file or `None` to keep the cache in memory only.
+        """
+        self.cachePath = (laShared.fullpath(cachePath) if cachePath is not None else None)
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: dict[str, tuple[list, tuple]] = {}
+        self._lock = threading.Lock()
+
+        # Load the existing cache
+        if (self.cachePath is not None) and os.path.isfile(self.cachePath):
+            try:
+                self.load()
+            except ValueError:
+                # A corrupt or truncated cache is only a slower scan
+                self._entries = {}
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, metaPath: str) -> bool:
+        return laShared.fullpath(metaPath) in self._entries
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(cachePath={self.cachePath!r}, entries={len(self._entries)})"
+
+    # Functions
+    def load(self):
+        """
+        Replaces the cache contents with those of the cache file.
+        If the cache file was written by an incompatible version, it is ignored.
+        If the cache file cannot be parsed or is not in the expected shape, a `ValueError` will be raised.
+        """
+        # Read the cache file
+        with open(self.cachePath, "rb") as cacheFile:
+            cacheData = cacheFile.read()
+
+        try:
+            cacheJson: dict[str, Any] = laJson.loads(cacheData)
+        except ValueError as e:
+            # Fail
+            raise ValueError(f"Could not parse JSON from the provided cache file: {self.cachePath}\n\nCause: {e}")
+
+        # Check the version
+        if not isinstance(cacheJson, dict):
+            # Fail
+            raise ValueError(f"The provided cache file is not a JSON object: {self.cachePath}")
+
+        if cacheJson.get("_cachever", None) != laShared.VER_CATALOG_CACHE:
+            return
+
+        # Restore the entries
+        entriesJson = cacheJson.get("entries", {})
+        if not isinstance(entriesJson, dict):
+            # Fail
+            raise ValueError(f"The entries of the provided cache file are not a JSON object: {self.cachePath}")
+
+        entries = {}
+        for metaPath, entry in entriesJson.items():
+            # Drop entries that are not in the expected shape, they are reloaded by the next scan
+            if (not isinstance(entry, list)) or (len(entry) != 2) or (not isinstance(entry[0], list)):
+                continue
+
+            try:
+                entries[metaPath] = (entry[0], self._thawRecord(entry[1]))
+            except (TypeError, ValueError):
+                continue
+
+        with self._lock:
+            self._entries = entries
+
+    def save(self):
+        """
+        Writes the cache to the cache file.
+        The file is replaced atomically so an interrupted save never leaves a partial cache behind.
+        """
+        # Check if there is anywhere to save
+        if self.cachePath is None:
+            raise ValueError("No cache path was provided to save the catalog cache to.")
+
+        # Snapshot the entries
+        with self._lock:
+            cacheJson = {
+                "_cachever": laShared.VER_CATALOG_CACHE,
+                "entries": dict(self._entries)
+            }
+
+        # Write next to the destination then swap it in
+        os.makedirs(os.path.dirname(self.cachePath), exist_ok=True)
+        tempFd, tempPath = tempfile.mkstemp(prefix=f".{os.path.basename(self.cachePath)}.", suffix=".tmp", dir=os.path.dirname(self.cachePath))
+        try:
+            with os.fdopen(tempFd, "w", encoding="utf-8") as cacheFile:
+                cacheFile.write(laJson.dumps(cacheJson))
+
+            # Keep the permissions of the file being replaced
+            try:
+                shutil.copymode(self.cachePath, tempPath)
+            except OSError:
+                os.chmod(tempPath, 0o644)
+
+            os.replace(tempPath, self.cachePath)
+        except BaseException:
+            # Clean up the partial file
+            try:
+                os.remove(tempPath)
+            except OSError:
+                pass
+
+            raise
+
+    def getItem(self, metaPath: str, validate: bool = True) -> Optional[LibAlexItem]:
+        """
+        Returns the cached item for the provided meta file or `None` if it is missing or any of its files have changed.
+
+        metaPath: The absolute path to the meta file.
+        validate: If `True`, entries recorded while one of their files was missing are not returned.
+        """
+        # Find the entry
+        entry = self._entries.get(metaPath, None)
+        if entry is None:
+            return None
+
+        # Entries written by a deferred validation load may point at missing files
+        signatures, record = entry
+        if validate and (None in signatures):
+            return None
+
+        # Compare the signatures
+        if signatures != self._signatures(metaPath, record):
+            return None
+
+        return LibAlexItem.fromRecord(record)
+
+    def putItem(self, item: LibAlexItem):
+        """
+        Records the provided item in the cache along with the current signatures of its files.
+
+        item: The item to record. It must have a `metaFilepath`.
+        """
+        record = item.toRecord()
+        with self._lock:
+            self._entries[item.metaFilepath] = (self._signatures(item.metaFilepath, record), record)
+
+    def loadItem(self, metaPath: str, **loadArgs) -> LibAlexItem:
+        """
+        Loads an item from the cache when it is unchanged or from its meta file otherwise.
+        If the operation fails, the errors of `LibAlexItem.fromMetaFile(...)` may be raised.
+
+        metaPath: The path to the meta file.
+        loadArgs: Additional keyword arguments passed to `LibAlexItem.fromMetaFile(...)` when the item must be loaded.
+
+        Returns a LibAlexandria Item.
+        """
+        # Try the cache
+        metaPath = laShared.fullpath(metaPath)
+        item = self.getItem(metaPath, validate=(not loadArgs.get("deferValidation", False)))
+        if item is not None:
+            with self._lock:
+                self.hits += 1
+
+            return item
+
+        # Load from disk
+        metaSignature = laShared.fileSignature(metaPath)
+        item = LibAlexItem.fromMetaFile(metaPath, **loadArgs)
+
+        # Only keep the item if the meta file did not change while it was read
+        record = item.toRecord()
+        signatures = self._signatures(item.metaFilepath, record)
+        with self._lock:
+            if (metaSignature is not None) and (signatures[0] == list(metaSignature)):
+                self._entries[item.metaFilepath] = (signatures, record)
+
+            self.misses += 1
+
+        return item
+
+    def prune(self, keepPaths: Iterable[str], rootPath: Optional[str] = None) -> int:
+        """
+        Removes entries whose meta files are not in the provided paths.
+
+        keepPaths: The absolute meta filepaths to keep.
+        rootPath: If provided, only entries below this directory are considered for removal.
+
+        Returns the number of entries removed.
+        """
+        # Prepare the filters
+        keepPaths = set(keepPaths)
+        rootPrefix = (os.path.join(laShared.fullpath(rootPath), "") if rootPath is not None else "")
+
+        # Remove the stale entries
+        with self._lock:
+            stalePaths = [p for p in self._entries if p.startswith(rootPrefix) and (p not in keepPaths)]
+            for metaPath in stalePaths:
+                del self._entries[metaPath]
+
+        return len(stalePaths)
+
+    def clear(self):
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    # Private Functions
+    @staticmethod
+    def _signatures(metaPath: str, record: tuple) -> list:
+        """
+        Collects the signatures of every file the provided record depends on.
+
+        metaPath: The absolute path to the meta file.
+        record: The item record as created by `LibAlexItem.toRecord()`.
+
+        Returns a list of signatures in a JSON compatible form.
+        """
+        # Collect the paths
+        paths = [metaPath]
+
+        sourceFile = record[6]
+        if isinstance(sourceFile, str):
+            paths.append(sourceFile)
+
+        relatedFiles = record[7]
+        if relatedFiles is not None:
+            paths.extend(rf[1] for rf in relatedFiles)
+
+        # Stat each file
+        signatures = []
+        for path in paths:
+            signature = laShared.fileSignature(path)
+            signatures.append(list(signature) if signature is not None else None)
+
+        return signatures
+
+    @staticmethod
+    def _thawRecord(record: list) -> tuple:
+        """
+        Converts a record read from JSON back into the tuple form created by `LibAlexItem.toRecord()`.
+        If the record does not have the expected fields, a `ValueError` will be raised.
+
+        record: The record as read from JSON.
+        """
+        if (not isinstance(record, list)) or (len(record) != _RECORD_FIELDS):
+            # Fail
+            raise ValueError(f"Expected a record of {_RECORD_FIELDS} fields.")
+
+        record = list(record)
+        if record[7] is not None:
+            record[7] = tuple(tuple(rf) for rf in record[7])
+
+        return tuple(record)
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,203 @@
+# LibAlexandria: LibAlexandria Scan Checkpoint
+# A crash-safe journal of the progress of a LibAlexandria Library scan so an interrupted scan can resume.
+
+# Imports
+import os
+from typing import Any, Optional, IO
+
+import libAlexDefaults as laShared
+import libAlexJson as laJson
+from libAlexScanReport import LibAlexScanError
+
+# Classes
+class LibAlexScanCheckpoint:
+    """
+    An append-only journal of the meta files a scan has finished with.
+
+    Each finished meta file is a single JSON line, so writing progress costs the same no matter how far the scan has come.
+    Lines are flushed to disk every `interval` entries and a line cut short by a crash is ignored when the journal is loaded.
+    """
+    # Constructors
+    def __init__(self, checkpointPath: str, interval: int = laShared.DEF_CHECKPOINT_INTERVAL):
+        """
+        Creates a new scan checkpoint and loads any existing journal.
+        If the journal was written by an incompatible version, it is ignored.
+
+        checkpointPath: The path to the journal file.
+        interval: The number of finished meta files between writes to disk.
+        """
+        self.checkpointPath = laShared.fullpath(checkpointPath)
+        self.interval = max(1, interval)
+        self.rootPath: Optional[str] = None
+        self.completed: set[str] = set()
+        self.errors: list[LibAlexScanError] = []
+
+        self._pending: list[str] = []
+        self._file: Optional[IO[str]] = None
+        self._partialLine = False
+
+        # Load the existing journal
+        if os.path.isfile(self.checkpointPath):
+            self.load()
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self.completed)
+
+    def __contains__(self, metaPath: str) -> bool:
+        return metaPath in self.completed
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(checkpointPath={self.checkpointPath!r}, completed={len(self.completed)}, errors={len(self.errors)})"
+
+    # Functions
+    def load(self):
+        """
+        Replaces the progress with that of the journal file.
+        """
+        self.rootPath = None
+        self.completed = set()
+        self.errors = []
+
+        with open(self.checkpointPath, "rb") as checkpointFile:
+            checkpointData = checkpointFile.read()
+
+        lines = checkpointData.splitlines()
+        self._partialLine = not checkpointData.endswith(b"\n")
+
+        # Check the header
+        try:
+            header: dict[str, Any] = laJson.loads(lines[0]) if lines else {}
+        except ValueError:
+            header = {}
+
+        if (not isinstance(header, dict)) or (header.get("_checkpointver", None) != laShared.VER_SCAN_CHECKPOINT):
+            return
+
+        self.rootPath = header.get("rootPath", None)
+
+        # Replay the entries
+        for line in lines[1:]:
+            try:
+                entry = laJson.loads(line)
+            except ValueError:
+                # Cut short by a crash
+                continue
+
+            # Skip lines that are not entries written by this journal
+            if (not isinstance(entry, list)) or (len(entry) not in (1, 3)) or not all(isinstance(e, str) for e in entry):
+                continue
+
+            if len(entry) == 1:
+                self.completed.add(entry[0])
+            else:
+                self.completed.add(entry[0])
+                self.errors.append(LibAlexScanError(*entry))
+
+    def begin(self, rootPath: str):
+        """
+        Opens the journal for the scan of the provided library.
+        If the journal belongs to a different library, a `ValueError` will be raised.
+
+        rootPath: The absolute path to the root directory of the library.
+        """
+        # Check the library
+        if (self.rootPath is not None) and (self.rootPath != rootPath):
+            raise ValueError(f"The scan checkpoint at \"{self.checkpointPath}\" belongs to the library at \"{self.rootPath}\" instead of \"{rootPath}\".")
+
+        # Open the journal
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.checkpointPath), exist_ok=True)
+            self._file = open(self.checkpointPath, "a", encoding="utf-8", newline="\n")
+
+            # Start a new journal
+            if self.rootPath is None:
+                self._file.seek(0)
+                self._file.truncate()
+                self._file.write(laJson.dumps({"_checkpointver": laShared.VER_SCAN_CHECKPOINT, "rootPath": rootPath}) + "\n")
+                self._file.flush()
+                self.rootPath = rootPath
+            elif self._partialLine:
+                # End the line cut short by a crash
+                self._file.write("\n")
+                self._partialLine = False
+
+    def isDone(self, metaPath: str) -> bool:
+        """
+        Returns `True` if the provided meta file was finished by an earlier run of the scan.
+
+        metaPath: The absolute path to the meta file.
+        """
+        return metaPath in self.completed
+
+    def markDone(self, metaPath: str):
+        """
+        Records that the provided meta file was loaded and handed to the consumer.
+
+        metaPath: The absolute path to the meta file.
+        """
+        self.completed.add(metaPath)
+        self._append([metaPath])
+
+    def recordError(self, error: LibAlexScanError):
+        """
+        Records that the provided meta file failed to load so it is not retried when resuming.
+
+        error: The error of the meta file.
+        """
+        self.completed.add(error.metaPath)
+        self.errors.append(error)
+        self._append(list(error.toRecord()))
+
+    def flush(self):
+        """
+        Writes every pending entry to disk.
+        """
+        if (self._file is None) or not self._pending:
+            return
+
+        self._file.write("".join(self._pending))
+        self._pending.clear()
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """
+        Writes every pending entry and closes the journal so a later scan can resume from it.
+        """
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    def finish(self):
+        """
+        Closes and removes the journal once a scan has completed so the next scan starts over.
+        """
+        # Drop the pending entries
+        self._pending.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        if os.path.isfile(self.checkpointPath):
+            os.remove(self.checkpointPath)
+
+        self.rootPath = None
+        self.completed = set()
+        self.errors = []
+
+    # Private Functions
+    def _append(self, entry: list):
+        """
+        Queues a journal entry and writes the queue once it is full.
+
+        entry: The JSON array of the entry.
+        """
+        self._pending.append(laJson.dumps(entry) + "\n")
+        if len(self._pending) >= self.interval:
+            self.flush()
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
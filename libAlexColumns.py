@@ -0,0 +1,263 @@
+# LibAlexandria: LibAlexandria Column Store
+# A compact, dictionary-encoded column store of a whole LibAlexandria Library for analytics.
+
+# Imports
+from array import array
+from collections import Counter
+from typing import Optional, Iterable, Any
+
+import libAlexDates as laDates
+from libAlexItem import LibAlexItem
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Classes
+class LibAlexColumns:
+    """
+    A compact column store of a whole LibAlexandria Library.
+
+    String columns are dictionary encoded as `array` codes into a list of unique values, version components are stored as integer arrays, and flags are stored as flag id lists addressed by an offsets array.
+    Dates are also normalized as they are appended and stored as the integer day ordinals of `libAlexDates.normalizeDate(...)`.
+    Items are appended one at a time so a scan can be exported without holding every `LibAlexItem` in memory.
+    """
+    # Variables
+    STRING_COLUMNS = ("title", "author", "date", "classification")
+    VERSION_COLUMNS = ("major", "minor", "patch")
+    DATE_COLUMNS = ("dateStart", "dateEnd")
+
+    # Constructors
+    def __init__(self):
+        """
+        Creates a new empty column store.
+        """
+        self.metaFilepaths: list[Optional[str]] = []
+
+        self._dictionaries: dict[str, list[Optional[str]]] = {name: [] for name in self.STRING_COLUMNS}
+        self._lookups: dict[str, dict[Optional[str], int]] = {name: {} for name in self.STRING_COLUMNS}
+        self._codes: dict[str, array] = {name: array("I") for name in self.STRING_COLUMNS}
+        self._versions: dict[str, array] = {name: array("i") for name in self.VERSION_COLUMNS}
+        self._dates: dict[str, array] = {name: array("i") for name in self.DATE_COLUMNS}
+
+        self._flagNames: list[str] = []
+        self._flagLookup: dict[str, int] = {}
+        self._flagOffsets = array("Q", [0])
+        self._flagIds = array("I")
+
+    @classmethod
+    def fromItems(cls, items: Iterable[LibAlexItem]) -> 'LibAlexColumns':
+        """
+        Builds a column store from the provided items.
+
+        items: The items to store. A `LibAlexScanner` or its `scan()` generator may be provided to export a library while it is scanned.
+
+        Returns a new column store.
+        """
+        columns = cls()
+        for item in items:
+            columns.append(item)
+
+        return columns
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self.metaFilepaths)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(rows={len(self)}, flags={len(self._flagNames)})"
+
+    # Functions
+    def append(self, item: LibAlexItem):
+        """
+        Appends a row for the provided item.
+
+        item: The item to append.
+        """
+        # Encode the strings
+        for name in self.STRING_COLUMNS:
+            self._codes[name].append(self._encode(name, getattr(item, name)))
+
+        # Store the version
+        version = item.version
+        if version is not None:
+            self._versions["major"].append(version.major)
+            self._versions["minor"].append(version.minor)
+            self._versions["patch"].append(version.patch)
+        else:
+            for name in self.VERSION_COLUMNS:
+                self._versions[name].append(-1)
+
+        # Store the normalized date
+        dateRange = laDates.normalizeDate(item.date)
+        if dateRange is not None:
+            self._dates["dateStart"].append(dateRange[0])
+            self._dates["dateEnd"].append(dateRange[1])
+        else:
+            for name in self.DATE_COLUMNS:
+                self._dates[name].append(-1)
+
+        # Store the flags
+        for flag in item.getAllFlags():
+            flagId = self._flagLookup.get(flag, None)
+            if flagId is None:
+                flagId = len(self._flagNames)
+                self._flagLookup[flag] = flagId
+                self._flagNames.append(flag)
+
+            self._flagIds.append(flagId)
+
+        self._flagOffsets.append(len(self._flagIds))
+        self.metaFilepaths.append(item.metaFilepath)
+
+    def codes(self, name: str) -> array:
+        """
+        Returns the dictionary codes of the provided string column.
+
+        name: One of `STRING_COLUMNS`.
+        """
+        return self._codes[name]
+
+    def dictionary(self, name: str) -> list[Optional[str]]:
+        """
+        Returns the unique values of the provided string column indexed by code.
+
+        name: One of `STRING_COLUMNS`.
+        """
+        return self._dictionaries[name]
+
+    def column(self, name: str) -> list[Any]:
+        """
+        Returns the decoded values of the provided column.
+
+        name: One of `STRING_COLUMNS`, `VERSION_COLUMNS`, or `DATE_COLUMNS`.
+        """
+        if name in self._versions:
+            return self._versions[name].tolist()
+
+        if name in self._dates:
+            return self._dates[name].tolist()
+
+        dictionary = self._dictionaries[name]
+        return [dictionary[code] for code in self._codes[name]]
+
+    def versions(self, name: str) -> array:
+        """
+        Returns the raw integer array of the provided version column.
+        Items without a version are stored as `-1`.
+
+        name: One of `VERSION_COLUMNS`.
+        """
+        return self._versions[name]
+
+    def dates(self, name: str) -> array:
+        """
+        Returns the raw integer array of day ordinals of the provided date column.
+        Items whose date is not understood are stored as `-1`.
+
+        name: One of `DATE_COLUMNS`.
+        """
+        return self._dates[name]
+
+    def flagNames(self) -> list[str]:
+        """
+        Returns every stored flag indexed by flag id.
+        """
+        return self._flagNames
+
+    def flagIds(self, row: int) -> array:
+        """
+        Returns the flag ids of the provided row.
+
+        row: The row number.
+        """
+        return self._flagIds[self._flagOffsets[row]:self._flagOffsets[row + 1]]
+
+    def flagsOf(self, row: int) -> list[str]:
+        """
+        Returns the flags of the provided row.
+
+        row: The row number.
+        """
+        return [self._flagNames[flagId] for flagId in self.flagIds(row)]
+
+    def countBy(self, name: str) -> dict[Any, int]:
+        """
+        Counts the rows per value of the provided column.
+
+        name: One of `STRING_COLUMNS`, `VERSION_COLUMNS`, `DATE_COLUMNS`, or `"flags"`.
+
+        Returns a dictionary of values to row counts.
+        """
+        # Count the flags
+        if name == "flags":
+            return {self._flagNames[flagId]: count for flagId, count in Counter(self._flagIds).items()}
+
+        # Count the versions
+        if name in self._versions:
+            return dict(Counter(self._versions[name]))
+
+        # Count the dates
+        if name in self._dates:
+            return dict(Counter(self._dates[name]))
+
+        # Count the codes
+        dictionary = self._dictionaries[name]
+        return {dictionary[code]: count for code, count in Counter(self._codes[name]).items()}
+
+    def toNumpy(self) -> dict[str, Any]:
+        """
+        Exports the column store as NumPy arrays.
+        The arrays are copies, so rows may still be appended to the column store afterwards.
+        If NumPy is not installed, an `ImportError` will be raised.
+
+        Returns a dictionary with the following keys:
+        `items`: A structured array with one record per row holding the string column codes, the version columns, and the date columns.
+        `flagOffsets`: An array where the flag ids of row `n` are `flagIds[flagOffsets[n]:flagOffsets[n + 1]]`.
+        `flagIds`: An array of flag ids indexing into `flagNames()`.
+        """
+        # Check for NumPy
+        if numpy is None:
+            raise ImportError("NumPy must be installed to export a LibAlexColumns object as NumPy arrays.")
+
+        # Build the records
+        fields = [(name, numpy.uint32) for name in self.STRING_COLUMNS] + [(name, numpy.int32) for name in self.VERSION_COLUMNS + self.DATE_COLUMNS]
+        items = numpy.empty(len(self), dtype=fields)
+        for name in self.STRING_COLUMNS:
+            items[name] = numpy.frombuffer(self._codes[name], dtype=numpy.uint32)
+
+        for name in self.VERSION_COLUMNS:
+            items[name] = numpy.frombuffer(self._versions[name], dtype=numpy.int32)
+
+        for name in self.DATE_COLUMNS:
+            items[name] = numpy.frombuffer(self._dates[name], dtype=numpy.int32)
+
+        return {
+            "items": items,
+            "flagOffsets": numpy.frombuffer(self._flagOffsets, dtype=numpy.uint64).copy(),
+            "flagIds": numpy.frombuffer(self._flagIds, dtype=numpy.uint32).copy()
+        }
+
+    # Private Functions
+    def _encode(self, name: str, value: Optional[str]) -> int:
+        """
+        Finds or assigns the dictionary code of a value.
+
+        name: The string column.
+        value: The value to encode.
+
+        Returns the code.
+        """
+        lookup = self._lookups[name]
+        code = lookup.get(value, None)
+        if code is None:
+            code = len(self._dictionaries[name])
+            lookup[value] = code
+            self._dictionaries[name].append(value)
+
+        return code
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,394 @@
+# LibAlexandria: LibAlexandria Content Hashing
+# Fingerprints the source and related files of LibAlexandria Items and finds items sharing identical content.
+
+# Imports
+import os
+import mmap
+import shutil
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Any, Iterable
+
+import libAlexDefaults as laShared
+import libAlexJson as laJson
+from libAlexItem import LibAlexItem
+
+# Classes
+class LibAlexDuplicateGroup:
+    """
+    A set of distinct files with identical content along with the items referring to them.
+    """
+    # Slots
+    __slots__ = ("digest", "size", "paths", "items")
+
+    # Constructors
+    def __init__(self, digest: str, size: int, paths: list[str], items: list[LibAlexItem]):
+        """
+        Creates a new duplicate group.
+
+        digest: The hex digest shared by every file.
+        size: The size of each file in bytes.
+        paths: The absolute paths of the identical files in path order.
+        items: The items referring to any of the files in the order they were provided.
+        """
+        self.digest = digest
+        self.size = size
+        self.paths = paths
+        self.items = items
+
+    # Python Functions
+    def __str__(self) -> str:
+        return f"{len(self.paths)} copies of {self.size} bytes ({self.digest[:12]})"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({laShared.slotValues(self)})"
+
+    # Properties
+    @property
+    def wastedBytes(self) -> int:
+        """
+        The number of bytes taken up by every copy past the first.
+        """
+        return self.size * (len(self.paths) - 1)
+
+class LibAlexContentHasher:
+    """
+    Hashes the source and related files of LibAlexandria Items in parallel.
+
+    Digests are cached along with the `(device, inode, mtime_ns, size)` signature of each file, so unchanged files are never hashed twice.
+    Files are hashed in chunks, and large files are memory mapped so they are never copied into Python memory.
+    Hashing releases the GIL, so a thread pool uses several cores.
+    """
+    # Constructors
+    def __init__(self,
+        cachePath: Optional[str] = None,
+        algorithm: str = laShared.DEF_HASH_ALGORITHM,
+        workers: int = laShared.DEF_SCAN_WORKERS,
+        chunkSize: int = laShared.DEF_HASH_CHUNK_SIZE,
+        mmapThreshold: int = laShared.DEF_HASH_MMAP_THRESHOLD
+    ):
+        """
+        Creates a new content hasher and loads any existing cache file.
+        A cache file that cannot be parsed is discarded, so every file is hashed again.
+        If the algorithm is not provided by `hashlib`, a `ValueError` will be raised.
+
+        cachePath: The path to the cache file or `None` to keep the digests in memory only.
+        algorithm: The name of the `hashlib` algorithm to use.
+        workers: The maximum number of threads used to hash files.
+        chunkSize: The number of bytes hashed at a time.
+        mmapThreshold: The size in bytes from which files are memory mapped instead of read.
+        """
+        # Check the algorithm
+        if algorithm not in hashlib.algorithms_available:
+            raise ValueError(f"\"{algorithm}\" is not a hash algorithm provided by hashlib.")
+
+        self.cachePath = (laShared.fullpath(cachePath) if cachePath is not None else None)
+        self.algorithm = algorithm
+        self.workers = max(1, workers)
+        self.chunkSize = max(1, chunkSize)
+        self.mmapThreshold = mmapThreshold
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: dict[str, tuple[list, str]] = {}
+        self._lock = threading.Lock()
+
+        # Load the existing cache
+        if (self.cachePath is not None) and os.path.isfile(self.cachePath):
+            try:
+                self.load()
+            except ValueError:
+                # A corrupt or truncated cache only costs hashing again
+                self._entries = {}
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(algorithm={self.algorithm!r}, cachePath={self.cachePath!r}, entries={len(self._entries)})"
+
+    # Functions
+    def load(self):
+        """
+        Replaces the cached digests with those of the cache file.
+        If the cache file was written by an incompatible version or with another algorithm, it is ignored.
+        If the cache file cannot be parsed or is not in the expected shape, a `ValueError` will be raised.
+        """
+        # Read the cache file
+        with open(self.cachePath, "rb") as cacheFile:
+            cacheData = cacheFile.read()
+
+        try:
+            cacheJson: dict[str, Any] = laJson.loads(cacheData)
+        except ValueError as e:
+            # Fail
+            raise ValueError(f"Could not parse JSON from the provided content hash cache file: {self.cachePath}\n\nCause: {e}")
+
+        # Check the version
+        if not isinstance(cacheJson, dict):
+            # Fail
+            raise ValueError(f"The provided content hash cache file is not a JSON object: {self.cachePath}")
+
+        if (cacheJson.get("_cachever", None) != laShared.VER_CONTENT_HASH_CACHE) or (cacheJson.get("algorithm", None) != self.algorithm):
+            return
+
+        # Restore the entries
+        entries = cacheJson.get("entries", {})
+        if not isinstance(entries, dict):
+            # Fail
+            raise ValueError(f"The entries of the provided content hash cache file are not a JSON object: {self.cachePath}")
+
+        restored = {}
+        for path, entry in entries.items():
+            if not (
+                isinstance(entry, list) and (len(entry) == 2)
+                and isinstance(entry[0], list) and (len(entry[0]) == 4)
+                and isinstance(entry[1], str)
+            ):
+                # Fail
+                raise ValueError(f"The content hash cache file has a malformed entry for \"{path}\": {self.cachePath}")
+
+            restored[path] = (entry[0], entry[1])
+
+        with self._lock:
+            self._entries = restored
+
+    def save(self):
+        """
+        Writes the cached digests to the cache file.
+        The file is replaced atomically so an interrupted save never leaves a partial cache behind.
+        """
+        # Check if there is anywhere to save
+        if self.cachePath is None:
+            raise ValueError("No cache path was provided to save the content hash cache to.")
+
+        # Snapshot the entries
+        with self._lock:
+            cacheJson = {
+                "_cachever": laShared.VER_CONTENT_HASH_CACHE,
+                "algorithm": self.algorithm,
+                "entries": dict(self._entries)
+            }
+
+        # Write next to the destination then swap it in
+        os.makedirs(os.path.dirname(self.cachePath), exist_ok=True)
+        tempFd, tempPath = tempfile.mkstemp(prefix=f".{os.path.basename(self.cachePath)}.", suffix=".tmp", dir=os.path.dirname(self.cachePath))
+        try:
+            with os.fdopen(tempFd, "w", encoding="utf-8") as cacheFile:
+                cacheFile.write(laJson.dumps(cacheJson))
+
+            # Keep the permissions of the file being replaced
+            try:
+                shutil.copymode(self.cachePath, tempPath)
+            except OSError:
+                os.chmod(tempPath, 0o644)
+
+            os.replace(tempPath, self.cachePath)
+        except BaseException:
+            # Clean up the partial file
+            try:
+                os.remove(tempPath)
+            except OSError:
+                pass
+
+            raise
+
+    def hashFile(self, path: str) -> Optional[str]:
+        """
+        Returns the hex digest of the provided file or `None` if it cannot be read.
+        The cached digest is used while the file is unchanged.
+
+        path: The absolute path to the file.
+        """
+        # Check the cache
+        signature = laShared.fileSignature(path)
+        if signature is None:
+            return None
+
+        signature = list(signature)
+        entry = self._entries.get(path, None)
+        if (entry is not None) and (entry[0] == signature):
+            with self._lock:
+                self.hits += 1
+
+            return entry[1]
+
+        # Hash the content
+        try:
+            digest = self._hashContent(path, signature[3])
+        except OSError:
+            return None
+
+        # Only keep the digest if the file did not change while it was read
+        with self._lock:
+            if laShared.fileSignature(path) == tuple(signature):
+                self._entries[path] = (signature, digest)
+
+            self.misses += 1
+
+        return digest
+
+    def hashFiles(self, paths: Iterable[str]) -> dict[str, Optional[str]]:
+        """
+        Hashes the provided files in parallel.
+
+        paths: The absolute paths of the files. Repeated paths are only hashed once.
+
+        Returns a dictionary of paths to hex digests or `None` for files that could not be read.
+        """
+        uniquePaths = list(dict.fromkeys(paths))
+        if (len(uniquePaths) <= 1) or (self.workers == 1):
+            return {path: self.hashFile(path) for path in uniquePaths}
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(uniquePaths))) as executor:
+            return dict(zip(uniquePaths, executor.map(self.hashFile, uniquePaths)))
+
+    def hashItems(self, items: Iterable[LibAlexItem]) -> dict[str, Optional[str]]:
+        """
+        Hashes the source and related files of the provided items in parallel.
+
+        items: The items whose files should be hashed.
+
+        Returns a dictionary of paths to hex digests or `None` for files that could not be read.
+        """
+        return self.hashFiles(path for item in items for path in self.itemPaths(item))
+
+    def findDuplicates(self, items: Iterable[LibAlexItem]) -> list[LibAlexDuplicateGroup]:
+        """
+        Finds distinct source and related files with identical content.
+        Hard links to the same file count as a single file, listed under its first path, and its items include those of every link.
+        Files are only hashed when another file has the same size, since files of different sizes cannot be identical.
+
+        items: The items whose files should be compared.
+
+        Returns the duplicate groups sorted by wasted bytes, largest first.
+        """
+        # Gather the files
+        items = list(items)
+        pathItems: dict[str, list[LibAlexItem]] = {}
+        for item in items:
+            for path in self.itemPaths(item):
+                users = pathItems.setdefault(path, [])
+                if (not users) or (users[-1] is not item):
+                    users.append(item)
+
+        # Hard links share a device and inode
+        links: dict[tuple[int, int], list[str]] = {}
+        fileSizes: dict[tuple[int, int], int] = {}
+        for path in sorted(pathItems):
+            signature = laShared.fileSignature(path)
+            if signature is not None:
+                links.setdefault(signature[:2], []).append(path)
+                fileSizes[signature[:2]] = signature[3]
+
+        # Only files sharing a size can share content
+        sizes: dict[int, list[str]] = {}
+        linkedPaths: dict[str, list[str]] = {}
+        for fileId, paths in links.items():
+            sizes.setdefault(fileSizes[fileId], []).append(paths[0])
+            linkedPaths[paths[0]] = paths
+
+        candidates = [path for paths in sizes.values() if len(paths) > 1 for path in paths]
+        digests = self.hashFiles(candidates)
+
+        # Group by content
+        groups: dict[tuple[int, str], list[str]] = {}
+        for size, paths in sizes.items():
+            for path in paths:
+                digest = digests.get(path, None)
+                if digest is not None:
+                    groups.setdefault((size, digest), []).append(path)
+
+        # Build the report
+        duplicates = []
+        for (size, digest), paths in groups.items():
+            if len(paths) < 2:
+                continue
+
+            paths.sort()
+            groupItems = []
+            seen = set()
+            for path in paths:
+                for item in (item for link in linkedPaths[path] for item in pathItems[link]):
+                    if id(item) not in seen:
+                        seen.add(id(item))
+                        groupItems.append(item)
+
+            duplicates.append(LibAlexDuplicateGroup(digest, size, paths, groupItems))
+
+        duplicates.sort(key=lambda g: (-g.wastedBytes, g.paths[0]))
+
+        return duplicates
+
+    def prune(self, keepPaths: Iterable[str]) -> int:
+        """
+        Removes cached digests of files that are not in the provided paths.
+
+        keepPaths: The absolute paths to keep.
+
+        Returns the number of entries removed.
+        """
+        keepPaths = set(keepPaths)
+        with self._lock:
+            stalePaths = [p for p in self._entries if p not in keepPaths]
+            for path in stalePaths:
+                del self._entries[path]
+
+        return len(stalePaths)
+
+    @staticmethod
+    def itemPaths(item: LibAlexItem) -> list[str]:
+        """
+        Returns the source file and related file paths of the provided item.
+
+        item: The item to get the paths of.
+        """
+        paths = []
+        if isinstance(item.sourceFile, str):
+            paths.append(item.sourceFile)
+
+        if isinstance(item.relatedFiles, list):
+            paths.extend(rf.path for rf in item.relatedFiles if isinstance(rf.path, str))
+
+        return paths
+
+    # Private Functions
+    def _hashContent(self, path: str, size: int) -> str:
+        """
+        Hashes the content of a file in chunks.
+
+        path: The absolute path to the file.
+        size: The size of the file in bytes.
+
+        Returns the hex digest.
+        """
+        hasher = hashlib.new(self.algorithm)
+        with open(path, "rb") as contentFile:
+            if (size >= self.mmapThreshold) and (size > 0):
+                # Map large files instead of copying them
+                with mmap.mmap(contentFile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        for offset in range(0, len(view), self.chunkSize):
+                            hasher.update(view[offset:offset + self.chunkSize])
+                    finally:
+                        view.release()
+            else:
+                # Read into a reused buffer
+                buffer = bytearray(min(self.chunkSize, max(size, 1)))
+                view = memoryview(buffer)
+                while True:
+                    count = contentFile.readinto(buffer)
+                    if not count:
+                        break
+
+                    hasher.update(view[:count])
+
+        return hasher.hexdigest()
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,277 @@
+# LibAlexandria: LibAlexandria Date Index
+# An interval index of the normalized dates of LibAlexandria Items for date range queries.
+
+# Imports
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from typing import Iterable, Optional, Union
+
+import libAlexDates as laDates
+from libAlexItem import LibAlexItem
+
+# Variables
+_AFTER_ALL = float("inf")
+
+# Classes
+class LibAlexDateIndex:
+    """
+    An interval index from the normalized dates of LibAlexandria Items to their integer ids.
+
+    Each item date is normalized once by `libAlexDates.normalizeDate(...)` into an inclusive range of day ordinals.
+    Ranges are kept in two sorted lists, one by start and one by end, so counts are answered with bisections alone and listings only walk the smaller side of a query.
+    Single inserts shift both lists, so many items should be indexed together with `addMany(...)`, which normalizes their dates in bulk and sorts once.
+    Items whose date is not understood, like `Undated`, are tracked separately and never match a range.
+    Item ids are chosen by the caller and should be non-negative integers.
+    """
+    # Constructors
+    def __init__(self):
+        """
+        Creates a new empty date index.
+        """
+        self._byStart: list[tuple[int, int, int]] = []
+        self._byEnd: list[tuple[int, int, int]] = []
+        self._itemRanges: dict[int, tuple[int, int]] = {}
+        self._undated: set[int] = set()
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self._itemRanges) + len(self._undated)
+
+    def __contains__(self, itemId: int) -> bool:
+        return (itemId in self._itemRanges) or (itemId in self._undated)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(items={len(self)}, undated={len(self._undated)})"
+
+    # Functions
+    def add(self, itemId: int, item: LibAlexItem):
+        """
+        Indexes the date of the provided item under the provided id.
+        If the id is already indexed, its previous date is replaced.
+
+        itemId: The id to index the item under.
+        item: The item to index.
+        """
+        self.addRange(itemId, laDates.normalizeDate(item.date))
+
+    def update(self, itemId: int, item: LibAlexItem):
+        """
+        Replaces the date indexed under the provided id with that of the provided item.
+
+        itemId: The id the item is indexed under.
+        item: The changed item.
+        """
+        self.addRange(itemId, laDates.normalizeDate(item.date))
+
+    def addMany(self, items: Iterable[tuple[int, LibAlexItem]]):
+        """
+        Indexes the dates of many items at once, normalizing each unique date string once and sorting the entries a single time.
+        Ids that are already indexed have their previous dates replaced.
+
+        items: `(itemId, item)` tuples to index.
+        """
+        items = list(items)
+        dateRanges = laDates.normalizeDates(item.date for _, item in items)
+        self.addRanges(zip((itemId for itemId, _ in items), dateRanges))
+
+    def addRanges(self, dateRanges: Iterable[tuple[int, Optional[tuple[int, int]]]]):
+        """
+        Indexes many ranges of day ordinals at once, sorting the entries a single time.
+        Ids that are already indexed have their previous ranges replaced.
+
+        dateRanges: `(itemId, dateRange)` tuples to index. A range may be `None` if the item is undated.
+        """
+        # Collect the new entries, keeping the last range of repeated ids
+        byStart = []
+        byEnd = []
+        for itemId, dateRange in dict(dateRanges).items():
+            self.remove(itemId)
+
+            if dateRange is None:
+                self._undated.add(itemId)
+                continue
+
+            start, end = dateRange
+            byStart.append((start, end, itemId))
+            byEnd.append((end, start, itemId))
+            self._itemRanges[itemId] = (start, end)
+
+        # Merge them in with a single sort each
+        if byStart:
+            byStart.sort()
+            byEnd.sort()
+            self._byStart.extend(byStart)
+            self._byStart.sort()
+            self._byEnd.extend(byEnd)
+            self._byEnd.sort()
+
+    def addRange(self, itemId: int, dateRange: Optional[tuple[int, int]]):
+        """
+        Indexes the provided range of day ordinals under the provided id.
+        If the id is already indexed, its previous range is replaced.
+
+        itemId: The id to index the range under.
+        dateRange: An inclusive `(start, end)` tuple of day ordinals or `None` if the item is undated.
+        """
+        # Skip unchanged ranges
+        if (itemId in self) and (self._itemRanges.get(itemId, None) == dateRange):
+            return
+
+        # Clear any previous range
+        self.remove(itemId)
+
+        # Track undated items apart
+        if dateRange is None:
+            self._undated.add(itemId)
+            return
+
+        # Insert in order
+        start, end = dateRange
+        insort(self._byStart, (start, end, itemId))
+        insort(self._byEnd, (end, start, itemId))
+        self._itemRanges[itemId] = (start, end)
+
+    def remove(self, itemId: int) -> bool:
+        """
+        Removes the provided id from the index.
+
+        itemId: The id to remove.
+
+        Returns `True` if the id was indexed.
+        """
+        # Check the undated items
+        if itemId in self._undated:
+            self._undated.remove(itemId)
+            return True
+
+        # Find the range
+        dateRange = self._itemRanges.pop(itemId, None)
+        if dateRange is None:
+            return False
+
+        # Remove the entries
+        start, end = dateRange
+        del self._byStart[bisect_left(self._byStart, (start, end, itemId))]
+        del self._byEnd[bisect_left(self._byEnd, (end, start, itemId))]
+
+        return True
+
+    def clear(self):
+        """
+        Removes every item from the index.
+        """
+        self._byStart.clear()
+        self._byEnd.clear()
+        self._itemRanges.clear()
+        self._undated.clear()
+
+    def rangeOf(self, itemId: int) -> Optional[tuple[int, int]]:
+        """
+        Returns the range of day ordinals indexed under the provided id or `None` if it is not indexed or undated.
+
+        itemId: The id to look up.
+        """
+        return self._itemRanges.get(itemId, None)
+
+    def undated(self) -> list[int]:
+        """
+        Returns a sorted list of the ids of items whose date is not understood.
+        """
+        return sorted(self._undated)
+
+    def between(self,
+        low: Union[str, int, date, None] = None,
+        high: Union[str, int, date, None] = None,
+        within: bool = False
+    ) -> list[int]:
+        """
+        Finds the items written between the provided dates.
+        Date strings stand for their whole range, so `between("1600", "1650")` covers 1600-01-01 through 1650-12-31.
+
+        low: The earliest date as a date string, day ordinal, or `datetime.date` or `None` for no lower bound.
+        high: The latest date as a date string, day ordinal, or `datetime.date` or `None` for no upper bound.
+        within: If `True`, only items whose whole date range lies between the bounds match. If `False`, items whose date range overlaps the bounds match, so `c. 1650` matches `between("1600", "1650")`.
+
+        Returns a list of matching item ids ordered by start date, end date, and then id.
+        """
+        lowDay, highDay = self._bounds(low, high)
+        if lowDay > highDay:
+            return []
+
+        # Items starting within the bounds
+        if within:
+            start = bisect_left(self._byStart, (lowDay,))
+            end = bisect_right(self._byStart, (highDay, _AFTER_ALL), lo=start)
+            return [itemId for _, itemEnd, itemId in self._byStart[start:end] if itemEnd <= highDay]
+
+        # Walk whichever side leaves fewer items to check
+        startsBefore = bisect_right(self._byStart, (highDay, _AFTER_ALL))
+        endsFrom = bisect_left(self._byEnd, (lowDay,))
+        if startsBefore <= (len(self._byEnd) - endsFrom):
+            return [itemId for _, itemEnd, itemId in self._byStart[:startsBefore] if itemEnd >= lowDay]
+
+        matches = [(itemStart, itemEnd, itemId) for itemEnd, itemStart, itemId in self._byEnd[endsFrom:] if itemStart <= highDay]
+        matches.sort()
+        return [itemId for _, _, itemId in matches]
+
+    def count(self,
+        low: Union[str, int, date, None] = None,
+        high: Union[str, int, date, None] = None
+    ) -> int:
+        """
+        Counts the items whose date range overlaps the provided bounds without listing them.
+
+        low: The earliest date as a date string, day ordinal, or `datetime.date` or `None` for no lower bound.
+        high: The latest date as a date string, day ordinal, or `datetime.date` or `None` for no upper bound.
+        """
+        lowDay, highDay = self._bounds(low, high)
+        if lowDay > highDay:
+            return 0
+
+        # Every dated item except those ending before or starting after the bounds
+        endsBefore = bisect_left(self._byEnd, (lowDay,))
+        startsAfter = len(self._byStart) - bisect_right(self._byStart, (highDay, _AFTER_ALL))
+        return len(self._byStart) - endsBefore - startsAfter
+
+    def ordered(self, reverse: bool = False) -> list[int]:
+        """
+        Returns the ids of every dated item ordered by start date, end date, and then id.
+
+        reverse: If `True`, the latest items come first.
+        """
+        ids = [itemId for _, _, itemId in self._byStart]
+        if reverse:
+            ids.reverse()
+
+        return ids
+
+    def earliest(self) -> Optional[int]:
+        """
+        Returns the earliest indexed day ordinal or `None` if no dated items are indexed.
+        """
+        return (self._byStart[0][0] if self._byStart else None)
+
+    def latest(self) -> Optional[int]:
+        """
+        Returns the latest indexed day ordinal or `None` if no dated items are indexed.
+        """
+        return (self._byEnd[-1][0] if self._byEnd else None)
+
+    # Private Functions
+    @staticmethod
+    def _bounds(low: Union[str, int, date, None], high: Union[str, int, date, None]) -> tuple[int, int]:
+        """
+        Converts query bounds into inclusive day ordinals.
+        If a bound cannot be understood, a `ValueError` will be raised.
+
+        low: The earliest date or `None`.
+        high: The latest date or `None`.
+        """
+        lowDay = (laDates.dateBound(low) if low is not None else date.min.toordinal())
+        highDay = (laDates.dateBound(high, end=True) if high is not None else date.max.toordinal())
+
+        return (lowDay, highDay)
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
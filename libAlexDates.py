@@ -0,0 +1,223 @@
+# LibAlexandria: LibAlexandria Dates
+# Normalizes the free-form dates of LibAlexandria Items into sortable day ranges.
+
+# Imports
+import re
+import calendar
+from datetime import date as _date
+from functools import lru_cache
+from typing import Iterable, Optional, Union
+
+import libAlexDefaults as laShared
+
+# Variables
+_MONTHS = {
+    "jan": 1, "january": 1, "feb": 2, "february": 2, "mar": 3, "march": 3, "apr": 4, "april": 4,
+    "may": 5, "jun": 6, "june": 6, "jul": 7, "july": 7, "aug": 8, "august": 8,
+    "sep": 9, "sept": 9, "september": 9, "oct": 10, "october": 10, "nov": 11, "november": 11, "dec": 12, "december": 12
+}
+
+_CIRCA_PATTERN = re.compile(r"^(?:(?:circa|approx|around|about|ca|c)(?:\.\s*|\s+)|~\s*)(.+)$")
+_NUMERIC_PATTERN = re.compile(r"^(?:(\d{1,4})|(\d{3,4})[-/.](\d{1,2})(?:[-/.](\d{1,2}))?)$")
+_YEAR_RANGE_PATTERN = re.compile(r"^(\d{1,4})\s*(?:-|–|—|to)\s*(\d{1,4})$")
+_DECADE_PATTERN = re.compile(r"^(\d{1,3})0'?s$")
+_CENTURY_PATTERN = re.compile(r"^(\d{1,2})(?:st|nd|rd|th)\s+century$")
+_MONTH_YEAR_PATTERN = re.compile(r"^([a-z]+)\.?\s+(\d{1,4})$")
+_MONTH_DAY_YEAR_PATTERN = re.compile(r"^([a-z]+)\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{1,4})$")
+_DAY_MONTH_YEAR_PATTERN = re.compile(r"^(\d{1,2})(?:st|nd|rd|th)?\s+([a-z]+)\.?,?\s+(\d{1,4})$")
+
+# Functions
+def normalizeDate(s: Optional[str]) -> Optional[tuple[int, int]]:
+    """
+    Parses a free-form item date into the range of days it may refer to.
+    Recently seen date strings are only parsed once.
+
+    Years like `1984`, year-months like `1984-04` or `April 1984`, full dates like `1984-04-01` or `1 April 1984`, decades like `1980s`, centuries like `17th century`, and year ranges like `1600-1650` are understood.
+    Numeric year-months and full dates need a three or four digit year, so ambiguous dates like `1/2` are not understood.
+    A `c.`, `ca.`, or `circa` prefix widens the range by `DEF_DATE_CIRCA_YEARS` on either side.
+
+    s: The date string.
+
+    Returns a `(start, end)` tuple of inclusive proleptic Gregorian day ordinals as used by `datetime.date.toordinal()` or `None` if the date is not understood, like `Undated`.
+    """
+    if not isinstance(s, str):
+        return None
+
+    return _cachedNormalizeDate(s)
+
+def normalizeDates(dates: Iterable[Optional[str]]) -> list[Optional[tuple[int, int]]]:
+    """
+    Normalizes many dates at once, parsing each unique date string only once.
+
+    dates: The date strings, like the `date` of every item of a scan.
+
+    Returns a list of the results of `normalizeDate(...)` in the same order.
+    """
+    seen: dict[Optional[str], Optional[tuple[int, int]]] = {}
+    results = []
+    for s in dates:
+        dateRange = seen.get(s, seen)
+        if dateRange is seen:
+            dateRange = seen[s] = normalizeDate(s)
+
+        results.append(dateRange)
+
+    return results
+
+def dateBound(value: Union[str, int, _date], end: bool = False) -> int:
+    """
+    Converts a query bound into a day ordinal.
+    If the bound cannot be understood, a `ValueError` will be raised.
+
+    value: A date string understood by `normalizeDate(...)`, a day ordinal, or a `datetime.date`.
+    end: If `True`, a date string stands for its last day. If `False`, for its first day.
+
+    Returns the day ordinal.
+    """
+    if isinstance(value, _date):
+        return value.toordinal()
+
+    if isinstance(value, int):
+        return value
+
+    dateRange = normalizeDate(value)
+    if dateRange is None:
+        # Fail
+        raise ValueError(f"\"{value}\" is not a date that can be queried by.")
+
+    return dateRange[1 if end else 0]
+
+def formatOrdinal(ordinal: int) -> str:
+    """
+    Returns the provided day ordinal as an ISO 8601 date string like `1984-04-01`.
+
+    ordinal: The day ordinal.
+    """
+    return _date.fromordinal(ordinal).isoformat()
+
+@lru_cache(maxsize=laShared.DEF_DATE_CACHE_SIZE)
+def _cachedNormalizeDate(s: str) -> Optional[tuple[int, int]]:
+    """
+    Parses and caches the day range of the provided date string.
+
+    s: The date string.
+    """
+    text = " ".join(s.lower().split())
+
+    # Widen approximate dates
+    match = _CIRCA_PATTERN.match(text)
+    if match is not None:
+        dateRange = _parseDate(match.group(1))
+        if dateRange is None:
+            return None
+
+        return _widen(dateRange, laShared.DEF_DATE_CIRCA_YEARS)
+
+    return _parseDate(text)
+
+def _parseDate(text: str) -> Optional[tuple[int, int]]:
+    """
+    Parses an exact date in one of the understood formats.
+
+    text: The lowercase date text with single spaces.
+
+    Returns a `(start, end)` tuple of day ordinals or `None`.
+    """
+    # Numeric years, year-months, and full dates with at least a three digit year
+    match = _NUMERIC_PATTERN.match(text)
+    if match is not None:
+        year, fullYear, month, day = match.groups()
+        if year is not None:
+            return _dayRange(int(year), None, None)
+
+        return _dayRange(int(fullYear), int(month), (int(day) if day is not None else None))
+
+    # Year ranges
+    match = _YEAR_RANGE_PATTERN.match(text)
+    if match is not None:
+        startYear, endYear = int(match.group(1)), int(match.group(2))
+        if startYear > endYear:
+            return None
+
+        return _span(_dayRange(startYear, None, None), _dayRange(endYear, None, None))
+
+    # Decades
+    match = _DECADE_PATTERN.match(text)
+    if match is not None:
+        startYear = int(match.group(1)) * 10
+        return _span(_dayRange(startYear, None, None), _dayRange(startYear + 9, None, None))
+
+    # Centuries
+    match = _CENTURY_PATTERN.match(text)
+    if match is not None:
+        startYear = ((int(match.group(1)) - 1) * 100) + 1
+        return _span(_dayRange(startYear, None, None), _dayRange(startYear + 99, None, None))
+
+    # Named months
+    match = _MONTH_YEAR_PATTERN.match(text)
+    if match is not None:
+        month = _MONTHS.get(match.group(1), None)
+        return (_dayRange(int(match.group(2)), month, None) if month is not None else None)
+
+    match = _MONTH_DAY_YEAR_PATTERN.match(text)
+    if match is not None:
+        month = _MONTHS.get(match.group(1), None)
+        return (_dayRange(int(match.group(3)), month, int(match.group(2))) if month is not None else None)
+
+    match = _DAY_MONTH_YEAR_PATTERN.match(text)
+    if match is not None:
+        month = _MONTHS.get(match.group(2), None)
+        return (_dayRange(int(match.group(3)), month, int(match.group(1))) if month is not None else None)
+
+    return None
+
+def _dayRange(year: int, month: Optional[int], day: Optional[int]) -> Optional[tuple[int, int]]:
+    """
+    Returns the day ordinals of a year, month, or single day or `None` if it does not exist.
+
+    year: The year.
+    month: The month or `None` for the whole year.
+    day: The day or `None` for the whole month.
+    """
+    try:
+        if month is None:
+            return (_date(year, 1, 1).toordinal(), _date(year, 12, 31).toordinal())
+
+        if day is None:
+            return (_date(year, month, 1).toordinal(), _date(year, month, calendar.monthrange(year, month)[1]).toordinal())
+
+        ordinal = _date(year, month, day).toordinal()
+        return (ordinal, ordinal)
+    except ValueError:
+        return None
+
+def _span(first: Optional[tuple[int, int]], last: Optional[tuple[int, int]]) -> Optional[tuple[int, int]]:
+    """
+    Returns the range from the start of the first range to the end of the last or `None` if either is missing.
+
+    first: The first range.
+    last: The last range.
+    """
+    if (first is None) or (last is None):
+        return None
+
+    return (first[0], last[1])
+
+def _widen(dateRange: tuple[int, int], years: int) -> tuple[int, int]:
+    """
+    Widens a range by the provided number of years on either side, staying within the supported years.
+
+    dateRange: The range to widen.
+    years: The number of years to add on either side.
+    """
+    start = _date.fromordinal(dateRange[0])
+    end = _date.fromordinal(dateRange[1])
+
+    startYear = max(1, start.year - years)
+    endYear = min(9999, end.year + years)
+
+    return (_date(startYear, 1, 1).toordinal(), _date(endYear, 12, 31).toordinal())
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
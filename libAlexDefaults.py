@@ -4,11 +4,22 @@
 # Imports
 import os
 import re
+from functools import lru_cache
+from typing import Optional, Any
 from unicodedata import normalize
 
 # Variables
 VER_LIBALEX = "2.0.0"
 
+VER_CATALOG_CACHE = "1.0.0"
+VER_TEXT_INDEX = "1.0.0"
+VER_SCAN_CHECKPOINT = "1.0.0"
+VER_CONTENT_HASH_CACHE = "1.0.0"
+VER_SQLITE_STORE = "1.0.0"
+VER_SNAPSHOT = "1.0.0"
+
+META_FILENAME = "meta.json"
+
 DEF_ITEM_DIR = None
 DEF_ITEM_META_PATH = None
 DEF_ITEM_RES_FLAGS = None
@@ -27,6 +38,34 @@ DEF_REL_FILES = None
 DEF_FLAGS = None
 DEF_DESC = "An empty LibAlexandria Item."
 
+DEF_VERSION_CACHE_SIZE = 4096
+DEF_SLUG_CACHE_SIZE = 65536
+DEF_DATE_CACHE_SIZE = 4096
+DEF_VALIDATOR_CACHE_SIZE = 16384
+
+DEF_DATE_CIRCA_YEARS = 5
+
+DEF_TEXT_FIELD_WEIGHTS = {"title": 2.0, "author": 1.5, "description": 1.0}
+DEF_TEXT_SEARCH_LIMIT = 20
+DEF_BM25_K1 = 1.2
+DEF_BM25_B = 0.75
+
+DEF_QUERY_PAGE_SIZE = 50
+DEF_QUERY_INTERSECT_RATIO = 4
+
+DEF_SCAN_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+DEF_SCAN_ORDERED = False
+DEF_CHECKPOINT_INTERVAL = 1000
+
+DEF_HASH_ALGORITHM = "blake2b"
+DEF_HASH_CHUNK_SIZE = 1024 * 1024
+DEF_HASH_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+DEF_LOAD_PROCESSES = os.cpu_count() or 1
+DEF_LOAD_PARTITIONS_PER_PROCESS = 4
+
+DEF_SQLITE_BATCH_SIZE = 500
+
 # Functions
 def fullpath(path: str) -> str:
     """
@@ -62,6 +101,57 @@ def checkPath(path: str, createPath: bool = False) -> bool:
     # Success
     return True
 
+def relativePath(path: str, directory: Optional[str]) -> str:
+    """
+    Returns the provided path relative to the provided directory as written in meta files.
+
+    path: The absolute path to make relative.
+    directory: The directory the path should be relative to or `None` to keep only the file name.
+
+    Returns the relative path.
+    """
+    # Check if there is anything to be relative to
+    if directory is None:
+        return os.path.basename(path)
+
+    # Resolve the relative path
+    try:
+        return os.path.relpath(path, directory)
+    except ValueError:
+        # The path is on another drive
+        return os.path.basename(path)
+
+def fileSignature(path: str) -> Optional[tuple[int, int, int, int]]:
+    """
+    Builds a signature from the stat information of the provided file.
+
+    path: The path to the file.
+
+    Returns a tuple of `(device, inode, mtime_ns, size)` or `None` if the file could not be stat'd.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+def slotValues(obj: Any) -> dict[str, Any]:
+    """
+    Collects the values of every assigned slot of the provided object for use in `__repr__` functions.
+
+    obj: An object whose class defines `__slots__`.
+
+    Returns a dictionary of slot names to values.
+    """
+    values = {}
+    for cls in reversed(type(obj).__mro__):
+        for name in cls.__dict__.get("__slots__", ()):
+            if hasattr(obj, name):
+                values[name] = getattr(obj, name)
+
+    return values
+
 def slugify(s: str) -> str:
     """
     Converts the provided string into a slugified version
@@ -77,6 +167,18 @@ def slugify(s: str) -> str:
     s = re.sub(r"[-\s]+", "-", s).strip("-_")
     return s
 
+@lru_cache(maxsize=DEF_SLUG_CACHE_SIZE)
+def slugifyCached(s: str) -> str:
+    """
+    Converts the provided string into a slugified version like `slugify(...)` while remembering recent results.
+    Use this for strings that repeat often such as directory names.
+
+    s: String to slugify.
+
+    Returns the string slugified.
+    """
+    return slugify(s)
+
 # Console Execution
 if __name__ == "__main__":
     print("This file cannot be run from the command line.")
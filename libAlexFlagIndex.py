@@ -0,0 +1,574 @@
+# LibAlexandria: LibAlexandria Flag Index
+# An inverted index from flags to the LibAlexandria Items that carry them.
+
+# Imports
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Optional, Union
+
+from libAlexItem import LibAlexItem
+
+# Variables
+_CHUNK_SHIFT = 16
+_CHUNK_BYTES = (1 << _CHUNK_SHIFT) // 8
+_CHUNK_MASK = (1 << _CHUNK_SHIFT) - 1
+_ARRAY_LIMIT = 4096
+
+# Classes
+class LibAlexFlagIndex:
+    """
+    An inverted index from flags to the integer ids of the LibAlexandria Items that carry them.
+
+    Each flag keeps compressed postings in the style of a roaring bitmap.
+    Flags carried by at most 4096 items, like the directory names in `resolvedFlags`, keep a sorted `array("I")` of ids, so a flag costs memory in proportion to its items rather than to the size of the library.
+    Larger flags switch to a chunked bitmap with one 65536 bit `bytearray` per occupied range of ids and switch back once they shrink to half the limit.
+    Adding, updating, or removing an item changes each of its flags in place at a cost bounded by the array limit or a single chunk, regardless of library size.
+    Queries start from the smallest required flag and check the other flags against it, either id by id for sparse flags or chunk by chunk for dense ones, so query work scales with the smallest matching set.
+    Item ids are chosen by the caller and should be non-negative integers below 2**32.
+    """
+    # Constructors
+    def __init__(self):
+        """
+        Creates a new empty flag index.
+        """
+        self._postings: dict[str, _LibAlexFlagPostings] = {}
+        self._itemFlags: dict[int, tuple[str, ...]] = {}
+        self._allItems = _LibAlexFlagPostings()
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self._itemFlags)
+
+    def __contains__(self, itemId: int) -> bool:
+        return itemId in self._itemFlags
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(items={len(self._itemFlags)}, flags={len(self._postings)})"
+
+    # Functions
+    def add(self, itemId: int, item: LibAlexItem):
+        """
+        Indexes every flag returned by `item.getAllFlags()` under the provided id.
+        If the id is already indexed, its previous flags are replaced.
+
+        itemId: The id to index the item under.
+        item: The item to index.
+        """
+        self.addFlags(itemId, item.getAllFlags())
+
+    def update(self, itemId: int, item: LibAlexItem):
+        """
+        Replaces the flags indexed under the provided id with those of the provided item.
+
+        itemId: The id the item is indexed under.
+        item: The re-flagged item.
+        """
+        self.addFlags(itemId, item.getAllFlags())
+
+    def addFlags(self, itemId: int, flags: Iterable[str]):
+        """
+        Indexes the provided flags under the provided id.
+        If the id is already indexed, its previous flags are replaced.
+
+        itemId: The id to index the flags under.
+        flags: The flags to index.
+        """
+        # Clear any previous flags
+        if itemId in self._itemFlags:
+            self.remove(itemId)
+
+        # Record the id under each flag
+        flags = tuple(set(flags))
+        for flag in flags:
+            postings = self._postings.get(flag, None)
+            if postings is None:
+                postings = self._postings[flag] = _LibAlexFlagPostings()
+
+            postings.add(itemId)
+
+        self._itemFlags[itemId] = flags
+        self._allItems.add(itemId)
+
+    def remove(self, itemId: int) -> bool:
+        """
+        Removes the provided id from the index.
+
+        itemId: The id to remove.
+
+        Returns `True` if the id was indexed.
+        """
+        # Find the flags
+        flags = self._itemFlags.pop(itemId, None)
+        if flags is None:
+            return False
+
+        # Drop the id from each flag
+        for flag in flags:
+            postings = self._postings[flag]
+            postings.remove(itemId)
+            if not postings.count:
+                del self._postings[flag]
+
+        self._allItems.remove(itemId)
+
+        return True
+
+    def clear(self):
+        """
+        Removes every item from the index.
+        """
+        self._postings.clear()
+        self._itemFlags.clear()
+        self._allItems = _LibAlexFlagPostings()
+
+    def flags(self) -> list[str]:
+        """
+        Returns a sorted list of every indexed flag.
+        """
+        return sorted(self._postings)
+
+    def flagsWithPrefix(self, prefix: str) -> list[str]:
+        """
+        Returns a sorted list of every indexed flag starting with the provided prefix.
+
+        prefix: The prefix to match.
+        """
+        return sorted(f for f in self._postings if f.startswith(prefix))
+
+    def flagsOf(self, itemId: int) -> Optional[tuple[str, ...]]:
+        """
+        Returns the flags indexed under the provided id or `None` if it is not indexed.
+
+        itemId: The id to look up.
+        """
+        return self._itemFlags.get(itemId, None)
+
+    def flagCount(self, flag: str) -> int:
+        """
+        Returns the number of items carrying the provided flag.
+
+        flag: The flag to count.
+        """
+        postings = self._postings.get(flag, None)
+        return (postings.count if postings is not None else 0)
+
+    def query(self,
+        allOf: Iterable[str] = (),
+        anyOf: Iterable[str] = (),
+        noneOf: Iterable[str] = (),
+        anyOfGroups: Iterable[Iterable[str]] = ()
+    ) -> list[int]:
+        """
+        Finds the items matching the provided boolean query.
+        With no arguments, every indexed item matches.
+
+        allOf: Flags that must all be present.
+        anyOf: Flags of which at least one must be present. Ignored when empty.
+        noneOf: Flags that must all be absent.
+        anyOfGroups: Further groups of flags of which at least one per group must be present. An empty group matches nothing.
+
+        Returns a sorted list of matching item ids.
+        """
+        matches = self._match(allOf, anyOf, noneOf, anyOfGroups)
+        if isinstance(matches, list):
+            return matches
+
+        ids = []
+        for key, bits in matches.items():
+            ids.extend(self._chunkIds(key, bits))
+
+        return ids
+
+    def count(self,
+        allOf: Iterable[str] = (),
+        anyOf: Iterable[str] = (),
+        noneOf: Iterable[str] = (),
+        anyOfGroups: Iterable[Iterable[str]] = ()
+    ) -> int:
+        """
+        Counts the items matching the provided boolean query without listing them.
+
+        allOf: Flags that must all be present.
+        anyOf: Flags of which at least one must be present. Ignored when empty.
+        noneOf: Flags that must all be absent.
+        anyOfGroups: Further groups of flags of which at least one per group must be present. An empty group matches nothing.
+
+        Returns the number of matching items.
+        """
+        matches = self._match(allOf, anyOf, noneOf, anyOfGroups)
+        if isinstance(matches, list):
+            return len(matches)
+
+        return sum(bits.bit_count() for bits in matches.values())
+
+    def bitmap(self,
+        allOf: Iterable[str] = (),
+        anyOf: Iterable[str] = (),
+        noneOf: Iterable[str] = (),
+        anyOfGroups: Iterable[Iterable[str]] = ()
+    ) -> int:
+        """
+        Builds an `int` bitmap of the items matching the provided boolean query.
+        The bitmap spans every id up to the highest match, so prefer `query(...)` or `count(...)` on large libraries.
+
+        allOf: Flags that must all be present.
+        anyOf: Flags of which at least one must be present. Ignored when empty.
+        noneOf: Flags that must all be absent.
+        anyOfGroups: Further groups of flags of which at least one per group must be present. An empty group matches nothing.
+
+        Returns an `int` bitmap where bit `n` is set when item `n` matches.
+        """
+        matches = self._match(allOf, anyOf, noneOf, anyOfGroups)
+        if isinstance(matches, list):
+            return self._idsToChunk(matches, 0)
+
+        result = 0
+        for key, bits in matches.items():
+            result |= bits << (key << _CHUNK_SHIFT)
+
+        return result
+
+    @staticmethod
+    def bitmapToIds(bitmap: int) -> list[int]:
+        """
+        Converts an `int` bitmap into the sorted list of ids whose bits are set.
+
+        bitmap: The bitmap to convert.
+        """
+        # Check for an empty bitmap
+        if bitmap <= 0:
+            return []
+
+        # View the bitmap as machine words so empty stretches are skipped quickly
+        wordCount = (bitmap.bit_length() + 63) // 64
+        words = memoryview(bitmap.to_bytes(wordCount * 8, sys.byteorder)).cast("Q")
+
+        # Collect the set bits
+        ids = []
+        for wordNum, word in enumerate(words):
+            base = wordNum * 64
+            while word:
+                lowBit = word & -word
+                ids.append(base + lowBit.bit_length() - 1)
+                word ^= lowBit
+
+        return ids
+
+    # Private Functions
+    def _match(self,
+        allOf: Iterable[str],
+        anyOf: Iterable[str],
+        noneOf: Iterable[str],
+        anyOfGroups: Iterable[Iterable[str]]
+    ) -> Union[list[int], dict[int, int]]:
+        """
+        Evaluates a boolean query starting from its smallest required set.
+
+        allOf: Flags that must all be present.
+        anyOf: Flags of which at least one must be present. Ignored when empty.
+        noneOf: Flags that must all be absent.
+        anyOfGroups: Further groups of flags of which at least one per group must be present.
+
+        Returns a sorted list of matching ids when the smallest set was sparse or a dictionary of chunk numbers to the bits of their matches in chunk order otherwise.
+        """
+        # Look up the required flags smallest first
+        required = []
+        for flag in set(allOf):
+            postings = self._postings.get(flag, None)
+            if postings is None:
+                return []
+
+            required.append(postings)
+
+        required.sort(key=lambda p: p.count)
+
+        # Look up the optional groups
+        groups = []
+        anyOf = tuple(anyOf)
+        for group in ((anyOf,) if anyOf else ()) + tuple(tuple(g) for g in anyOfGroups):
+            postings = [self._postings[f] for f in set(group) if f in self._postings]
+            if not postings:
+                return []
+
+            groups.append(postings)
+
+        excluded = [self._postings[f] for f in set(noneOf) if f in self._postings]
+
+        # Pick the smallest set to start from
+        if required:
+            driver = required.pop(0)
+        elif groups:
+            group = min(groups, key=lambda g: sum(p.count for p in g))
+            groups.remove(group)
+            if len(group) == 1:
+                driver = group[0]
+            else:
+                # Check the union of the smallest group id by id
+                candidates = sorted(set().union(*(p.ids() for p in group)))
+                return self._filterIds(candidates, required, groups, excluded)
+        else:
+            driver = self._allItems
+
+        # Check sparse sets id by id
+        if not driver.isDense():
+            return self._filterIds(driver.ids(), required, groups, excluded)
+
+        # Combine dense sets chunk by chunk
+        matches = {}
+        for key in driver.chunkKeys():
+            bits = driver.chunkBits(key)
+            for postings in required:
+                bits &= postings.chunkBits(key)
+                if not bits:
+                    break
+
+            for group in groups:
+                if not bits:
+                    break
+
+                anyBits = 0
+                for postings in group:
+                    anyBits |= postings.chunkBits(key)
+
+                bits &= anyBits
+
+            for postings in excluded:
+                if not bits:
+                    break
+
+                bits &= ~postings.chunkBits(key)
+
+            if bits:
+                matches[key] = bits
+
+        return matches
+
+    @staticmethod
+    def _filterIds(
+        candidates: Iterable[int],
+        required: list['_LibAlexFlagPostings'],
+        groups: list[list['_LibAlexFlagPostings']],
+        excluded: list['_LibAlexFlagPostings']
+    ) -> list[int]:
+        """
+        Keeps the candidate ids that satisfy every remaining part of a query.
+
+        candidates: The sorted candidate ids.
+        required: Postings every id must be in.
+        groups: Groups of postings of which every id must be in at least one per group.
+        excluded: Postings no id may be in.
+
+        Returns the sorted matching ids.
+        """
+        return [
+            itemId for itemId in candidates
+            if all(itemId in p for p in required)
+            and all(any(itemId in p for p in g) for g in groups)
+            and not any(itemId in p for p in excluded)
+        ]
+
+    @classmethod
+    def _chunkIds(cls, key: int, bits: int) -> list[int]:
+        """
+        Lists the ids set in the bits of a chunk.
+
+        key: The chunk number.
+        bits: The bits of the chunk.
+        """
+        base = key << _CHUNK_SHIFT
+        return [base + i for i in cls.bitmapToIds(bits)]
+
+    @staticmethod
+    def _idsToChunk(ids: Iterable[int], base: int) -> int:
+        """
+        Builds an `int` bitmap of the provided ids relative to a base id.
+
+        ids: The sorted ids.
+        base: The id of bit zero.
+        """
+        ids = [i - base for i in ids]
+        if not ids:
+            return 0
+
+        chunk = bytearray((ids[-1] >> 3) + 1)
+        for offset in ids:
+            chunk[offset >> 3] |= 1 << (offset & 7)
+
+        return int.from_bytes(chunk, "little")
+
+class _LibAlexFlagPostings:
+    """
+    The compressed ids of the items carrying a single flag.
+
+    Sparse postings keep a sorted `array("I")` of ids and dense postings keep a `bytearray` bitmap per occupied chunk of ids.
+    """
+    # Slots
+    __slots__ = ("count", "_ids", "_chunks", "_chunkCounts")
+
+    # Constructors
+    def __init__(self):
+        """
+        Creates new empty sparse postings.
+        """
+        self.count = 0
+        self._ids: Optional[array] = array("I")
+        self._chunks: Optional[dict[int, bytearray]] = None
+        self._chunkCounts: Optional[dict[int, int]] = None
+
+    # Python Functions
+    def __contains__(self, itemId: int) -> bool:
+        if self._ids is not None:
+            i = bisect_left(self._ids, itemId)
+            return (i < len(self._ids)) and (self._ids[i] == itemId)
+
+        chunk = self._chunks.get(itemId >> _CHUNK_SHIFT, None)
+        offset = itemId & _CHUNK_MASK
+        return (chunk is not None) and bool(chunk[offset >> 3] & (1 << (offset & 7)))
+
+    # Functions
+    def isDense(self) -> bool:
+        """
+        Returns if the postings are kept as chunked bitmaps.
+        """
+        return self._ids is None
+
+    def add(self, itemId: int):
+        """
+        Adds an id to the postings.
+
+        itemId: The id to add.
+        """
+        # Insert in order, appending when ids arrive in order
+        ids = self._ids
+        if ids is not None:
+            if (not ids) or (itemId > ids[-1]):
+                ids.append(itemId)
+            else:
+                i = bisect_left(ids, itemId)
+                if ids[i] == itemId:
+                    return
+
+                ids.insert(i, itemId)
+
+            self.count += 1
+
+            if self.count > _ARRAY_LIMIT:
+                self._toDense()
+
+            return
+
+        # Set the bit
+        key = itemId >> _CHUNK_SHIFT
+        chunk = self._chunks.get(key, None)
+        if chunk is None:
+            chunk = self._chunks[key] = bytearray(_CHUNK_BYTES)
+
+        offset = itemId & _CHUNK_MASK
+        bit = 1 << (offset & 7)
+        if chunk[offset >> 3] & bit:
+            return
+
+        chunk[offset >> 3] |= bit
+        self._chunkCounts[key] = self._chunkCounts.get(key, 0) + 1
+        self.count += 1
+
+    def remove(self, itemId: int):
+        """
+        Removes an id from the postings.
+
+        itemId: The id to remove.
+        """
+        # Drop the array entry
+        if self._ids is not None:
+            i = bisect_left(self._ids, itemId)
+            if (i < len(self._ids)) and (self._ids[i] == itemId):
+                del self._ids[i]
+                self.count -= 1
+
+            return
+
+        # Clear the bit
+        key = itemId >> _CHUNK_SHIFT
+        chunk = self._chunks.get(key, None)
+        offset = itemId & _CHUNK_MASK
+        bit = 1 << (offset & 7)
+        if (chunk is None) or not (chunk[offset >> 3] & bit):
+            return
+
+        chunk[offset >> 3] &= ~bit & 0xFF
+        self.count -= 1
+
+        # Drop empty chunks
+        chunkCount = self._chunkCounts[key] - 1
+        if chunkCount:
+            self._chunkCounts[key] = chunkCount
+        else:
+            del self._chunks[key]
+            del self._chunkCounts[key]
+
+        if self.count < (_ARRAY_LIMIT // 2):
+            self._toSparse()
+
+    def ids(self) -> list[int]:
+        """
+        Returns the sorted list of ids.
+        """
+        if self._ids is not None:
+            return self._ids.tolist()
+
+        ids = []
+        for key in self.chunkKeys():
+            ids.extend(LibAlexFlagIndex._chunkIds(key, self.chunkBits(key)))
+
+        return ids
+
+    def chunkKeys(self) -> list[int]:
+        """
+        Returns the sorted numbers of the chunks holding ids.
+        """
+        if self._ids is not None:
+            return sorted({i >> _CHUNK_SHIFT for i in self._ids})
+
+        return sorted(self._chunks)
+
+    def chunkBits(self, key: int) -> int:
+        """
+        Returns the ids of a chunk as an `int` bitmap relative to the start of the chunk.
+
+        key: The chunk number.
+        """
+        if self._ids is not None:
+            base = key << _CHUNK_SHIFT
+            start = bisect_left(self._ids, base)
+            end = bisect_left(self._ids, base + (1 << _CHUNK_SHIFT), lo=start)
+            return LibAlexFlagIndex._idsToChunk(self._ids[start:end], base)
+
+        chunk = self._chunks.get(key, None)
+        return (int.from_bytes(chunk, "little") if chunk is not None else 0)
+
+    # Private Functions
+    def _toDense(self):
+        """
+        Converts sparse postings into chunked bitmaps.
+        """
+        ids = self._ids
+        self._ids = None
+        self._chunks = {}
+        self._chunkCounts = {}
+        self.count = 0
+        for itemId in ids:
+            self.add(itemId)
+
+    def _toSparse(self):
+        """
+        Converts chunked bitmaps into sparse postings.
+        """
+        ids = self.ids()
+        self._ids = array("I", ids)
+        self._chunks = None
+        self._chunkCounts = None
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,218 @@
+# LibAlexandria: LibAlexandria Inotify Watcher
+# A minimal `ctypes` binding to Linux inotify used to find changed directories and files without walking a library.
+
+# Imports
+import os
+import sys
+import errno
+import struct
+import ctypes
+import ctypes.util
+import weakref
+from typing import Optional
+
+# Variables
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+_ENTRY_EVENTS = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+_SELF_EVENTS = IN_DELETE_SELF | IN_MOVE_SELF
+_WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | _ENTRY_EVENTS | _SELF_EVENTS | IN_ONLYDIR
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 65536
+
+# Functions
+def _loadLibc() -> Optional[ctypes.CDLL]:
+    """
+    Loads the C library if it provides inotify.
+
+    Returns the C library or `None` if inotify is not available on this platform.
+    """
+    # Only Linux has inotify
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+
+        libc.inotify_init1.argtypes = (ctypes.c_int, )
+        libc.inotify_init1.restype = ctypes.c_int
+        libc.inotify_add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        libc.inotify_add_watch.restype = ctypes.c_int
+        libc.inotify_rm_watch.argtypes = (ctypes.c_int, ctypes.c_int)
+        libc.inotify_rm_watch.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        return None
+
+    return libc
+
+_LIBC = _loadLibc()
+
+def inotifyAvailable() -> bool:
+    """
+    Returns `True` if inotify can be used on this platform.
+    """
+    return _LIBC is not None
+
+# Classes
+class LibAlexInotify:
+    """
+    Watches a set of directories with inotify and reports which directories and files changed since the last read.
+
+    Inotify is not recursive, so every directory of interest must be watched with `watch(...)`.
+    The file descriptor is non-blocking, so `read()` returns immediately when nothing has changed.
+    It is released by `close()`, when a `with` block ends, or at the latest when the watcher is garbage collected, so dropped watchers do not leak their watches.
+    """
+    # Constructors
+    def __init__(self):
+        """
+        Creates a new inotify watcher.
+        If inotify is not available or cannot be initialized, an `OSError` will be raised.
+        """
+        # Check for inotify
+        if _LIBC is None:
+            raise OSError(errno.ENOSYS, "Inotify is not available on this platform.")
+
+        # Open the inotify instance
+        fd = _LIBC.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"Could not initialize inotify: {os.strerror(err)}")
+
+        self._fd = fd
+        self._finalizer = weakref.finalize(self, os.close, fd)
+        self._dirPaths: dict[int, str] = {}
+        self._watches: dict[str, int] = {}
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self._watches)
+
+    def __contains__(self, dirPath: str) -> bool:
+        return dirPath in self._watches
+
+    def __enter__(self) -> 'LibAlexInotify':
+        return self
+
+    def __exit__(self, *excInfo):
+        self.close()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(watches={len(self._watches)})"
+
+    # Functions
+    def watch(self, dirPath: str):
+        """
+        Starts watching the provided directory for changes to its entries.
+        If the watch cannot be added, for example because the watch limit was reached, an `OSError` will be raised.
+
+        dirPath: The absolute path to the directory.
+        """
+        # Check if the directory is already watched
+        if dirPath in self._watches:
+            return
+
+        # Add the watch
+        wd = _LIBC.inotify_add_watch(self._fd, os.fsencode(dirPath), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"Could not watch the directory at \"{dirPath}\": {os.strerror(err)}")
+
+        self._dirPaths[wd] = dirPath
+        self._watches[dirPath] = wd
+
+    def unwatch(self, dirPath: str):
+        """
+        Stops watching the provided directory.
+
+        dirPath: The absolute path to the directory.
+        """
+        wd = self._watches.pop(dirPath, None)
+        if wd is not None:
+            del self._dirPaths[wd]
+            _LIBC.inotify_rm_watch(self._fd, wd)
+
+    def read(self) -> tuple[set[str], set[str], bool]:
+        """
+        Reads every change reported since the last read without blocking.
+
+        Returns a tuple of:
+        The set of directories whose entries were created, deleted, or renamed, including watched directories that were removed themselves.
+        The set of files that were created, modified, or removed.
+        `True` if the kernel queue overflowed and changes may have been lost.
+        """
+        dirtyDirs: set[str] = set()
+        dirtyFiles: set[str] = set()
+        overflowed = False
+
+        # Drain the queue
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+
+            if not data:
+                break
+
+            # Decode each event
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, nameLength = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + nameLength].rstrip(b"\0")
+                offset += nameLength
+
+                # Check for lost events
+                if mask & IN_Q_OVERFLOW:
+                    overflowed = True
+                    continue
+
+                dirPath = self._dirPaths.get(wd, None)
+                if dirPath is None:
+                    continue
+
+                # Forget watches removed by the kernel
+                if mask & IN_IGNORED:
+                    del self._dirPaths[wd]
+                    self._watches.pop(dirPath, None)
+                    continue
+
+                # Sort out the change
+                if mask & _SELF_EVENTS:
+                    dirtyDirs.add(dirPath)
+                    continue
+
+                if mask & _ENTRY_EVENTS:
+                    dirtyDirs.add(dirPath)
+
+                if name and not (mask & IN_ISDIR):
+                    dirtyFiles.add(os.path.join(dirPath, os.fsdecode(name)))
+
+        return (dirtyDirs, dirtyFiles, overflowed)
+
+    def close(self):
+        """
+        Stops watching every directory and releases the inotify instance.
+        """
+        if self._fd >= 0:
+            self._finalizer()
+            self._fd = -1
+            self._dirPaths.clear()
+            self._watches.clear()
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,243 @@
+# LibAlexandria: LibAlexandria Instrumentation
+# Opt-in per-phase timing of LibAlexandria Item loading.
+
+# Imports
+import threading
+from array import array
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Callable, Iterator, Optional
+
+# Variables
+_stats: Optional['LibAlexStats'] = None
+_local = threading.local()
+
+# Classes
+class LibAlexStats:
+    """
+    Collects the call counts and timings of instrumented phases.
+
+    Phases are named by what they spend time on, like `item.parseJson`, and phases spent in a system call are prefixed with `syscall.`.
+    Timings are kept as nanosecond samples so percentiles can be reported.
+    """
+    # Constructors
+    def __init__(self, callback: Optional[Callable[[str, int], None]] = None):
+        """
+        Creates a new empty stats collector.
+
+        callback: A function called with the phase name and elapsed nanoseconds of every recorded phase or `None`.
+        """
+        self.callback = callback
+
+        self._samples: dict[str, array] = {}
+        self._lock = threading.Lock()
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._samples
+
+    def __str__(self) -> str:
+        return self.report()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(phases={len(self._samples)})"
+
+    # Functions
+    def record(self, name: str, elapsedNs: int):
+        """
+        Records a single run of a phase.
+
+        name: The name of the phase.
+        elapsedNs: The time spent in the phase in nanoseconds.
+        """
+        with self._lock:
+            samples = self._samples.get(name, None)
+            if samples is None:
+                samples = self._samples[name] = array("q")
+
+            samples.append(elapsedNs)
+
+        if self.callback is not None:
+            self.callback(name, elapsedNs)
+
+    def names(self) -> list[str]:
+        """
+        Returns the sorted names of every recorded phase.
+        """
+        return sorted(self._samples)
+
+    def count(self, name: str) -> int:
+        """
+        Returns the number of times the provided phase was recorded.
+
+        name: The name of the phase.
+        """
+        return len(self._samples.get(name, ()))
+
+    def total(self, name: str) -> int:
+        """
+        Returns the cumulative time spent in the provided phase in nanoseconds.
+
+        name: The name of the phase.
+        """
+        return sum(self._samples.get(name, ()))
+
+    def percentile(self, name: str, fraction: float) -> int:
+        """
+        Returns a percentile of the time spent in the provided phase in nanoseconds using the nearest rank.
+        If the phase was never recorded, `0` is returned.
+
+        name: The name of the phase.
+        fraction: The percentile as a fraction between `0` and `1`.
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(name, ()))
+
+        if not samples:
+            return 0
+
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Summarizes every recorded phase.
+
+        Returns a dictionary of phase names to dictionaries of the call count, total milliseconds, mean microseconds, and latency percentiles in microseconds.
+        """
+        # Snapshot the samples
+        with self._lock:
+            allSamples = {name: sorted(samples) for name, samples in self._samples.items()}
+
+        summary = {}
+        for name in sorted(allSamples):
+            samples = allSamples[name]
+            total = sum(samples)
+            summary[name] = {
+                "calls": len(samples),
+                "totalMs": total / 1e6,
+                "meanUs": (total / len(samples)) / 1e3,
+                "p50us": samples[min(len(samples) - 1, int(0.50 * len(samples)))] / 1e3,
+                "p90us": samples[min(len(samples) - 1, int(0.90 * len(samples)))] / 1e3,
+                "p99us": samples[min(len(samples) - 1, int(0.99 * len(samples)))] / 1e3
+            }
+
+        return summary
+
+    def report(self) -> str:
+        """
+        Returns the summary as a table sorted by total time.
+        """
+        lines = [f"{'Phase':<26}{'Calls':>10}{'Total ms':>12}{'Mean us':>10}{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}"]
+        for name, result in sorted(self.summary().items(), key=lambda s: -s[1]["totalMs"]):
+            lines.append(
+                f"{name:<26}{result['calls']:>10,}{result['totalMs']:>12.1f}{result['meanUs']:>10.1f}"
+                f"{result['p50us']:>10.1f}{result['p90us']:>10.1f}{result['p99us']:>10.1f}"
+            )
+
+        return "\n".join(lines)
+
+    def reset(self):
+        """
+        Removes every recorded sample.
+        """
+        with self._lock:
+            self._samples.clear()
+
+# Functions
+def _noStart():
+    """
+    Does nothing while instrumentation is disabled.
+    """
+    pass
+
+def _noLap(name: str):
+    """
+    Does nothing while instrumentation is disabled.
+    """
+    pass
+
+def _timedStart():
+    """
+    Starts timing the first phase of an instrumented function on this thread.
+    """
+    _local.last = perf_counter_ns()
+
+def _timedLap(name: str):
+    """
+    Records the time since the previous lap or start on this thread as the provided phase.
+
+    name: The name of the phase that just ended.
+    """
+    now = perf_counter_ns()
+    last = getattr(_local, "last", None)
+    stats = _stats
+    if (last is not None) and (stats is not None):
+        stats.record(name, now - last)
+
+    # Leave the bookkeeping out of the next phase
+    _local.last = perf_counter_ns()
+
+start: Callable[[], None] = _noStart
+lap: Callable[[str], None] = _noLap
+
+def enable(stats: Optional[LibAlexStats] = None) -> LibAlexStats:
+    """
+    Starts recording the phases of every instrumented function.
+
+    stats: The collector to record into or `None` to create one.
+
+    Returns the collector in use.
+    """
+    global _stats, start, lap
+
+    _stats = (stats if stats is not None else LibAlexStats())
+    start = _timedStart
+    lap = _timedLap
+
+    return _stats
+
+def disable() -> Optional[LibAlexStats]:
+    """
+    Stops recording phases. Instrumented functions go back to calling no-op hooks.
+
+    Returns the collector that was in use or `None`.
+    """
+    global _stats, start, lap
+
+    stats = _stats
+    _stats = None
+    start = _noStart
+    lap = _noLap
+
+    return stats
+
+def getStats() -> Optional[LibAlexStats]:
+    """
+    Returns the collector in use or `None` if instrumentation is disabled.
+    """
+    return _stats
+
+@contextmanager
+def collect(stats: Optional[LibAlexStats] = None) -> Iterator[LibAlexStats]:
+    """
+    Records phases only within a `with` block and restores the previous state afterwards.
+
+    stats: The collector to record into or `None` to create one.
+
+    Yields the collector in use.
+    """
+    previous = _stats
+    try:
+        yield enable(stats)
+    finally:
+        if previous is not None:
+            enable(previous)
+        else:
+            disable()
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -3,12 +3,20 @@
 
 # Imports
 import os
-import json
+import shutil
+import asyncio
+import tempfile
+from concurrent.futures import Executor
+from functools import partial
 from typing import Optional, Any
 from warnings import warn
 
 import libAlexDefaults as laShared
+import libAlexJson as laJson
+import libAlexInstrumentation as laInst
 from libAlexRelatedFile import LibAlexRelatedFile
+from libAlexPathValidator import LibAlexPathValidator
+from libAlexPathTrie import LibAlexFlagTrie
 from libAlexSemanticVersion import SemanticVersion
 
 # Classes
@@ -16,6 +24,25 @@ class LibAlexItem:
     """
     A LibAlexandria Item representing the information for the provided directory's meta file and content.
     """
+    # Variables
+    V1_DEPRECATION = "DEPRECATED: Version `1.*` Meta files should be converted to Version `2.*` for increased compatibility and functionality!"
+
+    # Slots
+    __slots__ = (
+        "version",
+        "title",
+        "author",
+        "date",
+        "description",
+        "directory",
+        "sourceFile",
+        "relatedFiles",
+        "metaFilepath",
+        "classification",
+        "flags",
+        "resolvedFlags"
+    )
+
     # Constructors
     def __init__(self,
         version: Optional[SemanticVersion] = None,
@@ -61,58 +88,102 @@ class LibAlexItem:
         self.resolvedFlags = resolvedFlags
 
     @classmethod
-    def fromMetaFile(cls, metaPath: str) -> 'LibAlexItem':
+    def fromMetaFile(cls,
+        metaPath: str,
+        validator: Optional[LibAlexPathValidator] = None,
+        deferValidation: bool = False,
+        flagTrie: Optional[LibAlexFlagTrie] = None
+    ) -> 'LibAlexItem':
         """
         Loads a LibAlexandria Item from the provided `meta.json` format file.
         If the operation fails, a `FileNotFoundError`, `json.JSONDecodeError`, or `ValueError` may be raised.
 
         metaPath: The path to the `meta.json` format file.
+        validator: A `LibAlexPathValidator` to answer existence checks from shared directory listings or `None` to check each path directly.
+        deferValidation: If `True`, the meta, source, and related files are not checked for existence and `validate()` should be called later.
+        flagTrie: A `LibAlexFlagTrie` shared between loads to resolve directory flags once per directory or `None` to resolve them for this item alone.
         """
         # Manage paths
+        laInst.start()
         metaPath = laShared.fullpath(metaPath)
         dirPath = os.path.dirname(metaPath)
+        laInst.lap("item.resolvePath")
 
         # Verify the paths exist
-        if not os.path.isdir(dirPath):
-            # Fail
-            raise FileNotFoundError(f"No directory present to load from at: {dirPath}")
+        if not deferValidation:
+            # Pick how to check
+            isDir = (validator.isDir if validator is not None else os.path.isdir)
+            isFile = (validator.isFile if validator is not None else os.path.isfile)
 
-        if not os.path.isfile(metaPath):
-            # Check if the user doesn't read documentation
-            if os.path.isfile(os.path.join(metaPath, "meta.json")):
-                # Correct the meta path
-                metaPath = os.path.join(metaPath, "meta.json")
-                dirPath = os.path.dirname(metaPath)
-            else:
+            if not isDir(dirPath):
                 # Fail
-                raise FileNotFoundError(f"No meta file was present at: {metaPath}")
+                raise FileNotFoundError(f"No directory present to load from at: {dirPath}")
 
-        # Resolve additional flags from the directory structure
-        resolvedFlags = [laShared.slugify(t) for t in (dirPath.split(os.sep)[1:])]
+            if not isFile(metaPath):
+                # Check if the user doesn't read documentation
+                if isFile(os.path.join(metaPath, laShared.META_FILENAME)):
+                    # Correct the meta path
+                    metaPath = os.path.join(metaPath, laShared.META_FILENAME)
+                    dirPath = os.path.dirname(metaPath)
+                else:
+                    # Fail
+                    raise FileNotFoundError(f"No meta file was present at: {metaPath}")
+
+            laInst.lap("syscall.stat" if validator is None else "item.validatorLookup")
 
         # Read the meta file
         try:
-            with open(metaPath, "r") as metaFile:
-                # Load the meta json data
-                metaJson: dict[str, Any] = json.load(metaFile)
-        except json.JSONDecodeError as e:
-            # Fail
-            raise ValueError(f"Could not parse JSON from the provided meta file: {metaPath}\n\nCause: {e}")
+            metaJson = cls._readMetaFile(metaPath)
+        except IsADirectoryError:
+            # Check if the user doesn't read documentation
+            metaPath = os.path.join(metaPath, laShared.META_FILENAME)
+            dirPath = os.path.dirname(metaPath)
+            metaJson = cls._readMetaFile(metaPath)
+
+        # Resolve additional flags from the directory structure
+        if flagTrie is not None:
+            resolvedFlags = flagTrie.resolveFlags(dirPath)
+        else:
+            resolvedFlags = [laShared.slugifyCached(t) for t in (dirPath.split(os.sep)[1:])]
+
+        laInst.lap("item.resolveFlags")
 
         # Load from the JSON
         return cls.fromJson(
             metaJson,
             directory=dirPath,
             metaFilepath=metaPath,
-            resolvedFlags=resolvedFlags
+            resolvedFlags=resolvedFlags,
+            validator=validator,
+            deferValidation=deferValidation
         )
 
+    @classmethod
+    async def fromMetaFileAsync(cls,
+        metaPath: str,
+        executor: Optional[Executor] = None,
+        **loadArgs
+    ) -> 'LibAlexItem':
+        """
+        Loads a LibAlexandria Item from the provided `meta.json` format file without blocking the running event loop.
+        The blocking reads and checks of `fromMetaFile(...)` run in the provided executor.
+        If the operation fails, the errors of `fromMetaFile(...)` may be raised.
+
+        metaPath: The path to the `meta.json` format file.
+        executor: The executor to run the load in or `None` to use the event loop's default executor.
+        loadArgs: Additional keyword arguments passed to `fromMetaFile(...)`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(cls.fromMetaFile, metaPath, **loadArgs))
+
     @classmethod
     def fromJson(cls,
         jsonData: dict[str, Any],
         directory: Optional[str] = laShared.DEF_ITEM_DIR,
         metaFilepath: Optional[str] = laShared.DEF_ITEM_META_PATH,
-        resolvedFlags: Optional[list[str]] = laShared.DEF_ITEM_RES_FLAGS
+        resolvedFlags: Optional[list[str]] = laShared.DEF_ITEM_RES_FLAGS,
+        validator: Optional[LibAlexPathValidator] = None,
+        deferValidation: bool = False
     ) -> 'LibAlexItem':
         """
         Loads a LibAlexandria Item from the provided JSON data.
@@ -122,55 +193,113 @@ class LibAlexItem:
         directory: An absolute path to the directory where the item is located.
         metaFilepath: An absolute path to the meta file of the item.
         resolvedFlags: Any additional resolved flags to add to the item.
+        validator: A `LibAlexPathValidator` to answer existence checks from or `None` to check each path directly.
+        deferValidation: If `True`, the source and related files are not checked for existence.
 
         Returns a new LibAlexandria Item.
         """
         # Get the version or fail
+        laInst.start()
         dataVersion = cls.versionFromJson(jsonData)
+        laInst.lap("item.parseVersion")
 
         # Pack the args
         packedArgs = {
             "jsonData": jsonData,
             "directory": directory,
             "metaFilepath": metaFilepath,
-            "resolvedFlags": resolvedFlags
+            "resolvedFlags": resolvedFlags,
+            "validator": validator,
+            "deferValidation": deferValidation
         }
 
         # Check the version
         if dataVersion.major == 2:
-            return cls._fromV2Json(**packedArgs)
+            return cls._fromV2Json(**packedArgs, version=dataVersion)
         elif dataVersion.major == 1:
             return cls._fromV1Json(**packedArgs)
         else:
             # Fail
             raise ValueError(f"\"{dataVersion.string}\" is not a supported version of LibAlexandria Metadata file.")
 
+    @classmethod
+    def fromRecord(cls, record: tuple) -> 'LibAlexItem':
+        """
+        Rebuilds a LibAlexandria Item from a record created by `toRecord()`.
+        No files are read or checked for existence.
+
+        record: The record to rebuild from.
+
+        Returns a new LibAlexandria Item.
+        """
+        # Unpack the record
+        (
+            version, title, author, date, description, directory, sourceFile,
+            relatedFiles, metaFilepath, classification, flags, resolvedFlags
+        ) = record
+
+        # Build the object
+        return cls(
+            version=(SemanticVersion.fromString(version) if version is not None else None),
+            title=title,
+            author=author,
+            date=date,
+            description=description,
+            directory=directory,
+            sourceFile=sourceFile,
+            relatedFiles=([LibAlexRelatedFile.fromRecord(rf) for rf in relatedFiles] if relatedFiles is not None else None),
+            metaFilepath=metaFilepath,
+            classification=classification,
+            flags=(list(flags) if flags is not None else None),
+            resolvedFlags=(list(resolvedFlags) if resolvedFlags is not None else None)
+        )
+
     @classmethod
     def versionFromJson(cls, jsonData: dict[str, Any]) -> SemanticVersion:
         """
         Extracts the version of the provided JSON data.
-        If a version is not found, a `ValueError` may be raised.
+        If the data is not a JSON object or a valid version string is not found, a `ValueError` will be raised.
 
         jsonData: The JSON data to extract the version from.
 
         Returns a SemanticVersion object.
         """
+        # Check the shape
+        if not isinstance(jsonData, dict):
+            # Fail
+            raise ValueError(f"Provided LibAlexandria Metadata must be a JSON object, not {type(jsonData).__name__}.")
+
         # Extract the version code
         dataVersion = jsonData.get("_infover", None)
 
         # Check for validity
-        if dataVersion != None:
-            return SemanticVersion(dataVersion)
-        else:
+        if dataVersion == None:
             # Fail
             raise ValueError(f"Provided LibAlexandria Metadata file does not provide a version using the `_infover` key.")
 
+        if not isinstance(dataVersion, str):
+            # Fail
+            raise ValueError(f"The `_infover` key of a LibAlexandria Metadata file must be a version string, not {type(dataVersion).__name__}.")
+
+        if not dataVersion.strip():
+            # Fail
+            raise ValueError("The `_infover` key of a LibAlexandria Metadata file must not be empty.")
+
+        version = SemanticVersion.fromString(dataVersion)
+        if not version.isValid:
+            # Fail
+            raise ValueError(f"The `_infover` key of a LibAlexandria Metadata file is not a valid version: \"{dataVersion}\"")
+
+        return version
+
     @classmethod
     def _fromV1Json(cls,
         jsonData: dict[str, Any],
         directory: Optional[str] = laShared.DEF_ITEM_DIR,
         metaFilepath: Optional[str] = laShared.DEF_ITEM_META_PATH,
-        resolvedFlags: Optional[list[str]] = laShared.DEF_ITEM_RES_FLAGS
+        resolvedFlags: Optional[list[str]] = laShared.DEF_ITEM_RES_FLAGS,
+        validator: Optional[LibAlexPathValidator] = None,
+        deferValidation: bool = False
     ) -> 'LibAlexItem':
         """
         Loads a LibAlexandria Item from the provided `v1.*` JSON data.
@@ -180,34 +309,52 @@ class LibAlexItem:
         directory: An absolute path to the directory where the item is located.
         metaFilepath: An absolute path to the meta file of the item.
         resolvedFlags: Any additional resolved flags to add to the item.
+        validator: A `LibAlexPathValidator` to answer existence checks from or `None` to check each path directly.
+        deferValidation: If `True`, the source file is not checked for existence.
 
         Returns a new LibAlexandria Item.
         """
         # Tell them off
-        warn("DEPRECATED: Version `1.*` Meta files should be converted to Version `2.*` for increased compatibility and functionality!")
+        warn(cls.V1_DEPRECATION)
 
         # Mock v2 style data
         return cls._fromV2Json(
-            {
-                "_infover": f"1.0.0+mockedv2",
-                "title": jsonData.get("title", laShared.DEF_TITLE),
-                "author": jsonData.get("author", laShared.DEF_AUTHOR),
-                "date": jsonData.get("date", laShared.DEF_DATE),
-                "sourceFile": jsonData.get("content", laShared.DEF_SRC_FILE),
-                "flags": jsonData.get("flags", laShared.DEF_FLAGS),
-                "description": jsonData.get("description", laShared.DEF_DESC)
-            },
+            cls._mockV2Json(jsonData),
             directory=directory,
             metaFilepath=metaFilepath,
-            resolvedFlags=resolvedFlags
+            resolvedFlags=resolvedFlags,
+            validator=validator,
+            deferValidation=deferValidation
         )
 
+    @staticmethod
+    def _mockV2Json(jsonData: dict[str, Any]) -> dict[str, Any]:
+        """
+        Maps the fields of `v1.*` JSON data onto their `v2.*` keys.
+
+        jsonData: The `v1.*` JSON data.
+
+        Returns the `v2.*` style JSON data.
+        """
+        return {
+            "_infover": f"1.0.0+mockedv2",
+            "title": jsonData.get("title", laShared.DEF_TITLE),
+            "author": jsonData.get("author", laShared.DEF_AUTHOR),
+            "date": jsonData.get("date", laShared.DEF_DATE),
+            "sourceFile": jsonData.get("content", laShared.DEF_SRC_FILE),
+            "flags": jsonData.get("flags", laShared.DEF_FLAGS),
+            "description": jsonData.get("description", laShared.DEF_DESC)
+        }
+
     @classmethod
     def _fromV2Json(cls,
         jsonData: dict[str, Any],
         directory: Optional[str] = laShared.DEF_ITEM_DIR,
         metaFilepath: Optional[str] = laShared.DEF_ITEM_META_PATH,
-        resolvedFlags: Optional[list[str]] = laShared.DEF_ITEM_RES_FLAGS
+        resolvedFlags: Optional[list[str]] = laShared.DEF_ITEM_RES_FLAGS,
+        version: Optional[SemanticVersion] = None,
+        validator: Optional[LibAlexPathValidator] = None,
+        deferValidation: bool = False
     ) -> 'LibAlexItem':
         """
         Loads a LibAlexandria Item from the provided `v2.*` JSON data.
@@ -217,50 +364,37 @@ class LibAlexItem:
         directory: An absolute path to the directory where the item is located.
         metaFilepath: An absolute path to the meta file of the item.
         resolvedFlags: Any additional resolved flags to add to the item.
+        version: The already parsed version of the JSON data or `None` to parse it from `_infover`.
+        validator: A `LibAlexPathValidator` to answer existence checks from or `None` to check each path directly.
+        deferValidation: If `True`, the source and related files are not checked for existence.
 
         Returns a new LibAlexandria Item.
         """
         # Resolve the source file
-        sourceFile = jsonData.get("sourceFile", laShared.DEF_SRC_FILE)
-        if (sourceFile != laShared.DEF_SRC_FILE) and isinstance(sourceFile, str):
-            # Build the full path
-            sourceFile = os.path.join(directory, sourceFile)
-
-            # Check if the source file exists
-            if not os.path.isfile(sourceFile):
-                # Fail
-                raise FileNotFoundError(f"Provided source filepath could not be resolved: {sourceFile}")
+        sourceFile = cls._resolveSourceFile(
+            jsonData.get("sourceFile", laShared.DEF_SRC_FILE),
+            directory,
+            validator=validator,
+            deferValidation=deferValidation
+        )
+        laInst.lap("item.sourceFile")
 
         # Resolve related files
-        relatedFilesData = jsonData.get("otherFiles", laShared.DEF_REL_FILES)
-        if (relatedFilesData != laShared.DEF_REL_FILES) and isinstance(relatedFilesData, list):
-            # Populate the related files list
-            relatedFiles = []
-            rfData: dict[str, Any]
-            for rfData in relatedFilesData:
-                # Resolve the full filepath
-                relatedFilePath = rfData.get("path", laShared.DEF_REL_FILE_PATH)
-                if relatedFilePath != laShared.DEF_REL_FILE_PATH:
-                    relatedFilePath = os.path.join(directory, relatedFilePath)
-
-                # Record the related file
-                try:
-                    relatedFile = LibAlexRelatedFile(
-                        rfData.get("label", laShared.DEF_REL_FILE_LABEL),
-                        relatedFilePath,
-                        rfData.get("description", laShared.DEF_REL_FILE_DESC),
-                        rfData.get("id", laShared.DEF_REL_FILE_ID)
-                    )
-                    relatedFiles.append(relatedFile)
-                except FileNotFoundError as e:
-                    raise FileNotFoundError(f"Failed to load a Related File because:\n{e}")
-        else:
-            # No data
-            relatedFiles = relatedFilesData
+        relatedFiles = cls._resolveRelatedFiles(
+            jsonData.get("otherFiles", laShared.DEF_REL_FILES),
+            directory,
+            validator=validator,
+            deferValidation=deferValidation
+        )
+        laInst.lap("item.relatedFiles")
+
+        # Parse the version if it was not provided
+        if version is None:
+            version = cls.versionFromJson(jsonData)
 
         # Build the object
-        return cls(
-            version=cls.versionFromJson(jsonData),
+        item = cls(
+            version=version,
             title=jsonData.get("title", laShared.DEF_TITLE),
             author=jsonData.get("author", laShared.DEF_AUTHOR),
             date=jsonData.get("date", laShared.DEF_DATE),
@@ -273,13 +407,160 @@ class LibAlexItem:
             flags=jsonData.get("flags", laShared.DEF_FLAGS),
             resolvedFlags=resolvedFlags
         )
+        laInst.lap("item.construct")
+
+        return item
+
+    @classmethod
+    def _resolveSourceFile(cls,
+        sourceFile: Any,
+        directory: Optional[str],
+        validator: Optional[LibAlexPathValidator] = None,
+        deferValidation: bool = False
+    ) -> Optional[str]:
+        """
+        Resolves the `sourceFile` value of `v2.*` JSON data into an absolute path.
+        If the value is not a string, a `ValueError` will be raised.
+        If the source file does not exist, a `FileNotFoundError` will be raised.
+
+        sourceFile: The `sourceFile` value of the JSON data.
+        directory: An absolute path to the directory where the item is located.
+        validator: A `LibAlexPathValidator` to answer the existence check from or `None` to check the path directly.
+        deferValidation: If `True`, the source file is not checked for existence.
+
+        Returns the absolute path to the source file or `None`.
+        """
+        if sourceFile == "":
+            # Written by `toJson()` for items without a source file
+            return laShared.DEF_SRC_FILE
+
+        if (sourceFile != laShared.DEF_SRC_FILE) and not isinstance(sourceFile, str):
+            # Fail
+            raise ValueError(f"The `sourceFile` of a LibAlexandria Metadata file must be a string, not {type(sourceFile).__name__}.")
+
+        if sourceFile != laShared.DEF_SRC_FILE:
+            # Build the full path
+            sourceFile = os.path.join(directory, sourceFile)
+
+            # Check if the source file exists
+            if not deferValidation:
+                cls._validateSourceFile(sourceFile, validator)
+
+        return sourceFile
+
+    @staticmethod
+    def _resolveRelatedFiles(
+        relatedFilesData: Any,
+        directory: Optional[str],
+        validator: Optional[LibAlexPathValidator] = None,
+        deferValidation: bool = False
+    ) -> Optional[list[LibAlexRelatedFile]]:
+        """
+        Resolves the `otherFiles` value of `v2.*` JSON data into Related Files.
+        If an entry is not a JSON object with a string path, a `ValueError` will be raised.
+        If a related file does not exist, a `FileNotFoundError` will be raised.
+
+        relatedFilesData: The `otherFiles` value of the JSON data.
+        directory: An absolute path to the directory where the item is located.
+        validator: A `LibAlexPathValidator` to answer existence checks from or `None` to check each path directly.
+        deferValidation: If `True`, the related files are not checked for existence.
+
+        Returns a list of `LibAlexRelatedFile` objects or the original value if no list was provided.
+        """
+        # Check for data
+        if (relatedFilesData == laShared.DEF_REL_FILES) or not isinstance(relatedFilesData, list):
+            return relatedFilesData
+
+        # Populate the related files list
+        relatedFiles = []
+        rfData: dict[str, Any]
+        for rfData in relatedFilesData:
+            # Check the shape
+            if not isinstance(rfData, dict):
+                # Fail
+                raise ValueError(f"Each entry of `otherFiles` in a LibAlexandria Metadata file must be a JSON object, not {type(rfData).__name__}.")
+
+            # Resolve the full filepath
+            relatedFilePath = rfData.get("path", laShared.DEF_REL_FILE_PATH)
+            if (relatedFilePath != laShared.DEF_REL_FILE_PATH) and not isinstance(relatedFilePath, str):
+                # Fail
+                raise ValueError(f"The `path` of a Related File must be a string, not {type(relatedFilePath).__name__}.")
+
+            if relatedFilePath != laShared.DEF_REL_FILE_PATH:
+                relatedFilePath = os.path.join(directory, relatedFilePath)
+
+            # Record the related file
+            try:
+                relatedFile = LibAlexRelatedFile(
+                    rfData.get("label", laShared.DEF_REL_FILE_LABEL),
+                    relatedFilePath,
+                    rfData.get("description", laShared.DEF_REL_FILE_DESC),
+                    rfData.get("id", laShared.DEF_REL_FILE_ID),
+                    validate=False
+                )
+
+                if not deferValidation:
+                    relatedFile.validate(validator)
+
+                relatedFiles.append(relatedFile)
+            except FileNotFoundError as e:
+                raise FileNotFoundError(f"Failed to load a Related File because:\n{e}")
+
+        return relatedFiles
+
+    @classmethod
+    def _readMetaFile(cls, metaPath: str) -> dict[str, Any]:
+        """
+        Reads and parses the provided meta file.
+        If the operation fails, a `FileNotFoundError` or `ValueError` may be raised.
+
+        metaPath: The absolute path to the meta file.
+
+        Returns the parsed JSON data.
+        """
+        # Read the raw data
+        laInst.start()
+        with open(metaPath, "rb") as metaFile:
+            laInst.lap("syscall.open")
+            metaData = metaFile.read()
+
+        laInst.lap("syscall.read")
+
+        # Load the meta json data
+        try:
+            metaJson = laJson.loads(metaData)
+        except ValueError as e:
+            # Fail
+            raise ValueError(f"Could not parse JSON from the provided meta file: {metaPath}\n\nCause: {e}")
+
+        laInst.lap("item.parseJson")
+
+        return metaJson
+
+    @staticmethod
+    def _validateSourceFile(sourceFile: str, validator: Optional[LibAlexPathValidator] = None):
+        """
+        Checks that the provided source file exists.
+        If it does not, a `FileNotFoundError` will be raised.
+
+        sourceFile: The absolute path to the source file.
+        validator: A `LibAlexPathValidator` to answer the check from or `None` to check the filesystem directly.
+        """
+        if validator is not None:
+            exists = validator.isFile(sourceFile)
+        else:
+            exists = os.path.isfile(sourceFile)
+
+        if not exists:
+            # Fail
+            raise FileNotFoundError(f"Provided source filepath could not be resolved: {sourceFile}")
 
     # Python Functions
     def __str__(self) -> str:
         return f"{self.title} by {self.author} ({self.date})"
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.__dict__})"
+        return f"{self.__class__.__name__}({laShared.slotValues(self)})"
 
     # Functions
     def getAllFlags(self) -> list:
@@ -300,11 +581,32 @@ class LibAlexItem:
 
         return sorted(tuple(set(allFlags)))
 
+    def validate(self, validator: Optional[LibAlexPathValidator] = None):
+        """
+        Checks that the source file and every related file of the item exist.
+        This completes the checks skipped when loading with `deferValidation`.
+        If a file is missing, a `FileNotFoundError` will be raised.
+
+        validator: A `LibAlexPathValidator` to answer the checks from or `None` to check the filesystem directly.
+        """
+        # Check the source file
+        if isinstance(self.sourceFile, str):
+            self._validateSourceFile(self.sourceFile, validator)
+
+        # Check the related files
+        if isinstance(self.relatedFiles, list):
+            for relatedFile in self.relatedFiles:
+                try:
+                    relatedFile.validate(validator)
+                except FileNotFoundError as e:
+                    raise FileNotFoundError(f"Failed to load a Related File because:\n{e}")
+
     def toJson(self) -> dict[str, Any]:
         """
         Returns the JSON representation of the item in the most recent metadata format.
 
         Filepaths are assumed to be relative to the meta file as specified in the standard.
+        When the item has a directory, filepaths in subdirectories keep their relative path.
         """
         # Build the JSON
         jsonData = {
@@ -321,12 +623,12 @@ class LibAlexItem:
         jsonData["date"] = self.date
 
         if isinstance(self.sourceFile, str):
-            jsonData["sourceFile"] = os.path.basename(self.sourceFile)
+            jsonData["sourceFile"] = laShared.relativePath(self.sourceFile, self.directory)
         else:
             jsonData["sourceFile"] = ""
 
         if isinstance(self.relatedFiles, list):
-            jsonData["otherFiles"] = [rf.toJson() for rf in self.relatedFiles]
+            jsonData["otherFiles"] = [rf.toJson(relativeTo=self.directory) for rf in self.relatedFiles]
         else:
             jsonData["otherFiles"] = []
 
@@ -339,6 +641,105 @@ class LibAlexItem:
 
         return jsonData
 
+    def toRecord(self) -> tuple:
+        """
+        Returns a compact tuple record of every field of the item that can be restored with `fromRecord(...)`.
+
+        Unlike `toJson()`, filepaths are kept absolute and the directory, meta filepath, and resolved flags are included.
+        """
+        return (
+            (self.version.string if isinstance(self.version, SemanticVersion) else None),
+            self.title,
+            self.author,
+            self.date,
+            self.description,
+            self.directory,
+            self.sourceFile,
+            (tuple(rf.toRecord() for rf in self.relatedFiles) if isinstance(self.relatedFiles, list) else None),
+            self.metaFilepath,
+            self.classification,
+            (tuple(self.flags) if isinstance(self.flags, list) else None),
+            (tuple(self.resolvedFlags) if isinstance(self.resolvedFlags, list) else None)
+        )
+
+    def toMetaFile(self, metaPath: Optional[str] = None, skipUnchanged: bool = True) -> bool:
+        """
+        Writes the item to a `meta.json` format file in the most recent metadata format.
+        The file is written to a temporary file first and then renamed into place, so readers never see a partial file.
+
+        metaPath: The path to write to or `None` to overwrite the item's own `metaFilepath`.
+        skipUnchanged: If `True`, nothing is written when the file already holds byte-identical content.
+
+        Returns `True` if the file was written.
+        """
+        # Find the destination
+        if metaPath is None:
+            metaPath = self.metaFilepath
+
+        if metaPath is None:
+            raise ValueError("No meta filepath was provided to write the LibAlexandria Item to.")
+
+        return self._writeMetaJson(laShared.fullpath(metaPath), self.toJson(), skipUnchanged=skipUnchanged)
+
+    # Private Functions
+    @staticmethod
+    def _serializeMetaJson(jsonData: dict[str, Any]) -> bytes:
+        """
+        Serializes JSON data in the layout used for `meta.json` format files.
+
+        jsonData: The JSON data to serialize.
+
+        Returns the file contents.
+        """
+        return (laJson.dumps(jsonData, indent=4) + "\n").encode("utf-8")
+
+    @staticmethod
+    def _writeMetaJson(metaPath: str, jsonData: dict[str, Any], skipUnchanged: bool = True) -> bool:
+        """
+        Atomically writes JSON data to a `meta.json` format file.
+
+        metaPath: The absolute path to write to.
+        jsonData: The JSON data to write.
+        skipUnchanged: If `True`, nothing is written when the file already holds byte-identical content.
+
+        Returns `True` if the file was written.
+        """
+        # Serialize the data
+        metaData = LibAlexItem._serializeMetaJson(jsonData)
+
+        # Check for identical content
+        if skipUnchanged:
+            try:
+                with open(metaPath, "rb") as metaFile:
+                    if metaFile.read() == metaData:
+                        return False
+            except FileNotFoundError:
+                pass
+
+        # Write next to the destination then swap it in
+        tempFd, tempPath = tempfile.mkstemp(prefix=".meta.", suffix=".tmp", dir=os.path.dirname(metaPath))
+        try:
+            with os.fdopen(tempFd, "wb") as tempFile:
+                tempFile.write(metaData)
+
+            # Keep the permissions of the file being replaced
+            try:
+                shutil.copymode(metaPath, tempPath)
+            except OSError:
+                os.chmod(tempPath, 0o644)
+
+            os.replace(tempPath, metaPath)
+        except BaseException:
+            # Clean up the partial file
+            try:
+                os.remove(tempPath)
+            except OSError:
+                pass
+
+            raise
+
+        return True
+
 # Console Execution
 if __name__ == "__main__":
     print("This file cannot be run from the command line.")
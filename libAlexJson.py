@@ -0,0 +1,118 @@
+# LibAlexandria: JSON Backends
+# Selects the fastest installed JSON library for reading and writing LibAlexandria files.
+
+# Imports
+import json
+import importlib
+from typing import Optional, Any, Callable
+
+# Variables
+BACKENDS = ("orjson", "ujson", "json")
+
+_backendName: str = "json"
+_loads: Callable[[Any], Any] = json.loads
+_dumps: Callable[..., str] = json.dumps
+
+# Functions
+def availableBackends() -> list[str]:
+    """
+    Returns the names of every supported JSON backend that is installed, fastest first.
+    """
+    available = []
+    for name in BACKENDS:
+        try:
+            importlib.import_module(name)
+            available.append(name)
+        except ImportError:
+            continue
+
+    return available
+
+def getBackend() -> str:
+    """
+    Returns the name of the JSON backend currently in use.
+    """
+    return _backendName
+
+def setBackend(name: Optional[str] = None):
+    """
+    Selects the JSON backend used by `loads(...)` and `dumps(...)`.
+    If the backend is not supported or not installed, a `ValueError` will be raised.
+
+    name: The name of a backend from `BACKENDS` or `None` to use the fastest installed backend.
+    """
+    global _backendName, _loads, _dumps
+
+    # Pick the fastest backend
+    if name is None:
+        name = availableBackends()[0]
+
+    # Check the backend
+    if name not in BACKENDS:
+        raise ValueError(f"\"{name}\" is not a supported JSON backend. Choose from: {', '.join(BACKENDS)}")
+
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        raise ValueError(f"The \"{name}\" JSON backend is not installed.")
+
+    # Bind the functions
+    if name == "orjson":
+        def orjsonDumps(obj: Any, indent: Optional[int] = None) -> str:
+            if indent is None:
+                return module.dumps(obj).decode("utf-8")
+            elif indent == 2:
+                return module.dumps(obj, option=module.OPT_INDENT_2).decode("utf-8")
+
+            # Only two space indents are supported natively
+            return json.dumps(obj, indent=indent, ensure_ascii=False)
+
+        _loads = module.loads
+        _dumps = orjsonDumps
+    elif name == "ujson":
+        def ujsonDumps(obj: Any, indent: Optional[int] = None) -> str:
+            return module.dumps(obj, indent=(indent or 0), ensure_ascii=False, escape_forward_slashes=False)
+
+        _loads = module.loads
+        _dumps = ujsonDumps
+    else:
+        def jsonDumps(obj: Any, indent: Optional[int] = None) -> str:
+            if indent is None:
+                return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+            return json.dumps(obj, indent=indent, ensure_ascii=False)
+
+        _loads = json.loads
+        _dumps = jsonDumps
+
+    _backendName = name
+
+def loads(data: Any) -> Any:
+    """
+    Parses JSON data with the current backend.
+    If the data is not valid JSON, a `ValueError` will be raised regardless of the backend.
+
+    data: The JSON data as `bytes` or `str`.
+
+    Returns the parsed data.
+    """
+    return _loads(data)
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """
+    Serializes data to a JSON string with the current backend.
+    Non-ASCII characters are written as-is rather than escaped.
+
+    obj: The data to serialize.
+    indent: The number of spaces to indent by or `None` for compact output.
+
+    Returns the JSON string.
+    """
+    return _dumps(obj, indent=indent)
+
+# Setup
+setBackend()
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
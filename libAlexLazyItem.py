@@ -0,0 +1,206 @@
+# LibAlexandria: LibAlexandria Lazy Item
+# A LibAlexandria Item that only resolves its source file, related files, and description when they are first used.
+
+# Imports
+from typing import Any, Optional
+
+import libAlexDefaults as laShared
+import libAlexInstrumentation as laInst
+from libAlexItem import LibAlexItem
+from libAlexRelatedFile import LibAlexRelatedFile
+from libAlexSemanticVersion import SemanticVersion
+from libAlexPathValidator import LibAlexPathValidator
+
+# Variables
+_SOURCE_FILE_SLOT = LibAlexItem.sourceFile
+_RELATED_FILES_SLOT = LibAlexItem.relatedFiles
+_DESCRIPTION_SLOT = LibAlexItem.description
+
+# Classes
+class LibAlexLazyItem(LibAlexItem):
+    """
+    A LibAlexandria Item for listings that only need the header fields of many items.
+
+    Loading parses the meta file and fills in the version, title, author, date, classification, and flags straight away.
+    The source file, related files, and description are kept as raw JSON values and only resolved, including any existence checks, when they are first read.
+    A missing source or related file therefore raises its `FileNotFoundError` from the first read of `sourceFile` or `relatedFiles` instead of from loading.
+    Assigning a deferred field replaces it without resolving it.
+    """
+    # Slots
+    __slots__ = ("_pending", "_validator", "_deferValidation")
+
+    # Constructors
+    def __init__(self, *args, **kwargs):
+        """
+        Creates a new fully resolved LibAlexandria Lazy Item.
+        Takes the same arguments as `LibAlexItem`.
+        """
+        self._pending: Optional[dict[str, Any]] = None
+        self._validator: Optional[LibAlexPathValidator] = None
+        self._deferValidation = False
+
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def _fromV2Json(cls,
+        jsonData: dict[str, Any],
+        directory: Optional[str] = laShared.DEF_ITEM_DIR,
+        metaFilepath: Optional[str] = laShared.DEF_ITEM_META_PATH,
+        resolvedFlags: Optional[list[str]] = laShared.DEF_ITEM_RES_FLAGS,
+        version: Optional[SemanticVersion] = None,
+        validator: Optional[LibAlexPathValidator] = None,
+        deferValidation: bool = False
+    ) -> 'LibAlexLazyItem':
+        """
+        Loads the header fields of a LibAlexandria Lazy Item from the provided `v2.*` JSON data and defers the rest.
+        If the version is missing, a `ValueError` may be raised.
+
+        jsonData: The JSON data to load.
+        directory: An absolute path to the directory where the item is located.
+        metaFilepath: An absolute path to the meta file of the item.
+        resolvedFlags: Any additional resolved flags to add to the item.
+        version: The already parsed version of the JSON data or `None` to parse it from `_infover`.
+        validator: A `LibAlexPathValidator` to answer the deferred existence checks from or `None` to check each path directly.
+        deferValidation: If `True`, the source and related files are not checked for existence when resolved.
+
+        Returns a new LibAlexandria Lazy Item.
+        """
+        # Parse the version if it was not provided
+        if version is None:
+            version = cls.versionFromJson(jsonData)
+
+        # Build the header
+        item = cls(
+            version=version,
+            title=jsonData.get("title", laShared.DEF_TITLE),
+            author=jsonData.get("author", laShared.DEF_AUTHOR),
+            date=jsonData.get("date", laShared.DEF_DATE),
+            directory=directory,
+            metaFilepath=metaFilepath,
+            classification=jsonData.get("classification", laShared.DEF_CLASSIFICATION),
+            flags=jsonData.get("flags", laShared.DEF_FLAGS),
+            resolvedFlags=resolvedFlags
+        )
+
+        # Keep the rest for later
+        item._pending = {
+            "sourceFile": jsonData.get("sourceFile", laShared.DEF_SRC_FILE),
+            "relatedFiles": jsonData.get("otherFiles", laShared.DEF_REL_FILES),
+            "description": jsonData.get("description", laShared.DEF_DESC)
+        }
+        item._validator = validator
+        item._deferValidation = deferValidation
+        laInst.lap("item.construct")
+
+        return item
+
+    # Python Functions
+    def __repr__(self):
+        values = {}
+        for name in LibAlexItem.__slots__:
+            if self.isPending(name):
+                values[name] = "<pending>"
+            else:
+                values[name] = getattr(self, name)
+
+        return f"{self.__class__.__name__}({values})"
+
+    # Properties
+    @property
+    def sourceFile(self) -> Optional[str]:
+        """
+        An absolute path to the primary source file of the item or `None`.
+        """
+        if (self._pending is not None) and ("sourceFile" in self._pending):
+            self.sourceFile = self._resolveSourceFile(
+                self._pending["sourceFile"],
+                self.directory,
+                validator=self._validator,
+                deferValidation=self._deferValidation
+            )
+
+        return _SOURCE_FILE_SLOT.__get__(self)
+
+    @sourceFile.setter
+    def sourceFile(self, value: Optional[str]):
+        _SOURCE_FILE_SLOT.__set__(self, value)
+        self._resolved("sourceFile")
+
+    @property
+    def relatedFiles(self) -> Optional[list[LibAlexRelatedFile]]:
+        """
+        A list of `LibAlexRelatedFile` objects or `None`.
+        """
+        if (self._pending is not None) and ("relatedFiles" in self._pending):
+            self.relatedFiles = self._resolveRelatedFiles(
+                self._pending["relatedFiles"],
+                self.directory,
+                validator=self._validator,
+                deferValidation=self._deferValidation
+            )
+
+        return _RELATED_FILES_SLOT.__get__(self)
+
+    @relatedFiles.setter
+    def relatedFiles(self, value: Optional[list[LibAlexRelatedFile]]):
+        _RELATED_FILES_SLOT.__set__(self, value)
+        self._resolved("relatedFiles")
+
+    @property
+    def description(self) -> str:
+        """
+        A description of the item.
+        """
+        if (self._pending is not None) and ("description" in self._pending):
+            self.description = self._pending["description"]
+
+        return _DESCRIPTION_SLOT.__get__(self)
+
+    @description.setter
+    def description(self, value: str):
+        _DESCRIPTION_SLOT.__set__(self, value)
+        self._resolved("description")
+
+    @property
+    def isResolved(self) -> bool:
+        """
+        `True` once every deferred field has been resolved.
+        """
+        return self._pending is None
+
+    # Functions
+    def isPending(self, name: str) -> bool:
+        """
+        Checks if the provided field has not been resolved yet.
+
+        name: The name of the field like `relatedFiles`.
+        """
+        return (self._pending is not None) and (name in self._pending)
+
+    def resolve(self):
+        """
+        Resolves every deferred field now, for example before handing the item to another thread.
+        If a source or related file is missing, a `FileNotFoundError` will be raised.
+        """
+        self.sourceFile
+        self.relatedFiles
+        self.description
+
+    # Private Functions
+    def _resolved(self, name: str):
+        """
+        Marks a deferred field as resolved and drops the raw JSON once nothing is left to resolve.
+
+        name: The name of the field.
+        """
+        if self._pending is None:
+            return
+
+        self._pending.pop(name, None)
+        if not self._pending:
+            self._pending = None
+            self._validator = None
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
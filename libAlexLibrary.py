@@ -0,0 +1,507 @@
+# LibAlexandria: LibAlexandria Library
+# An in-memory LibAlexandria Library that stays in sync with its directory through incremental refreshes.
+
+# Imports
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Iterable, Optional, Union
+
+import libAlexDefaults as laShared
+from libAlexItem import LibAlexItem
+from libAlexFlagIndex import LibAlexFlagIndex
+from libAlexTextIndex import LibAlexTextIndex
+from libAlexVersionIndex import LibAlexVersionIndex
+from libAlexDateIndex import LibAlexDateIndex
+from libAlexQuery import LibAlexQuery, LibAlexQueryPlanner, LibAlexQueryResult
+from libAlexPathTrie import LibAlexFlagTrie
+from libAlexInotify import LibAlexInotify, inotifyAvailable
+
+# Classes
+class LibAlexLibraryEvent:
+    """
+    A change to a `LibAlexLibrary` found by a refresh.
+    """
+    # Variables
+    ADDED = "added"
+    UPDATED = "updated"
+    REMOVED = "removed"
+
+    # Slots
+    __slots__ = ("kind", "itemId", "metaPath", "item", "previous")
+
+    # Constructors
+    def __init__(self,
+        kind: str,
+        itemId: int,
+        metaPath: str,
+        item: Optional[LibAlexItem] = None,
+        previous: Optional[LibAlexItem] = None
+    ):
+        """
+        Creates a new library event.
+
+        kind: One of `ADDED`, `UPDATED`, or `REMOVED`.
+        itemId: The id of the item in the library.
+        metaPath: The absolute path to the meta file of the item.
+        item: The current item or `None` if it was removed.
+        previous: The item before the change or `None` if it was added.
+        """
+        self.kind = kind
+        self.itemId = itemId
+        self.metaPath = metaPath
+        self.item = item
+        self.previous = previous
+
+    # Python Functions
+    def __str__(self) -> str:
+        return f"{self.kind}: {self.metaPath}"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({laShared.slotValues(self)})"
+
+class LibAlexLibrary:
+    """
+    An in-memory LibAlexandria Library with flag and text indexes that can be refreshed incrementally.
+
+    The library keeps a snapshot of the `(device, inode, mtime_ns, size)` signature of every directory, meta file, source file, and related file.
+    A refresh only re-lists directories whose modification time changed and only reloads items whose files changed, so its cost follows the number of changes rather than the number of items.
+    On Linux, inotify is used when available so unchanged directories and items are not even stat-ed.
+    """
+    # Constructors
+    def __init__(self,
+        rootPath: str,
+        workers: int = laShared.DEF_SCAN_WORKERS,
+        watch: bool = True
+    ):
+        """
+        Creates a new empty library.
+        Call `refresh()` to load it.
+
+        rootPath: The path to the root directory of the library.
+        workers: The maximum number of threads used to load changed items.
+        watch: If `True`, inotify is used to find changes when available. If `False`, every refresh compares stat snapshots.
+        """
+        self.rootPath = laShared.fullpath(rootPath)
+        self.workers = max(1, workers)
+
+        self.items: dict[int, LibAlexItem] = {}
+        self.errors: dict[str, str] = {}
+        self.flagIndex = LibAlexFlagIndex()
+        self.textIndex = LibAlexTextIndex()
+        self.versionIndex = LibAlexVersionIndex()
+        self.dateIndex = LibAlexDateIndex()
+        self.flagTrie = LibAlexFlagTrie()
+
+        self._ids: dict[str, int] = {}
+        self._nextId = 0
+        self._snapshots: dict[str, tuple[tuple[str, ...], tuple]] = {}
+        self._dependents: dict[str, set[str]] = {}
+        self._dirs: dict[str, tuple[int, tuple[str, ...], bool]] = {}
+        self._subscribers: list[Callable[[LibAlexLibraryEvent], None]] = []
+
+        # Start watching
+        self._watcher: Optional[LibAlexInotify] = None
+        if watch and inotifyAvailable():
+            try:
+                self._watcher = LibAlexInotify()
+            except OSError:
+                self._watcher = None
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[LibAlexItem]:
+        return iter(self.items.values())
+
+    def __contains__(self, metaPath: str) -> bool:
+        return laShared.fullpath(metaPath) in self._ids
+
+    def __enter__(self) -> 'LibAlexLibrary':
+        return self
+
+    def __exit__(self, *excInfo):
+        self.close()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(rootPath={self.rootPath!r}, items={len(self.items)}, watching={self.watching})"
+
+    # Properties
+    @property
+    def watching(self) -> bool:
+        """
+        `True` if changes are currently found with inotify.
+        """
+        return self._watcher is not None
+
+    # Functions
+    def subscribe(self, callback: Callable[[LibAlexLibraryEvent], None]):
+        """
+        Calls the provided function with every `LibAlexLibraryEvent` found by later refreshes.
+
+        callback: The function to call.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[LibAlexLibraryEvent], None]):
+        """
+        Stops calling the provided function.
+
+        callback: A function passed to `subscribe(...)`.
+        """
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def itemId(self, metaPath: str) -> Optional[int]:
+        """
+        Returns the id of the item loaded from the provided meta file or `None` if it is not in the library.
+
+        metaPath: The path to the meta file.
+        """
+        return self._ids.get(laShared.fullpath(metaPath), None)
+
+    def getItem(self, itemId: int) -> Optional[LibAlexItem]:
+        """
+        Returns the item with the provided id or `None` if it is not in the library.
+
+        itemId: The id of the item.
+        """
+        return self.items.get(itemId, None)
+
+    def query(self, query: Union[LibAlexQuery, str], pageSize: int = laShared.DEF_QUERY_PAGE_SIZE) -> LibAlexQueryResult:
+        """
+        Finds the items matching the provided query using the indexes of the library.
+        See `LibAlexQuery` for the query syntax.
+
+        query: A `LibAlexQuery` or query text to parse.
+        pageSize: The number of items per page of the result.
+
+        Returns a lazily evaluated `LibAlexQueryResult`.
+        """
+        return LibAlexQueryPlanner.fromLibrary(self).search(query, pageSize=pageSize)
+
+    def refresh(self) -> list[LibAlexLibraryEvent]:
+        """
+        Brings the library in line with its directory.
+        The first refresh loads every item. Later refreshes only reload the items whose files changed and update the indexes for them alone.
+        Items that fail to load are removed from the library and their errors are kept in `errors` until they load again.
+        If the library root does not exist, every item is removed.
+
+        Returns the events of the refresh in the order they were applied. Subscribers have been called with each of them.
+        """
+        # Find the changes
+        if (self._watcher is not None) and self._dirs:
+            dirtyDirs, dirtyFiles, overflowed = self._watcher.read()
+        else:
+            dirtyDirs, dirtyFiles, overflowed = (set(), set(), True)
+
+        if overflowed:
+            # Compare every snapshot
+            addedPaths, removedPaths, listedDirs = self._updateDirs([self.rootPath], force=False)
+            candidates = set(self._snapshots)
+        else:
+            # Only look at what was reported
+            addedPaths, removedPaths, listedDirs = self._updateDirs(dirtyDirs, force=True)
+            candidates = set()
+            for filePath in dirtyFiles:
+                candidates.update(self._dependents.get(filePath, ()))
+
+        # Check the meta files of listed directories and retry failed items there
+        candidates.update(os.path.join(d, laShared.META_FILENAME) for d in listedDirs if self._dirs.get(d, (0, (), False))[2])
+        retryPaths = {p for p in self.errors if os.path.dirname(p) in listedDirs}
+
+        # Find the changed items
+        changedPaths = set()
+        for metaPath in candidates.difference(removedPaths, addedPaths):
+            snapshot = self._snapshots.get(metaPath, None)
+            if (snapshot is not None) and (snapshot != self._snapshot(snapshot[0])):
+                changedPaths.add(metaPath)
+
+        # Load the new and changed items
+        loadPaths = sorted(addedPaths | changedPaths | retryPaths.difference(removedPaths))
+        loaded = self._loadItems(loadPaths)
+
+        # Apply the changes
+        events: list[LibAlexLibraryEvent] = []
+        for metaPath in sorted(removedPaths):
+            self._forget(metaPath, events)
+
+        added: list[tuple[int, LibAlexItem]] = []
+        for metaPath, item in zip(loadPaths, loaded):
+            if isinstance(item, LibAlexItem):
+                self._store(metaPath, item, events, added)
+            else:
+                self._forget(metaPath, events)
+                self.errors[metaPath] = f"{type(item).__name__}: {item}"
+                self._remember(metaPath, (metaPath, ))
+
+        # Index the new items together so sorted indexes are only sorted once
+        self.versionIndex.addMany(added)
+        self.dateIndex.addMany(added)
+
+        # Notify the subscribers
+        for event in events:
+            for callback in list(self._subscribers):
+                callback(event)
+
+        return events
+
+    def close(self):
+        """
+        Stops watching the library directory. Later refreshes compare stat snapshots instead.
+        """
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+    # Private Functions
+    def _updateDirs(self, dirPaths: Iterable[str], force: bool) -> tuple[set[str], set[str], set[str]]:
+        """
+        Re-lists changed directories and records which meta files appeared or disappeared.
+
+        dirPaths: The directories to start from.
+        force: If `True`, only the provided directories and newly found subdirectories are listed. If `False`, every known directory below them is stat-ed and only those whose modification time changed are listed.
+
+        Returns a tuple of the added meta filepaths, the removed meta filepaths, and the directories that were listed.
+        """
+        addedPaths: set[str] = set()
+        removedPaths: set[str] = set()
+        listedDirs: set[str] = set()
+
+        stack = list(dirPaths)
+        while stack:
+            dirPath = stack.pop()
+
+            # Ignore anything outside the library
+            if (dirPath != self.rootPath) and not dirPath.startswith(os.path.join(self.rootPath, "")):
+                continue
+
+            known = self._dirs.get(dirPath, None)
+
+            # Check if the directory still exists
+            try:
+                mtime = os.stat(dirPath).st_mtime_ns
+            except OSError:
+                removedPaths.update(self._dropDirs(dirPath))
+                continue
+
+            # Skip unchanged directories
+            if (not force) and (known is not None) and (known[0] == mtime):
+                stack.extend(known[1])
+                continue
+
+            # Watch before listing so nothing created in between is missed
+            if self._watcher is not None:
+                try:
+                    self._watcher.watch(dirPath)
+                except OSError:
+                    # Fall back to stat snapshots
+                    self.close()
+
+            # List the directory
+            try:
+                with os.scandir(dirPath) as dirIter:
+                    entries = list(dirIter)
+            except OSError:
+                removedPaths.update(self._dropDirs(dirPath))
+                continue
+
+            subDirs = []
+            hasMeta = False
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subDirs.append(entry.path)
+                    elif (entry.name == laShared.META_FILENAME) and entry.is_file():
+                        hasMeta = True
+                except OSError:
+                    # Entry vanished while listing
+                    continue
+
+            listedDirs.add(dirPath)
+
+            # Forget vanished subdirectories
+            if known is not None:
+                for subDir in set(known[1]).difference(subDirs):
+                    removedPaths.update(self._dropDirs(subDir))
+
+            # Check the meta file
+            metaPath = os.path.join(dirPath, laShared.META_FILENAME)
+            hadMeta = (known is not None) and known[2]
+            if hasMeta and not hadMeta:
+                addedPaths.add(metaPath)
+            elif hadMeta and not hasMeta:
+                removedPaths.add(metaPath)
+
+            self._dirs[dirPath] = (mtime, tuple(subDirs), hasMeta)
+
+            # Continue into the subdirectories
+            stack.extend(s for s in subDirs if (not force) or (s not in self._dirs))
+
+        # Settle meta files that both vanished and appeared during the walk
+        touchedPaths = addedPaths | removedPaths
+        addedPaths = set()
+        removedPaths = set()
+        for metaPath in touchedPaths:
+            present = self._dirs.get(os.path.dirname(metaPath), (0, (), False))[2]
+            if present and (metaPath not in self._snapshots):
+                addedPaths.add(metaPath)
+            elif (not present) and (metaPath in self._snapshots):
+                removedPaths.add(metaPath)
+
+        return (addedPaths, removedPaths, listedDirs)
+
+    def _dropDirs(self, dirPath: str) -> list[str]:
+        """
+        Forgets a directory and everything below it.
+
+        dirPath: The absolute path to the directory.
+
+        Returns the meta filepaths that were below it.
+        """
+        prefix = os.path.join(dirPath, "")
+        dropPaths = [p for p in self._dirs if (p == dirPath) or p.startswith(prefix)]
+
+        metaPaths = []
+        for path in dropPaths:
+            if self._dirs.pop(path)[2]:
+                metaPaths.append(os.path.join(path, laShared.META_FILENAME))
+
+            if self._watcher is not None:
+                self._watcher.unwatch(path)
+
+        self.flagTrie.forget(dirPath)
+
+        return metaPaths
+
+    def _loadItems(self, metaPaths: list[str]) -> list:
+        """
+        Loads the provided meta files.
+
+        metaPaths: The absolute paths to the meta files.
+
+        Returns a list holding a `LibAlexItem` or the raised error for each meta file.
+        """
+        if not metaPaths:
+            return []
+
+        # Load small batches in place
+        if (len(metaPaths) == 1) or (self.workers == 1):
+            return [self._loadItem(p) for p in metaPaths]
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(metaPaths))) as executor:
+            return list(executor.map(self._loadItem, metaPaths))
+
+    def _loadItem(self, metaPath: str):
+        """
+        Loads a single meta file.
+
+        metaPath: The absolute path to the meta file.
+
+        Returns the `LibAlexItem` or the raised error. Any error is returned, so a single broken meta file never aborts a refresh.
+        """
+        try:
+            return LibAlexItem.fromMetaFile(metaPath, flagTrie=self.flagTrie)
+        except Exception as e:
+            return e
+
+    def _store(self, metaPath: str, item: LibAlexItem, events: list[LibAlexLibraryEvent], added: list[tuple[int, LibAlexItem]]):
+        """
+        Adds or replaces an item and its index entries.
+        New items are left out of the sorted indexes and appended to `added` so they can be indexed together.
+
+        metaPath: The absolute path to the meta file of the item.
+        item: The loaded item.
+        events: The list to append the resulting event to.
+        added: The list to append `(itemId, item)` tuples of new items to.
+        """
+        self.errors.pop(metaPath, None)
+
+        # Record what the item depends on
+        paths = [metaPath]
+        if isinstance(item.sourceFile, str):
+            paths.append(item.sourceFile)
+
+        if item.relatedFiles is not None:
+            paths.extend(rf.path for rf in item.relatedFiles)
+
+        self._remember(metaPath, tuple(paths))
+
+        # Index the item
+        itemId = self._ids.get(metaPath, None)
+        if itemId is None:
+            itemId = self._nextId
+            self._nextId += 1
+            self._ids[metaPath] = itemId
+            self.flagIndex.add(itemId, item)
+            self.textIndex.add(itemId, item)
+            added.append((itemId, item))
+            events.append(LibAlexLibraryEvent(LibAlexLibraryEvent.ADDED, itemId, metaPath, item=item))
+        else:
+            self.flagIndex.update(itemId, item)
+            self.textIndex.update(itemId, item)
+            self.versionIndex.update(itemId, item)
+            self.dateIndex.update(itemId, item)
+            events.append(LibAlexLibraryEvent(LibAlexLibraryEvent.UPDATED, itemId, metaPath, item=item, previous=self.items[itemId]))
+
+        self.items[itemId] = item
+
+    def _forget(self, metaPath: str, events: list[LibAlexLibraryEvent]):
+        """
+        Removes an item and its index entries.
+
+        metaPath: The absolute path to the meta file of the item.
+        events: The list to append the resulting event to.
+        """
+        self.errors.pop(metaPath, None)
+        self._remember(metaPath, None)
+
+        itemId = self._ids.pop(metaPath, None)
+        if itemId is None:
+            return
+
+        self.flagIndex.remove(itemId)
+        self.textIndex.remove(itemId)
+        self.versionIndex.remove(itemId)
+        self.dateIndex.remove(itemId)
+        events.append(LibAlexLibraryEvent(LibAlexLibraryEvent.REMOVED, itemId, metaPath, previous=self.items.pop(itemId)))
+
+    def _remember(self, metaPath: str, paths: Optional[tuple[str, ...]]):
+        """
+        Replaces the recorded snapshot of the files a meta file depends on.
+
+        metaPath: The absolute path to the meta file.
+        paths: The files the item depends on starting with the meta file or `None` to forget the meta file.
+        """
+        # Forget the previous files
+        previous = self._snapshots.pop(metaPath, None)
+        if previous is not None:
+            for path in previous[0]:
+                dependents = self._dependents.get(path, None)
+                if dependents is not None:
+                    dependents.discard(metaPath)
+                    if not dependents:
+                        del self._dependents[path]
+
+        if paths is None:
+            return
+
+        # Record the current files
+        self._snapshots[metaPath] = self._snapshot(paths)
+        for path in paths:
+            self._dependents.setdefault(path, set()).add(metaPath)
+
+    @staticmethod
+    def _snapshot(paths: tuple[str, ...]) -> tuple[tuple[str, ...], tuple]:
+        """
+        Takes the stat signatures of the provided files.
+
+        paths: The files the item depends on starting with the meta file.
+
+        Returns a tuple of the paths and their signatures.
+        """
+        return (paths, tuple(laShared.fileSignature(p) for p in paths))
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,210 @@
+# LibAlexandria: LibAlexandria Library Migration
+# Converts the `v1.*` meta files of a whole LibAlexandria Library to the most recent metadata format.
+
+# Imports
+import os
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Any, Optional
+
+import libAlexDefaults as laShared
+from libAlexItem import LibAlexItem
+from libAlexScanner import LibAlexScanner
+
+# Variables
+_V1_KEYS = ("_infover", "title", "author", "date", "content", "flags", "description")
+
+# Classes
+class LibAlexMigrationReport:
+    """
+    The outcome of a `LibAlexMigrator` run.
+    """
+    # Constructors
+    def __init__(self):
+        """
+        Creates a new empty report.
+        """
+        self.scanned = 0
+        self.migrated = 0
+        self.unchanged = 0
+        self.skipped = 0
+        self.failed = 0
+        self.errors: list[tuple[str, str]] = []
+        self.warnings: list[tuple[str, str]] = []
+
+    # Python Functions
+    def __str__(self) -> str:
+        return f"{self.scanned} scanned, {self.migrated} migrated, {self.unchanged} unchanged, {self.skipped} skipped, {self.failed} failed"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.__dict__})"
+
+    # Functions
+    def record(self, metaPath: str, status: str, warnings: Optional[list[str]] = None):
+        """
+        Counts the outcome of a single meta file.
+
+        metaPath: The meta file.
+        status: One of `"migrated"`, `"unchanged"`, or `"skipped"`.
+        warnings: Any warnings raised while migrating the meta file.
+        """
+        self.scanned += 1
+        setattr(self, status, getattr(self, status) + 1)
+        self.warnings.extend((metaPath, message) for message in (warnings or ()))
+
+    def recordError(self, metaPath: str, error: Exception):
+        """
+        Counts a meta file that could not be migrated.
+
+        metaPath: The meta file.
+        error: The error raised while migrating it.
+        """
+        self.scanned += 1
+        self.failed += 1
+        self.errors.append((metaPath, f"{type(error).__name__}: {error}"))
+
+class LibAlexMigrator:
+    """
+    Converts the `v1.*` meta files of a LibAlexandria Library to the most recent metadata format in parallel.
+
+    Files are rewritten atomically and files whose converted content is byte-identical to what is on disk are left untouched.
+    Keys that are not part of the metadata format are carried over, and files in a newer format keep their own `_infover` version.
+    Warnings raised for a file, like the `v1.*` deprecation notice, are recorded in the report instead of being emitted.
+    """
+    # Constructors
+    def __init__(self,
+        rootPath: str,
+        workers: int = laShared.DEF_SCAN_WORKERS,
+        rewriteCurrent: bool = False,
+        dryRun: bool = False
+    ):
+        """
+        Creates a new library migrator.
+
+        rootPath: The path to the root directory of the library.
+        workers: The maximum number of threads used to convert files.
+        rewriteCurrent: If `True`, meta files already in a newer format are also rewritten in the standard layout while keeping their version.
+        dryRun: If `True`, files are converted and counted as a real run would count them but not written.
+        """
+        self.rootPath = laShared.fullpath(rootPath)
+        self.workers = max(1, workers)
+        self.rewriteCurrent = rewriteCurrent
+        self.dryRun = dryRun
+
+    # Python Functions
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.__dict__})"
+
+    # Functions
+    def run(self) -> LibAlexMigrationReport:
+        """
+        Migrates every meta file in the library.
+        Files that fail to convert are recorded in the report rather than stopping the run.
+        If the library root does not exist, a `FileNotFoundError` will be raised.
+
+        Returns a report of the run.
+        """
+        report = LibAlexMigrationReport()
+        maxPending = self.workers * 2
+        pending: dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for metaPath in LibAlexScanner(self.rootPath).findMetaFiles():
+                pending[executor.submit(self._migrate, metaPath)] = metaPath
+
+                # Keep a bounded number of files in flight
+                if len(pending) >= maxPending:
+                    self._collect(pending, report, FIRST_COMPLETED)
+
+            self._collect(pending, report)
+
+        return report
+
+    def migrateMetaFile(self, metaPath: str) -> str:
+        """
+        Migrates a single meta file.
+        If the file cannot be read or converted, a `ValueError` or `FileNotFoundError` may be raised.
+
+        metaPath: The absolute path to the meta file.
+
+        Returns `"migrated"` if the file was rewritten, `"unchanged"` if the converted content was already on disk, or `"skipped"` if the file did not need converting.
+        """
+        return self._migrate(metaPath)[0]
+
+    # Private Functions
+    def _migrate(self, metaPath: str) -> tuple[str, list[str]]:
+        """
+        Migrates a single meta file and collects its warnings.
+        The errors are those of `migrateMetaFile(...)`.
+
+        metaPath: The absolute path to the meta file.
+
+        Returns a `(status, warnings)` tuple.
+        """
+        # Read the meta file
+        metaJson: dict[str, Any] = LibAlexItem._readMetaFile(metaPath)
+        version = LibAlexItem.versionFromJson(metaJson)
+        warnings = []
+
+        # Check if the file needs converting
+        if version.major == 1:
+            # Convert without emitting the deprecation warning from a worker thread
+            knownKeys = _V1_KEYS
+            v2Json = LibAlexItem._mockV2Json(metaJson)
+            warnings.append(LibAlexItem.V1_DEPRECATION)
+        elif self.rewriteCurrent:
+            knownKeys = ()
+            v2Json = metaJson
+        else:
+            return ("skipped", warnings)
+
+        # Convert without requiring the content files
+        item = LibAlexItem._fromV2Json(
+            v2Json,
+            directory=os.path.dirname(metaPath),
+            metaFilepath=metaPath,
+            deferValidation=True
+        )
+
+        # Keep newer versions and any keys outside of the format
+        jsonData = item.toJson()
+        if version.major != 1:
+            jsonData["_infover"] = version.string
+
+        for key, value in metaJson.items():
+            if (key not in jsonData) and (key not in knownKeys):
+                jsonData[key] = value
+
+        # Only report files that a real run would rewrite
+        if self.dryRun:
+            with open(metaPath, "rb") as metaFile:
+                changed = (metaFile.read() != LibAlexItem._serializeMetaJson(jsonData))
+
+            return (("migrated" if changed else "unchanged"), warnings)
+
+        # Write the converted file
+
+        return (("migrated" if LibAlexItem._writeMetaJson(metaPath, jsonData) else "unchanged"), warnings)
+
+    @staticmethod
+    def _collect(pending: dict[Future, str], report: LibAlexMigrationReport, returnWhen: str = "ALL_COMPLETED"):
+        """
+        Records finished migrations in the report.
+        Any error raised while migrating a file is recorded against it.
+
+        pending: The pending futures mapped to their meta files. It is modified in place.
+        report: The report to record in.
+        returnWhen: When to stop waiting as accepted by `concurrent.futures.wait(...)`.
+        """
+        done, _ = wait(pending, return_when=returnWhen)
+        for future in done:
+            metaPath = pending.pop(future)
+            try:
+                status, warnings = future.result()
+            except Exception as e:
+                report.recordError(metaPath, e)
+            else:
+                report.record(metaPath, status, warnings)
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,207 @@
+# LibAlexandria: LibAlexandria NDJSON Catalogs
+# Streams whole LibAlexandria Libraries to and from newline delimited JSON catalogs.
+
+# Imports
+import os
+import gzip
+import shutil
+import tempfile
+from typing import Iterable, Iterator, Any, Union, IO
+
+import libAlexDefaults as laShared
+import libAlexJson as laJson
+from libAlexItem import LibAlexItem
+from libAlexScanner import LibAlexScanner
+from libAlexSemanticVersion import SemanticVersion
+
+# Functions
+def itemToLine(item: LibAlexItem) -> str:
+    """
+    Serializes an item to a single catalog line without the trailing newline.
+    The line holds the `toJson()` data of the item along with its original `_version`, absolute `_directory` and `_metaFilepath`, and `_resolvedFlags`.
+    Unset fields are written as explicit nulls, and items without a directory keep their filepaths absolute.
+
+    item: The item to serialize.
+
+    Returns the JSON line.
+    """
+    lineJson = item.toJson()
+
+    # Keep unset fields as nulls
+    if item.classification is None:
+        lineJson["classification"] = None
+
+    if item.sourceFile is None:
+        lineJson["sourceFile"] = None
+    elif item.directory is None:
+        lineJson["sourceFile"] = item.sourceFile
+
+    if item.relatedFiles is None:
+        lineJson["otherFiles"] = None
+    elif item.directory is None:
+        for rfJson, rf in zip(lineJson["otherFiles"], item.relatedFiles):
+            rfJson["path"] = rf.path
+
+    if item.flags is None:
+        lineJson["flags"] = None
+
+    lineJson["_version"] = (item.version.string if isinstance(item.version, SemanticVersion) else None)
+    lineJson["_directory"] = item.directory
+    lineJson["_metaFilepath"] = item.metaFilepath
+    lineJson["_resolvedFlags"] = item.resolvedFlags
+
+    return laJson.dumps(lineJson)
+
+def itemFromLine(line: Union[str, bytes]) -> LibAlexItem:
+    """
+    Rebuilds an item from a catalog line written by `itemToLine(...)`.
+    No files are read or checked for existence.
+    If the line cannot be parsed, a `ValueError` will be raised.
+
+    line: The JSON line.
+
+    Returns a new LibAlexandria Item.
+    """
+    lineJson: dict[str, Any] = laJson.loads(line)
+    directory = lineJson.get("_directory", laShared.DEF_ITEM_DIR)
+
+    # Filepaths of items without a directory are already absolute
+    item = LibAlexItem.fromJson(
+        lineJson,
+        directory=(directory if directory is not None else ""),
+        metaFilepath=lineJson.get("_metaFilepath", laShared.DEF_ITEM_META_PATH),
+        resolvedFlags=lineJson.get("_resolvedFlags", laShared.DEF_ITEM_RES_FLAGS),
+        deferValidation=True
+    )
+    item.directory = directory
+
+    # Restore the version the item was loaded with
+    if "_version" in lineJson:
+        version = lineJson["_version"]
+        item.version = (SemanticVersion.fromString(version) if version is not None else None)
+
+    return item
+
+def exportItems(items: Iterable[LibAlexItem], catalog: Union[str, IO[str]]) -> int:
+    """
+    Writes the provided items to an NDJSON catalog one line at a time.
+    Only one item is held at a time, so a `LibAlexScanner` can be exported while it scans.
+
+    items: The items to export.
+    catalog: A path to the catalog file or a text file object to write to. Paths ending with `.gz` are gzip compressed. Paths are replaced atomically.
+
+    Returns the number of items written.
+    """
+    # Write to an open file
+    if not isinstance(catalog, str):
+        return _writeLines(items, catalog)
+
+    # Write next to the destination then swap it in
+    catalogPath = laShared.fullpath(catalog)
+    tempFd, tempPath = tempfile.mkstemp(prefix=f".{os.path.basename(catalogPath)}.", suffix=".tmp", dir=os.path.dirname(catalogPath))
+    os.close(tempFd)
+    try:
+        with _openCatalog(tempPath, "w", compressed=catalogPath.endswith(".gz")) as catalogFile:
+            count = _writeLines(items, catalogFile)
+
+        # Keep the permissions of the file being replaced
+        try:
+            shutil.copymode(catalogPath, tempPath)
+        except OSError:
+            os.chmod(tempPath, 0o644)
+
+        os.replace(tempPath, catalogPath)
+    except BaseException:
+        # Clean up the partial file
+        try:
+            os.remove(tempPath)
+        except OSError:
+            pass
+
+        raise
+
+    return count
+
+def exportLibrary(rootPath: str, catalog: Union[str, IO[str]], **scannerArgs) -> int:
+    """
+    Scans a library and writes every item to an NDJSON catalog as it is loaded.
+    If an item fails to load, the error raised by the scanner is raised and no catalog file is written.
+
+    rootPath: The path to the root directory of the library.
+    catalog: A path to the catalog file or a text file object to write to as accepted by `exportItems(...)`.
+    scannerArgs: Additional keyword arguments passed to `LibAlexScanner(...)`.
+
+    Returns the number of items written.
+    """
+    return exportItems(LibAlexScanner(rootPath, **scannerArgs), catalog)
+
+def importItems(catalog: Union[str, IO], skipInvalid: bool = False) -> Iterator[LibAlexItem]:
+    """
+    Reads an NDJSON catalog one line at a time and yields each rebuilt `LibAlexItem`.
+    The original meta files are not read and no file is checked for existence.
+    Blank lines are ignored.
+    If a line cannot be parsed and `skipInvalid` is `False`, a `ValueError` naming the line will be raised.
+
+    catalog: A path to the catalog file or a text or binary file object to read from. Paths ending with `.gz` are read as gzip compressed.
+    skipInvalid: If `True`, lines that cannot be parsed are skipped.
+    """
+    # Open the catalog
+    if isinstance(catalog, str):
+        catalogPath = laShared.fullpath(catalog)
+        with _openCatalog(catalogPath, "r", compressed=catalogPath.endswith(".gz")) as catalogFile:
+            yield from importItems(catalogFile, skipInvalid)
+
+        return
+
+    # Rebuild each line
+    for lineNum, line in enumerate(catalog, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            yield itemFromLine(line)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            if skipInvalid:
+                continue
+
+            # Fail
+            raise ValueError(f"Could not load the LibAlexandria Item on line {lineNum} of the catalog.\n\nCause: {e}")
+
+# Private Functions
+def _writeLines(items: Iterable[LibAlexItem], catalogFile: IO[str]) -> int:
+    """
+    Writes one line per item to an open catalog file.
+
+    items: The items to write.
+    catalogFile: The text file object to write to.
+
+    Returns the number of items written.
+    """
+    count = 0
+    for item in items:
+        catalogFile.write(itemToLine(item))
+        catalogFile.write("\n")
+        count += 1
+
+    return count
+
+def _openCatalog(catalogPath: str, mode: str, compressed: bool) -> IO:
+    """
+    Opens a catalog file.
+    Files are read as bytes, which every JSON backend accepts, and written as UTF-8 text.
+
+    catalogPath: The path to the catalog file.
+    mode: `"r"` or `"w"`.
+    compressed: If `True`, the file is gzip compressed.
+
+    Returns the open file object.
+    """
+    opener = (gzip.open if compressed else open)
+    if mode == "r":
+        return opener(catalogPath, "rb")
+
+    return opener(catalogPath, "wt", encoding="utf-8", newline="\n")
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,117 @@
+# LibAlexandria: LibAlexandria Flag Trie
+# Resolves the directory flags of LibAlexandria Items once per directory in a path-component trie.
+
+# Imports
+import os
+from typing import Optional
+
+import libAlexDefaults as laShared
+
+# Classes
+class _FlagTrieNode:
+    """
+    A directory in a `LibAlexFlagTrie`.
+    """
+    # Slots
+    __slots__ = ("flags", "children")
+
+    # Constructors
+    def __init__(self, flags: tuple[str, ...]):
+        """
+        flags: The resolved flags of the directory.
+        """
+        self.flags = flags
+        self.children: dict[str, '_FlagTrieNode'] = {}
+
+class LibAlexFlagTrie:
+    """
+    Resolves the flags LibAlexandria Items gain from their directory path.
+
+    Each directory is a node in a trie of path components that stores its already slugified flags.
+    A new directory only slugifies its own name and extends the flags of its parent, so items sharing ancestors never repeat that work.
+    """
+    # Constructors
+    def __init__(self):
+        """
+        Creates a new empty flag trie.
+        """
+        self._root = _FlagTrieNode(())
+        self._nodeCount = 0
+
+    # Python Functions
+    def __len__(self) -> int:
+        return self._nodeCount
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(nodes={self._nodeCount})"
+
+    # Functions
+    def resolveFlags(self, dirPath: str) -> list[str]:
+        """
+        Resolves the flags of an item located in the provided directory.
+        The result matches slugifying every component of the directory path.
+
+        dirPath: The absolute path of the item directory.
+
+        Returns a new list of the resolved flags.
+        """
+        return list(self._node(dirPath).flags)
+
+    def forget(self, dirPath: Optional[str] = None):
+        """
+        Drops the provided directory and everything below it from the trie.
+
+        dirPath: The absolute path of the directory or `None` to empty the trie.
+        """
+        # Empty the trie
+        if dirPath is None:
+            self._root = _FlagTrieNode(())
+            self._nodeCount = 0
+            return
+
+        # Find the parent
+        components = dirPath.split(os.sep)[1:]
+        node = self._root
+        for component in components[:-1]:
+            node = node.children.get(component, None)
+            if node is None:
+                return
+
+        # Drop the subtree
+        removed = node.children.pop(components[-1], None) if components else None
+        if removed is not None:
+            self._nodeCount -= self._countNodes(removed)
+
+    # Private Functions
+    def _node(self, dirPath: str) -> _FlagTrieNode:
+        """
+        Finds or creates the node of the provided directory.
+
+        dirPath: The absolute path of the directory.
+        """
+        node = self._root
+        for component in dirPath.split(os.sep)[1:]:
+            child = node.children.get(component, None)
+            if child is None:
+                # Extend the parent flags
+                newChild = _FlagTrieNode(node.flags + (laShared.slugifyCached(component),))
+                child = node.children.setdefault(component, newChild)
+                if child is newChild:
+                    self._nodeCount += 1
+
+            node = child
+
+        return node
+
+    @classmethod
+    def _countNodes(cls, node: _FlagTrieNode) -> int:
+        """
+        Counts the provided node and every node below it.
+
+        node: The node to count from.
+        """
+        return 1 + sum(cls._countNodes(child) for child in node.children.values())
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,191 @@
+# LibAlexandria: LibAlexandria Path Validator
+# Answers file existence checks from cached per-directory listings instead of individual stat calls.
+
+# Imports
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Iterable, Any
+
+import libAlexDefaults as laShared
+
+# Classes
+class LibAlexPathValidator:
+    """
+    Answers file existence checks from cached per-directory `os.scandir` listings.
+
+    Each directory is listed at most once while its listing is cached, so every check for a file in the same item directory is answered from memory.
+    Only the most recently used listings are kept, so a validator shared across many scans stays bounded.
+    Listings are a snapshot; call `forget(...)` to drop them once the files may have changed.
+    """
+    # Constructors
+    def __init__(self, maxListings: Optional[int] = laShared.DEF_VALIDATOR_CACHE_SIZE):
+        """
+        Creates a new path validator with no cached listings.
+
+        maxListings: The maximum number of directory listings to keep or `None` to keep every listing.
+        """
+        self.maxListings = maxListings
+
+        self._listings: OrderedDict[str, Optional[dict[str, tuple[bool, bool]]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(listings={len(self._listings)})"
+
+    # Functions
+    def addListing(self, dirPath: str, entries: Iterable[os.DirEntry]):
+        """
+        Records a listing that was already produced by `os.scandir` so it does not need to be listed again.
+
+        dirPath: The absolute path of the listed directory.
+        entries: The entries of the directory.
+        """
+        self._store(dirPath, self._buildListing(entries))
+
+    def listing(self, dirPath: str) -> Optional[dict[str, tuple[bool, bool]]]:
+        """
+        Returns the cached listing of the provided directory, listing it if needed.
+
+        dirPath: The absolute path of the directory.
+
+        Returns a dictionary of entry names to `(isFile, isDir)` tuples or `None` if the directory could not be listed.
+        """
+        # Check the cache
+        with self._lock:
+            try:
+                listing = self._listings[dirPath]
+                self._listings.move_to_end(dirPath)
+                return listing
+            except KeyError:
+                pass
+
+        # List the directory
+        try:
+            with os.scandir(dirPath) as dirIter:
+                listing = self._buildListing(dirIter)
+        except OSError:
+            listing = None
+
+        self._store(dirPath, listing)
+        return listing
+
+    def isFile(self, path: str) -> bool:
+        """
+        Returns if the provided path is an existing file.
+
+        path: The path to check.
+        """
+        entry = self._entry(path)
+        return (entry is not None) and entry[0]
+
+    def isDir(self, path: str) -> bool:
+        """
+        Returns if the provided path is an existing directory.
+
+        path: The path to check.
+        """
+        path = laShared.fullpath(path)
+        listing = self._listings.get(path, self._listings)
+        if listing is not self._listings:
+            return listing is not None
+
+        entry = self._entry(path)
+        return (entry is not None) and entry[1]
+
+    def exists(self, path: str) -> bool:
+        """
+        Returns if the provided path exists.
+
+        path: The path to check.
+        """
+        return self._entry(path) is not None
+
+    def validateItems(self, items: Iterable[Any]) -> list[tuple[Any, FileNotFoundError]]:
+        """
+        Validates the files of many items in a single pass.
+        Items sharing a directory are answered from the same listing.
+
+        items: The `LibAlexItem` objects to validate.
+
+        Returns a list of `(item, error)` tuples for every item with a missing file.
+        """
+        failures = []
+        for item in items:
+            try:
+                item.validate(self)
+            except FileNotFoundError as e:
+                failures.append((item, e))
+
+        return failures
+
+    def forget(self, dirPath: Optional[str] = None):
+        """
+        Drops cached listings so they are listed again on the next check.
+
+        dirPath: The directory whose listing should be dropped or `None` to drop every listing.
+        """
+        with self._lock:
+            if dirPath is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(laShared.fullpath(dirPath), None)
+
+    # Private Functions
+    def _store(self, dirPath: str, listing: Optional[dict[str, tuple[bool, bool]]]):
+        """
+        Caches a listing as the most recently used one, dropping the least recently used listings over the limit.
+
+        dirPath: The absolute path of the listed directory.
+        listing: The listing or `None` if the directory could not be listed.
+        """
+        with self._lock:
+            self._listings[dirPath] = listing
+            self._listings.move_to_end(dirPath)
+
+            if self.maxListings is not None:
+                while len(self._listings) > self.maxListings:
+                    self._listings.popitem(last=False)
+
+    def _entry(self, path: str) -> Optional[tuple[bool, bool]]:
+        """
+        Finds the listing entry for the provided path.
+
+        path: The path to find.
+
+        Returns an `(isFile, isDir)` tuple or `None` if the path does not exist.
+        """
+        path = laShared.fullpath(path)
+        dirPath, name = os.path.split(path)
+        listing = self.listing(dirPath)
+        if listing is None:
+            return None
+
+        return listing.get(name, None)
+
+    @staticmethod
+    def _buildListing(entries: Iterable[os.DirEntry]) -> dict[str, tuple[bool, bool]]:
+        """
+        Converts directory entries into a listing.
+
+        entries: The entries to convert.
+
+        Returns a dictionary of entry names to `(isFile, isDir)` tuples.
+        """
+        listing = {}
+        for entry in entries:
+            try:
+                listing[entry.name] = (entry.is_file(), entry.is_dir())
+            except OSError:
+                # Entry vanished while listing
+                continue
+
+        return listing
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
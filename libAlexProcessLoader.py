@@ -0,0 +1,195 @@
+# LibAlexandria: LibAlexandria Process Loader
+# Loads very large LibAlexandria Libraries across several processes to use more than one core.
+
+# Imports
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, Union
+
+import libAlexDefaults as laShared
+from libAlexItem import LibAlexItem
+from libAlexScanner import LibAlexScanner
+from libAlexScanReport import LibAlexScanError, LibAlexScanReport
+from libAlexPathValidator import LibAlexPathValidator
+from libAlexPathTrie import LibAlexFlagTrie
+
+# Variables
+_WORKER_FLAG_TRIE = LibAlexFlagTrie()
+
+# Classes
+class LibAlexProcessLoader:
+    """
+    Loads a LibAlexandria Library in worker processes so parsing is not limited by the GIL.
+
+    The library is split into directory subtrees that are each walked and parsed by a worker process.
+    Workers send back compact `LibAlexItem.toRecord()` tuples, which are cheap to pickle, and items are only built in the parent when asked for.
+    """
+    # Constructors
+    def __init__(self,
+        rootPath: str,
+        processes: int = laShared.DEF_LOAD_PROCESSES,
+        ordered: bool = laShared.DEF_SCAN_ORDERED,
+        deferValidation: bool = False,
+        partitionsPerProcess: int = laShared.DEF_LOAD_PARTITIONS_PER_PROCESS,
+        collectErrors: bool = False
+    ):
+        """
+        Creates a new LibAlexandria Library process loader.
+
+        rootPath: The path to the root directory of the library.
+        processes: The maximum number of worker processes.
+        ordered: If `True`, items are yielded in path order. If `False`, the items of each subtree are yielded as soon as it is loaded.
+        deferValidation: If `True`, source and related files are not checked for existence while loading.
+        partitionsPerProcess: The number of subtrees to aim for per process so uneven subtrees still keep every process busy.
+        collectErrors: If `True`, meta files that fail to load are recorded in `report` and the load continues. If `False`, the first error is raised.
+        """
+        self.rootPath = laShared.fullpath(rootPath)
+        self.processes = max(1, processes)
+        self.ordered = ordered
+        self.deferValidation = deferValidation
+        self.partitionsPerProcess = max(1, partitionsPerProcess)
+        self.collectErrors = collectErrors
+        self.report = LibAlexScanReport()
+
+    # Python Functions
+    def __iter__(self) -> Iterator[LibAlexItem]:
+        return self.load()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.__dict__})"
+
+    # Functions
+    def partitions(self) -> list[tuple[str, bool]]:
+        """
+        Splits the library into subtrees by listing directories breadth first until there are enough of them.
+        If the library root does not exist, a `FileNotFoundError` will be raised.
+
+        Returns a list of `(dirPath, recursive)` tuples in path order. A non-recursive partition only covers the meta file of its own directory.
+        """
+        # Verify the root exists
+        if not os.path.isdir(self.rootPath):
+            # Fail
+            raise FileNotFoundError(f"No library directory present to load at: {self.rootPath}")
+
+        # Split one level at a time until there are enough subtrees
+        target = self.processes * self.partitionsPerProcess
+        partitions: list[tuple[str, bool]] = []
+        level = [self.rootPath]
+        while level and ((len(partitions) + len(level)) < target):
+            nextLevel = []
+            for dirPath in level:
+                # List the directory
+                try:
+                    with os.scandir(dirPath) as dirIter:
+                        entries = list(dirIter)
+                except OSError:
+                    # Skip unreadable directories like the scanner does
+                    continue
+
+                # Sort out the entries
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            nextLevel.append(entry.path)
+                        elif (entry.name == laShared.META_FILENAME) and entry.is_file():
+                            partitions.append((dirPath, False))
+                    except OSError:
+                        # Entry vanished while listing
+                        continue
+
+            level = nextLevel
+
+        partitions.extend((dirPath, True) for dirPath in level)
+
+        # Match the order of the scanner
+        partitions.sort(key=lambda p: (p[0].split(os.sep), p[1]))
+
+        return partitions
+
+    def records(self) -> Iterator[tuple]:
+        """
+        Loads every item in the library and yields the `LibAlexItem.toRecord()` tuple of each.
+        Workers catch errors per meta file, so one bad file never discards the rest of its subtree.
+        If an item fails to load, the error raised by `LibAlexItem.fromMetaFile(...)` is raised from the generator after the items before it unless `collectErrors` is set.
+        """
+        # Split the library
+        self.report = LibAlexScanReport()
+        partitions = self.partitions()
+        if not partitions:
+            return
+
+        with ProcessPoolExecutor(max_workers=min(self.processes, len(partitions))) as executor:
+            futures = [
+                executor.submit(_loadPartition, dirPath, recursive, self.deferValidation, self.collectErrors)
+                for dirPath, recursive in partitions
+            ]
+
+            try:
+                # Hand back the records of each subtree
+                for future in (futures if self.ordered else as_completed(futures)):
+                    for result in future.result():
+                        # Record the error
+                        if isinstance(result, LibAlexScanError):
+                            self.report.errors.append(result)
+                            continue
+
+                        if isinstance(result, Exception):
+                            raise result
+
+                        self.report.loaded += 1
+                        yield result
+            finally:
+                # Drop anything the consumer no longer wants
+                for future in futures:
+                    future.cancel()
+
+    def load(self) -> Iterator[LibAlexItem]:
+        """
+        Loads every item in the library and yields each `LibAlexItem` as it becomes available.
+        Errors are handled as they are by `records()`.
+        """
+        for record in self.records():
+            yield LibAlexItem.fromRecord(record)
+
+# Functions
+def _loadPartition(dirPath: str, recursive: bool, deferValidation: bool, collectErrors: bool) -> list[Union[tuple, LibAlexScanError, Exception]]:
+    """
+    Loads the items of a single partition in a worker process.
+
+    dirPath: The directory of the partition.
+    recursive: If `True`, every meta file below the directory is loaded. If `False`, only the meta file of the directory is loaded.
+    deferValidation: If `True`, source and related files are not checked for existence.
+    collectErrors: If `True`, a `LibAlexScanError` is returned for each meta file that fails to load. If `False`, the first error itself is returned last and loading stops.
+
+    Returns the records of the loaded items and any errors in path order.
+    """
+    # Find the meta files
+    if recursive:
+        validator = LibAlexPathValidator()
+        metaPaths = LibAlexScanner(dirPath, validator=validator).findMetaFiles()
+    else:
+        validator = None
+        metaPaths = [os.path.join(dirPath, laShared.META_FILENAME)]
+
+    # Load each item
+    results = []
+    for metaPath in metaPaths:
+        try:
+            results.append(LibAlexItem.fromMetaFile(
+                metaPath,
+                validator=validator,
+                deferValidation=deferValidation,
+                flagTrie=_WORKER_FLAG_TRIE
+            ).toRecord())
+        except (ValueError, OSError) as e:
+            if not collectErrors:
+                results.append(e)
+                break
+
+            results.append(LibAlexScanError.fromException(metaPath, e))
+
+    return results
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
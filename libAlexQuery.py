@@ -0,0 +1,726 @@
+# LibAlexandria: LibAlexandria Query
+# A small filter language for LibAlexandria Items and a planner that answers it from the library indexes.
+
+# Imports
+import re
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+import libAlexDefaults as laShared
+import libAlexDates as laDates
+from libAlexItem import LibAlexItem
+from libAlexSemanticVersion import SemanticVersion
+from libAlexFlagIndex import LibAlexFlagIndex
+from libAlexTextIndex import LibAlexTextIndex
+from libAlexVersionIndex import LibAlexVersionIndex
+from libAlexDateIndex import LibAlexDateIndex
+
+# Variables
+_TERM_PATTERN = re.compile(r'(-)?(?:([A-Za-z]+)(>=|<=|:|=|>|<))?(?:"((?:[^"\\]|\\.)*)"|(\S+))')
+_ESCAPE_PATTERN = re.compile(r'\\(.)')
+
+# Classes
+class LibAlexQueryTerm:
+    """
+    A single predicate of a `LibAlexQuery` like `flag:poetry`, `version>=2.0.0`, or `date<1900`.
+
+    Text fields match words or quoted phrases with the same normalization as `slugify(...)`, flags and classifications match exactly, and a trailing `*` on a value matches as a prefix.
+    Date ranges compare the normalized date ranges of `libAlexDates.normalizeDate(...)`, so an item matches when its date may fall within the range and undated items never match.
+    """
+    # Slots
+    __slots__ = ("field", "op", "value", "negated", "isPrefix", "_key")
+
+    # Variables
+    FIELDS = ("text", "flag", "classification", "title", "author", "description", "version", "date")
+    TEXT_FIELDS = ("title", "author", "description")
+    RANGE_OPS = (">=", ">", "<=", "<")
+
+    # Constructors
+    def __init__(self, field: str, op: str, value: str, negated: bool = False):
+        """
+        Creates a new query term.
+        If the field, operator, or value is not supported, a `ValueError` will be raised.
+
+        field: The field to match, one of `FIELDS`.
+        op: The comparison operator, `:` or `=` for a match and `>=`, `>`, `<=`, or `<` for a `version` or `date` range.
+        value: The value to compare with. A trailing `*` matches as a prefix.
+        negated: If `True`, the term matches items that do not match the value.
+        """
+        # Check the field
+        field = field.lower()
+        if field not in self.FIELDS:
+            # Fail
+            raise ValueError(f"\"{field}\" is not a queryable field. Use one of: {', '.join(self.FIELDS)}.")
+
+        # Check the operator
+        if op == "=":
+            op = ":"
+
+        if (op != ":") and ((op not in self.RANGE_OPS) or (field not in ("version", "date"))):
+            # Fail
+            raise ValueError(f"The \"{op}\" operator cannot be used with the \"{field}\" field.")
+
+        self.field = field
+        self.op = op
+        self.negated = negated
+        self.isPrefix = value.endswith("*") and (op == ":") and (field != "version")
+        self.value = (value[:-1] if self.isPrefix else value)
+
+        # Prepare the value for matching
+        if field == "version":
+            version = SemanticVersion.fromString(self.value)
+            if not version.isValid:
+                # Fail
+                raise ValueError(f"\"{self.value}\" is not a valid version to query by.")
+
+            self._key = version.sortKey
+        elif field in ("text", *self.TEXT_FIELDS):
+            self._key = laShared.slugify(self.value)
+        elif (field == "date") and (op != ":"):
+            self._key = laDates.normalizeDate(self.value)
+            if self._key is None:
+                # Fail
+                raise ValueError(f"\"{self.value}\" is not a date that can be queried by.")
+        elif field == "date":
+            self._key = self.value.lower()
+        else:
+            self._key = self.value
+
+    # Python Functions
+    def __str__(self) -> str:
+        value = self.value + ("*" if self.isPrefix else "")
+        if (not value) or any(c.isspace() or (c == "\"") for c in value):
+            value = "\"" + value.replace("\\", "\\\\").replace("\"", "\\\"") + "\""
+
+        return f"{'-' if self.negated else ''}{self.field}{self.op}{value}"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self)!r})"
+
+    def __eq__(self, other: 'LibAlexQueryTerm') -> bool:
+        if not isinstance(other, LibAlexQueryTerm):
+            return NotImplemented
+
+        return str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    # Functions
+    def tokens(self) -> list[str]:
+        """
+        Returns the normalized search terms of a text field value as indexed by `LibAlexTextIndex`.
+        """
+        return [t for t in self._key.split("-") if t]
+
+    def matches(self, item: LibAlexItem) -> bool:
+        """
+        Checks the provided item against the term.
+
+        item: The item to check.
+
+        Returns `True` if the item matches.
+        """
+        return self._matchesValue(item) != self.negated
+
+    # Private Functions
+    def _matchesValue(self, item: LibAlexItem) -> bool:
+        """
+        Checks the provided item against the value of the term ignoring negation.
+
+        item: The item to check.
+        """
+        # Flags
+        if self.field == "flag":
+            if self.isPrefix:
+                return any(f.startswith(self._key) for f in item.getAllFlags())
+
+            return self._key in item.getAllFlags()
+
+        # Classification
+        if self.field == "classification":
+            if not isinstance(item.classification, str):
+                return False
+
+            if self.isPrefix:
+                return item.classification.startswith(self._key)
+
+            return item.classification == self._key
+
+        # Version
+        if self.field == "version":
+            if (not isinstance(item.version, SemanticVersion)) or (not item.version.isValid):
+                return False
+
+            sortKey = item.version.sortKey
+            if self.op == ">=":
+                return sortKey >= self._key
+            elif self.op == ">":
+                return sortKey > self._key
+            elif self.op == "<=":
+                return sortKey <= self._key
+            elif self.op == "<":
+                return sortKey < self._key
+
+            return sortKey == self._key
+
+        # Date ranges
+        if (self.field == "date") and (self.op != ":"):
+            dateRange = laDates.normalizeDate(item.date)
+            if dateRange is None:
+                return False
+
+            if self.op == ">=":
+                return dateRange[1] >= self._key[0]
+            elif self.op == ">":
+                return dateRange[1] > self._key[1]
+            elif self.op == "<=":
+                return dateRange[0] <= self._key[1]
+
+            return dateRange[0] < self._key[0]
+
+        # Date
+        if self.field == "date":
+            if not isinstance(item.date, str):
+                return False
+
+            date = item.date.lower()
+            return (date.startswith(self._key) if self.isPrefix else (date == self._key))
+
+        # Text
+        fields = (self.TEXT_FIELDS if self.field == "text" else (self.field,))
+        return any(self._containsPhrase(getattr(item, field)) for field in fields)
+
+    def _containsPhrase(self, text: Optional[str]) -> bool:
+        """
+        Checks if the provided text contains the normalized words of the term in order.
+
+        text: The text to search.
+        """
+        if not self._key:
+            return True
+
+        if not text:
+            return False
+
+        # Compare whole words by their separators
+        haystack = f"-{laShared.slugify(text)}-"
+        return f"-{self._key}{'' if self.isPrefix else '-'}" in haystack
+
+class LibAlexQuery:
+    """
+    A parsed query over LibAlexandria Items where every term must match.
+
+    Queries are written as space separated terms like `flag:poetry author:"Smith" classification:PR* version>=2.0.0 sonnets`.
+    A term is `field:value`, `version` and `date` also accept `>=`, `>`, `<=`, and `<`, a leading `-` negates a term, and a bare word searches the title, author, and description.
+    """
+    # Slots
+    __slots__ = ("string", "terms")
+
+    # Constructors
+    def __init__(self, terms: Iterable[LibAlexQueryTerm] = (), string: Optional[str] = None):
+        """
+        Creates a new query from already built terms.
+
+        terms: The terms that must all match.
+        string: The text the query was parsed from or `None` to build it from the terms.
+        """
+        self.terms = tuple(terms)
+        self.string = (string if string is not None else " ".join(str(t) for t in self.terms))
+
+    @classmethod
+    def parse(cls, s: str) -> 'LibAlexQuery':
+        """
+        Parses the provided query text.
+        Words prefixed with an unknown field are searched as plain text.
+        If a term uses an unsupported operator or an invalid version, a `ValueError` will be raised.
+
+        s: The query text.
+
+        Returns a new query.
+        """
+        terms = []
+        for match in _TERM_PATTERN.finditer(s):
+            negated, field, op, quoted, bare = match.groups()
+            value = (_ESCAPE_PATTERN.sub(r"\1", quoted) if quoted is not None else bare)
+
+            # Words with an unknown field prefix, like `re:` or `http:`, are plain words
+            if (field is not None) and (field.lower() not in LibAlexQueryTerm.FIELDS):
+                value = f"{field} {value}"
+                field = None
+
+            # Bare words search the text fields
+            if field is None:
+                field = "text"
+                op = ":"
+
+                # Skip words with nothing to search for
+                if not laShared.slugify(value):
+                    continue
+
+            terms.append(LibAlexQueryTerm(field, op, value, negated=(negated is not None)))
+
+        return cls(terms, string=s)
+
+    # Python Functions
+    def __str__(self) -> str:
+        return self.string
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.string!r})"
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    # Functions
+    def matches(self, item: LibAlexItem) -> bool:
+        """
+        Checks the provided item against every term.
+
+        item: The item to check.
+
+        Returns `True` if the item matches.
+        """
+        return all(term.matches(item) for term in self.terms)
+
+    def filter(self, items: Iterable[LibAlexItem]) -> Iterator[LibAlexItem]:
+        """
+        Yields the provided items that match the query without using any index.
+
+        items: The items to check.
+        """
+        for item in items:
+            if self.matches(item):
+                yield item
+
+class LibAlexQueryResult:
+    """
+    The lazily evaluated matches of a query.
+
+    Candidate ids are checked against the terms no index could answer only as pages are asked for, so reading the first page of a broad query does not check the whole library.
+    """
+    # Constructors
+    def __init__(self,
+        items: dict[int, LibAlexItem],
+        candidateIds: list[int],
+        residualTerms: Iterable[LibAlexQueryTerm] = (),
+        plan: Iterable[str] = (),
+        pageSize: int = laShared.DEF_QUERY_PAGE_SIZE
+    ):
+        """
+        Creates a new query result.
+
+        items: The items by id to return.
+        candidateIds: The ids that may match in result order.
+        residualTerms: The terms every candidate still has to be checked against.
+        plan: Descriptions of the steps the planner took.
+        pageSize: The number of items per page.
+        """
+        self.items = items
+        self.candidateIds = candidateIds
+        self.residualTerms = tuple(residualTerms)
+        self.plan = list(plan)
+        self.pageSize = max(1, pageSize)
+
+        self._matched: list[int] = []
+        self._cursor = 0
+
+    # Python Functions
+    def __iter__(self) -> Iterator[LibAlexItem]:
+        for itemId in self.ids():
+            yield self.items[itemId]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(candidates={len(self.candidateIds)}, checked={self._cursor}, matched={len(self._matched)})"
+
+    # Functions
+    def ids(self) -> Iterator[int]:
+        """
+        Yields the ids of the matching items in result order.
+        """
+        position = 0
+        while True:
+            # Check more candidates when needed
+            if position >= len(self._matched):
+                if not self._advance(position + 1):
+                    return
+
+            yield self._matched[position]
+            position += 1
+
+    def page(self, pageNum: int) -> list[LibAlexItem]:
+        """
+        Returns the matching items of the provided page.
+        Only the candidates needed to fill the page are checked.
+
+        pageNum: The page number starting at `0`.
+
+        Returns a list of up to `pageSize` items, which is empty past the last page.
+        """
+        start = max(0, pageNum) * self.pageSize
+        end = start + self.pageSize
+        self._advance(end)
+
+        return [self.items[itemId] for itemId in self._matched[start:end]]
+
+    def pages(self) -> Iterator[list[LibAlexItem]]:
+        """
+        Yields every non-empty page of matching items in order.
+        """
+        pageNum = 0
+        while True:
+            page = self.page(pageNum)
+            if not page:
+                return
+
+            yield page
+            pageNum += 1
+
+    def count(self) -> int:
+        """
+        Checks every remaining candidate and returns the number of matching items.
+        """
+        self._advance(None)
+        return len(self._matched)
+
+    def explain(self) -> str:
+        """
+        Returns the steps the planner took, one per line.
+        """
+        return "\n".join(self.plan)
+
+    # Private Functions
+    def _advance(self, target: Optional[int]) -> bool:
+        """
+        Checks candidates until the provided number of items have matched.
+
+        target: The number of matches wanted or `None` to check every candidate.
+
+        Returns `True` if at least `target` items have matched.
+        """
+        while ((target is None) or (len(self._matched) < target)) and (self._cursor < len(self.candidateIds)):
+            itemId = self.candidateIds[self._cursor]
+            self._cursor += 1
+
+            # Skip items removed since planning
+            item = self.items.get(itemId, None)
+            if item is None:
+                continue
+
+            if all(term.matches(item) for term in self.residualTerms):
+                self._matched.append(itemId)
+
+        return (target is not None) and (len(self._matched) >= target)
+
+class LibAlexQueryPlanner:
+    """
+    Answers `LibAlexQuery` objects from the flag, text, version, and date indexes of a library.
+
+    Each term an index can answer is estimated from the index without listing ids.
+    The smallest estimate seeds the candidates, and further indexed terms are only intersected while their estimate is within `intersectRatio` of the candidates left, otherwise checking the candidates item by item is cheaper.
+    Terms no index answers exactly are checked item by item as results are read, and a query without an indexed term falls back to scanning every item.
+    """
+    # Constructors
+    def __init__(self,
+        items: dict[int, LibAlexItem],
+        flagIndex: Optional[LibAlexFlagIndex] = None,
+        textIndex: Optional[LibAlexTextIndex] = None,
+        versionIndex: Optional[LibAlexVersionIndex] = None,
+        dateIndex: Optional[LibAlexDateIndex] = None,
+        intersectRatio: float = laShared.DEF_QUERY_INTERSECT_RATIO
+    ):
+        """
+        Creates a new query planner.
+        The indexes must use the ids of `items`.
+
+        items: The items to query by id.
+        flagIndex: A `LibAlexFlagIndex` of the items or `None`.
+        textIndex: A `LibAlexTextIndex` of the items or `None`.
+        versionIndex: A `LibAlexVersionIndex` of the items or `None`.
+        dateIndex: A `LibAlexDateIndex` of the items or `None`.
+        intersectRatio: How many times larger than the current candidates an index lookup may be before the candidates are checked item by item instead.
+        """
+        self.items = items
+        self.flagIndex = flagIndex
+        self.textIndex = textIndex
+        self.versionIndex = versionIndex
+        self.dateIndex = dateIndex
+        self.intersectRatio = intersectRatio
+
+    @classmethod
+    def fromLibrary(cls, library: 'LibAlexLibrary', **kwargs) -> 'LibAlexQueryPlanner':
+        """
+        Creates a query planner over the items and indexes of a `LibAlexLibrary`.
+
+        library: The library to query.
+        kwargs: Any further arguments of the constructor.
+
+        Returns a new query planner.
+        """
+        return cls(
+            library.items,
+            flagIndex=library.flagIndex,
+            textIndex=library.textIndex,
+            versionIndex=library.versionIndex,
+            dateIndex=library.dateIndex,
+            **kwargs
+        )
+
+    # Python Functions
+    def __repr__(self):
+        return f"{self.__class__.__name__}(items={len(self.items)}, flagIndex={self.flagIndex is not None}, textIndex={self.textIndex is not None}, versionIndex={self.versionIndex is not None}, dateIndex={self.dateIndex is not None})"
+
+    # Functions
+    def search(self, query: Union[LibAlexQuery, str], pageSize: int = laShared.DEF_QUERY_PAGE_SIZE) -> LibAlexQueryResult:
+        """
+        Plans the provided query and returns its lazily evaluated result.
+        Queries with bare words are ordered by BM25 score when a text index is attached, otherwise results are ordered by id.
+
+        query: A `LibAlexQuery` or query text to parse.
+        pageSize: The number of items per page of the result.
+
+        Returns a `LibAlexQueryResult`.
+        """
+        # Parse the query
+        if isinstance(query, str):
+            query = LibAlexQuery.parse(query)
+
+        # Run the index lookups cheapest first
+        residual = list(query.terms)
+        plan = []
+        candidates: Optional[set[int]] = None
+        scores: dict[int, float] = {}
+        for step in sorted(self._steps(query.terms), key=lambda s: s.estimate):
+            # Check large lookups item by item instead
+            if (candidates is not None) and (not step.ranked) and (step.estimate > (len(candidates) * self.intersectRatio)):
+                plan.append(f"skip {step.name} {step.describe()} (~{step.estimate:,} > {len(candidates):,} candidates)")
+                continue
+
+            found = step.fetch()
+            candidates = (set(found) if candidates is None else candidates.intersection(found))
+            plan.append(f"{step.name} {step.describe()} (~{step.estimate:,}) -> {len(candidates):,} candidates")
+
+            if step.ranked:
+                for itemId, score in found.items():
+                    scores[itemId] = scores.get(itemId, 0.0) + score
+
+            if step.exact:
+                residual = [t for t in residual if t not in step.exact]
+
+            # Nothing can match anymore
+            if not candidates:
+                break
+
+        # Order the candidates
+        if candidates is None:
+            candidateIds = sorted(self.items)
+            plan.append(f"scan {len(candidateIds):,} items")
+        elif scores:
+            candidateIds = sorted(candidates, key=lambda i: (-scores.get(i, 0.0), i))
+        else:
+            candidateIds = sorted(candidates)
+
+        if residual:
+            plan.append(f"filter {' '.join(str(t) for t in residual)}")
+
+        return LibAlexQueryResult(self.items, candidateIds, residual, plan=plan, pageSize=pageSize)
+
+    def count(self, query: Union[LibAlexQuery, str]) -> int:
+        """
+        Returns the number of items matching the provided query.
+
+        query: A `LibAlexQuery` or query text to parse.
+        """
+        return self.search(query).count()
+
+    # Private Functions
+    def _steps(self, terms: tuple[LibAlexQueryTerm, ...]) -> list['_LibAlexQueryStep']:
+        """
+        Builds the index lookups available for the provided terms.
+
+        terms: The terms of the query.
+        """
+        steps = []
+
+        # Combine every flag lookup into one bitmap
+        if self.flagIndex is not None:
+            step = self._flagStep(terms)
+            if step is not None:
+                steps.append(step)
+
+        # Text lookups
+        if self.textIndex is not None:
+            for term in terms:
+                if (not term.negated) and (term.field in ("text", *LibAlexQueryTerm.TEXT_FIELDS)) and term.tokens():
+                    steps.append(self._textStep(term))
+
+        # Version lookups
+        if self.versionIndex is not None:
+            for term in terms:
+                if (not term.negated) and (term.field == "version"):
+                    steps.append(self._versionStep(term))
+
+        # Date lookups
+        if self.dateIndex is not None:
+            for term in terms:
+                if (not term.negated) and (term.field == "date") and (term.op != ":"):
+                    steps.append(self._dateStep(term))
+
+        return steps
+
+    def _flagStep(self, terms: tuple[LibAlexQueryTerm, ...]) -> Optional['_LibAlexQueryStep']:
+        """
+        Builds a single flag index lookup for the flag and classification terms.
+        Classifications are indexed as flags, so their lookup is only a superset that is still checked item by item.
+
+        terms: The terms of the query.
+        """
+        index = self.flagIndex
+        positive = [t for t in terms if (not t.negated) and (t.field in ("flag", "classification"))]
+        negative = [t for t in terms if t.negated and (t.field == "flag")]
+        if not (positive or negative):
+            return None
+
+        # Exact flags are required and each prefix needs one of its flags
+        allOf = [t.value for t in positive if not t.isPrefix]
+        anyOfGroups = [index.flagsWithPrefix(t.value) for t in positive if t.isPrefix]
+
+        # Remove the unwanted flags
+        noneOf = []
+        for term in negative:
+            noneOf.extend(index.flagsWithPrefix(term.value) if term.isPrefix else [term.value])
+
+        ids = index.query(allOf=allOf, noneOf=noneOf, anyOfGroups=anyOfGroups)
+
+        exactTerms = [t for t in (positive + negative) if t.field == "flag"]
+        return _LibAlexQueryStep(
+            "flagIndex",
+            positive + negative,
+            len(ids),
+            lambda: ids,
+            exactTerms=exactTerms
+        )
+
+    def _textStep(self, term: LibAlexQueryTerm) -> '_LibAlexQueryStep':
+        """
+        Builds a text index lookup of the words of a text term.
+        Only a single word searched across every text field is answered exactly.
+
+        term: The text term.
+        """
+        index = self.textIndex
+
+        # Expand the words into groups of alternative terms
+        tokens = term.tokens()
+        groups = [[t] for t in tokens[:-1]]
+        groups.append(index.termsWithPrefix(tokens[-1]) if term.isPrefix else [tokens[-1]])
+
+        # The rarest word bounds the matches
+        estimate = min(sum(index.documentFrequency(t) for t in group) for group in groups)
+
+        isExact = (term.field == "text") and (len(tokens) == 1)
+        return _LibAlexQueryStep(
+            "textIndex",
+            [term],
+            estimate,
+            lambda: index.scoreGroups(groups, requireAll=True),
+            exactTerms=([term] if isExact else []),
+            ranked=(term.field == "text")
+        )
+
+    def _versionStep(self, term: LibAlexQueryTerm) -> '_LibAlexQueryStep':
+        """
+        Builds a version index lookup of a version term.
+
+        term: The version term.
+        """
+        index = self.versionIndex
+
+        # Translate the operator into bounds
+        bounds = {
+            ":": {"low": term.value, "high": term.value, "includeHigh": True},
+            ">=": {"low": term.value},
+            ">": {"low": term.value, "includeLow": False},
+            "<=": {"high": term.value, "includeHigh": True},
+            "<": {"high": term.value}
+        }[term.op]
+
+        return _LibAlexQueryStep(
+            "versionIndex",
+            [term],
+            index.count(**bounds),
+            lambda: index.range(**bounds),
+            exactTerms=[term]
+        )
+
+    def _dateStep(self, term: LibAlexQueryTerm) -> '_LibAlexQueryStep':
+        """
+        Builds a date index lookup of a date range term.
+
+        term: The date range term.
+        """
+        index = self.dateIndex
+
+        # Translate the operator into inclusive day bounds
+        start, end = term._key
+        bounds = {
+            ">=": {"low": start},
+            ">": {"low": end + 1},
+            "<=": {"high": end},
+            "<": {"high": start - 1}
+        }[term.op]
+
+        return _LibAlexQueryStep(
+            "dateIndex",
+            [term],
+            index.count(**bounds),
+            lambda: index.between(**bounds),
+            exactTerms=[term]
+        )
+
+class _LibAlexQueryStep:
+    """
+    A single index lookup considered by the `LibAlexQueryPlanner`.
+    """
+    # Slots
+    __slots__ = ("name", "terms", "estimate", "fetch", "exact", "ranked")
+
+    # Constructors
+    def __init__(self,
+        name: str,
+        terms: list[LibAlexQueryTerm],
+        estimate: int,
+        fetch: Callable[[], Union[list[int], dict[int, float]]],
+        exactTerms: list[LibAlexQueryTerm] = (),
+        ranked: bool = False
+    ):
+        """
+        Creates a new index lookup.
+
+        name: The name of the index.
+        terms: The terms the lookup covers.
+        estimate: The number of ids the lookup is expected to find.
+        fetch: A function that runs the lookup and returns the found ids or a dictionary of ids to scores.
+        exactTerms: The covered terms the lookup answers exactly so they need no further checks.
+        ranked: If `True`, the lookup returns scores used to order the results and always runs.
+        """
+        self.name = name
+        self.terms = terms
+        self.estimate = estimate
+        self.fetch = fetch
+        self.exact = tuple(exactTerms)
+        self.ranked = ranked
+
+    # Python Functions
+    def __repr__(self):
+        return f"{self.__class__.__name__}({laShared.slotValues(self)})"
+
+    # Functions
+    def describe(self) -> str:
+        """
+        Returns the terms covered by the lookup as query text.
+        """
+        return " ".join(str(t) for t in self.terms)
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
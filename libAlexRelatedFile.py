@@ -7,19 +7,24 @@ import json
 from typing import Optional
 
 import libAlexDefaults as laShared
+from libAlexPathValidator import LibAlexPathValidator
 
 # Classes
 class LibAlexRelatedFile:
     """
     A utility object for defining an additional file generally associated with a LibAlexandria Item.
     """
+    # Slots
+    __slots__ = ("label", "path", "description", "id")
+
     # Constructors
-    def __init__(self, label: str, path: str, description: str, id: Optional[str] = None):
+    def __init__(self, label: str, path: str, description: str, id: Optional[str] = None, validate: bool = True):
         """
         label: Title or generic label for the referenced file.
         path: A full filepath to the referenced file.
         description: A description of the referenced file.
         id: A string identifier for the referenced file or `None`.
+        validate: If `True`, a `FileNotFoundError` is raised when the referenced file does not exist.
         """
         # Assign values
         self.label = label
@@ -30,26 +35,41 @@ class LibAlexRelatedFile:
         # Validate the path
         self.path = laShared.fullpath(self.path)
 
-        if not laShared.checkPath(self.path):
-            raise FileNotFoundError(f"Related File called \"{self.label}\" could not be found at: {self.path}")
+        if validate:
+            self.validate()
+
+    @classmethod
+    def fromRecord(cls, record: tuple) -> 'LibAlexRelatedFile':
+        """
+        Rebuilds a Related File from a record created by `toRecord()`.
+        The referenced file is not checked for existence.
+
+        record: The record to rebuild from.
+
+        Returns a new LibAlexandria Related File.
+        """
+        label, path, description, id = record
+        return cls(label, path, description, id, validate=False)
 
     # Python Functions
     def __str__(self) -> str:
         return f"{self.label} at {self.path}"
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.__dict__})"
+        return f"{self.__class__.__name__}({laShared.slotValues(self)})"
 
     # Functions
-    def toJson(self) -> dict:
+    def toJson(self, relativeTo: Optional[str] = None) -> dict:
         """
         Returns a dictionary representation of the object.
 
         Filepaths are assumed to be relative to the meta file as specified in the standard.
+
+        relativeTo: The directory of the meta file to make the path relative to or `None` to keep only the file name.
         """
         jsonData = {
             "label": self.label,
-            "path": os.path.basename(self.path),
+            "path": laShared.relativePath(self.path, relativeTo),
             "description": self.description
         }
 
@@ -58,6 +78,29 @@ class LibAlexRelatedFile:
 
         return jsonData
 
+    def validate(self, validator: Optional[LibAlexPathValidator] = None):
+        """
+        Checks that the referenced file exists.
+        If it does not, a `FileNotFoundError` will be raised.
+
+        validator: A `LibAlexPathValidator` to answer the check from or `None` to check the filesystem directly.
+        """
+        if validator is not None:
+            exists = validator.exists(self.path)
+        else:
+            exists = laShared.checkPath(self.path)
+
+        if not exists:
+            raise FileNotFoundError(f"Related File called \"{self.label}\" could not be found at: {self.path}")
+
+    def toRecord(self) -> tuple:
+        """
+        Returns a compact tuple record of the object that can be restored with `fromRecord(...)`.
+
+        Unlike `toJson()`, the filepath is kept absolute.
+        """
+        return (self.label, self.path, self.description, self.id)
+
     def toJsonStr(self) -> str:
         """
         Returns a JSON string representation of the object.
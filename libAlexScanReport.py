@@ -0,0 +1,122 @@
+# LibAlexandria: LibAlexandria Scan Report
+# Structured per-file errors and totals of a LibAlexandria Library scan.
+
+# Imports
+from typing import Any
+
+import libAlexDefaults as laShared
+
+# Classes
+class LibAlexScanError:
+    """
+    A meta file that could not be loaded during a scan.
+    """
+    # Slots
+    __slots__ = ("metaPath", "errorType", "message")
+
+    # Constructors
+    def __init__(self, metaPath: str, errorType: str, message: str):
+        """
+        Creates a new scan error.
+
+        metaPath: The absolute path to the meta file.
+        errorType: The name of the exception type that was raised, like `ValueError`.
+        message: The message of the exception.
+        """
+        self.metaPath = metaPath
+        self.errorType = errorType
+        self.message = message
+
+    @classmethod
+    def fromException(cls, metaPath: str, error: Exception) -> 'LibAlexScanError':
+        """
+        Creates a scan error from a raised exception.
+
+        metaPath: The absolute path to the meta file.
+        error: The exception raised while loading it.
+
+        Returns a new scan error.
+        """
+        return cls(metaPath, type(error).__name__, str(error))
+
+    # Python Functions
+    def __str__(self) -> str:
+        return f"{self.metaPath}: {self.errorType}: {self.message}"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({laShared.slotValues(self)})"
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, LibAlexScanError):
+            return NotImplemented
+
+        return (self.metaPath, self.errorType, self.message) == (other.metaPath, other.errorType, other.message)
+
+    def __hash__(self) -> int:
+        return hash(self.toRecord())
+
+    # Functions
+    def toRecord(self) -> tuple[str, str, str]:
+        """
+        Returns a compact `(metaPath, errorType, message)` tuple of the error.
+        """
+        return (self.metaPath, self.errorType, self.message)
+
+class LibAlexScanReport:
+    """
+    The totals and errors of a scan that continues past files that fail to load.
+    """
+    # Constructors
+    def __init__(self):
+        """
+        Creates a new empty report.
+        """
+        self.loaded = 0
+        self.resumed = 0
+        self.errors: list[LibAlexScanError] = []
+
+    # Python Functions
+    def __str__(self) -> str:
+        return f"{self.loaded} loaded, {self.resumed} resumed, {len(self.errors)} failed"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.__dict__})"
+
+    # Properties
+    @property
+    def failed(self) -> int:
+        """
+        The number of meta files that failed to load.
+        """
+        return len(self.errors)
+
+    # Functions
+    def errorsByType(self) -> dict[str, list[LibAlexScanError]]:
+        """
+        Groups the errors by the name of their exception type.
+
+        Returns a dictionary of exception type names to errors in the order they were recorded.
+        """
+        groups: dict[str, list[LibAlexScanError]] = {}
+        for error in self.errors:
+            groups.setdefault(error.errorType, []).append(error)
+
+        return groups
+
+    def toJson(self) -> dict[str, Any]:
+        """
+        Returns the JSON representation of the report.
+        """
+        return {
+            "loaded": self.loaded,
+            "resumed": self.resumed,
+            "failed": self.failed,
+            "errors": [
+                {"metaPath": e.metaPath, "errorType": e.errorType, "message": e.message}
+                for e in self.errors
+            ]
+        }
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,372 @@
+# LibAlexandria: LibAlexandria Library Scanner
+# Discovers and loads every LibAlexandria Item below a library root directory.
+
+# Imports
+import os
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from itertools import islice
+from typing import Iterator, AsyncIterator, Iterable, Optional, Union
+
+import libAlexDefaults as laShared
+import libAlexInstrumentation as laInst
+from libAlexItem import LibAlexItem
+from libAlexLazyItem import LibAlexLazyItem
+from libAlexCatalogCache import LibAlexCatalogCache
+from libAlexPathValidator import LibAlexPathValidator
+from libAlexPathTrie import LibAlexFlagTrie
+from libAlexScanReport import LibAlexScanError, LibAlexScanReport
+from libAlexCheckpoint import LibAlexScanCheckpoint
+
+# Classes
+class LibAlexScanner:
+    """
+    Walks a LibAlexandria Library and loads its Items through a bounded thread pool.
+    """
+    # Constructors
+    def __init__(self,
+        rootPath: str,
+        workers: int = laShared.DEF_SCAN_WORKERS,
+        ordered: bool = laShared.DEF_SCAN_ORDERED,
+        cache: Optional[LibAlexCatalogCache] = None,
+        validator: Optional[LibAlexPathValidator] = None,
+        deferValidation: bool = False,
+        flagTrie: Optional[LibAlexFlagTrie] = None,
+        collectErrors: bool = False,
+        checkpoint: Optional[LibAlexScanCheckpoint] = None,
+        lazy: bool = False
+    ):
+        """
+        Creates a new LibAlexandria Library scanner.
+
+        rootPath: The path to the root directory of the library.
+        workers: The maximum number of threads used to load items.
+        ordered: If `True`, items are yielded in path order. If `False`, items are yielded as soon as they are loaded.
+        cache: A `LibAlexCatalogCache` used to skip parsing unchanged items or `None`.
+        validator: A `LibAlexPathValidator` that is seeded with the directory listings of the walk and answers every existence check or `None` to check each path directly.
+        deferValidation: If `True`, source and related files are not checked for existence while loading.
+        flagTrie: A `LibAlexFlagTrie` to resolve directory flags with or `None` to create one for this scanner.
+        collectErrors: If `True`, meta files that fail to load are recorded in `report` and the scan continues. If `False`, the first error is raised.
+        checkpoint: A `LibAlexScanCheckpoint` that records progress so an interrupted scan resumes where it stopped or `None`.
+        lazy: If `True`, items are loaded as `LibAlexLazyItem` objects that resolve their source file, related files, and description on first use. Items served from a cache are always loaded fully.
+        """
+        self.rootPath = laShared.fullpath(rootPath)
+        self.workers = max(1, workers)
+        self.ordered = ordered
+        self.cache = cache
+        self.validator = validator
+        self.deferValidation = deferValidation
+        self.flagTrie = (flagTrie if flagTrie is not None else LibAlexFlagTrie())
+        self.collectErrors = collectErrors
+        self.checkpoint = checkpoint
+        self.lazy = lazy
+        self.report = LibAlexScanReport()
+
+    # Python Functions
+    def __iter__(self) -> Iterator[LibAlexItem]:
+        return self.scan()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.__dict__})"
+
+    # Functions
+    def findMetaFiles(self) -> Iterator[str]:
+        """
+        Walks the library using `os.scandir` and yields the absolute path of every meta file found.
+        Meta files are yielded in path order with a directory's own meta file preceding those of its subdirectories.
+        If the library root does not exist, a `FileNotFoundError` will be raised.
+        """
+        # Verify the root exists
+        if not os.path.isdir(self.rootPath):
+            # Fail
+            raise FileNotFoundError(f"No library directory present to scan at: {self.rootPath}")
+
+        # Walk the tree depth first
+        stack = [self.rootPath]
+        while stack:
+            dirPath = stack.pop()
+
+            # List the directory
+            laInst.start()
+            try:
+                with os.scandir(dirPath) as dirIter:
+                    entries = sorted(dirIter, key=lambda e: e.name)
+            except OSError:
+                # Skip unreadable directories like `os.walk` does
+                continue
+
+            laInst.lap("syscall.scandir")
+
+            # Share the listing with the validator
+            if self.validator is not None:
+                self.validator.addListing(dirPath, entries)
+
+            # Sort out the entries
+            subDirs = []
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subDirs.append(entry.path)
+                    elif (entry.name == laShared.META_FILENAME) and entry.is_file():
+                        yield entry.path
+                except OSError:
+                    # Entry vanished while walking
+                    continue
+
+            # Queue the subdirectories so they are popped in order
+            stack.extend(reversed(subDirs))
+
+    def scan(self) -> Iterator[LibAlexItem]:
+        """
+        Loads every item in the library and yields each `LibAlexItem` as it becomes available.
+        Loading starts before the walk has finished and at most a small multiple of `workers` items are held in flight.
+        If an item fails to load, the error raised by `LibAlexItem.fromMetaFile(...)` is raised from the generator unless `collectErrors` is set.
+
+        When a cache is attached, a completed scan also prunes cache entries below the root that no longer exist.
+        The cache is not saved automatically.
+
+        When a checkpoint is attached, meta files finished by an earlier interrupted scan are skipped and an item only counts as finished once the consumer asks for the next one.
+        A completed scan removes the checkpoint.
+        """
+        # Prepare the pool
+        maxPending = self.workers * 2
+        pending: deque[Future] = deque()
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+
+        seenPaths: list[str] = []
+        completed = False
+        self._beginReport()
+
+        try:
+            # Submit items as they are discovered
+            for metaPath in self.findMetaFiles():
+                seenPaths.append(metaPath)
+
+                # Skip items finished before an interruption
+                if (self.checkpoint is not None) and self.checkpoint.isDone(metaPath):
+                    self.report.resumed += 1
+                    continue
+
+                pending.append(executor.submit(self._loadResult, metaPath))
+
+                # Hand back items once the window is full
+                if len(pending) >= maxPending:
+                    yield from self._finishResults(self._collect(pending, maxPending - 1))
+
+            # Hand back the remaining items
+            yield from self._finishResults(self._collect(pending, 0))
+            completed = True
+
+            # Forget removed items
+            if self.cache is not None:
+                self.cache.prune(seenPaths, rootPath=self.rootPath)
+        finally:
+            # Drop anything the consumer no longer wants
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._endCheckpoint(completed)
+
+    async def scanAsync(self) -> AsyncIterator[LibAlexItem]:
+        """
+        Loads every item in the library without blocking the running event loop and yields each `LibAlexItem` as it becomes available.
+        Walking and loading run in threads with at most a small multiple of `workers` items held in flight.
+        If the consumer stops iterating or is cancelled, no further items are loaded.
+        If an item fails to load, the error raised by `LibAlexItem.fromMetaFile(...)` is raised from the generator unless `collectErrors` is set.
+        Checkpoints are used as they are by `scan()`.
+        """
+        # Prepare the pool
+        loop = asyncio.get_running_loop()
+        maxPending = self.workers * 2
+        pending: deque[asyncio.Future] = deque()
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+
+        metaPaths = self.findMetaFiles()
+        seenPaths: list[str] = []
+        exhausted = False
+        completed = False
+        self._beginReport()
+
+        try:
+            while pending or not exhausted:
+                # Top up the in-flight window
+                if (not exhausted) and (len(pending) < maxPending):
+                    batch = await asyncio.to_thread(self._nextMetaFiles, metaPaths, maxPending - len(pending))
+                    if not batch:
+                        exhausted = True
+
+                    for metaPath in batch:
+                        seenPaths.append(metaPath)
+
+                        # Skip items finished before an interruption
+                        if (self.checkpoint is not None) and self.checkpoint.isDone(metaPath):
+                            self.report.resumed += 1
+                            continue
+
+                        pending.append(loop.run_in_executor(executor, self._loadResult, metaPath))
+
+                    continue
+
+                # Hand back loaded items
+                failure = None
+                if self.ordered:
+                    # Wait for the oldest item
+                    results = [await pending.popleft()]
+                else:
+                    # Wait for any item
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    pending = deque(f for f in pending if f not in done)
+
+                    results = []
+                    for future in done:
+                        if future.exception() is None:
+                            results.append(future.result())
+                        elif failure is None:
+                            failure = future
+
+                for item in self._finishResults(results):
+                    yield item
+
+                # Raise the first failure once every loaded item was yielded
+                if failure is not None:
+                    failure.result()
+
+            completed = True
+
+            # Forget removed items
+            if self.cache is not None:
+                self.cache.prune(seenPaths, rootPath=self.rootPath)
+        finally:
+            # Drop anything the consumer no longer wants without blocking the loop
+            for future in pending:
+                future.cancel()
+
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._endCheckpoint(completed)
+
+    # Private Functions
+    @staticmethod
+    def _nextMetaFiles(metaPaths: Iterator[str], count: int) -> list[str]:
+        """
+        Takes up to the provided number of meta filepaths from the walk.
+
+        metaPaths: The walk as returned by `findMetaFiles()`.
+        count: The maximum number of paths to take.
+        """
+        return list(islice(metaPaths, count))
+
+    def _loadItem(self, metaPath: str) -> LibAlexItem:
+        """
+        Loads a single item from the provided meta file.
+
+        metaPath: The absolute path to the meta file.
+
+        Returns a new LibAlexandria Item.
+        """
+        loadArgs = {
+            "validator": self.validator,
+            "deferValidation": self.deferValidation,
+            "flagTrie": self.flagTrie
+        }
+
+        if self.cache is not None:
+            return self.cache.loadItem(metaPath, **loadArgs)
+
+        if self.lazy:
+            return LibAlexLazyItem.fromMetaFile(metaPath, **loadArgs)
+
+        return LibAlexItem.fromMetaFile(metaPath, **loadArgs)
+
+    def _loadResult(self, metaPath: str) -> Union[LibAlexItem, LibAlexScanError]:
+        """
+        Loads a single item and captures its error when errors are collected.
+
+        metaPath: The absolute path to the meta file.
+
+        Returns the new LibAlexandria Item or the `LibAlexScanError` of the meta file.
+        """
+        try:
+            return self._loadItem(metaPath)
+        except (ValueError, OSError) as e:
+            if not self.collectErrors:
+                raise
+
+            return LibAlexScanError.fromException(metaPath, e)
+
+    def _beginReport(self):
+        """
+        Starts a new report and opens the checkpoint for a scan.
+        Errors recorded before an interruption are carried over from the checkpoint.
+        """
+        self.report = LibAlexScanReport()
+        if self.checkpoint is not None:
+            self.checkpoint.begin(self.rootPath)
+            self.report.errors.extend(self.checkpoint.errors)
+
+    def _endCheckpoint(self, completed: bool):
+        """
+        Closes the checkpoint at the end of a scan.
+
+        completed: If `True`, the scan finished and the checkpoint is removed. If `False`, it is kept to resume from.
+        """
+        if self.checkpoint is None:
+            return
+
+        if completed:
+            self.checkpoint.finish()
+        else:
+            self.checkpoint.close()
+
+    def _finishResults(self, results: Iterable[Union[LibAlexItem, LibAlexScanError]]) -> Iterator[LibAlexItem]:
+        """
+        Records loaded results in the report and checkpoint and yields the items.
+
+        results: The loaded items and errors.
+        """
+        for result in results:
+            # Record the error
+            if isinstance(result, LibAlexScanError):
+                self.report.errors.append(result)
+                if self.checkpoint is not None:
+                    self.checkpoint.recordError(result)
+
+                continue
+
+            # Hand back the item
+            self.report.loaded += 1
+            yield result
+
+            # Only count it once the consumer is done with it
+            if self.checkpoint is not None:
+                self.checkpoint.markDone(result.metaFilepath)
+
+    def _collect(self, pending: deque, keep: int) -> Iterator[Union[LibAlexItem, LibAlexScanError]]:
+        """
+        Yields loaded results from the pending futures until no more than `keep` remain.
+
+        pending: The queue of pending futures. It is modified in place.
+        keep: The number of futures that may be left pending.
+        """
+        while len(pending) > keep:
+            if self.ordered:
+                # Wait for the oldest item
+                yield pending.popleft().result()
+            else:
+                # Wait for any item
+                done, notDone = wait(pending, return_when=FIRST_COMPLETED)
+                pending.clear()
+                pending.extend(notDone)
+
+                # Yield every loaded item before raising the first failure
+                failure = None
+                for future in done:
+                    if future.exception() is None:
+                        yield future.result()
+                    elif failure is None:
+                        failure = future
+
+                if failure is not None:
+                    failure.result()
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -3,12 +3,26 @@
 
 # Imports
 import re
+from functools import lru_cache
+
+import libAlexDefaults as laShared
+
+# Variables
+_VERSION_PATTERN = re.compile(
+    r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$",
+    re.MULTILINE
+)
 
 # Classes
 class SemanticVersion:
     """
     Interprets "Semantic Versioning 2.0.0" strings as code accessible parameters.
+
+    Objects are immutable once constructed so identical version strings can share a single instance through `fromString(...)`.
     """
+    # Slots
+    __slots__ = ("string", "isValid", "major", "minor", "patch", "preRelease", "metaData", "sortKey")
+
     # Constructor
     def __init__(self, s: str):
         """
@@ -32,30 +46,65 @@ class SemanticVersion:
         # Interpret the version
         self._parse()
 
+        # Precompute the precedence key which also freezes the object
+        self.sortKey = self._buildSortKey()
+
+    @classmethod
+    def fromString(cls, s: str) -> 'SemanticVersion':
+        """
+        Returns a shared `SemanticVersion` for the provided string.
+        Recently used version strings are only parsed once.
+
+        s: A Semantic Versioning version string like `1.0.0`.
+        """
+        if cls is SemanticVersion:
+            return _cachedVersion(s)
+
+        return cls(s)
+
     # Python Functions
     def __str__(self) -> str:
         return self.string
 
     def __repr__(self):
-        return f"{self.__class__.__name__}({self.__dict__})"
+        return f"{self.__class__.__name__}({laShared.slotValues(self)})"
+
+    def __setattr__(self, name: str, value):
+        # Only allow assignment while constructing
+        if hasattr(self, "sortKey"):
+            raise AttributeError(f"{self.__class__.__name__} objects are immutable.")
+
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self):
+        return (self.__class__, (self.string,))
+
+    def __hash__(self) -> int:
+        return hash(self.string)
 
     def __eq__(self, other: 'SemanticVersion') -> bool:
+        if not isinstance(other, SemanticVersion):
+            return NotImplemented
+
         return self.string == other.string
 
     def __ne__(self, other: 'SemanticVersion') -> bool:
+        if not isinstance(other, SemanticVersion):
+            return NotImplemented
+
         return self.string != other.string
 
     def __lt__(self, other: 'SemanticVersion') -> bool:
-        return self._versionTuple() < other._versionTuple()
+        return self.sortKey < other.sortKey
 
     def __le__(self, other: 'SemanticVersion') -> bool:
-        return self._versionTuple() <= other._versionTuple()
+        return self.sortKey <= other.sortKey
 
     def __gt__(self, other: 'SemanticVersion') -> bool:
-        return self._versionTuple() > other._versionTuple()
+        return self.sortKey > other.sortKey
 
     def __ge__(self, other: 'SemanticVersion') -> bool:
-        return self._versionTuple() >= other._versionTuple()
+        return self.sortKey >= other.sortKey
 
     # Private Functions
     def _parse(self):
@@ -77,8 +126,7 @@ class SemanticVersion:
             return
 
         # Collect matches
-        regex = r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
-        matches = re.finditer(regex, self.string, re.MULTILINE)
+        matches = _VERSION_PATTERN.finditer(self.string)
 
         # Loop through matches
         matchNum = -1
@@ -133,6 +181,36 @@ class SemanticVersion:
         """
         return (self.major, self.minor, self.patch)
 
+    def _buildSortKey(self) -> tuple:
+        """
+        Builds a tuple that orders versions by "Semantic Versioning 2.0.0" precedence.
+
+        Pre-release versions precede their release, numeric identifiers precede alphanumeric ones and compare numerically, and build meta data is ignored.
+        """
+        # Releases follow every pre-release
+        if not self.preRelease:
+            return (self.major, self.minor, self.patch, (1,))
+
+        # Order the pre-release identifiers
+        identifiers = []
+        for ident in self.preRelease.split("."):
+            if ident.isdigit():
+                identifiers.append((0, int(ident), ""))
+            else:
+                identifiers.append((1, 0, ident))
+
+        return (self.major, self.minor, self.patch, (0, *identifiers))
+
+# Functions
+@lru_cache(maxsize=laShared.DEF_VERSION_CACHE_SIZE)
+def _cachedVersion(s: str) -> SemanticVersion:
+    """
+    Parses and caches a `SemanticVersion` for the provided string.
+
+    s: A Semantic Versioning version string like `1.0.0`.
+    """
+    return SemanticVersion(s)
+
 # Console Execution
 if __name__ == "__main__":
     print("This file cannot be run from the command line.")
@@ -0,0 +1,484 @@
+# LibAlexandria: LibAlexandria Snapshot
+# A compact, memory-mapped binary snapshot of a whole LibAlexandria Library for instant startup.
+
+# Imports
+import os
+import sys
+import mmap
+import shutil
+import struct
+import tempfile
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, Optional
+
+import libAlexDefaults as laShared
+from libAlexItem import LibAlexItem
+from libAlexRelatedFile import LibAlexRelatedFile
+from libAlexSemanticVersion import SemanticVersion
+
+# Variables
+_MAGIC = b"LIBALEXS"
+_HEADER = struct.Struct("<8s16s9I")
+_HEADER_WORDS = _HEADER.size // 4
+
+_NONE = 0xFFFFFFFF
+
+_STRING_FIELDS = ("metaFilepath", "version", "title", "author", "date", "description", "directory", "sourceFile", "classification")
+_RECORD_WORDS = len(_STRING_FIELDS) + 5
+_FLAG_START = len(_STRING_FIELDS)
+_FLAG_COUNT = _FLAG_START + 1
+_RESOLVED_FLAG_COUNT = _FLAG_START + 2
+_RELATED_START = _FLAG_START + 3
+_RELATED_COUNT = _FLAG_START + 4
+_RELATED_WORDS = 4
+
+# Classes
+class LibAlexSnapshot:
+    """
+    A read-only binary snapshot of a whole LibAlexandria Library opened with `mmap`.
+
+    The file holds a sorted table of unique strings, one fixed-width record of string ids and counts per item sorted by meta filepath, and flat arrays of flag ids and related file records addressed by offsets from each record.
+    Opening a snapshot only maps the file, lookups and filters read the mapped words in place, and `LibAlexItem` objects are only built for the rows a caller asks for.
+    Snapshots are written with `LibAlexSnapshot.write(...)` and use little-endian 32-bit words, so they can only be opened on little-endian hosts.
+    """
+    # Variables
+    FIELDS = _STRING_FIELDS
+
+    # Constructors
+    def __init__(self, snapshotPath: str):
+        """
+        Opens an existing snapshot file.
+        If the file is not a snapshot, was written by an incompatible version, or the host is big-endian, a `ValueError` will be raised.
+
+        snapshotPath: The path to the snapshot file.
+        """
+        self.snapshotPath = laShared.fullpath(snapshotPath)
+
+        # Check the host
+        if sys.byteorder != "little":
+            # Fail
+            raise ValueError("LibAlexandria Snapshots can only be opened on little-endian hosts.")
+
+        # Map the file
+        with open(self.snapshotPath, "rb") as snapshotFile:
+            size = os.fstat(snapshotFile.fileno()).st_size
+            if (size < _HEADER.size) or (size % 4 != 0):
+                # Fail
+                raise ValueError(f"\"{self.snapshotPath}\" is not a LibAlexandria Snapshot.")
+
+            self._mmap = mmap.mmap(snapshotFile.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Check the header
+        magic, version, *counts = _HEADER.unpack_from(self._mmap)
+        version = version.rstrip(b"\0").decode("ascii", "replace")
+        if magic != _MAGIC:
+            self._mmap.close()
+            # Fail
+            raise ValueError(f"\"{self.snapshotPath}\" is not a LibAlexandria Snapshot.")
+
+        if version != laShared.VER_SNAPSHOT:
+            self._mmap.close()
+            # Fail
+            raise ValueError(f"\"{self.snapshotPath}\" was written as snapshot version {version} but version {laShared.VER_SNAPSHOT} is required.")
+
+        (
+            self._recordCount, self._stringCount, _, _,
+            self._stringOffsets, self._stringData, self._records, self._flags, self._related
+        ) = counts
+        self._words = memoryview(self._mmap).cast("I")
+
+    # Python Functions
+    def __len__(self) -> int:
+        return self._recordCount
+
+    def __iter__(self) -> Iterator[LibAlexItem]:
+        for row in range(self._recordCount):
+            yield self.item(row)
+
+    def __contains__(self, metaPath: str) -> bool:
+        return self.row(metaPath) is not None
+
+    def __enter__(self) -> 'LibAlexSnapshot':
+        return self
+
+    def __exit__(self, *excInfo):
+        self.close()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(snapshotPath={self.snapshotPath!r}, records={self._recordCount}, strings={self._stringCount})"
+
+    # Functions
+    @staticmethod
+    def write(items: Iterable[LibAlexItem], snapshotPath: str) -> int:
+        """
+        Writes a snapshot of the provided items.
+        The file is replaced atomically so an interrupted write never leaves a partial snapshot behind.
+        If an item has no meta filepath, a `ValueError` will be raised.
+        When two items share a meta filepath, the later one is kept.
+
+        items: The items to write. A `LibAlexLibrary`, a `LibAlexScanner`, or its `scan()` generator may be provided.
+        snapshotPath: The path to write the snapshot file to.
+
+        Returns the number of items written.
+        """
+        # Flatten the items
+        latest: dict[str, tuple] = {}
+        for item in items:
+            # Check the key
+            if item.metaFilepath is None:
+                # Fail
+                raise ValueError("A LibAlexandria Item must have a meta filepath to be written to a snapshot.")
+
+            metaPath = laShared.fullpath(item.metaFilepath)
+            latest[metaPath] = (metaPath, *item.toRecord())
+
+        # Collect the strings in encoded byte order, keeping undecodable filenames as their original bytes
+        strings = set()
+        for record in latest.values():
+            (
+                metaPath, version, title, author, date, description, directory, sourceFile,
+                relatedFiles, _, classification, flags, resolvedFlags
+            ) = record
+            strings.update((metaPath, version, title, author, date, description, directory, sourceFile, classification))
+            strings.update(flags or ())
+            strings.update(resolvedFlags or ())
+            for relatedFile in (relatedFiles or ()):
+                strings.update(relatedFile)
+
+        strings.discard(None)
+        encoded = sorted((s.encode("utf-8", "surrogateescape"), s) for s in strings)
+        stringIds = {s: stringId for stringId, (_, s) in enumerate(encoded)}
+        stringIds[None] = _NONE
+        encoded = [data for data, _ in encoded]
+
+        # Build the string table
+        stringOffsets = [0]
+        for data in encoded:
+            stringOffsets.append(stringOffsets[-1] + len(data))
+
+        stringData = b"".join(encoded)
+        stringData += b"\0" * (-len(stringData) % 4)
+
+        # Build the records, flags, and related files in meta filepath order
+        records = []
+        flagIds = []
+        relatedWords = []
+        for metaPath in sorted(latest, key=stringIds.__getitem__):
+            (
+                metaPath, version, title, author, date, description, directory, sourceFile,
+                relatedFiles, _, classification, flags, resolvedFlags
+            ) = latest[metaPath]
+
+            records.extend(stringIds[s] for s in (metaPath, version, title, author, date, description, directory, sourceFile, classification))
+            records.append(len(flagIds))
+            records.append(len(flags) if flags is not None else _NONE)
+            records.append(len(resolvedFlags) if resolvedFlags is not None else _NONE)
+            flagIds.extend(stringIds[flag] for flag in (flags or ()))
+            flagIds.extend(stringIds[flag] for flag in (resolvedFlags or ()))
+
+            records.append(len(relatedWords) // _RELATED_WORDS)
+            records.append(len(relatedFiles) if relatedFiles is not None else _NONE)
+            for relatedFile in (relatedFiles or ()):
+                relatedWords.extend(stringIds[s] for s in relatedFile)
+
+        # Lay out the sections in words
+        stringOffsetsStart = _HEADER_WORDS
+        stringDataStart = stringOffsetsStart + len(stringOffsets)
+        recordsStart = stringDataStart + (len(stringData) // 4)
+        flagsStart = recordsStart + len(records)
+        relatedStart = flagsStart + len(flagIds)
+
+        header = _HEADER.pack(
+            _MAGIC,
+            laShared.VER_SNAPSHOT.encode("ascii"),
+            len(latest),
+            len(strings),
+            len(flagIds),
+            len(relatedWords) // _RELATED_WORDS,
+            stringOffsetsStart,
+            stringDataStart,
+            recordsStart,
+            flagsStart,
+            relatedStart
+        )
+
+        # Write next to the destination then swap it in
+        snapshotPath = laShared.fullpath(snapshotPath)
+        os.makedirs(os.path.dirname(snapshotPath), exist_ok=True)
+        tempFd, tempPath = tempfile.mkstemp(prefix=f".{os.path.basename(snapshotPath)}.", suffix=".tmp", dir=os.path.dirname(snapshotPath))
+        try:
+            with os.fdopen(tempFd, "wb") as snapshotFile:
+                snapshotFile.write(header)
+                snapshotFile.write(struct.pack(f"<{len(stringOffsets)}I", *stringOffsets))
+                snapshotFile.write(stringData)
+                for words in (records, flagIds, relatedWords):
+                    snapshotFile.write(struct.pack(f"<{len(words)}I", *words))
+
+            # Keep the permissions of the file being replaced
+            try:
+                shutil.copymode(snapshotPath, tempPath)
+            except OSError:
+                os.chmod(tempPath, 0o644)
+
+            os.replace(tempPath, snapshotPath)
+        except BaseException:
+            # Clean up the partial file
+            try:
+                os.remove(tempPath)
+            except OSError:
+                pass
+
+            raise
+
+        return len(latest)
+
+    def close(self):
+        """
+        Unmaps the snapshot file.
+        Items that were already built stay usable.
+        """
+        if self._mmap.closed:
+            return
+
+        self._words.release()
+        self._mmap.close()
+
+    def row(self, metaPath: str) -> Optional[int]:
+        """
+        Finds the row of the item with the provided meta filepath.
+
+        metaPath: The path to the meta file of the item.
+
+        Returns the row number or `None` if the item is not in the snapshot.
+        """
+        # Find the string
+        stringId = self._stringId(laShared.fullpath(metaPath))
+        if stringId is None:
+            return None
+
+        # Records are sorted by meta filepath so their string ids are in order too
+        rows = range(self._recordCount)
+        row = bisect_left(rows, stringId, key=lambda r: self._words[self._records + (r * _RECORD_WORDS)])
+        if (row < self._recordCount) and (self._words[self._records + (row * _RECORD_WORDS)] == stringId):
+            return row
+
+        return None
+
+    def item(self, row: int) -> LibAlexItem:
+        """
+        Builds the item stored in the provided row.
+        No files are read or checked for existence.
+        If the row does not exist, an `IndexError` will be raised.
+
+        row: The row number.
+
+        Returns a new LibAlexandria Item.
+        """
+        # Check the row
+        if not (0 <= row < self._recordCount):
+            # Fail
+            raise IndexError(f"Row {row} is not in a snapshot of {self._recordCount} items.")
+
+        # Read the record
+        base = self._records + (row * _RECORD_WORDS)
+        (
+            metaPath, version, title, author, date, description, directory, sourceFile, classification
+        ) = (self._string(self._words[base + i]) for i in range(len(_STRING_FIELDS)))
+
+        return LibAlexItem(
+            version=(SemanticVersion.fromString(version) if version is not None else None),
+            title=title,
+            author=author,
+            date=date,
+            description=description,
+            directory=directory,
+            sourceFile=sourceFile,
+            relatedFiles=self.relatedFilesOf(row),
+            metaFilepath=metaPath,
+            classification=classification,
+            flags=self._flagList(base, 0),
+            resolvedFlags=self._flagList(base, 1)
+        )
+
+    def getItem(self, metaPath: str) -> Optional[LibAlexItem]:
+        """
+        Builds the item with the provided meta filepath.
+
+        metaPath: The path to the meta file of the item.
+
+        Returns a new LibAlexandria Item or `None` if the item is not in the snapshot.
+        """
+        row = self.row(metaPath)
+        return (self.item(row) if row is not None else None)
+
+    def items(self, rows: Iterable[int]) -> list[LibAlexItem]:
+        """
+        Builds the items stored in the provided rows.
+
+        rows: The row numbers, like those returned by `withFlag(...)`.
+        """
+        return [self.item(row) for row in rows]
+
+    def value(self, row: int, name: str) -> Optional[str]:
+        """
+        Reads a single string field of a row without building its item.
+
+        row: The row number.
+        name: One of `FIELDS`.
+        """
+        return self._string(self._words[self._records + (row * _RECORD_WORDS) + _STRING_FIELDS.index(name)])
+
+    def flagsOf(self, row: int) -> list[str]:
+        """
+        Reads every flag of a row, as returned by `LibAlexItem.getAllFlags()`, without building its item.
+
+        row: The row number.
+        """
+        base = self._records + (row * _RECORD_WORDS)
+        start = self._flags + self._words[base + _FLAG_START]
+        flagIds = set(self._words[start:start + self._flagCount(base)])
+
+        # Include the classification
+        flagIds.add(self._words[base + _STRING_FIELDS.index("classification")])
+        flagIds.discard(_NONE)
+
+        # String ids are in sorted string order
+        return [self._string(flagId) for flagId in sorted(flagIds)]
+
+    def relatedFilesOf(self, row: int) -> Optional[list[LibAlexRelatedFile]]:
+        """
+        Builds only the related files of a row.
+        The related files are not checked for existence.
+
+        row: The row number.
+
+        Returns a list of `LibAlexRelatedFile` objects or `None` if the item had none.
+        """
+        base = self._records + (row * _RECORD_WORDS)
+        count = self._words[base + _RELATED_COUNT]
+        if count == _NONE:
+            return None
+
+        start = self._related + (self._words[base + _RELATED_START] * _RELATED_WORDS)
+        return [
+            LibAlexRelatedFile.fromRecord(tuple(self._string(self._words[i + j]) for j in range(_RELATED_WORDS)))
+            for i in range(start, start + (count * _RELATED_WORDS), _RELATED_WORDS)
+        ]
+
+    def withFlag(self, flag: str) -> list[int]:
+        """
+        Finds the rows with the provided flag, resolved flag, or classification by comparing string ids in place.
+
+        flag: The flag to find.
+
+        Returns a sorted list of row numbers.
+        """
+        stringId = self._stringId(flag)
+        if stringId is None:
+            return []
+
+        # Find the flag ids then the records holding them
+        rows = set(self.withValue("classification", flag))
+        flagStarts = range(self._recordCount)
+        for position, flagId in enumerate(self._words[self._flags:self._flags + self._flagTotal()]):
+            if flagId == stringId:
+                rows.add(bisect_right(flagStarts, position, key=lambda r: self._words[self._records + (r * _RECORD_WORDS) + _FLAG_START]) - 1)
+
+        return sorted(rows)
+
+    def withValue(self, name: str, value: Optional[str]) -> list[int]:
+        """
+        Finds the rows whose string field exactly equals the provided value by comparing string ids in place.
+
+        name: One of `FIELDS`.
+        value: The value to find or `None`.
+
+        Returns a sorted list of row numbers.
+        """
+        stringId = (self._stringId(value) if value is not None else _NONE)
+        if stringId is None:
+            return []
+
+        column = self._words[self._records + _STRING_FIELDS.index(name):self._flags:_RECORD_WORDS]
+        return [row for row, valueId in enumerate(column) if valueId == stringId]
+
+    def metaPaths(self) -> list[str]:
+        """
+        Returns the meta filepath of every row in row order.
+        """
+        return [self.value(row, "metaFilepath") for row in range(self._recordCount)]
+
+    # Private Functions
+    def _string(self, stringId: int) -> Optional[str]:
+        """
+        Decodes a string of the string table.
+
+        stringId: The string id or the id of `None`.
+        """
+        if stringId == _NONE:
+            return None
+
+        start = self._stringOffsets + stringId
+        byteStart = (self._stringData * 4) + self._words[start]
+        byteEnd = (self._stringData * 4) + self._words[start + 1]
+        return self._mmap[byteStart:byteEnd].decode("utf-8", "surrogateescape")
+
+    def _stringId(self, s: str) -> Optional[int]:
+        """
+        Finds the id of a string by binary searching the sorted string table.
+
+        s: The string to find.
+
+        Returns the string id or `None` if the string is not in the table.
+        """
+        data = s.encode("utf-8", "surrogateescape")
+        dataStart = self._stringData * 4
+
+        # Compare the raw bytes in place
+        def stringBytes(stringId: int) -> bytes:
+            start = self._stringOffsets + stringId
+            return self._mmap[dataStart + self._words[start]:dataStart + self._words[start + 1]]
+
+        stringId = bisect_left(range(self._stringCount), data, key=stringBytes)
+        if (stringId < self._stringCount) and (stringBytes(stringId) == data):
+            return stringId
+
+        return None
+
+    def _flagCount(self, base: int) -> int:
+        """
+        Returns the number of flags and resolved flags of the record starting at the provided word.
+
+        base: The first word of the record.
+        """
+        return sum(count for count in (self._words[base + _FLAG_COUNT], self._words[base + _RESOLVED_FLAG_COUNT]) if count != _NONE)
+
+    def _flagList(self, base: int, which: int) -> Optional[list[str]]:
+        """
+        Reads the flags or resolved flags of the record starting at the provided word.
+
+        base: The first word of the record.
+        which: `0` for the flags or `1` for the resolved flags.
+
+        Returns a list of flags or `None` if the item had none.
+        """
+        count = self._words[base + _FLAG_COUNT + which]
+        if count == _NONE:
+            return None
+
+        start = self._flags + self._words[base + _FLAG_START]
+        if which == 1:
+            flagCount = self._words[base + _FLAG_COUNT]
+            start += (flagCount if flagCount != _NONE else 0)
+
+        return [self._string(flagId) for flagId in self._words[start:start + count]]
+
+    def _flagTotal(self) -> int:
+        """
+        Returns the number of words in the flags section.
+        """
+        return self._related - self._flags
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
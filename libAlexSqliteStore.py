@@ -0,0 +1,486 @@
+# LibAlexandria: LibAlexandria SQLite Store
+# A catalog of LibAlexandria Items persisted in a local SQLite database.
+
+# Imports
+import os
+import sqlite3
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Union
+
+import libAlexDefaults as laShared
+from libAlexItem import LibAlexItem
+from libAlexRelatedFile import LibAlexRelatedFile
+from libAlexSemanticVersion import SemanticVersion
+
+# Variables
+_ITEM_COLUMNS = (
+    "metaPath", "version", "versionOrder", "title", "author", "date", "description", "directory",
+    "sourceFile", "classification", "flagCount", "resolvedFlagCount", "relatedFileCount"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS info (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    metaPath TEXT NOT NULL UNIQUE,
+    version TEXT,
+    versionOrder TEXT,
+    title TEXT,
+    author TEXT,
+    date TEXT,
+    description TEXT,
+    directory TEXT,
+    sourceFile TEXT,
+    classification TEXT,
+    flagCount INTEGER,
+    resolvedFlagCount INTEGER,
+    relatedFileCount INTEGER
+);
+CREATE TABLE IF NOT EXISTS flags (
+    itemId INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+    resolved INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    flag TEXT NOT NULL,
+    PRIMARY KEY (itemId, resolved, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS relatedFiles (
+    itemId INTEGER NOT NULL REFERENCES items(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    label TEXT,
+    path TEXT,
+    description TEXT,
+    fileId TEXT,
+    PRIMARY KEY (itemId, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS flagsByFlag ON flags (flag, itemId);
+CREATE INDEX IF NOT EXISTS itemsByAuthor ON items (author COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS itemsByClassification ON items (classification);
+CREATE INDEX IF NOT EXISTS itemsByVersion ON items (versionOrder);
+"""
+
+# Classes
+class LibAlexSqliteStore:
+    """
+    A catalog of LibAlexandria Items persisted in a local SQLite database so very large libraries do not have to be held in memory.
+
+    Items are keyed by their meta filepath and written with batched transactional upserts.
+    Flags and related files are kept in their own tables, and flag, author, classification, and version lookups are indexed.
+    Query results are rebuilt into `LibAlexItem` objects a batch at a time as they are iterated.
+    """
+    # Constructors
+    def __init__(self, dbPath: str = ":memory:", batchSize: int = laShared.DEF_SQLITE_BATCH_SIZE):
+        """
+        Opens or creates a SQLite store.
+        If the database was written by an incompatible version, a `ValueError` will be raised.
+
+        dbPath: The path to the database file or `:memory:` to keep the store in memory only.
+        batchSize: The number of items written per transaction and rebuilt per query batch.
+        """
+        self.dbPath = (laShared.fullpath(dbPath) if dbPath != ":memory:" else dbPath)
+        self.batchSize = max(1, batchSize)
+
+        # Open the database
+        if self.dbPath != ":memory:":
+            os.makedirs(os.path.dirname(self.dbPath), exist_ok=True)
+
+        self._connection = sqlite3.connect(self.dbPath)
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        if self.dbPath != ":memory:":
+            self._connection.execute("PRAGMA journal_mode = WAL")
+            self._connection.execute("PRAGMA synchronous = NORMAL")
+
+        # Prepare the schema
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+            row = self._connection.execute("SELECT value FROM info WHERE key = '_storever'").fetchone()
+            if row is None:
+                self._connection.execute("INSERT INTO info (key, value) VALUES ('_storever', ?)", (laShared.VER_SQLITE_STORE,))
+
+        if (row is not None) and (row[0] != laShared.VER_SQLITE_STORE):
+            self._connection.close()
+
+            # Fail
+            raise ValueError(f"\"{row[0]}\" is not a supported version of LibAlexandria SQLite store: {self.dbPath}")
+
+    # Python Functions
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def __contains__(self, metaPath: str) -> bool:
+        return self._connection.execute("SELECT 1 FROM items WHERE metaPath = ?", (laShared.fullpath(metaPath),)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[LibAlexItem]:
+        return self.find()
+
+    def __enter__(self) -> 'LibAlexSqliteStore':
+        return self
+
+    def __exit__(self, *excInfo):
+        self.close()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(dbPath={self.dbPath!r}, batchSize={self.batchSize})"
+
+    # Functions
+    def close(self):
+        """
+        Closes the database.
+        """
+        self._connection.close()
+
+    def upsertItems(self, items: Iterable[LibAlexItem]) -> int:
+        """
+        Inserts the provided items or replaces those already stored under the same meta filepath.
+        Items are written `batchSize` at a time, each batch in a single transaction, so an iterating scan can be stored as it runs.
+        If an item has no meta filepath, a `ValueError` will be raised.
+
+        items: The items to store.
+
+        Returns the number of items written.
+        """
+        written = 0
+        items = iter(items)
+        while True:
+            batch = list(islice(items, self.batchSize))
+            if not batch:
+                return written
+
+            self._upsertBatch(batch)
+            written += len(batch)
+
+    def upsertItem(self, item: LibAlexItem):
+        """
+        Inserts the provided item or replaces the one already stored under the same meta filepath.
+        If the item has no meta filepath, a `ValueError` will be raised.
+
+        item: The item to store.
+        """
+        self._upsertBatch([item])
+
+    def removeItems(self, metaPaths: Iterable[str]) -> int:
+        """
+        Removes the items stored under the provided meta filepaths along with their flags and related files.
+
+        metaPaths: The meta filepaths of the items to remove.
+
+        Returns the number of items removed.
+        """
+        removed = 0
+        metaPaths = iter(metaPaths)
+        while True:
+            batch = [(laShared.fullpath(p),) for p in islice(metaPaths, self.batchSize)]
+            if not batch:
+                return removed
+
+            with self._connection:
+                removed += self._connection.executemany("DELETE FROM items WHERE metaPath = ?", batch).rowcount
+
+    def clear(self):
+        """
+        Removes every item from the store.
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM items")
+
+    def getItem(self, metaPath: str) -> Optional[LibAlexItem]:
+        """
+        Returns the item stored under the provided meta filepath or `None` if it is not stored.
+
+        metaPath: The path to the meta file of the item.
+        """
+        return next(self._select("items.metaPath = ?", [laShared.fullpath(metaPath)]), None)
+
+    def metaPaths(self) -> list[str]:
+        """
+        Returns the sorted meta filepaths of every stored item.
+        """
+        return [row[0] for row in self._connection.execute("SELECT metaPath FROM items ORDER BY metaPath")]
+
+    def find(self,
+        flags: Iterable[str] = (),
+        author: Optional[str] = None,
+        classification: Optional[str] = None,
+        low: Union[SemanticVersion, str, None] = None,
+        high: Union[SemanticVersion, str, None] = None,
+        includeLow: bool = True,
+        includeHigh: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Iterator[LibAlexItem]:
+        """
+        Finds the stored items matching every provided condition and rebuilds them as they are iterated.
+        With no conditions, every item matches.
+
+        flags: Flags that must all be among the flags or resolved flags of an item.
+        author: The author to match, ignoring case, or `None`.
+        classification: The classification to match or `None`. A trailing `*` matches as a prefix.
+        low: The lowest version to match or `None` for no lower bound.
+        high: The highest version to match or `None` for no upper bound.
+        includeLow: If `True`, items at exactly the `low` version match.
+        includeHigh: If `True`, items at exactly the `high` version match.
+        limit: The maximum number of items to return or `None` for every match.
+        offset: The number of matching items to skip for pagination.
+
+        Yields the matching items ordered by meta filepath.
+        """
+        where, params = self._where(flags, author, classification, low, high, includeLow, includeHigh)
+        return self._select(where, params, limit=limit, offset=offset)
+
+    def count(self,
+        flags: Iterable[str] = (),
+        author: Optional[str] = None,
+        classification: Optional[str] = None,
+        low: Union[SemanticVersion, str, None] = None,
+        high: Union[SemanticVersion, str, None] = None,
+        includeLow: bool = True,
+        includeHigh: bool = False
+    ) -> int:
+        """
+        Counts the stored items matching every provided condition without rebuilding them.
+        The conditions are those of `find(...)`.
+        """
+        where, params = self._where(flags, author, classification, low, high, includeLow, includeHigh)
+        return self._connection.execute(f"SELECT COUNT(*) FROM items WHERE {where}", params).fetchone()[0]
+
+    # Private Functions
+    def _upsertBatch(self, items: list[LibAlexItem]):
+        """
+        Writes a batch of items in a single transaction.
+
+        items: The items to write.
+        """
+        # Flatten the items keeping the last of any repeated meta filepath
+        latest = {}
+        for item in items:
+            row = self._itemRow(item)
+            latest.pop(row[0], None)
+            latest[row[0]] = (item, row)
+
+        items = [item for item, _ in latest.values()]
+        rows = [row for _, row in latest.values()]
+        metaPaths = list(latest)
+
+        with self._connection:
+            # Write the item fields
+            updates = ", ".join(f"{c} = excluded.{c}" for c in _ITEM_COLUMNS[1:])
+            self._connection.executemany(
+                f"INSERT INTO items ({', '.join(_ITEM_COLUMNS)}) VALUES ({', '.join('?' * len(_ITEM_COLUMNS))}) "
+                f"ON CONFLICT (metaPath) DO UPDATE SET {updates}",
+                rows
+            )
+
+            # Find the ids of the written rows
+            ids = dict(self._connection.execute(
+                f"SELECT metaPath, id FROM items WHERE metaPath IN ({', '.join('?' * len(metaPaths))})",
+                metaPaths
+            ).fetchall())
+            placeholders = ", ".join("?" * len(ids))
+            self._connection.execute(f"DELETE FROM flags WHERE itemId IN ({placeholders})", list(ids.values()))
+            self._connection.execute(f"DELETE FROM relatedFiles WHERE itemId IN ({placeholders})", list(ids.values()))
+
+            # Write the flags and related files
+            flagRows = []
+            relatedRows = []
+            for item, metaPath in zip(items, metaPaths):
+                itemId = ids[metaPath]
+                for resolved, itemFlags in ((0, item.flags), (1, item.resolvedFlags)):
+                    if isinstance(itemFlags, list):
+                        flagRows.extend((itemId, resolved, position, flag) for position, flag in enumerate(itemFlags))
+
+                if isinstance(item.relatedFiles, list):
+                    relatedRows.extend(
+                        (itemId, position, rf.label, rf.path, rf.description, rf.id)
+                        for position, rf in enumerate(item.relatedFiles)
+                    )
+
+            self._connection.executemany("INSERT INTO flags VALUES (?, ?, ?, ?)", flagRows)
+            self._connection.executemany("INSERT INTO relatedFiles VALUES (?, ?, ?, ?, ?, ?)", relatedRows)
+
+    def _itemRow(self, item: LibAlexItem) -> tuple:
+        """
+        Flattens the fields of an item into a row of the items table.
+        If the item has no meta filepath, a `ValueError` will be raised.
+
+        item: The item to flatten.
+        """
+        # Check the key
+        if item.metaFilepath is None:
+            # Fail
+            raise ValueError("A LibAlexandria Item must have a meta filepath to be stored.")
+
+        version = (item.version if isinstance(item.version, SemanticVersion) else None)
+        return (
+            laShared.fullpath(item.metaFilepath),
+            (version.string if version is not None else None),
+            (self._versionOrder(version) if (version is not None) and version.isValid else None),
+            item.title,
+            item.author,
+            item.date,
+            item.description,
+            item.directory,
+            item.sourceFile,
+            item.classification,
+            (len(item.flags) if isinstance(item.flags, list) else None),
+            (len(item.resolvedFlags) if isinstance(item.resolvedFlags, list) else None),
+            (len(item.relatedFiles) if isinstance(item.relatedFiles, list) else None)
+        )
+
+    def _where(self,
+        flags: Iterable[str],
+        author: Optional[str],
+        classification: Optional[str],
+        low: Union[SemanticVersion, str, None],
+        high: Union[SemanticVersion, str, None],
+        includeLow: bool,
+        includeHigh: bool
+    ) -> tuple[str, list]:
+        """
+        Builds the SQL condition of a query.
+        The conditions are those of `find(...)`.
+
+        Returns a `(where, params)` tuple.
+        """
+        conditions = []
+        params = []
+
+        # Flags
+        for flag in flags:
+            conditions.append("items.id IN (SELECT itemId FROM flags WHERE flag = ?)")
+            params.append(flag)
+
+        # Author
+        if author is not None:
+            conditions.append("items.author = ? COLLATE NOCASE")
+            params.append(author)
+
+        # Classification
+        if classification is not None:
+            if classification.endswith("*"):
+                # Match the prefix as a range so the index is used
+                prefix = classification[:-1]
+                conditions.append("(items.classification >= ? AND items.classification < ?)")
+                params.extend((prefix, prefix + "\U0010ffff"))
+            else:
+                conditions.append("items.classification = ?")
+                params.append(classification)
+
+        # Version
+        if low is not None:
+            conditions.append(f"items.versionOrder {'>=' if includeLow else '>'} ?")
+            params.append(self._versionOrder(self._boundVersion(low)))
+
+        if high is not None:
+            conditions.append(f"items.versionOrder {'<=' if includeHigh else '<'} ?")
+            params.append(self._versionOrder(self._boundVersion(high)))
+
+        return ((" AND ".join(conditions) if conditions else "1"), params)
+
+    def _select(self, where: str, params: list, limit: Optional[int] = None, offset: int = 0) -> Iterator[LibAlexItem]:
+        """
+        Runs an item query and rebuilds its results a batch at a time.
+
+        where: The SQL condition on the items table.
+        params: The parameters of the condition.
+        limit: The maximum number of items to return or `None` for every match.
+        offset: The number of matching items to skip.
+        """
+        cursor = self._connection.execute(
+            f"SELECT id, {', '.join(_ITEM_COLUMNS)} FROM items WHERE {where} ORDER BY metaPath LIMIT ? OFFSET ?",
+            [*params, (limit if limit is not None else -1), max(0, offset)]
+        )
+
+        while True:
+            rows = cursor.fetchmany(self.batchSize)
+            if not rows:
+                return
+
+            yield from self._buildItems(rows)
+
+    def _buildItems(self, rows: list[tuple]) -> list[LibAlexItem]:
+        """
+        Rebuilds items from rows of the items table along with their flags and related files.
+
+        rows: The rows to rebuild.
+        """
+        # Collect the flags and related files of the batch
+        ids = [row[0] for row in rows]
+        placeholders = ", ".join("?" * len(ids))
+        flags: dict[tuple[int, int], list[str]] = {}
+        for itemId, resolved, flag in self._connection.execute(
+            f"SELECT itemId, resolved, flag FROM flags WHERE itemId IN ({placeholders}) ORDER BY itemId, resolved, position",
+            ids
+        ):
+            flags.setdefault((itemId, resolved), []).append(flag)
+
+        relatedFiles: dict[int, list[LibAlexRelatedFile]] = {}
+        for itemId, label, path, description, fileId in self._connection.execute(
+            f"SELECT itemId, label, path, description, fileId FROM relatedFiles WHERE itemId IN ({placeholders}) ORDER BY itemId, position",
+            ids
+        ):
+            relatedFiles.setdefault(itemId, []).append(LibAlexRelatedFile.fromRecord((label, path, description, fileId)))
+
+        # Build the objects
+        items = []
+        for (
+            itemId, metaPath, version, _, title, author, date, description, directory,
+            sourceFile, classification, flagCount, resolvedFlagCount, relatedFileCount
+        ) in rows:
+            items.append(LibAlexItem(
+                version=(SemanticVersion.fromString(version) if version is not None else None),
+                title=title,
+                author=author,
+                date=date,
+                description=description,
+                directory=directory,
+                sourceFile=sourceFile,
+                relatedFiles=(relatedFiles.get(itemId, []) if relatedFileCount is not None else None),
+                metaFilepath=metaPath,
+                classification=classification,
+                flags=(flags.get((itemId, 0), []) if flagCount is not None else None),
+                resolvedFlags=(flags.get((itemId, 1), []) if resolvedFlagCount is not None else None)
+            ))
+
+        return items
+
+    @staticmethod
+    def _boundVersion(version: Union[SemanticVersion, str]) -> SemanticVersion:
+        """
+        Returns the provided query bound as a version.
+        If the bound is not a valid version, a `ValueError` will be raised.
+
+        version: The bound as a `SemanticVersion` or version string.
+        """
+        if isinstance(version, str):
+            version = SemanticVersion.fromString(version)
+
+        if not version.isValid:
+            # Fail
+            raise ValueError(f"\"{version.string}\" is not a valid version to query by.")
+
+        return version
+
+    @staticmethod
+    def _versionOrder(version: SemanticVersion) -> str:
+        """
+        Encodes a version as text that sorts by "Semantic Versioning 2.0.0" precedence so SQLite can index it.
+
+        Numbers are zero padded, pre-release identifiers are separated by `!` so shorter identifier lists sort first, and releases end with `~` so they follow their pre-releases.
+
+        version: The version to encode.
+        """
+        order = f"{version.major:020d}.{version.minor:020d}.{version.patch:020d}"
+        if not version.preRelease:
+            return order + "~"
+
+        identifiers = []
+        for ident in version.preRelease.split("."):
+            identifiers.append(f"0{int(ident):020d}" if ident.isdigit() else f"1{ident}")
+
+        return order + "!" + "!".join(identifiers)
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
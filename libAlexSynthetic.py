@@ -0,0 +1,138 @@
+# LibAlexandria: Synthetic Libraries
+# Generates synthetic LibAlexandria Libraries for benchmarks and tests.
+
+# Imports
+import os
+import random
+from typing import Any
+
+import libAlexDefaults as laShared
+import libAlexJson as laJson
+
+# Variables
+_WORDS = (
+    "amber", "atlas", "autumn", "breeze", "canyon", "cedar", "comet", "coral", "dawn", "delta",
+    "ember", "fable", "fjord", "glade", "harbor", "hollow", "iris", "juniper", "lantern", "lumen",
+    "meadow", "mirth", "nectar", "orbit", "prairie", "quill", "raven", "saffron", "thistle", "umber",
+    "velvet", "willow", "zephyr", "élan", "façade", "naïve"
+)
+_FLAGS = (
+    "poetry", "prose", "drama", "essay", "letters", "fiction", "nonfiction", "history",
+    "science", "philosophy", "english", "french", "german", "translated", "draft", "annotated"
+)
+_CLASSIFICATIONS = ("AS", "BF", "D", "PN", "PQ", "PR", "PS", "PT", "Q", "Z")
+_VERSIONS = ("2.0.0", "2.0.1", "2.1.0", "2.1.0-rc.1", "2.2.0+build.7")
+_DATES = ("{year}", "{year}-{month:02d}", "{year}-{month:02d}-{day:02d}", "c. {year}", "Undated")
+
+# Functions
+def buildMetaJson(itemNum: int, rng: random.Random, v1: bool = False, relatedFileCount: int = 2) -> dict[str, Any]:
+    """
+    Builds the JSON data of a synthetic meta file.
+    File paths refer to `source.txt` and `related<n>.txt` next to the meta file.
+
+    itemNum: The number of the item used to make its fields unique.
+    rng: The random number generator to draw fields from.
+    v1: If `True`, `v1.*` data is built instead of `v2.*` data.
+    relatedFileCount: The number of related files to reference. Ignored for `v1.*` data.
+
+    Returns the JSON data.
+    """
+    # Draw the shared fields
+    title = " ".join(rng.choice(_WORDS).capitalize() for _ in range(rng.randint(1, 5)))
+    author = f"{rng.choice(_WORDS).capitalize()} {rng.choice(_WORDS).capitalize()}"
+    date = rng.choice(_DATES).format(year=rng.randint(1500, 2023), month=rng.randint(1, 12), day=rng.randint(1, 28))
+    flags = rng.sample(_FLAGS, rng.randint(0, 5))
+    description = f"Synthetic item {itemNum}: " + " ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 40)))
+
+    # Build v1 data
+    if v1:
+        return {
+            "_infover": "1.0.0",
+            "title": title,
+            "author": author,
+            "date": date,
+            "content": "source.txt",
+            "flags": flags,
+            "description": description
+        }
+
+    # Build v2 data
+    return {
+        "_infover": rng.choice(_VERSIONS),
+        "classification": rng.choice(_CLASSIFICATIONS),
+        "title": title,
+        "author": author,
+        "date": date,
+        "sourceFile": "source.txt",
+        "otherFiles": [
+            {
+                "label": f"Related File {r}",
+                "path": f"related{r}.txt",
+                "description": f"Related file {r} of synthetic item {itemNum}."
+            }
+            for r in range(relatedFileCount)
+        ],
+        "flags": flags,
+        "description": description
+    }
+
+def generateLibrary(
+    rootPath: str,
+    itemCount: int = 1000,
+    depth: int = 2,
+    fanout: int = 10,
+    v1Ratio: float = 0.0,
+    relatedFileCount: int = 2,
+    seed: int = 0
+) -> list[str]:
+    """
+    Writes a synthetic LibAlexandria Library to disk.
+    Items are spread over a tree of shelf directories and each has its own directory holding a meta file, a source file, and related files.
+
+    rootPath: The directory to write the library to. It is created if needed.
+    itemCount: The number of items to write.
+    depth: The number of shelf directory levels above each item directory.
+    fanout: The number of shelf directories per level.
+    v1Ratio: The fraction of items written as `v1.*` meta files.
+    relatedFileCount: The number of related files per `v2.*` item.
+    seed: The seed for the random number generator so libraries can be reproduced.
+
+    Returns the absolute meta filepaths of the written items in generation order.
+    """
+    rng = random.Random(seed)
+    rootPath = laShared.fullpath(rootPath)
+    metaPaths = []
+
+    for itemNum in range(itemCount):
+        # Place the item on a shelf
+        shelves = []
+        shelfNum = itemNum
+        for level in range(depth):
+            shelves.append(f"Shelf {level}-{shelfNum % fanout}")
+            shelfNum //= fanout
+
+        itemDir = os.path.join(rootPath, *shelves, f"Item {itemNum:07d}")
+        os.makedirs(itemDir, exist_ok=True)
+
+        # Write the meta file
+        v1 = rng.random() < v1Ratio
+        metaJson = buildMetaJson(itemNum, rng, v1=v1, relatedFileCount=relatedFileCount)
+        metaPath = os.path.join(itemDir, laShared.META_FILENAME)
+        with open(metaPath, "w", encoding="utf-8") as metaFile:
+            metaFile.write(laJson.dumps(metaJson, indent=4))
+
+        # Write the content
+        with open(os.path.join(itemDir, "source.txt"), "w", encoding="utf-8") as sourceFile:
+            sourceFile.write(metaJson["description"])
+
+        for r in range(0 if v1 else relatedFileCount):
+            with open(os.path.join(itemDir, f"related{r}.txt"), "w", encoding="utf-8") as relatedFile:
+                relatedFile.write(f"Related file {r} of synthetic item {itemNum}.")
+
+        metaPaths.append(metaPath)
+
+    return metaPaths
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,362 @@
+# LibAlexandria: LibAlexandria Text Index
+# A persistent inverted full-text index over the titles, authors, and descriptions of LibAlexandria Items.
+
+# Imports
+import os
+import math
+import shutil
+import tempfile
+from bisect import bisect_left
+from typing import Optional, Any
+
+import libAlexDefaults as laShared
+import libAlexJson as laJson
+from libAlexItem import LibAlexItem
+
+# Classes
+class LibAlexTextIndex:
+    """
+    An inverted full-text index over the titles, authors, and descriptions of LibAlexandria Items ranked with BM25.
+
+    Text is tokenized with the same normalization as `slugify(...)`, so accents, case, and punctuation are ignored.
+    Item ids are chosen by the caller, and items can be added, updated, and removed at any time.
+    """
+    # Variables
+    FIELDS = ("title", "author", "description")
+
+    # Constructors
+    def __init__(self,
+        fieldWeights: Optional[dict[str, float]] = None,
+        k1: float = laShared.DEF_BM25_K1,
+        b: float = laShared.DEF_BM25_B
+    ):
+        """
+        Creates a new empty text index.
+
+        fieldWeights: The weight of a term occurrence in each of `FIELDS` or `None` for the defaults.
+        k1: The BM25 term frequency saturation parameter.
+        b: The BM25 length normalization parameter.
+        """
+        self.fieldWeights = dict(fieldWeights if fieldWeights is not None else laShared.DEF_TEXT_FIELD_WEIGHTS)
+        self.k1 = k1
+        self.b = b
+
+        self._postings: dict[str, dict[int, float]] = {}
+        self._itemTerms: dict[int, tuple[str, ...]] = {}
+        self._lengths: dict[int, float] = {}
+        self._totalLength = 0.0
+        self._sortedTerms: Optional[list[str]] = None
+
+    @classmethod
+    def load(cls, indexPath: str) -> 'LibAlexTextIndex':
+        """
+        Loads a text index written by `save(...)`.
+        If the file cannot be parsed, is not in the expected shape, or was written by an incompatible version, a `ValueError` will be raised.
+
+        indexPath: The path to the index file.
+
+        Returns the loaded text index.
+        """
+        # Read the index file
+        with open(laShared.fullpath(indexPath), "rb") as indexFile:
+            indexData = indexFile.read()
+
+        try:
+            indexJson: dict[str, Any] = laJson.loads(indexData)
+        except ValueError as e:
+            # Fail
+            raise ValueError(f"Could not parse JSON from the provided text index file: {indexPath}\n\nCause: {e}")
+
+        # Check the version
+        if not isinstance(indexJson, dict):
+            # Fail
+            raise ValueError(f"The text index file at \"{indexPath}\" is not a JSON object.")
+
+        if indexJson.get("_indexver", None) != laShared.VER_TEXT_INDEX:
+            raise ValueError(f"The text index file at \"{indexPath}\" was written by an incompatible version.")
+
+        # Check the shape
+        terms = indexJson.get("terms", None)
+        postings = indexJson.get("postings", None)
+        lengths = indexJson.get("lengths", None)
+        if not (
+            isinstance(indexJson.get("fieldWeights", None), dict)
+            and all(isinstance(indexJson.get(key, None), (int, float)) for key in ("k1", "b"))
+            and isinstance(terms, list) and isinstance(postings, list) and (len(terms) == len(postings))
+            and all(isinstance(t, str) for t in terms)
+            and all(isinstance(p, list) and (len(p) % 2 == 0) for p in postings)
+            and isinstance(lengths, list) and (len(lengths) % 2 == 0)
+        ):
+            # Fail
+            raise ValueError(f"The text index file at \"{indexPath}\" is not in the expected shape.")
+
+        # Restore the index
+        try:
+            index = cls(indexJson["fieldWeights"], indexJson["k1"], indexJson["b"])
+            itemTerms: dict[int, list[str]] = {}
+            for term, flatPostings in zip(terms, postings):
+                index._postings[term] = dict(zip(flatPostings[0::2], flatPostings[1::2]))
+                for itemId in flatPostings[0::2]:
+                    itemTerms.setdefault(itemId, []).append(term)
+
+            index._itemTerms = {itemId: tuple(terms) for itemId, terms in itemTerms.items()}
+
+            index._lengths = dict(zip(lengths[0::2], lengths[1::2]))
+            index._totalLength = sum(index._lengths.values())
+        except TypeError as e:
+            # Fail
+            raise ValueError(f"Could not restore the text index file at \"{indexPath}\".\n\nCause: {e}")
+
+        return index
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, itemId: int) -> bool:
+        return itemId in self._lengths
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(items={len(self._lengths)}, terms={len(self._postings)})"
+
+    # Functions
+    @staticmethod
+    def tokenize(text: Optional[str]) -> list[str]:
+        """
+        Splits the provided text into normalized search terms.
+
+        text: The text to tokenize.
+
+        Returns a list of terms in order of appearance.
+        """
+        if not text:
+            return []
+
+        return [t for t in laShared.slugify(text).split("-") if t]
+
+    def add(self, itemId: int, item: LibAlexItem):
+        """
+        Indexes the text of the provided item under the provided id.
+        If the id is already indexed, its previous text is replaced.
+
+        itemId: The id to index the item under.
+        item: The item to index.
+        """
+        # Clear any previous text
+        if itemId in self._lengths:
+            self.remove(itemId)
+
+        # Weigh the terms of each field
+        frequencies: dict[str, float] = {}
+        length = 0.0
+        for field in self.FIELDS:
+            weight = self.fieldWeights.get(field, 1.0)
+            for term in self.tokenize(getattr(item, field)):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+                length += weight
+
+        # Record the postings
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term, None)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._sortedTerms = None
+
+            postings[itemId] = frequency
+
+        self._itemTerms[itemId] = tuple(frequencies)
+        self._lengths[itemId] = length
+        self._totalLength += length
+
+    def update(self, itemId: int, item: LibAlexItem):
+        """
+        Replaces the text indexed under the provided id with that of the provided item.
+
+        itemId: The id the item is indexed under.
+        item: The changed item.
+        """
+        self.add(itemId, item)
+
+    def remove(self, itemId: int) -> bool:
+        """
+        Removes the provided id from the index.
+
+        itemId: The id to remove.
+
+        Returns `True` if the id was indexed.
+        """
+        # Find the item
+        length = self._lengths.pop(itemId, None)
+        if length is None:
+            return False
+
+        # Drop the postings
+        for term in self._itemTerms.pop(itemId, ()):
+            postings = self._postings[term]
+            del postings[itemId]
+            if not postings:
+                del self._postings[term]
+                self._sortedTerms = None
+
+        self._totalLength -= length
+
+        return True
+
+    def clear(self):
+        """
+        Removes every item from the index.
+        """
+        self._postings.clear()
+        self._itemTerms.clear()
+        self._lengths.clear()
+        self._totalLength = 0.0
+        self._sortedTerms = None
+
+    def termsWithPrefix(self, prefix: str) -> list[str]:
+        """
+        Returns the sorted indexed terms starting with the provided normalized prefix.
+
+        prefix: The prefix to match.
+        """
+        # Keep the terms sorted for bisection
+        if self._sortedTerms is None:
+            self._sortedTerms = sorted(self._postings)
+
+        terms = []
+        for i in range(bisect_left(self._sortedTerms, prefix), len(self._sortedTerms)):
+            term = self._sortedTerms[i]
+            if not term.startswith(prefix):
+                break
+
+            terms.append(term)
+
+        return terms
+
+    def documentFrequency(self, term: str) -> int:
+        """
+        Returns the number of items containing the provided normalized term.
+
+        term: The term to count.
+        """
+        return len(self._postings.get(term, ()))
+
+    def search(self, query: str, limit: Optional[int] = laShared.DEF_TEXT_SEARCH_LIMIT, prefix: bool = False, requireAll: bool = False) -> list[tuple[int, float]]:
+        """
+        Finds the items best matching the provided query.
+        Words ending with `*` match every term starting with them.
+
+        query: The words to search for.
+        limit: The maximum number of results or `None` for every match.
+        prefix: If `True`, the last word of the query also matches as a prefix for search-as-you-type.
+        requireAll: If `True`, only items matching every word are returned.
+
+        Returns a list of `(itemId, score)` tuples sorted by descending score.
+        """
+        # Expand the query into groups of alternative terms
+        words = query.split()
+        groups: list[list[str]] = []
+        for wordNum, word in enumerate(words):
+            isPrefix = word.endswith("*") or (prefix and (wordNum == len(words) - 1))
+            tokens = self.tokenize(word)
+            if not tokens:
+                continue
+
+            # Only the final token of a word can be a prefix
+            for token in tokens[:-1]:
+                groups.append([token])
+
+            groups.append(self.termsWithPrefix(tokens[-1]) if isPrefix else [tokens[-1]])
+
+        # Score every candidate
+        scores = self.scoreGroups(groups, requireAll)
+
+        # Rank
+        ranked = sorted(scores.items(), key=lambda s: (-s[1], s[0]))
+        return (ranked[:limit] if limit is not None else ranked)
+
+    def scoreGroups(self, groups: list[list[str]], requireAll: bool = False) -> dict[int, float]:
+        """
+        Scores the items matching groups of alternative normalized terms with BM25.
+
+        groups: A list of term groups. An item matches a group when it contains any of its terms.
+        requireAll: If `True`, only items matching every group are scored.
+
+        Returns a dictionary of item ids to scores.
+        """
+        # Check for an empty index
+        itemCount = len(self._lengths)
+        if (itemCount == 0) or not groups:
+            return {}
+
+        averageLength = (self._totalLength / itemCount) or 1.0
+        scores: dict[int, float] = {}
+        matches: dict[int, int] = {}
+        for group in groups:
+            groupMatches = set()
+            for term in group:
+                postings = self._postings.get(term, None)
+                if not postings:
+                    continue
+
+                # Weigh rare terms higher
+                frequency = len(postings)
+                idf = math.log(1.0 + ((itemCount - frequency + 0.5) / (frequency + 0.5)))
+                for itemId, tf in postings.items():
+                    norm = self.k1 * (1.0 - self.b + (self.b * (self._lengths[itemId] / averageLength)))
+                    scores[itemId] = scores.get(itemId, 0.0) + (idf * ((tf * (self.k1 + 1.0)) / (tf + norm)))
+                    groupMatches.add(itemId)
+
+            for itemId in groupMatches:
+                matches[itemId] = matches.get(itemId, 0) + 1
+
+        # Drop partial matches
+        if requireAll:
+            scores = {itemId: score for itemId, score in scores.items() if matches[itemId] == len(groups)}
+
+        return scores
+
+    def save(self, indexPath: str):
+        """
+        Writes the index to the provided file.
+        Postings are stored as flat arrays and the file is replaced atomically.
+
+        indexPath: The path to write the index to.
+        """
+        # Flatten the postings
+        terms = list(self._postings)
+        indexJson = {
+            "_indexver": laShared.VER_TEXT_INDEX,
+            "fieldWeights": self.fieldWeights,
+            "k1": self.k1,
+            "b": self.b,
+            "terms": terms,
+            "postings": [[v for posting in self._postings[t].items() for v in posting] for t in terms],
+            "lengths": [v for posting in self._lengths.items() for v in posting]
+        }
+
+        # Write next to the destination then swap it in
+        indexPath = laShared.fullpath(indexPath)
+        tempFd, tempPath = tempfile.mkstemp(prefix=f".{os.path.basename(indexPath)}.", suffix=".tmp", dir=os.path.dirname(indexPath))
+        try:
+            with os.fdopen(tempFd, "w", encoding="utf-8") as indexFile:
+                indexFile.write(laJson.dumps(indexJson))
+
+            # Keep the permissions of the file being replaced
+            try:
+                shutil.copymode(indexPath, tempPath)
+            except OSError:
+                os.chmod(tempPath, 0o644)
+
+            os.replace(tempPath, indexPath)
+        except BaseException:
+            # Clean up the partial file
+            try:
+                os.remove(tempPath)
+            except OSError:
+                pass
+
+            raise
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
@@ -0,0 +1,336 @@
+# LibAlexandria: LibAlexandria Version Index
+# A sorted index of the versions of LibAlexandria Items for range queries.
+
+# Imports
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from typing import Iterable, Optional, Union
+
+from libAlexItem import LibAlexItem
+from libAlexSemanticVersion import SemanticVersion
+
+# Variables
+_AFTER_ALL_IDS = float("inf")
+
+# Classes
+class LibAlexVersionIndex:
+    """
+    A sorted index from the versions of LibAlexandria Items to their integer ids.
+
+    Entries are kept as `(sortKey, itemId)` tuples in a list ordered by "Semantic Versioning 2.0.0" precedence so range queries are answered with two bisections and no version is parsed or compared per item.
+    Single inserts shift the list, so many items should be indexed together with `addMany(...)`, which sorts once.
+    Counts per major and minor version are maintained as items are added and removed.
+    Items without a valid version are tracked separately and never match a range.
+    Item ids are chosen by the caller and should be non-negative integers.
+    """
+    # Constructors
+    def __init__(self):
+        """
+        Creates a new empty version index.
+        """
+        self._entries: list[tuple[tuple, int]] = []
+        self._itemVersions: dict[int, SemanticVersion] = {}
+        self._unversioned: set[int] = set()
+        self._majorCounts: Counter = Counter()
+        self._minorCounts: Counter = Counter()
+
+    # Python Functions
+    def __len__(self) -> int:
+        return len(self._itemVersions) + len(self._unversioned)
+
+    def __contains__(self, itemId: int) -> bool:
+        return (itemId in self._itemVersions) or (itemId in self._unversioned)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(items={len(self)}, unversioned={len(self._unversioned)})"
+
+    # Functions
+    def add(self, itemId: int, item: LibAlexItem):
+        """
+        Indexes the version of the provided item under the provided id.
+        If the id is already indexed, its previous version is replaced.
+
+        itemId: The id to index the item under.
+        item: The item to index.
+        """
+        self.addVersion(itemId, item.version)
+
+    def update(self, itemId: int, item: LibAlexItem):
+        """
+        Replaces the version indexed under the provided id with that of the provided item.
+
+        itemId: The id the item is indexed under.
+        item: The changed item.
+        """
+        self.addVersion(itemId, item.version)
+
+    def addMany(self, items: Iterable[tuple[int, LibAlexItem]]):
+        """
+        Indexes the versions of many items at once, sorting the entries a single time.
+        Ids that are already indexed have their previous versions replaced.
+
+        items: `(itemId, item)` tuples to index.
+        """
+        self.addVersions((itemId, item.version) for itemId, item in items)
+
+    def addVersions(self, versions: Iterable[tuple[int, Optional[SemanticVersion]]]):
+        """
+        Indexes many versions at once, sorting the entries a single time.
+        Ids that are already indexed have their previous versions replaced.
+
+        versions: `(itemId, version)` tuples to index. A version may be `None` if the item has no version.
+        """
+        # Collect the new entries, keeping the last version of repeated ids
+        entries = []
+        for itemId, version in dict(versions).items():
+            if itemId in self:
+                self.remove(itemId)
+
+            if (not isinstance(version, SemanticVersion)) or (not version.isValid):
+                self._unversioned.add(itemId)
+                continue
+
+            entries.append((version.sortKey, itemId))
+            self._itemVersions[itemId] = version
+            self._majorCounts[version.major] += 1
+            self._minorCounts[(version.major, version.minor)] += 1
+
+        # Merge them in with a single sort
+        if entries:
+            entries.sort()
+            self._entries.extend(entries)
+            self._entries.sort()
+
+    def addVersion(self, itemId: int, version: Optional[SemanticVersion]):
+        """
+        Indexes the provided version under the provided id.
+        If the id is already indexed, its previous version is replaced.
+
+        itemId: The id to index the version under.
+        version: The version to index or `None` if the item has no version.
+        """
+        # Skip unchanged versions
+        previous = self._itemVersions.get(itemId, None)
+        if (previous is not None) and (version is not None) and (previous.sortKey == version.sortKey):
+            self._itemVersions[itemId] = version
+            return
+
+        # Clear any previous version
+        self.remove(itemId)
+
+        # Track items without a usable version apart
+        if (not isinstance(version, SemanticVersion)) or (not version.isValid):
+            self._unversioned.add(itemId)
+            return
+
+        # Insert in order
+        insort(self._entries, (version.sortKey, itemId))
+        self._itemVersions[itemId] = version
+        self._majorCounts[version.major] += 1
+        self._minorCounts[(version.major, version.minor)] += 1
+
+    def remove(self, itemId: int) -> bool:
+        """
+        Removes the provided id from the index.
+
+        itemId: The id to remove.
+
+        Returns `True` if the id was indexed.
+        """
+        # Check the unversioned items
+        if itemId in self._unversioned:
+            self._unversioned.remove(itemId)
+            return True
+
+        # Find the version
+        version = self._itemVersions.pop(itemId, None)
+        if version is None:
+            return False
+
+        # Remove the entry
+        entry = (version.sortKey, itemId)
+        del self._entries[bisect_left(self._entries, entry)]
+
+        # Update the counts
+        self._decrement(self._majorCounts, version.major)
+        self._decrement(self._minorCounts, (version.major, version.minor))
+
+        return True
+
+    def clear(self):
+        """
+        Removes every item from the index.
+        """
+        self._entries.clear()
+        self._itemVersions.clear()
+        self._unversioned.clear()
+        self._majorCounts.clear()
+        self._minorCounts.clear()
+
+    def versionOf(self, itemId: int) -> Optional[SemanticVersion]:
+        """
+        Returns the version indexed under the provided id or `None` if it is not indexed or has no valid version.
+
+        itemId: The id to look up.
+        """
+        return self._itemVersions.get(itemId, None)
+
+    def unversioned(self) -> list[int]:
+        """
+        Returns a sorted list of the ids of items without a valid version.
+        """
+        return sorted(self._unversioned)
+
+    def range(self,
+        low: Union[SemanticVersion, str, None] = None,
+        high: Union[SemanticVersion, str, None] = None,
+        includeLow: bool = True,
+        includeHigh: bool = False
+    ) -> list[int]:
+        """
+        Finds the items with a version within the provided bounds.
+        Versions are compared by "Semantic Versioning 2.0.0" precedence so `1.0.0-alpha` falls below `1.0.0`.
+
+        low: The lowest version to match or `None` for no lower bound.
+        high: The highest version to match or `None` for no upper bound.
+        includeLow: If `True`, items at exactly the `low` version match.
+        includeHigh: If `True`, items at exactly the `high` version match.
+
+        Returns a list of matching item ids ordered by version and then id.
+        """
+        start, end = self._bounds(low, high, includeLow, includeHigh)
+        return [itemId for _, itemId in self._entries[start:end]]
+
+    def count(self,
+        low: Union[SemanticVersion, str, None] = None,
+        high: Union[SemanticVersion, str, None] = None,
+        includeLow: bool = True,
+        includeHigh: bool = False
+    ) -> int:
+        """
+        Counts the items with a version within the provided bounds without listing them.
+
+        low: The lowest version to match or `None` for no lower bound.
+        high: The highest version to match or `None` for no upper bound.
+        includeLow: If `True`, items at exactly the `low` version match.
+        includeHigh: If `True`, items at exactly the `high` version match.
+        """
+        start, end = self._bounds(low, high, includeLow, includeHigh)
+        return max(0, end - start)
+
+    def withMajor(self, major: int, minor: Optional[int] = None) -> list[int]:
+        """
+        Finds the items on the provided major version, including its pre-releases, like every `1.x` item.
+
+        major: The major version to match.
+        minor: The minor version to also match or `None` to match any minor version.
+
+        Returns a list of matching item ids ordered by version and then id.
+        """
+        # Bisect on the leading values of the sort keys
+        prefix = ((major,) if minor is None else (major, minor))
+        nextPrefix = prefix[:-1] + (prefix[-1] + 1,)
+        start = bisect_left(self._entries, (prefix,))
+        end = bisect_left(self._entries, (nextPrefix,), lo=start)
+
+        return [itemId for _, itemId in self._entries[start:end]]
+
+    def countByMajor(self) -> dict[int, int]:
+        """
+        Returns a dictionary of every indexed major version to its number of items in version order.
+        """
+        return dict(sorted(self._majorCounts.items()))
+
+    def countByMinor(self) -> dict[tuple[int, int], int]:
+        """
+        Returns a dictionary of every indexed `(major, minor)` version to its number of items in version order.
+        """
+        return dict(sorted(self._minorCounts.items()))
+
+    def lowest(self) -> Optional[SemanticVersion]:
+        """
+        Returns the lowest indexed version or `None` if no versions are indexed.
+        """
+        if not self._entries:
+            return None
+
+        return self._itemVersions[self._entries[0][1]]
+
+    def highest(self) -> Optional[SemanticVersion]:
+        """
+        Returns the highest indexed version or `None` if no versions are indexed.
+        """
+        if not self._entries:
+            return None
+
+        return self._itemVersions[self._entries[-1][1]]
+
+    # Private Functions
+    def _bounds(self,
+        low: Union[SemanticVersion, str, None],
+        high: Union[SemanticVersion, str, None],
+        includeLow: bool,
+        includeHigh: bool
+    ) -> tuple[int, int]:
+        """
+        Finds the slice of the entries within the provided bounds.
+
+        low: The lowest version to match or `None` for no lower bound.
+        high: The highest version to match or `None` for no upper bound.
+        includeLow: If `True`, entries at exactly the `low` version are included.
+        includeHigh: If `True`, entries at exactly the `high` version are included.
+
+        Returns a `(start, end)` tuple of entry indices.
+        """
+        # Find the start
+        start = 0
+        if low is not None:
+            lowKey = self._sortKey(low)
+            if includeLow:
+                start = bisect_left(self._entries, (lowKey,))
+            else:
+                start = bisect_right(self._entries, (lowKey, _AFTER_ALL_IDS))
+
+        # Find the end
+        end = len(self._entries)
+        if high is not None:
+            highKey = self._sortKey(high)
+            if includeHigh:
+                end = bisect_right(self._entries, (highKey, _AFTER_ALL_IDS), lo=start)
+            else:
+                end = bisect_left(self._entries, (highKey,), lo=start)
+
+        return (start, end)
+
+    @staticmethod
+    def _sortKey(version: Union[SemanticVersion, str]) -> tuple:
+        """
+        Returns the sort key of the provided bound.
+        If the bound is not a valid version, a `ValueError` will be raised.
+
+        version: The bound as a `SemanticVersion` or version string.
+        """
+        if isinstance(version, str):
+            version = SemanticVersion.fromString(version)
+
+        if not version.isValid:
+            # Fail
+            raise ValueError(f"\"{version.string}\" is not a valid version to query by.")
+
+        return version.sortKey
+
+    @staticmethod
+    def _decrement(counts: Counter, key):
+        """
+        Decrements a count and drops it once it reaches zero.
+
+        counts: The counts to update.
+        key: The key to decrement.
+        """
+        counts[key] -= 1
+        if counts[key] <= 0:
+            del counts[key]
+
+# Console Execution
+if __name__ == "__main__":
+    print("This file cannot be run from the command line.")
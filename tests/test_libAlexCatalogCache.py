@@ -0,0 +1,177 @@
+# LibAlexandria: LibAlexandria Catalog Cache Tests
+# Tests for the LibAlexandria Catalog Cache.
+
+# Imports
+import os
+import shutil
+import tempfile
+import unittest
+
+import libAlexDefaults as laShared
+import libAlexJson as laJson
+from libAlexCatalogCache import LibAlexCatalogCache
+from libAlexScanner import LibAlexScanner
+
+# Classes
+class TestLibAlexCatalogCache(unittest.TestCase):
+    def setUp(self):
+        assetDir = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "assets"))
+
+        # Build a small library
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = os.path.join(self.tempDir.name, "library")
+        self.cachePath = os.path.join(self.tempDir.name, "cache", "catalog.json")
+        self.itemDirs = [os.path.join(self.rootPath, name) for name in ("one", "two")]
+
+        for itemDir in self.itemDirs:
+            os.makedirs(itemDir)
+            shutil.copy(os.path.join(assetDir, "metaV2.json"), os.path.join(itemDir, "meta.json"))
+
+            for name in ("sourceFile.txt", "relatedFile.txt", "relatedFile2.txt"):
+                shutil.copy(os.path.join(assetDir, name), os.path.join(itemDir, name))
+
+        self.metaPath = os.path.join(self.itemDirs[0], "meta.json")
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_loadItem_missThenHit(self):
+        cache = LibAlexCatalogCache()
+        first = cache.loadItem(self.metaPath)
+        second = cache.loadItem(self.metaPath)
+
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(first.toJson(), second.toJson())
+        self.assertEqual(first.toRecord(), second.toRecord())
+        self.assertIsNot(first, second)
+
+    def test_loadItem_metaChanged(self):
+        cache = LibAlexCatalogCache()
+        cache.loadItem(self.metaPath)
+
+        with open(self.metaPath, "r") as metaFile:
+            metaText = metaFile.read()
+
+        with open(self.metaPath, "w") as metaFile:
+            metaFile.write(metaText.replace("Lorem Ipsum", "Dolor Sit Amet"))
+
+        item = cache.loadItem(self.metaPath)
+        self.assertEqual(cache.misses, 2)
+        self.assertEqual(item.title, "Dolor Sit Amet")
+
+    def test_loadItem_relatedFileRemoved(self):
+        cache = LibAlexCatalogCache()
+        cache.loadItem(self.metaPath)
+
+        os.remove(os.path.join(self.itemDirs[0], "relatedFile2.txt"))
+        self.assertIsNone(cache.getItem(self.metaPath))
+
+        with self.assertRaises(FileNotFoundError):
+            cache.loadItem(self.metaPath)
+
+    def test_saveAndLoad(self):
+        cache = LibAlexCatalogCache(self.cachePath)
+        cache.loadItem(self.metaPath)
+        cache.save()
+
+        self.assertTrue(os.path.isfile(self.cachePath))
+
+        warmCache = LibAlexCatalogCache(self.cachePath)
+        self.assertEqual(len(warmCache), 1)
+        self.assertIn(self.metaPath, warmCache)
+
+        item = warmCache.loadItem(self.metaPath)
+        self.assertEqual(warmCache.hits, 1)
+        self.assertEqual(warmCache.misses, 0)
+        self.assertEqual(len(item.relatedFiles), 2)
+
+    def test_load_corrupt(self):
+        # Truncated, wrong-shaped, and malformed caches are discarded and rebuilt
+        contents = (
+            "{\"_cachever\": ",
+            "[1, 2]",
+            "{\"_cachever\": \"%s\", \"entries\": []}" % laShared.VER_CATALOG_CACHE
+        )
+        os.makedirs(os.path.dirname(self.cachePath))
+        for content in contents:
+            with self.subTest(content=content):
+                with open(self.cachePath, "w") as cacheFile:
+                    cacheFile.write(content)
+
+                cache = LibAlexCatalogCache(self.cachePath)
+                self.assertEqual(len(cache), 0)
+                with self.assertRaises(ValueError):
+                    cache.load()
+
+                cache.loadItem(self.metaPath)
+                cache.save()
+                self.assertEqual(len(LibAlexCatalogCache(self.cachePath)), 1)
+
+    def test_load_badEntries(self):
+        # Entries that are not in the expected shape are dropped and the rest are kept
+        cache = LibAlexCatalogCache(self.cachePath)
+        cache.loadItem(self.metaPath)
+        cache.save()
+
+        with open(self.cachePath, "r") as cacheFile:
+            cacheText = cacheFile.read()
+
+        badEntries = "\"x\": [[], [1]], \"y\": [[]], \"z\": 1, "
+        with open(self.cachePath, "w") as cacheFile:
+            cacheFile.write(cacheText.replace("\"entries\":{", "\"entries\":{" + badEntries))
+
+        with open(self.cachePath, "rb") as cacheFile:
+            self.assertEqual(len(laJson.loads(cacheFile.read())["entries"]), 4)
+
+        warmCache = LibAlexCatalogCache(self.cachePath)
+        self.assertEqual(len(warmCache), 1)
+        self.assertIn(self.metaPath, warmCache)
+
+    def test_loadItem_deferredEntry(self):
+        # An entry recorded without validation is not reused when validation is requested
+        cache = LibAlexCatalogCache()
+        os.remove(os.path.join(self.itemDirs[0], "relatedFile2.txt"))
+        cache.loadItem(self.metaPath, deferValidation=True)
+
+        cache.loadItem(self.metaPath, deferValidation=True)
+        self.assertEqual(cache.hits, 1)
+        self.assertIsNone(cache.getItem(self.metaPath))
+
+        with self.assertRaises(FileNotFoundError):
+            cache.loadItem(self.metaPath)
+
+    def test_save_failure(self):
+        # Replacing a directory fails after the temporary file is written
+        os.makedirs(self.cachePath)
+        cache = LibAlexCatalogCache(self.cachePath)
+        cache.loadItem(self.metaPath)
+
+        with self.assertRaises(OSError):
+            cache.save()
+
+        self.assertEqual(os.listdir(os.path.dirname(self.cachePath)), ["catalog.json"])
+
+    def test_saveWithoutPath(self):
+        with self.assertRaises(ValueError):
+            LibAlexCatalogCache().save()
+
+    def test_scanWithCache(self):
+        cache = LibAlexCatalogCache(self.cachePath)
+        self.assertEqual(len(list(LibAlexScanner(self.rootPath, cache=cache))), 2)
+        self.assertEqual(cache.misses, 2)
+
+        self.assertEqual(len(list(LibAlexScanner(self.rootPath, cache=cache))), 2)
+        self.assertEqual(cache.hits, 2)
+
+    def test_scanPrunesRemovedItems(self):
+        cache = LibAlexCatalogCache()
+        list(LibAlexScanner(self.rootPath, cache=cache))
+        self.assertEqual(len(cache), 2)
+
+        shutil.rmtree(self.itemDirs[1])
+        list(LibAlexScanner(self.rootPath, cache=cache))
+        self.assertEqual(len(cache), 1)
+
+if __name__ == "__main__":
+    unittest.main()
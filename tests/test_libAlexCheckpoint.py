@@ -0,0 +1,110 @@
+# LibAlexandria: Scan Checkpoint Tests
+# Tests for the scan progress journal.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+from libAlexCheckpoint import LibAlexScanCheckpoint
+from libAlexScanReport import LibAlexScanError
+
+# Classes
+class TestLibAlexScanCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.checkpointPath = os.path.join(self.tempDir.name, "scan.checkpoint")
+        self.rootPath = os.path.join(self.tempDir.name, "Library")
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_roundTrip(self):
+        checkpoint = LibAlexScanCheckpoint(self.checkpointPath, interval=2)
+        checkpoint.begin(self.rootPath)
+        checkpoint.markDone("/a/meta.json")
+        checkpoint.recordError(LibAlexScanError("/b/meta.json", "ValueError", "Bad JSON"))
+        checkpoint.markDone("/c/meta.json")
+        checkpoint.close()
+
+        loaded = LibAlexScanCheckpoint(self.checkpointPath)
+        self.assertEqual(loaded.rootPath, self.rootPath)
+        self.assertEqual(loaded.completed, {"/a/meta.json", "/b/meta.json", "/c/meta.json"})
+        self.assertEqual(loaded.errors, [LibAlexScanError("/b/meta.json", "ValueError", "Bad JSON")])
+        self.assertTrue(loaded.isDone("/b/meta.json"))
+
+    def test_interval(self):
+        checkpoint = LibAlexScanCheckpoint(self.checkpointPath, interval=3)
+        checkpoint.begin(self.rootPath)
+        checkpoint.markDone("/a/meta.json")
+        checkpoint.markDone("/b/meta.json")
+
+        # Nothing is written until the interval is reached
+        self.assertEqual(len(LibAlexScanCheckpoint(self.checkpointPath)), 0)
+
+        checkpoint.markDone("/c/meta.json")
+        self.assertEqual(len(LibAlexScanCheckpoint(self.checkpointPath)), 3)
+        checkpoint.close()
+
+    def test_partialLine(self):
+        checkpoint = LibAlexScanCheckpoint(self.checkpointPath, interval=1)
+        checkpoint.begin(self.rootPath)
+        checkpoint.markDone("/a/meta.json")
+        checkpoint.close()
+
+        # Simulate a crash while writing
+        with open(self.checkpointPath, "a") as checkpointFile:
+            checkpointFile.write('["/b/me')
+
+        resumed = LibAlexScanCheckpoint(self.checkpointPath, interval=1)
+        self.assertEqual(resumed.completed, {"/a/meta.json"})
+
+        resumed.begin(self.rootPath)
+        resumed.markDone("/c/meta.json")
+        resumed.close()
+        self.assertEqual(LibAlexScanCheckpoint(self.checkpointPath).completed, {"/a/meta.json", "/c/meta.json"})
+
+    def test_malformedLines(self):
+        checkpoint = LibAlexScanCheckpoint(self.checkpointPath, interval=1)
+        checkpoint.begin(self.rootPath)
+        checkpoint.markDone("/a/meta.json")
+        checkpoint.close()
+
+        # Lines that parse but are not entries are skipped
+        with open(self.checkpointPath, "a") as checkpointFile:
+            checkpointFile.write('1\n{"a": 1}\nnull\n[]\n["/b/meta.json", "ValueError"]\n[1]\n["/c/meta.json"]\n')
+
+        loaded = LibAlexScanCheckpoint(self.checkpointPath)
+        self.assertEqual(loaded.completed, {"/a/meta.json", "/c/meta.json"})
+        self.assertEqual(loaded.errors, [])
+
+    def test_wrongLibrary(self):
+        checkpoint = LibAlexScanCheckpoint(self.checkpointPath)
+        checkpoint.begin(self.rootPath)
+        checkpoint.close()
+
+        with self.assertRaises(ValueError):
+            LibAlexScanCheckpoint(self.checkpointPath).begin(os.path.join(self.tempDir.name, "Other"))
+
+    def test_incompatible(self):
+        with open(self.checkpointPath, "w") as checkpointFile:
+            checkpointFile.write('{"_checkpointver": "0.0.1", "rootPath": "/elsewhere"}\n["/a/meta.json"]\n')
+
+        checkpoint = LibAlexScanCheckpoint(self.checkpointPath)
+        self.assertEqual(len(checkpoint), 0)
+
+        checkpoint.begin(self.rootPath)
+        checkpoint.close()
+        self.assertEqual(LibAlexScanCheckpoint(self.checkpointPath).rootPath, self.rootPath)
+
+    def test_finish(self):
+        checkpoint = LibAlexScanCheckpoint(self.checkpointPath)
+        checkpoint.begin(self.rootPath)
+        checkpoint.markDone("/a/meta.json")
+        checkpoint.finish()
+
+        self.assertFalse(os.path.exists(self.checkpointPath))
+        self.assertEqual(len(checkpoint), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# LibAlexandria: LibAlexandria Column Store Tests
+# Tests for the LibAlexandria Column Store.
+
+# Imports
+import unittest
+from datetime import date
+
+from libAlexItem import LibAlexItem
+from libAlexSemanticVersion import SemanticVersion
+from libAlexColumns import LibAlexColumns, numpy
+
+# Classes
+class TestLibAlexColumns(unittest.TestCase):
+    def setUp(self):
+        self.items = [
+            LibAlexItem(version=SemanticVersion("2.0.0"), title="One", author="Smith", flags=["poetry"], classification="PR"),
+            LibAlexItem(version=SemanticVersion("1.4.2"), title="Two", author="Jones", flags=["prose", "poetry"], classification="PQ"),
+            LibAlexItem(title="Three", author="Smith", date="1984-04", classification=None)
+        ]
+        self.columns = LibAlexColumns.fromItems(self.items)
+
+    def test_len(self):
+        self.assertEqual(len(self.columns), 3)
+
+    def test_stringColumns(self):
+        self.assertEqual(self.columns.column("author"), ["Smith", "Jones", "Smith"])
+        self.assertEqual(self.columns.dictionary("author"), ["Smith", "Jones"])
+        self.assertEqual(self.columns.codes("author").tolist(), [0, 1, 0])
+        self.assertEqual(self.columns.column("classification"), ["PR", "PQ", None])
+        self.assertEqual(self.columns.column("date"), ["Undated", "Undated", "1984-04"])
+
+    def test_versionColumns(self):
+        self.assertEqual(self.columns.column("major"), [2, 1, -1])
+        self.assertEqual(self.columns.versions("patch").tolist(), [0, 2, -1])
+
+    def test_dateColumns(self):
+        self.assertEqual(self.columns.column("dateStart"), [-1, -1, date(1984, 4, 1).toordinal()])
+        self.assertEqual(self.columns.dates("dateEnd").tolist(), [-1, -1, date(1984, 4, 30).toordinal()])
+        self.assertEqual(self.columns.countBy("dateStart"), {-1: 2, date(1984, 4, 1).toordinal(): 1})
+
+    def test_flags(self):
+        self.assertEqual(self.columns.flagsOf(0), self.items[0].getAllFlags())
+        self.assertEqual(self.columns.flagsOf(1), self.items[1].getAllFlags())
+        self.assertEqual(self.columns.flagsOf(2), [])
+
+    def test_countBy(self):
+        self.assertEqual(self.columns.countBy("author"), {"Smith": 2, "Jones": 1})
+        self.assertEqual(self.columns.countBy("major"), {2: 1, 1: 1, -1: 1})
+        self.assertEqual(self.columns.countBy("flags"), {"PR": 1, "poetry": 2, "PQ": 1, "prose": 1})
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_toNumpy(self):
+        arrays = self.columns.toNumpy()
+
+        self.assertEqual(arrays["items"]["major"].tolist(), [2, 1, -1])
+        self.assertEqual(arrays["items"]["author"].tolist(), [0, 1, 0])
+        self.assertEqual(arrays["flagOffsets"].tolist(), [0, 2, 5, 5])
+        self.assertEqual(len(arrays["flagIds"]), 5)
+
+    @unittest.skipUnless(numpy is None, "NumPy is installed")
+    def test_toNumpy_missing(self):
+        with self.assertRaises(ImportError):
+            self.columns.toNumpy()
+
+if __name__ == "__main__":
+    unittest.main()
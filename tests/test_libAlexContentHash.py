@@ -0,0 +1,173 @@
+# LibAlexandria: Content Hashing Tests
+# Tests for the content hasher and duplicate report.
+
+# Imports
+import os
+import hashlib
+import tempfile
+import unittest
+
+import libAlexDefaults as laShared
+from libAlexContentHash import LibAlexContentHasher
+from libAlexItem import LibAlexItem
+from libAlexRelatedFile import LibAlexRelatedFile
+
+# Classes
+class TestLibAlexContentHasher(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = self.tempDir.name
+
+        self.paths = {name: os.path.join(self.rootPath, name) for name in ("a.txt", "b.txt", "c.txt", "d.txt", "big.bin")}
+        self.writeFile("a.txt", b"The same words.")
+        self.writeFile("b.txt", b"The same words.")
+        self.writeFile("c.txt", b"Other words....")
+        self.writeFile("d.txt", b"Unique")
+        self.writeFile("big.bin", os.urandom(3000))
+
+        self.items = [
+            LibAlexItem(title="One", sourceFile=self.paths["a.txt"], relatedFiles=[
+                LibAlexRelatedFile("Big", self.paths["big.bin"], "", validate=False)
+            ]),
+            LibAlexItem(title="Two", sourceFile=self.paths["b.txt"]),
+            LibAlexItem(title="Three", sourceFile=self.paths["c.txt"], relatedFiles=[
+                LibAlexRelatedFile("Same", self.paths["a.txt"], "", validate=False)
+            ]),
+            LibAlexItem(title="Four", sourceFile=self.paths["d.txt"])
+        ]
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def writeFile(self, name: str, data: bytes):
+        with open(os.path.join(self.rootPath, name), "wb") as file:
+            file.write(data)
+
+    def test_hashFile(self):
+        for mmapThreshold in (0, 1 << 30):
+            with self.subTest(mmapThreshold=mmapThreshold):
+                hasher = LibAlexContentHasher(algorithm="sha256", chunkSize=1000, mmapThreshold=mmapThreshold)
+
+                with open(self.paths["big.bin"], "rb") as file:
+                    expected = hashlib.sha256(file.read()).hexdigest()
+
+                self.assertEqual(hasher.hashFile(self.paths["big.bin"]), expected)
+                self.assertIsNone(hasher.hashFile(os.path.join(self.rootPath, "missing.txt")))
+
+    def test_hashFile_emptyFile(self):
+        self.writeFile("empty.txt", b"")
+        hasher = LibAlexContentHasher(algorithm="sha256", mmapThreshold=0)
+        self.assertEqual(hasher.hashFile(os.path.join(self.rootPath, "empty.txt")), hashlib.sha256(b"").hexdigest())
+
+    def test_hashFile_cached(self):
+        hasher = LibAlexContentHasher()
+        first = hasher.hashFile(self.paths["a.txt"])
+        self.assertEqual(hasher.hashFile(self.paths["a.txt"]), first)
+        self.assertEqual((hasher.hits, hasher.misses), (1, 1))
+
+        # Changed files are hashed again
+        self.writeFile("a.txt", b"Changed words, longer.")
+        self.assertNotEqual(hasher.hashFile(self.paths["a.txt"]), first)
+        self.assertEqual(hasher.misses, 2)
+
+    def test_hashItems(self):
+        digests = LibAlexContentHasher(workers=3).hashItems(self.items)
+
+        self.assertEqual(set(digests), set(self.paths.values()))
+        self.assertEqual(digests[self.paths["a.txt"]], digests[self.paths["b.txt"]])
+        self.assertNotEqual(digests[self.paths["a.txt"]], digests[self.paths["c.txt"]])
+
+    def test_findDuplicates(self):
+        hasher = LibAlexContentHasher(workers=2)
+        duplicates = hasher.findDuplicates(self.items)
+
+        self.assertEqual(len(duplicates), 1)
+        self.assertEqual(duplicates[0].paths, [self.paths["a.txt"], self.paths["b.txt"]])
+        self.assertEqual([item.title for item in duplicates[0].items], ["One", "Three", "Two"])
+        self.assertEqual(duplicates[0].wastedBytes, 15)
+
+        # Files without a same-sized peer are never hashed
+        self.assertEqual(hasher.misses, 3)
+
+    def test_findDuplicates_hardLinks(self):
+        # Links to one file are not copies of it
+        linkPath = os.path.join(self.rootPath, "c-link.txt")
+        os.link(self.paths["c.txt"], linkPath)
+        items = self.items + [LibAlexItem(title="Five", sourceFile=linkPath)]
+
+        duplicates = LibAlexContentHasher().findDuplicates(items)
+        self.assertEqual([group.paths for group in duplicates], [[self.paths["a.txt"], self.paths["b.txt"]]])
+
+        # A linked copy is reported once with the items of every link
+        os.link(self.paths["b.txt"], os.path.join(self.rootPath, "b-link.txt"))
+        items.append(LibAlexItem(title="Six", sourceFile=os.path.join(self.rootPath, "b-link.txt")))
+
+        duplicates = LibAlexContentHasher().findDuplicates(items)
+        self.assertEqual(duplicates[0].paths, [self.paths["a.txt"], os.path.join(self.rootPath, "b-link.txt")])
+        self.assertEqual([item.title for item in duplicates[0].items], ["One", "Three", "Six", "Two"])
+        self.assertEqual(duplicates[0].wastedBytes, 15)
+
+    def test_load_corrupt(self):
+        cachePath = os.path.join(self.rootPath, "hashes.json")
+        version = laShared.VER_CONTENT_HASH_CACHE
+        contents = (
+            "{\"_cachever\": ",
+            "[1]",
+            '{"_cachever": "%s", "algorithm": "blake2b", "entries": []}' % version,
+            '{"_cachever": "%s", "algorithm": "blake2b", "entries": {"x": [[1, 2], "ab"]}}' % version
+        )
+        for content in contents:
+            with self.subTest(content=content):
+                with open(cachePath, "w") as cacheFile:
+                    cacheFile.write(content)
+
+                hasher = LibAlexContentHasher(cachePath)
+                self.assertEqual(len(hasher), 0)
+                with self.assertRaises(ValueError):
+                    hasher.load()
+
+    def test_save_replace(self):
+        cachePath = os.path.join(self.rootPath, "cache", "hashes.json")
+        hasher = LibAlexContentHasher(cachePath)
+        hasher.hashItems(self.items)
+        hasher.save()
+
+        # The mode of the replaced file is kept
+        os.chmod(cachePath, 0o600)
+        hasher.save()
+        self.assertEqual(os.stat(cachePath).st_mode & 0o777, 0o600)
+
+        # A failed save leaves no temporary file behind
+        os.remove(cachePath)
+        os.makedirs(os.path.join(cachePath, "inside"))
+        with self.assertRaises(OSError):
+            hasher.save()
+
+        self.assertEqual(os.listdir(os.path.dirname(cachePath)), ["hashes.json"])
+
+    def test_saveLoad(self):
+        cachePath = os.path.join(self.rootPath, "cache", "hashes.json")
+        hasher = LibAlexContentHasher(cachePath)
+        digests = hasher.hashItems(self.items)
+        hasher.save()
+
+        loaded = LibAlexContentHasher(cachePath)
+        self.assertEqual(len(loaded), len(digests))
+        self.assertEqual(loaded.hashItems(self.items), digests)
+        self.assertEqual(loaded.misses, 0)
+
+        # Another algorithm ignores the cache
+        self.assertEqual(len(LibAlexContentHasher(cachePath, algorithm="sha256")), 0)
+
+    def test_prune(self):
+        hasher = LibAlexContentHasher()
+        hasher.hashItems(self.items)
+        self.assertEqual(hasher.prune([self.paths["a.txt"]]), 4)
+        self.assertEqual(len(hasher), 1)
+
+    def test_badAlgorithm(self):
+        with self.assertRaises(ValueError):
+            LibAlexContentHasher(algorithm="notahash")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# LibAlexandria: LibAlexandria Date Index Tests
+# Tests for the LibAlexandria Date Index.
+
+# Imports
+import unittest
+from datetime import date
+
+import libAlexDates as laDates
+from libAlexItem import LibAlexItem
+from libAlexDateIndex import LibAlexDateIndex
+
+# Classes
+class TestLibAlexDateIndex(unittest.TestCase):
+    def setUp(self):
+        self.dates = ["1984", "c. 1650", "Undated", "1600-1650", "17th century", "April 1900", "1980s"]
+
+        self.index = LibAlexDateIndex()
+        for itemId, itemDate in enumerate(self.dates):
+            self.index.add(itemId, LibAlexItem(date=itemDate))
+
+    def test_len(self):
+        self.assertEqual(len(self.index), len(self.dates))
+        self.assertIn(2, self.index)
+        self.assertNotIn(10, self.index)
+        self.assertEqual(self.index.undated(), [2])
+        self.assertIsNone(self.index.rangeOf(2))
+        self.assertEqual(self.index.rangeOf(0), laDates.normalizeDate("1984"))
+
+    def test_between(self):
+        self.assertEqual(self.index.between("1600", "1650"), [3, 4, 1])
+        self.assertEqual(self.index.between("1600", "1650", within=True), [3])
+        self.assertEqual(self.index.between(low="1900"), [5, 6, 0])
+        self.assertEqual(self.index.between(high="1599"), [])
+        self.assertEqual(self.index.between(date(1984, 6, 1), date(1984, 6, 1)), [6, 0])
+        self.assertEqual(self.index.between(), [3, 4, 1, 5, 6, 0])
+
+    def test_between_reversed(self):
+        self.assertEqual(self.index.between("1650", "1600"), [])
+        self.assertEqual(self.index.between("1900", "1800", within=True), [])
+
+    def test_between_invalid(self):
+        with self.assertRaises(ValueError):
+            self.index.between("someday")
+
+    def test_count(self):
+        self.assertEqual(self.index.count(), 6)
+        self.assertEqual(self.index.count("1600", "1650"), 3)
+        self.assertEqual(self.index.count(low="1900"), 3)
+        self.assertEqual(self.index.count("1900", "1800"), 0)
+
+    def test_ordered(self):
+        self.assertEqual(self.index.ordered(), [3, 4, 1, 5, 6, 0])
+        self.assertEqual(self.index.ordered(reverse=True), [0, 6, 5, 1, 4, 3])
+
+    def test_earliestLatest(self):
+        self.assertEqual(laDates.formatOrdinal(self.index.earliest()), "1600-01-01")
+        self.assertEqual(laDates.formatOrdinal(self.index.latest()), "1989-12-31")
+        self.assertIsNone(LibAlexDateIndex().earliest())
+
+    def test_update(self):
+        self.index.update(0, LibAlexItem(date="1500"))
+        self.assertEqual(self.index.between(high="1599"), [0])
+
+        self.index.update(2, LibAlexItem(date="1700"))
+        self.assertEqual(self.index.undated(), [])
+        self.assertEqual(self.index.between("1700", "1700"), [4, 2])
+
+        self.index.update(3, LibAlexItem(date="Undated"))
+        self.assertEqual(self.index.undated(), [3])
+
+    def test_addMany(self):
+        index = LibAlexDateIndex()
+        index.addMany((itemId, LibAlexItem(date=itemDate)) for itemId, itemDate in enumerate(self.dates))
+
+        self.assertEqual(index.ordered(), self.index.ordered())
+        self.assertEqual(index.undated(), [2])
+        self.assertEqual(index.between("1600", "1650"), [3, 4, 1])
+
+        # Indexed and repeated ids keep their last range
+        index.addRanges([(0, laDates.normalizeDate("1500")), (7, None), (7, laDates.normalizeDate("1700"))])
+        self.assertEqual(index.ordered(), [0, 3, 4, 1, 7, 5, 6])
+        self.assertEqual(index.count("1500", "1500"), 1)
+        self.assertEqual(len(index), 8)
+
+    def test_remove(self):
+        self.assertTrue(self.index.remove(1))
+        self.assertTrue(self.index.remove(2))
+        self.assertFalse(self.index.remove(1))
+
+        self.assertEqual(self.index.between("1600", "1650"), [3, 4])
+        self.assertEqual(self.index.count("1600", "1650"), 2)
+
+    def test_clear(self):
+        self.index.clear()
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.between(), [])
+
+# Console Execution
+if __name__ == "__main__":
+    unittest.main()
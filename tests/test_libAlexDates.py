@@ -0,0 +1,63 @@
+# LibAlexandria: LibAlexandria Dates Tests
+# Tests for the LibAlexandria date normalization functions.
+
+# Imports
+import unittest
+from datetime import date
+
+import libAlexDates as laDates
+
+# Functions
+def days(start: date, end: date) -> tuple[int, int]:
+    return (start.toordinal(), end.toordinal())
+
+# Classes
+class TestLibAlexDates(unittest.TestCase):
+    def test_normalizeDate_exact(self):
+        self.assertEqual(laDates.normalizeDate("1984"), days(date(1984, 1, 1), date(1984, 12, 31)))
+        self.assertEqual(laDates.normalizeDate("1984-02"), days(date(1984, 2, 1), date(1984, 2, 29)))
+        self.assertEqual(laDates.normalizeDate("1984-04-01"), days(date(1984, 4, 1), date(1984, 4, 1)))
+        self.assertEqual(laDates.normalizeDate("1984/4/1"), days(date(1984, 4, 1), date(1984, 4, 1)))
+
+    def test_normalizeDate_named(self):
+        self.assertEqual(laDates.normalizeDate("April 1984"), laDates.normalizeDate("1984-04"))
+        self.assertEqual(laDates.normalizeDate("Apr. 1, 1984"), laDates.normalizeDate("1984-04-01"))
+        self.assertEqual(laDates.normalizeDate("1st April 1984"), laDates.normalizeDate("1984-04-01"))
+
+    def test_normalizeDate_spans(self):
+        self.assertEqual(laDates.normalizeDate("1600-1650"), days(date(1600, 1, 1), date(1650, 12, 31)))
+        self.assertEqual(laDates.normalizeDate("1980s"), days(date(1980, 1, 1), date(1989, 12, 31)))
+        self.assertEqual(laDates.normalizeDate("17th century"), days(date(1601, 1, 1), date(1700, 12, 31)))
+
+    def test_normalizeDate_circa(self):
+        expected = days(date(1645, 1, 1), date(1655, 12, 31))
+        self.assertEqual(laDates.normalizeDate("c. 1650"), expected)
+        self.assertEqual(laDates.normalizeDate("circa 1650"), expected)
+        self.assertEqual(laDates.normalizeDate("~1650"), expected)
+
+    def test_normalizeDate_unknown(self):
+        self.assertIsNone(laDates.normalizeDate("Undated"))
+        self.assertIsNone(laDates.normalizeDate("1984-13"))
+        self.assertIsNone(laDates.normalizeDate("1650-1600"))
+        self.assertIsNone(laDates.normalizeDate("1/2"))
+        self.assertIsNone(laDates.normalizeDate("3.5"))
+        self.assertIsNone(laDates.normalizeDate("12/25/84"))
+        self.assertIsNone(laDates.normalizeDate(None))
+
+    def test_normalizeDates(self):
+        self.assertEqual(laDates.normalizeDates(["1984", "Undated", "1984"]), [laDates.normalizeDate("1984"), None, laDates.normalizeDate("1984")])
+
+    def test_dateBound(self):
+        self.assertEqual(laDates.dateBound("1984"), date(1984, 1, 1).toordinal())
+        self.assertEqual(laDates.dateBound("1984", end=True), date(1984, 12, 31).toordinal())
+        self.assertEqual(laDates.dateBound(date(1984, 4, 1)), date(1984, 4, 1).toordinal())
+
+        with self.assertRaises(ValueError):
+            laDates.dateBound("someday")
+
+    def test_formatOrdinal(self):
+        self.assertEqual(laDates.formatOrdinal(date(1984, 4, 1).toordinal()), "1984-04-01")
+
+# Console Execution
+if __name__ == "__main__":
+    unittest.main()
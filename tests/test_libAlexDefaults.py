@@ -6,7 +6,7 @@ import unittest
 import os
 import tempfile
 
-from libAlexDefaults import fullpath, checkPath, slugify
+from libAlexDefaults import fullpath, checkPath, slugify, slugifyCached
 
 # Classes
 class TestFullPath(unittest.TestCase):
@@ -43,5 +43,10 @@ class TestSlugify(unittest.TestCase):
         slug = "hello-cest-un-tring-bruh-meow"
         self.assertEqual(slugify(string), slug)
 
+    def test_slugifyCached(self):
+        string = "Hëllö Wörld"
+        self.assertEqual(slugifyCached(string), slugify(string))
+        self.assertEqual(slugifyCached(string), slugify(string))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,137 @@
+# LibAlexandria: LibAlexandria Flag Index Tests
+# Tests for the LibAlexandria Flag Index.
+
+# Imports
+import unittest
+
+from libAlexItem import LibAlexItem
+from libAlexFlagIndex import LibAlexFlagIndex
+
+# Classes
+class TestLibAlexFlagIndex(unittest.TestCase):
+    def setUp(self):
+        self.items = [
+            LibAlexItem(flags=["poetry", "english"], classification="PR"),
+            LibAlexItem(flags=["poetry", "french"], classification="PQ"),
+            LibAlexItem(flags=["prose", "english"], classification="PR"),
+            LibAlexItem(flags=["prose"], resolvedFlags=["archive"], classification="AS")
+        ]
+
+        self.index = LibAlexFlagIndex()
+        for itemId, item in enumerate(self.items):
+            self.index.add(itemId, item)
+
+    def test_len(self):
+        self.assertEqual(len(self.index), len(self.items))
+        self.assertIn(0, self.index)
+        self.assertNotIn(10, self.index)
+
+    def test_flags(self):
+        self.assertEqual(self.index.flags(), ["AS", "PQ", "PR", "archive", "english", "french", "poetry", "prose"])
+        self.assertEqual(self.index.flagsWithPrefix("P"), ["PQ", "PR"])
+        self.assertEqual(self.index.flagCount("english"), 2)
+        self.assertEqual(self.index.flagCount("missing"), 0)
+
+    def test_query_all(self):
+        self.assertEqual(self.index.query(), [0, 1, 2, 3])
+        self.assertEqual(self.index.query(allOf=["poetry", "english"]), [0])
+        self.assertEqual(self.index.query(allOf=["poetry", "missing"]), [])
+
+    def test_query_any(self):
+        self.assertEqual(self.index.query(anyOf=["french", "archive"]), [1, 3])
+        self.assertEqual(self.index.query(allOf=["english"], anyOf=["poetry", "prose"]), [0, 2])
+
+    def test_query_none(self):
+        self.assertEqual(self.index.query(allOf=["english"], noneOf=["poetry"]), [2])
+        self.assertEqual(self.index.query(noneOf=["prose", "french"]), [0])
+
+    def test_count(self):
+        self.assertEqual(self.index.count(allOf=["PR"]), 2)
+        self.assertEqual(self.index.count(allOf=["PR"], noneOf=["prose"]), 1)
+
+    def test_update(self):
+        self.items[0].flags = ["prose", "english"]
+        self.index.update(0, self.items[0])
+
+        self.assertEqual(self.index.query(allOf=["poetry"]), [1])
+        self.assertEqual(self.index.query(allOf=["prose", "english"]), [0, 2])
+
+    def test_remove(self):
+        self.assertTrue(self.index.remove(1))
+        self.assertFalse(self.index.remove(1))
+
+        self.assertEqual(self.index.query(), [0, 2, 3])
+        self.assertNotIn("french", self.index.flags())
+        self.assertIsNone(self.index.flagsOf(1))
+
+    def test_largeIds(self):
+        index = LibAlexFlagIndex()
+        ids = [0, 63, 64, 1000, 100000]
+        for itemId in ids:
+            index.addFlags(itemId, ["big"])
+
+        self.assertEqual(index.query(allOf=["big"]), ids)
+        self.assertEqual(index.count(allOf=["big"]), len(ids))
+
+    def test_largeIds_updates(self):
+        index = LibAlexFlagIndex()
+        for itemId in range(0, 5000, 7):
+            index.addFlags(itemId, ["big", ("odd" if itemId % 2 else "even")])
+
+        self.assertTrue(index.remove(4998))
+        index.addFlags(7, ["even"])
+        self.assertNotIn(4998, index.query(allOf=["big"]))
+        self.assertEqual(index.count(allOf=["big"]), 713)
+        self.assertEqual(index.flagCount("odd"), 356)
+        self.assertEqual(index.query(allOf=["even"], noneOf=["big"]), [7])
+
+        for itemId in list(index.query(allOf=["odd"])):
+            index.remove(itemId)
+
+        self.assertNotIn("odd", index.flags())
+        self.assertEqual(index.bitmap(anyOf=["odd"]), 0)
+
+    def test_denseFlags(self):
+        # Flags switch between sparse and chunked postings as they grow and shrink
+        index = LibAlexFlagIndex()
+        itemFlags = {}
+        for itemId in range(0, 150000, 7):
+            flags = ["all", ("odd" if itemId % 2 else "even"), f"item{itemId}"]
+            if itemId % 3 == 0:
+                flags.append("third")
+
+            index.addFlags(itemId, flags)
+            itemFlags[itemId] = set(flags)
+
+        for itemId in list(itemFlags)[::3]:
+            index.remove(itemId)
+            del itemFlags[itemId]
+
+        def expected(allOf=(), anyOf=(), noneOf=()):
+            return sorted(
+                i for i, f in itemFlags.items()
+                if f.issuperset(allOf) and ((not anyOf) or (f & set(anyOf))) and not (f & set(noneOf))
+            )
+
+        queries = [
+            {},
+            {"allOf": ["odd"]},
+            {"allOf": ["all", "third"], "noneOf": ["even"]},
+            {"anyOf": ["third", "item14"]},
+            {"allOf": ["item21", "all"]},
+            {"noneOf": ["all"]}
+        ]
+        for query in queries:
+            with self.subTest(query=query):
+                self.assertEqual(index.query(**query), expected(**query))
+                self.assertEqual(index.count(**query), len(expected(**query)))
+
+        self.assertEqual(index.query(anyOfGroups=[["odd"], ["third"]]), expected(allOf=["odd", "third"]))
+        self.assertEqual(index.query(anyOfGroups=[[]]), [])
+
+    def test_bitmapToIds(self):
+        self.assertEqual(LibAlexFlagIndex.bitmapToIds(0), [])
+        self.assertEqual(LibAlexFlagIndex.bitmapToIds(0b1011), [0, 1, 3])
+
+if __name__ == "__main__":
+    unittest.main()
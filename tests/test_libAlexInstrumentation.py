@@ -0,0 +1,75 @@
+# LibAlexandria: Instrumentation Tests
+# Tests for the per-phase instrumentation of LibAlexandria Item loading.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+import libAlexInstrumentation as laInst
+from libAlexInstrumentation import LibAlexStats
+from libAlexItem import LibAlexItem
+from libAlexScanner import LibAlexScanner
+from libAlexSynthetic import generateLibrary
+
+# Classes
+class TestLibAlexInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.metaPath = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "assets", "metaV2.json"))
+
+    def tearDown(self):
+        laInst.disable()
+
+    def test_disabled(self):
+        self.assertIsNone(laInst.getStats())
+        self.assertIs(laInst.lap, laInst._noLap)
+
+        LibAlexItem.fromMetaFile(self.metaPath)
+        self.assertIsNone(laInst.getStats())
+
+    def test_fromMetaFile(self):
+        with laInst.collect() as stats:
+            for _ in range(3):
+                LibAlexItem.fromMetaFile(self.metaPath)
+
+        self.assertIsNone(laInst.getStats())
+        for name in ("item.resolvePath", "syscall.stat", "syscall.open", "syscall.read", "item.parseJson", "item.parseVersion", "item.relatedFiles", "item.construct"):
+            self.assertEqual(stats.count(name), 3, name)
+
+        summary = stats.summary()
+        self.assertGreaterEqual(summary["item.parseJson"]["p99us"], summary["item.parseJson"]["p50us"])
+        self.assertIn("item.parseJson", stats.report())
+
+    def test_scan(self):
+        with tempfile.TemporaryDirectory() as rootPath:
+            generateLibrary(rootPath, itemCount=12, depth=1, fanout=3)
+
+            with laInst.collect() as stats:
+                items = list(LibAlexScanner(rootPath, workers=3))
+
+        self.assertEqual(stats.count("item.construct"), len(items))
+        self.assertEqual(stats.count("syscall.scandir"), 1 + 3 + 12)
+
+    def test_callback(self):
+        calls = []
+        laInst.enable(LibAlexStats(callback=lambda name, ns: calls.append(name)))
+        LibAlexItem.fromMetaFile(self.metaPath)
+
+        self.assertIn("syscall.read", calls)
+        self.assertEqual(len(calls), sum(laInst.getStats().count(n) for n in laInst.getStats().names()))
+
+    def test_stats(self):
+        stats = LibAlexStats()
+        for ns in (10, 20, 30, 40):
+            stats.record("phase", ns)
+
+        self.assertEqual(stats.count("phase"), 4)
+        self.assertEqual(stats.total("phase"), 100)
+        self.assertEqual(stats.percentile("phase", 0.5), 30)
+        self.assertEqual(stats.percentile("missing", 0.5), 0)
+
+        stats.reset()
+        self.assertEqual(len(stats), 0)
+
+if __name__ == "__main__":
+    unittest.main()
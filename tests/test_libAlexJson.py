@@ -0,0 +1,70 @@
+# LibAlexandria: JSON Backends Tests
+# Tests for the JSON backend selection.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+import libAlexJson as laJson
+from libAlexItem import LibAlexItem
+
+# Classes
+class TestLibAlexJson(unittest.TestCase):
+    def setUp(self):
+        self.originalBackend = laJson.getBackend()
+        self.metaPath = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "assets", "metaV2.json"))
+        self.data = {"title": "Ç'est ün ẞtrïng", "flags": ["a", "b"], "count": 3, "empty": None}
+
+    def tearDown(self):
+        laJson.setBackend(self.originalBackend)
+
+    def test_availableBackends(self):
+        backends = laJson.availableBackends()
+        self.assertIn("json", backends)
+        self.assertEqual(backends, [b for b in laJson.BACKENDS if b in backends])
+
+    def test_setBackend_default(self):
+        laJson.setBackend()
+        self.assertEqual(laJson.getBackend(), laJson.availableBackends()[0])
+
+    def test_setBackend_invalid(self):
+        with self.assertRaises(ValueError):
+            laJson.setBackend("notjson")
+
+    def test_backends(self):
+        for backend in laJson.availableBackends():
+            with self.subTest(backend=backend):
+                laJson.setBackend(backend)
+
+                text = laJson.dumps(self.data)
+                self.assertIsInstance(text, str)
+                self.assertIn("ẞ", text)
+                self.assertEqual(laJson.loads(text), self.data)
+                self.assertEqual(laJson.loads(text.encode("utf-8")), self.data)
+                self.assertEqual(laJson.loads(laJson.dumps(self.data, indent=4)), self.data)
+
+                with self.assertRaises(ValueError):
+                    laJson.loads(b"{ not json")
+
+    def test_fromMetaFile(self):
+        for backend in laJson.availableBackends():
+            with self.subTest(backend=backend):
+                laJson.setBackend(backend)
+                item = LibAlexItem.fromMetaFile(self.metaPath)
+                self.assertEqual(item.title, "Lorem Ipsum")
+
+    def test_fromMetaFile_badJson(self):
+        with tempfile.TemporaryDirectory() as tempDir:
+            metaPath = os.path.join(tempDir, "meta.json")
+            with open(metaPath, "w") as metaFile:
+                metaFile.write("{ not json")
+
+            for backend in laJson.availableBackends():
+                with self.subTest(backend=backend):
+                    laJson.setBackend(backend)
+                    with self.assertRaises(ValueError):
+                        LibAlexItem.fromMetaFile(metaPath)
+
+if __name__ == "__main__":
+    unittest.main()
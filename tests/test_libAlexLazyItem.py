@@ -0,0 +1,108 @@
+# LibAlexandria: LibAlexandria Lazy Item Tests
+# Tests for the LibAlexandria Lazy Item.
+
+# Imports
+import os
+import shutil
+import pickle
+import tempfile
+import unittest
+import warnings
+
+from libAlexItem import LibAlexItem
+from libAlexLazyItem import LibAlexLazyItem
+from libAlexPathValidator import LibAlexPathValidator
+
+# Classes
+class TestLibAlexLazyItem(unittest.TestCase):
+    def setUp(self):
+        assetDir = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "assets"))
+
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.itemDir = self.tempDir.name
+        for name in ("metaV1.json", "metaV2.json", "sourceFile.txt", "relatedFile.txt", "relatedFile2.txt"):
+            shutil.copy(os.path.join(assetDir, name), os.path.join(self.itemDir, name))
+
+        self.metaPathV1 = os.path.join(self.itemDir, "metaV1.json")
+        self.metaPathV2 = os.path.join(self.itemDir, "metaV2.json")
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_fromMetaFile_header(self):
+        item = LibAlexLazyItem.fromMetaFile(self.metaPathV2)
+
+        self.assertIsInstance(item, LibAlexItem)
+        self.assertEqual((item.title, item.author, item.date, item.version.string), ("Lorem Ipsum", "John Doe", "1984-04-01", "2.0.0"))
+        self.assertFalse(item.isResolved)
+        self.assertTrue(item.isPending("relatedFiles"))
+        self.assertIn("<pending>", repr(item))
+
+    def test_fromMetaFile_matchesItem(self):
+        item = LibAlexLazyItem.fromMetaFile(self.metaPathV2)
+        expected = LibAlexItem.fromMetaFile(self.metaPathV2)
+
+        self.assertEqual(item.toRecord(), expected.toRecord())
+        self.assertEqual(item.toJson(), expected.toJson())
+        self.assertEqual(item.getAllFlags(), expected.getAllFlags())
+        self.assertTrue(item.isResolved)
+
+    def test_fromMetaFile_v1(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            item = LibAlexLazyItem.fromMetaFile(self.metaPathV1)
+            expected = LibAlexItem.fromMetaFile(self.metaPathV1)
+
+        self.assertEqual(item.toRecord(), expected.toRecord())
+
+    def test_deferredValidation(self):
+        os.remove(os.path.join(self.itemDir, "relatedFile2.txt"))
+        item = LibAlexLazyItem.fromMetaFile(self.metaPathV2)
+
+        # The header still loads and the source file resolves alone
+        self.assertEqual(item.title, "Lorem Ipsum")
+        self.assertEqual(item.sourceFile, os.path.join(self.itemDir, "sourceFile.txt"))
+
+        with self.assertRaises(FileNotFoundError):
+            item.relatedFiles
+
+        self.assertFalse(item.isResolved)
+
+    def test_deferValidation(self):
+        os.remove(os.path.join(self.itemDir, "sourceFile.txt"))
+        item = LibAlexLazyItem.fromMetaFile(self.metaPathV2, deferValidation=True)
+        item.resolve()
+
+        self.assertEqual(item.sourceFile, os.path.join(self.itemDir, "sourceFile.txt"))
+        self.assertTrue(item.isResolved)
+
+    def test_validator(self):
+        validator = LibAlexPathValidator()
+        item = LibAlexLazyItem.fromMetaFile(self.metaPathV2, validator=validator)
+        self.assertEqual(len(item.relatedFiles), 2)
+
+    def test_assign(self):
+        item = LibAlexLazyItem.fromMetaFile(self.metaPathV2)
+        item.relatedFiles = None
+        item.description = "Replaced."
+
+        self.assertIsNone(item.relatedFiles)
+        self.assertEqual(item.description, "Replaced.")
+        self.assertTrue(item.isPending("sourceFile"))
+
+    def test_constructor(self):
+        item = LibAlexLazyItem(title="Direct", description="Built directly.")
+        self.assertTrue(item.isResolved)
+        self.assertEqual(item.description, "Built directly.")
+        self.assertEqual(LibAlexLazyItem.fromRecord(item.toRecord()).title, "Direct")
+
+    def test_pickle(self):
+        item = LibAlexLazyItem.fromMetaFile(self.metaPathV2)
+        copied = pickle.loads(pickle.dumps(item))
+
+        self.assertTrue(copied.isResolved)
+        self.assertEqual(copied.toRecord(), item.toRecord())
+
+# Console Execution
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# LibAlexandria: LibAlexandria Library Tests
+# Tests for the incrementally refreshed LibAlexandria Library.
+
+# Imports
+import os
+import gc
+import json
+import shutil
+import tempfile
+import unittest
+
+from libAlexLibrary import LibAlexLibrary, LibAlexLibraryEvent
+from libAlexInotify import inotifyAvailable
+from libAlexSynthetic import generateLibrary
+
+# Classes
+class TestLibAlexLibrary(unittest.TestCase):
+    # Variables
+    watch = False
+
+    # Tests
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = self.tempDir.name
+        self.metaPaths = generateLibrary(self.rootPath, itemCount=20, depth=1, fanout=4, relatedFileCount=1, seed=2)
+
+        self.library = LibAlexLibrary(self.rootPath, workers=4, watch=self.watch)
+        self.events = []
+        self.library.subscribe(self.events.append)
+        self.library.refresh()
+
+    def tearDown(self):
+        self.library.close()
+        self.tempDir.cleanup()
+
+    def rewriteMeta(self, metaPath: str, **fields):
+        with open(metaPath, "r", encoding="utf-8") as metaFile:
+            metaJson = json.load(metaFile)
+
+        metaJson.update(fields)
+        with open(metaPath, "w", encoding="utf-8") as metaFile:
+            json.dump(metaJson, metaFile)
+
+    def test_refresh_initial(self):
+        self.assertEqual(len(self.library), 20)
+        self.assertEqual(len(self.events), 20)
+        self.assertTrue(all(e.kind == LibAlexLibraryEvent.ADDED for e in self.events))
+        self.assertEqual(len(self.library.textIndex), 20)
+        self.assertEqual(len(self.library.versionIndex), 20)
+        self.assertEqual(len(self.library.dateIndex), 20)
+        self.assertEqual(self.library.watching, self.watch and inotifyAvailable())
+
+    def test_refresh_unchanged(self):
+        self.assertEqual(self.library.refresh(), [])
+
+    def test_refresh_updated(self):
+        metaPath = self.metaPaths[3]
+        itemId = self.library.itemId(metaPath)
+        self.rewriteMeta(metaPath, title="Zanzibar Quokka", flags=["quokka"])
+
+        events = self.library.refresh()
+        self.assertEqual([(e.kind, e.itemId) for e in events], [(LibAlexLibraryEvent.UPDATED, itemId)])
+        self.assertEqual(events[0].item.title, "Zanzibar Quokka")
+        self.assertNotEqual(events[0].previous.title, "Zanzibar Quokka")
+
+        self.assertEqual(self.library.textIndex.search("quokka")[0][0], itemId)
+        self.assertEqual(self.library.flagIndex.query(allOf=["quokka"]), [itemId])
+        self.assertEqual(list(self.library.query("flag:quokka zanzibar").ids()), [itemId])
+
+    def test_refresh_relatedFileChanged(self):
+        metaPath = self.metaPaths[5]
+        with open(os.path.join(os.path.dirname(metaPath), "related0.txt"), "a") as relatedFile:
+            relatedFile.write(" More text.")
+
+        events = self.library.refresh()
+        self.assertEqual([(e.kind, e.metaPath) for e in events], [(LibAlexLibraryEvent.UPDATED, metaPath)])
+
+    def test_refresh_addedRemoved(self):
+        # Remove an item directory
+        removedPath = self.metaPaths[0]
+        removedId = self.library.itemId(removedPath)
+        shutil.rmtree(os.path.dirname(removedPath))
+
+        # Add an item in a new shelf
+        newDir = os.path.join(self.rootPath, "New Shelf", "New Item")
+        shutil.copytree(os.path.dirname(self.metaPaths[1]), newDir)
+        newPath = os.path.join(newDir, "meta.json")
+
+        events = self.library.refresh()
+        self.assertEqual(
+            sorted((e.kind, e.metaPath) for e in events),
+            [(LibAlexLibraryEvent.ADDED, newPath), (LibAlexLibraryEvent.REMOVED, removedPath)]
+        )
+
+        self.assertNotIn(removedPath, self.library)
+        self.assertIsNone(self.library.getItem(removedId))
+        self.assertNotIn(removedId, self.library.textIndex)
+        self.assertNotIn(removedId, self.library.versionIndex)
+        self.assertNotIn(removedId, self.library.dateIndex)
+        self.assertIn("new-shelf", self.library.getItem(self.library.itemId(newPath)).resolvedFlags)
+        self.assertEqual(len(self.library), 20)
+
+    def test_refresh_errors(self):
+        metaPath = self.metaPaths[7]
+        with open(metaPath, "w") as metaFile:
+            metaFile.write("{ not json")
+
+        events = self.library.refresh()
+        self.assertEqual([e.kind for e in events], [LibAlexLibraryEvent.REMOVED])
+        self.assertIn(metaPath, self.library.errors)
+
+        # Failed items are not retried until they change
+        self.assertEqual(self.library.refresh(), [])
+
+        self.rewriteMeta(self.metaPaths[8])
+        shutil.copy(self.metaPaths[8], metaPath)
+        events = self.library.refresh()
+        self.assertIn((LibAlexLibraryEvent.ADDED, metaPath), [(e.kind, e.metaPath) for e in events])
+        self.assertNotIn(metaPath, self.library.errors)
+
+    def test_refresh_malformed(self):
+        # Valid JSON in the wrong shape is reported instead of breaking the refresh
+        with open(self.metaPaths[3], "w") as metaFile:
+            metaFile.write("[1]")
+
+        with open(self.metaPaths[4], "w") as metaFile:
+            metaFile.write('{"_infover": 2}')
+
+        events = self.library.refresh()
+        self.assertEqual([e.kind for e in events], [LibAlexLibraryEvent.REMOVED] * 2)
+        self.assertEqual(len(self.library), 18)
+        self.assertIn(self.metaPaths[3], self.library.errors)
+        self.assertIn(self.metaPaths[4], self.library.errors)
+
+    def test_unsubscribe(self):
+        self.library.unsubscribe(self.events.append)
+        self.rewriteMeta(self.metaPaths[2], title="Changed")
+
+        self.assertEqual(len(self.library.refresh()), 1)
+        self.assertEqual(len(self.events), 20)
+
+@unittest.skipUnless(inotifyAvailable(), "Inotify is not available.")
+class TestLibAlexLibraryInotify(TestLibAlexLibrary):
+    # Variables
+    watch = True
+
+    # Tests
+    def test_dropped_releasesWatcher(self):
+        library = LibAlexLibrary(self.rootPath, watch=True)
+        library.refresh()
+        fd = library._watcher._fd
+
+        del library
+        gc.collect()
+
+        with self.assertRaises(OSError):
+            os.fstat(fd)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# LibAlexandria: Library Migration Tests
+# Tests for the LibAlexandria Library migrator.
+
+# Imports
+import os
+import json
+import tempfile
+import unittest
+import warnings
+
+from libAlexItem import LibAlexItem
+from libAlexMigrate import LibAlexMigrator
+from libAlexSynthetic import generateLibrary
+
+# Classes
+class TestLibAlexMigrator(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = self.tempDir.name
+        self.metaPaths = generateLibrary(self.rootPath, itemCount=30, depth=1, fanout=3, v1Ratio=0.5, seed=5)
+
+        self.v1Paths = [p for p in self.metaPaths if self.readMeta(p)["_infover"].startswith("1.")]
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    @staticmethod
+    def readMeta(metaPath: str) -> dict:
+        with open(metaPath, "r", encoding="utf-8") as metaFile:
+            return json.load(metaFile)
+
+    def test_run(self):
+        report = LibAlexMigrator(self.rootPath, workers=4).run()
+
+        self.assertEqual(report.scanned, 30)
+        self.assertEqual(report.migrated, len(self.v1Paths))
+        self.assertEqual(report.skipped, 30 - len(self.v1Paths))
+        self.assertEqual(report.failed, 0)
+
+        # Every file now loads without the deprecation warning
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for metaPath in self.v1Paths:
+                item = LibAlexItem.fromMetaFile(metaPath)
+                self.assertEqual(item.version.major, 2)
+                self.assertEqual(self.readMeta(metaPath)["sourceFile"], "source.txt")
+
+    def test_run_idempotent(self):
+        LibAlexMigrator(self.rootPath, rewriteCurrent=True).run()
+        signatures = {p: os.stat(p).st_mtime_ns for p in self.metaPaths}
+
+        report = LibAlexMigrator(self.rootPath, rewriteCurrent=True).run()
+        self.assertEqual(report.migrated, 0)
+        self.assertEqual(report.unchanged, 30)
+        self.assertEqual(signatures, {p: os.stat(p).st_mtime_ns for p in self.metaPaths})
+
+    def test_run_dryRun(self):
+        before = {p: self.readMeta(p) for p in self.metaPaths}
+
+        report = LibAlexMigrator(self.rootPath, dryRun=True).run()
+        self.assertEqual(report.migrated, len(self.v1Paths))
+        self.assertEqual(before, {p: self.readMeta(p) for p in self.metaPaths})
+
+        # Files already in the current layout are not counted
+        LibAlexMigrator(self.rootPath, rewriteCurrent=True).run()
+        report = LibAlexMigrator(self.rootPath, rewriteCurrent=True, dryRun=True).run()
+        self.assertEqual(report.migrated, 0)
+        self.assertEqual(report.unchanged, len(self.metaPaths))
+
+    def test_run_errors(self):
+        with open(self.metaPaths[0], "w") as metaFile:
+            metaFile.write("{ not json")
+
+        report = LibAlexMigrator(self.rootPath).run()
+        self.assertEqual(report.failed, 1)
+        self.assertEqual(report.errors[0][0], self.metaPaths[0])
+        self.assertEqual(report.scanned, 30)
+
+    def test_run_malformed(self):
+        # Valid JSON in the wrong shape is recorded like any other failure
+        with open(self.metaPaths[0], "w") as metaFile:
+            metaFile.write("[1]")
+
+        with open(self.metaPaths[1], "w") as metaFile:
+            metaFile.write('{"_infover": "2.0.0", "otherFiles": ["x"]}')
+
+        report = LibAlexMigrator(self.rootPath, rewriteCurrent=True).run()
+        self.assertEqual(report.failed, 2)
+        self.assertEqual(sorted(metaPath for metaPath, _ in report.errors), sorted(self.metaPaths[:2]))
+        self.assertEqual(report.scanned, 30)
+
+    def test_run_keepsVersionAndKeys(self):
+        v2Path = next(p for p in self.metaPaths if p not in self.v1Paths)
+        v2Json = self.readMeta(v2Path)
+        v2Json["_infover"] = "2.2.0"
+        v2Json["publisher"] = "Penguin"
+        with open(v2Path, "w") as metaFile:
+            json.dump(v2Json, metaFile)
+
+        v1Json = self.readMeta(self.v1Paths[0])
+        v1Json["isbn"] = "0-14-044913-9"
+        with open(self.v1Paths[0], "w") as metaFile:
+            json.dump(v1Json, metaFile)
+
+        LibAlexMigrator(self.rootPath, rewriteCurrent=True).run()
+
+        rewritten = self.readMeta(v2Path)
+        self.assertEqual(rewritten["_infover"], "2.2.0")
+        self.assertEqual(rewritten["publisher"], "Penguin")
+
+        converted = self.readMeta(self.v1Paths[0])
+        self.assertEqual(converted["_infover"], "2.0.0")
+        self.assertEqual(converted["isbn"], "0-14-044913-9")
+        self.assertNotIn("content", converted)
+
+    def test_run_noSourceFile(self):
+        # A v1 file without content is written with an empty source file and must still load
+        v1Json = self.readMeta(self.v1Paths[0])
+        del v1Json["content"]
+        with open(self.v1Paths[0], "w") as metaFile:
+            json.dump(v1Json, metaFile)
+
+        report = LibAlexMigrator(self.rootPath).run()
+        self.assertEqual(report.failed, 0)
+        self.assertEqual(self.readMeta(self.v1Paths[0])["sourceFile"], "")
+        self.assertIsNone(LibAlexItem.fromMetaFile(self.v1Paths[0]).sourceFile)
+
+    def test_run_warnings(self):
+        # Warnings are collected per file instead of being emitted from the workers
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            report = LibAlexMigrator(self.rootPath, workers=4).run()
+
+        self.assertEqual(caught, [])
+        self.assertEqual(sorted(metaPath for metaPath, _ in report.warnings), sorted(self.v1Paths))
+        self.assertEqual(report.warnings[0][1], LibAlexItem.V1_DEPRECATION)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# LibAlexandria: NDJSON Catalogs Tests
+# Tests for the streaming NDJSON catalog export and import.
+
+# Imports
+import io
+import os
+import tempfile
+import unittest
+
+import libAlexNdjson as laNdjson
+from libAlexItem import LibAlexItem
+from libAlexRelatedFile import LibAlexRelatedFile
+from libAlexScanner import LibAlexScanner
+from libAlexSynthetic import generateLibrary
+
+# Classes
+class TestLibAlexNdjson(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = os.path.join(self.tempDir.name, "Library")
+        generateLibrary(self.rootPath, itemCount=15, depth=1, fanout=3, relatedFileCount=2, seed=6)
+
+        self.items = list(LibAlexScanner(self.rootPath, ordered=True))
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_line_roundTrip(self):
+        for item in self.items:
+            line = laNdjson.itemToLine(item)
+            self.assertNotIn("\n", line)
+            self.assertEqual(laNdjson.itemFromLine(line).toRecord(), item.toRecord())
+
+    def test_line_noSourceFile(self):
+        item = LibAlexItem(title="Loose", directory=self.rootPath)
+        self.assertIsNone(laNdjson.itemFromLine(laNdjson.itemToLine(item)).sourceFile)
+
+    def test_line_defaultItem(self):
+        item = LibAlexItem()
+        self.assertEqual(laNdjson.itemFromLine(laNdjson.itemToLine(item)).toRecord(), item.toRecord())
+
+    def test_line_noDirectory(self):
+        sourcePath = os.path.join(self.rootPath, "loose.txt")
+        item = LibAlexItem(
+            title="Loose",
+            sourceFile=sourcePath,
+            relatedFiles=[LibAlexRelatedFile("Notes", os.path.join(self.rootPath, "notes.txt"), "Loose notes.", validate=False)],
+            classification=None,
+            flags=["draft"]
+        )
+
+        loaded = laNdjson.itemFromLine(laNdjson.itemToLine(item))
+        self.assertIsNone(loaded.directory)
+        self.assertEqual(loaded.sourceFile, sourcePath)
+        self.assertEqual(loaded.toRecord(), item.toRecord())
+
+    def test_exportImport_file(self):
+        for name in ("catalog.ndjson", "catalog.ndjson.gz"):
+            with self.subTest(name=name):
+                catalogPath = os.path.join(self.tempDir.name, name)
+
+                self.assertEqual(laNdjson.exportLibrary(self.rootPath, catalogPath, ordered=True), 15)
+                self.assertFalse(any(f.endswith(".tmp") for f in os.listdir(self.tempDir.name)))
+
+                items = list(laNdjson.importItems(catalogPath))
+                self.assertEqual([i.toRecord() for i in items], [i.toRecord() for i in self.items])
+
+    def test_export_replace(self):
+        catalogPath = os.path.join(self.tempDir.name, "catalog.ndjson")
+        laNdjson.exportItems(self.items, catalogPath)
+        os.chmod(catalogPath, 0o600)
+
+        # A failed export keeps the previous catalog and leaves no temporary file behind
+        def failingItems():
+            yield self.items[0]
+            raise RuntimeError("interrupted")
+
+        with self.assertRaises(RuntimeError):
+            laNdjson.exportItems(failingItems(), catalogPath)
+
+        self.assertFalse(any(f.endswith(".tmp") for f in os.listdir(self.tempDir.name)))
+        self.assertEqual(len(list(laNdjson.importItems(catalogPath))), 15)
+
+        # The mode of the replaced catalog is kept
+        laNdjson.exportItems(self.items[:2], catalogPath)
+        self.assertEqual(os.stat(catalogPath).st_mode & 0o777, 0o600)
+
+    def test_exportImport_stream(self):
+        stream = io.StringIO()
+        self.assertEqual(laNdjson.exportItems(iter(self.items), stream), 15)
+
+        stream.seek(0)
+        items = list(laNdjson.importItems(stream))
+        self.assertEqual(len(items), 15)
+        self.assertEqual(items[0].resolvedFlags, self.items[0].resolvedFlags)
+
+    def test_import_noFiles(self):
+        catalogPath = os.path.join(self.tempDir.name, "catalog.ndjson")
+        laNdjson.exportItems(self.items, catalogPath)
+
+        # The library is no longer needed
+        os.rename(self.rootPath, self.rootPath + " Moved")
+        self.assertEqual(len(list(laNdjson.importItems(catalogPath))), 15)
+
+    def test_import_invalid(self):
+        lines = [laNdjson.itemToLine(self.items[0]), "", "{ not json", laNdjson.itemToLine(self.items[1])]
+
+        with self.assertRaises(ValueError) as context:
+            list(laNdjson.importItems(io.StringIO("\n".join(lines))))
+
+        self.assertIn("line 3", str(context.exception))
+        self.assertEqual(len(list(laNdjson.importItems(io.StringIO("\n".join(lines)), skipInvalid=True))), 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+# LibAlexandria: LibAlexandria Flag Trie Tests
+# Tests for the LibAlexandria Flag Trie.
+
+# Imports
+import os
+import unittest
+
+from libAlexDefaults import slugify
+from libAlexItem import LibAlexItem
+from libAlexPathTrie import LibAlexFlagTrie
+
+# Classes
+class TestLibAlexFlagTrie(unittest.TestCase):
+    def setUp(self):
+        self.trie = LibAlexFlagTrie()
+        self.dirPaths = [
+            os.path.join(os.sep, "Library", "Poëtry", "Item One"),
+            os.path.join(os.sep, "Library", "Poëtry", "Item Two"),
+            os.path.join(os.sep, "Library", "Prose & Essays", "Item Three")
+        ]
+
+    def test_resolveFlags(self):
+        for dirPath in self.dirPaths:
+            expected = [slugify(t) for t in dirPath.split(os.sep)[1:]]
+            self.assertEqual(self.trie.resolveFlags(dirPath), expected)
+
+    def test_sharedNodes(self):
+        for dirPath in self.dirPaths:
+            self.trie.resolveFlags(dirPath)
+
+        # Library, Poëtry, Prose & Essays, and three items
+        self.assertEqual(len(self.trie), 6)
+
+        self.trie.resolveFlags(self.dirPaths[0])
+        self.assertEqual(len(self.trie), 6)
+
+    def test_copies(self):
+        flags = self.trie.resolveFlags(self.dirPaths[0])
+        flags.append("changed")
+        self.assertNotIn("changed", self.trie.resolveFlags(self.dirPaths[0]))
+
+    def test_forget(self):
+        for dirPath in self.dirPaths:
+            self.trie.resolveFlags(dirPath)
+
+        self.trie.forget(os.path.join(os.sep, "Library", "Poëtry"))
+        self.assertEqual(len(self.trie), 3)
+
+        self.trie.forget(os.path.join(os.sep, "Missing", "Path"))
+        self.assertEqual(len(self.trie), 3)
+
+        self.trie.forget()
+        self.assertEqual(len(self.trie), 0)
+
+    def test_fromMetaFile(self):
+        metaPath = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "assets", "metaV2.json"))
+
+        expected = LibAlexItem.fromMetaFile(metaPath).resolvedFlags
+        self.assertEqual(LibAlexItem.fromMetaFile(metaPath, flagTrie=self.trie).resolvedFlags, expected)
+
+if __name__ == "__main__":
+    unittest.main()
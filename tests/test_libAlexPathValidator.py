@@ -0,0 +1,133 @@
+# LibAlexandria: LibAlexandria Path Validator Tests
+# Tests for the LibAlexandria Path Validator and deferred item validation.
+
+# Imports
+import os
+import shutil
+import tempfile
+import unittest
+
+from libAlexItem import LibAlexItem
+from libAlexScanner import LibAlexScanner
+from libAlexPathValidator import LibAlexPathValidator
+
+# Classes
+class TestLibAlexPathValidator(unittest.TestCase):
+    def setUp(self):
+        assetDir = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "assets"))
+
+        # Build a single item library
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = self.tempDir.name
+        self.itemDir = os.path.join(self.rootPath, "item")
+        self.metaPath = os.path.join(self.itemDir, "meta.json")
+
+        os.makedirs(self.itemDir)
+        shutil.copy(os.path.join(assetDir, "metaV2.json"), self.metaPath)
+        for name in ("sourceFile.txt", "relatedFile.txt", "relatedFile2.txt"):
+            shutil.copy(os.path.join(assetDir, name), os.path.join(self.itemDir, name))
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_checks(self):
+        validator = LibAlexPathValidator()
+
+        self.assertTrue(validator.isFile(self.metaPath))
+        self.assertFalse(validator.isDir(self.metaPath))
+        self.assertTrue(validator.isDir(self.itemDir))
+        self.assertTrue(validator.exists(self.itemDir))
+        self.assertFalse(validator.exists(os.path.join(self.itemDir, "missing.txt")))
+        self.assertFalse(validator.isFile(os.path.join(self.rootPath, "missing", "file.txt")))
+
+        # The item directory was only listed once
+        self.assertEqual(len(validator), 3)
+
+    def test_snapshotAndForget(self):
+        validator = LibAlexPathValidator()
+        newPath = os.path.join(self.itemDir, "new.txt")
+        self.assertFalse(validator.isFile(newPath))
+
+        with open(newPath, "w") as newFile:
+            newFile.write("new")
+
+        self.assertFalse(validator.isFile(newPath))
+        validator.forget(self.itemDir)
+        self.assertTrue(validator.isFile(newPath))
+
+    def test_maxListings(self):
+        validator = LibAlexPathValidator(maxListings=2)
+        dirPaths = [os.path.join(self.rootPath, name) for name in ("a", "b", "c")]
+        for dirPath in dirPaths:
+            os.makedirs(dirPath)
+
+        # The least recently used listing is dropped first
+        validator.exists(os.path.join(dirPaths[0], "x"))
+        validator.exists(os.path.join(dirPaths[1], "x"))
+        validator.exists(os.path.join(dirPaths[0], "y"))
+        validator.exists(os.path.join(dirPaths[2], "x"))
+        self.assertEqual(len(validator), 2)
+
+        # The recently used listing is still a snapshot while the dropped one is listed again
+        for dirPath in dirPaths[:2]:
+            with open(os.path.join(dirPath, "new.txt"), "w") as newFile:
+                newFile.write("new")
+
+        self.assertFalse(validator.isFile(os.path.join(dirPaths[0], "new.txt")))
+        self.assertTrue(validator.isFile(os.path.join(dirPaths[1], "new.txt")))
+
+    def test_fromMetaFile_validator(self):
+        validator = LibAlexPathValidator()
+        item = LibAlexItem.fromMetaFile(self.metaPath, validator=validator)
+
+        self.assertEqual(len(item.relatedFiles), 2)
+        self.assertIn(self.itemDir, validator._listings)
+
+    def test_fromMetaFile_validatorMissingFile(self):
+        os.remove(os.path.join(self.itemDir, "relatedFile2.txt"))
+
+        with self.assertRaises(FileNotFoundError):
+            LibAlexItem.fromMetaFile(self.metaPath, validator=LibAlexPathValidator())
+
+    def test_fromMetaFile_deferred(self):
+        os.remove(os.path.join(self.itemDir, "sourceFile.txt"))
+
+        item = LibAlexItem.fromMetaFile(self.metaPath, deferValidation=True)
+        self.assertEqual(item.sourceFile, os.path.join(self.itemDir, "sourceFile.txt"))
+
+        with self.assertRaises(FileNotFoundError):
+            item.validate()
+
+    def test_fromMetaFile_deferredDirectory(self):
+        item = LibAlexItem.fromMetaFile(self.itemDir, deferValidation=True)
+        self.assertEqual(item.metaFilepath, self.metaPath)
+
+    def test_validateItems(self):
+        good = LibAlexItem.fromMetaFile(self.metaPath, deferValidation=True)
+        os.remove(os.path.join(self.itemDir, "relatedFile.txt"))
+        bad = LibAlexItem.fromMetaFile(self.metaPath, deferValidation=True)
+
+        validator = LibAlexPathValidator()
+        failures = validator.validateItems([good, bad])
+
+        # Both items share the same missing file
+        self.assertEqual([item for item, _ in failures], [good, bad])
+        self.assertTrue(all(isinstance(e, FileNotFoundError) for _, e in failures))
+
+    def test_scanner(self):
+        validator = LibAlexPathValidator()
+        items = list(LibAlexScanner(self.rootPath, validator=validator))
+
+        self.assertEqual(len(items), 1)
+        self.assertIn(self.rootPath, validator._listings)
+        self.assertIn(self.itemDir, validator._listings)
+
+    def test_scannerDeferred(self):
+        os.remove(os.path.join(self.itemDir, "relatedFile.txt"))
+
+        items = list(LibAlexScanner(self.rootPath, deferValidation=True))
+        self.assertEqual(len(items), 1)
+        self.assertEqual(len(LibAlexPathValidator().validateItems(items)), 1)
+
+if __name__ == "__main__":
+    unittest.main()
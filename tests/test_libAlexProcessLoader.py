@@ -0,0 +1,85 @@
+# LibAlexandria: LibAlexandria Process Loader Tests
+# Tests for the multiprocess LibAlexandria Library loader.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+from libAlexProcessLoader import LibAlexProcessLoader
+from libAlexScanner import LibAlexScanner
+from libAlexSynthetic import generateLibrary
+
+# Classes
+class TestLibAlexProcessLoader(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = self.tempDir.name
+        self.metaPaths = generateLibrary(self.rootPath, itemCount=40, depth=2, fanout=3, relatedFileCount=1, seed=4)
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_partitions(self):
+        partitions = LibAlexProcessLoader(self.rootPath, processes=2, partitionsPerProcess=2).partitions()
+
+        self.assertGreaterEqual(len(partitions), 4)
+        self.assertTrue(all(recursive for _, recursive in partitions))
+        self.assertEqual(partitions, sorted(partitions, key=lambda p: p[0].split(os.sep)))
+
+    def test_partitions_ownMeta(self):
+        itemDir = os.path.dirname(self.metaPaths[0])
+        partitions = LibAlexProcessLoader(itemDir, processes=1, partitionsPerProcess=2).partitions()
+        self.assertEqual(partitions, [(itemDir, False)])
+
+    def test_partitions_missing(self):
+        with self.assertRaises(FileNotFoundError):
+            LibAlexProcessLoader(os.path.join(self.rootPath, "missing")).partitions()
+
+    def test_load_ordered(self):
+        expected = [item.toRecord() for item in LibAlexScanner(self.rootPath, ordered=True)]
+        records = list(LibAlexProcessLoader(self.rootPath, processes=2, ordered=True).records())
+        self.assertEqual(records, expected)
+
+    def test_load_unordered(self):
+        items = list(LibAlexProcessLoader(self.rootPath, processes=2))
+
+        self.assertEqual(sorted(item.metaFilepath for item in items), sorted(self.metaPaths))
+        self.assertTrue(all(len(item.resolvedFlags) > 0 for item in items))
+
+    def test_load_error(self):
+        with open(self.metaPaths[5], "w") as metaFile:
+            metaFile.write("{ not json")
+
+        with self.assertRaises(ValueError):
+            list(LibAlexProcessLoader(self.rootPath, processes=2).records())
+
+    def test_load_collectErrors(self):
+        with open(self.metaPaths[5], "w") as metaFile:
+            metaFile.write("{ not json")
+
+        with open(self.metaPaths[6], "w") as metaFile:
+            metaFile.write('{"_infover": 2}')
+
+        loader = LibAlexProcessLoader(self.rootPath, processes=2, ordered=True, collectErrors=True)
+        items = list(loader)
+
+        # Only the broken files are missing from their subtrees
+        self.assertEqual(sorted(item.metaFilepath for item in items), sorted(set(self.metaPaths) - set(self.metaPaths[5:7])))
+        self.assertEqual(loader.report.loaded, 38)
+        self.assertEqual(sorted(e.metaPath for e in loader.report.errors), sorted(self.metaPaths[5:7]))
+
+    def test_load_collectErrors_badVersion(self):
+        # Empty and unparseable versions are reported like any other bad meta file
+        for metaPath, version in zip(self.metaPaths[5:7], ("", "not a version")):
+            with open(metaPath, "w") as metaFile:
+                metaFile.write('{"_infover": "%s"}' % version)
+
+        loader = LibAlexProcessLoader(self.rootPath, processes=2, collectErrors=True)
+        items = list(loader)
+
+        self.assertEqual(len(items), 38)
+        self.assertEqual(sorted(e.metaPath for e in loader.report.errorsByType()["ValueError"]), sorted(self.metaPaths[5:7]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+# LibAlexandria: LibAlexandria Query Tests
+# Tests for the LibAlexandria Query language and planner.
+
+# Imports
+import unittest
+
+from libAlexItem import LibAlexItem
+from libAlexSemanticVersion import SemanticVersion
+from libAlexFlagIndex import LibAlexFlagIndex
+from libAlexTextIndex import LibAlexTextIndex
+from libAlexVersionIndex import LibAlexVersionIndex
+from libAlexDateIndex import LibAlexDateIndex
+from libAlexQuery import LibAlexQuery, LibAlexQueryTerm, LibAlexQueryPlanner
+
+# Classes
+class TestLibAlexQuery(unittest.TestCase):
+    def setUp(self):
+        self.items = {
+            0: LibAlexItem(version=SemanticVersion("2.0.0"), title="Sonnets", author="William Shakespeare", flags=["poetry"], classification="PR"),
+            1: LibAlexItem(version=SemanticVersion("1.0.0"), title="Les Fleurs du mal", author="Charles Baudelaire", date="c. 1857", flags=["poetry", "french"], classification="PQ"),
+            2: LibAlexItem(version=SemanticVersion("2.1.0"), title="Hamlet", author="William Shakespeare", date="1603", flags=["drama"], classification="PR"),
+            3: LibAlexItem(version=SemanticVersion("2.0.0"), title="The Smith Sonnets", author="John Smith", flags=["poetry", "draft"], classification="PR"),
+            4: LibAlexItem(version=None, title="Notes", author="Anonymous", classification="AS")
+        }
+
+        flagIndex = LibAlexFlagIndex()
+        textIndex = LibAlexTextIndex()
+        versionIndex = LibAlexVersionIndex()
+        dateIndex = LibAlexDateIndex()
+        for itemId, item in self.items.items():
+            flagIndex.add(itemId, item)
+            textIndex.add(itemId, item)
+            versionIndex.add(itemId, item)
+            dateIndex.add(itemId, item)
+
+        self.planner = LibAlexQueryPlanner(self.items, flagIndex=flagIndex, textIndex=textIndex, versionIndex=versionIndex, dateIndex=dateIndex)
+        self.scanner = LibAlexQueryPlanner(self.items)
+
+    def assertQuery(self, query: str, expectedIds: list[int]):
+        # Every plan must agree with a plain scan
+        self.assertEqual(sorted(self.planner.search(query).ids()), expectedIds)
+        self.assertEqual(list(self.scanner.search(query).ids()), expectedIds)
+        self.assertEqual([i for i, item in self.items.items() if LibAlexQuery.parse(query).matches(item)], expectedIds)
+
+    def test_parse(self):
+        query = LibAlexQuery.parse('flag:poetry author:"John \\"J\\" Smith" classification:PR* -draft version>=2.0.0')
+        self.assertEqual(
+            [(t.field, t.op, t.value, t.negated, t.isPrefix) for t in query.terms],
+            [
+                ("flag", ":", "poetry", False, False),
+                ("author", ":", "John \"J\" Smith", False, False),
+                ("classification", ":", "PR", False, True),
+                ("text", ":", "draft", True, False),
+                ("version", ">=", "2.0.0", False, False)
+            ]
+        )
+
+        self.assertEqual(LibAlexQuery.parse(" ".join(str(t) for t in query.terms)).terms, query.terms)
+
+    def test_parse_unknownField(self):
+        # Unknown prefixes are searched as plain text
+        query = LibAlexQuery.parse('publisher:Penguin -re:"the raven" Flag:poetry')
+        self.assertEqual(
+            [(t.field, t.op, t.value, t.negated) for t in query.terms],
+            [
+                ("text", ":", "publisher Penguin", False),
+                ("text", ":", "re the raven", True),
+                ("flag", ":", "poetry", False)
+            ]
+        )
+        self.assertEqual(query.terms[0].tokens(), ["publisher", "penguin"])
+
+    def test_parse_invalid(self):
+        with self.assertRaises(ValueError):
+            LibAlexQuery.parse("flag>=poetry")
+
+        with self.assertRaises(ValueError):
+            LibAlexQuery.parse("version>=two")
+
+        with self.assertRaises(ValueError):
+            LibAlexQuery.parse("date<someday")
+
+    def test_term_matches(self):
+        item = self.items[3]
+        self.assertTrue(LibAlexQueryTerm("author", ":", "smith").matches(item))
+        self.assertFalse(LibAlexQueryTerm("author", ":", "smi").matches(item))
+        self.assertTrue(LibAlexQueryTerm("author", ":", "smi*").matches(item))
+        self.assertTrue(LibAlexQueryTerm("title", ":", "Smith Sonnets").matches(item))
+        self.assertFalse(LibAlexQueryTerm("title", ":", "Sonnets Smith").matches(item))
+        self.assertFalse(LibAlexQueryTerm("flag", ":", "draft", negated=True).matches(item))
+
+    def test_search_flags(self):
+        self.assertQuery("flag:poetry", [0, 1, 3])
+        self.assertQuery("flag:poetry -flag:draft", [0, 1])
+        self.assertQuery("flag:dr*", [2, 3])
+        self.assertQuery("-flag:poetry", [2, 4])
+        self.assertQuery("flag:missing", [])
+
+    def test_search_classification(self):
+        self.assertQuery("classification:PR", [0, 2, 3])
+        self.assertQuery("classification:P*", [0, 1, 2, 3])
+        self.assertQuery("flag:poetry classification:PR", [0, 3])
+
+    def test_search_text(self):
+        self.assertQuery("sonnets", [0, 3])
+        self.assertQuery("shakesp*", [0, 2])
+        self.assertQuery('author:"William Shakespeare" hamlet', [2])
+        self.assertQuery("author:smith", [3])
+        self.assertQuery("sonnets -author:smith", [0])
+
+    def test_search_version(self):
+        self.assertQuery("version:2.0.0", [0, 3])
+        self.assertQuery("version>=2.0.0", [0, 2, 3])
+        self.assertQuery("version>2.0.0", [2])
+        self.assertQuery("version<2.0.0", [1])
+        self.assertQuery("version>=1.0.0 version<=2.0.0", [0, 1, 3])
+
+    def test_search_date(self):
+        self.assertQuery("date:16*", [2])
+        self.assertQuery("date:undated", [0, 3, 4])
+
+    def test_search_dateRange(self):
+        # Circa dates match anywhere within their widened range
+        self.assertQuery("date>=1600", [1, 2])
+        self.assertQuery("date>1603", [1])
+        self.assertQuery("date<1603", [])
+        self.assertQuery("date<=1603", [2])
+        self.assertQuery("date>=1860 date<1900", [1])
+        self.assertQuery("date>=1603-04 flag:drama", [2])
+        self.assertQuery('date>"17th century"', [1])
+
+    def test_search_combined(self):
+        self.assertQuery('flag:poetry author:"Smith" classification:PR* version>=2.0.0', [3])
+        self.assertQuery("", [0, 1, 2, 3, 4])
+
+    def test_search_ranked(self):
+        # The shorter title ranks higher
+        self.assertEqual(list(self.planner.search("sonnets").ids()), [0, 3])
+
+    def test_plan(self):
+        result = self.planner.search("flag:poetry version>=2.1.0")
+        self.assertTrue(result.plan[0].startswith("versionIndex"))
+        self.assertEqual(result.residualTerms, ())
+
+        result = self.planner.search("date:1603")
+        self.assertTrue(result.explain().startswith("scan 5 items"))
+
+        result = self.planner.search("date<1700 version>=1.0.0")
+        self.assertTrue(result.plan[0].startswith("dateIndex"))
+
+    def test_plan_skip(self):
+        # A broad flag is checked on the one candidate instead of listing its bitmap
+        planner = LibAlexQueryPlanner(self.items, flagIndex=self.planner.flagIndex, versionIndex=self.planner.versionIndex, intersectRatio=1)
+        result = planner.search("version<2.0.0 flag:poetry")
+        self.assertTrue(result.plan[1].startswith("skip flagIndex"))
+        self.assertEqual(list(result.ids()), [1])
+
+    def test_pages(self):
+        result = self.planner.search("-flag:missing", pageSize=2)
+        self.assertEqual(result.page(0), [self.items[0], self.items[1]])
+        self.assertEqual(result.page(2), [self.items[4]])
+        self.assertEqual(result.page(3), [])
+        self.assertEqual([len(p) for p in result.pages()], [2, 2, 1])
+        self.assertEqual(result.count(), 5)
+
+    def test_lazy(self):
+        result = self.scanner.search("flag:poetry", pageSize=1)
+        self.assertEqual(result.page(0), [self.items[0]])
+        self.assertEqual(result._cursor, 1)
+        self.assertEqual(list(result), [self.items[0], self.items[1], self.items[3]])
+
+    def test_filter(self):
+        self.assertEqual(list(LibAlexQuery.parse("flag:french").filter(self.items.values())), [self.items[1]])
+
+# Console Execution
+if __name__ == "__main__":
+    unittest.main()
@@ -28,6 +28,9 @@ class TestLibAlexRelatedFile(unittest.TestCase):
     def test_repr(self):
         self.assertTrue(isinstance(repr(self.file), str))
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self.file, "__dict__"))
+
     def test_toJson(self):
         expectedJson = {
             "label": self.label,
@@ -37,6 +40,14 @@ class TestLibAlexRelatedFile(unittest.TestCase):
         }
         self.assertEqual(self.file.toJson(), expectedJson)
 
+    def test_record(self):
+        file = LibAlexRelatedFile.fromRecord(self.file.toRecord())
+        self.assertEqual(file.toRecord(), (self.label, self.path, self.desc, self.ident))
+
+    def test_unvalidatedInit(self):
+        file = LibAlexRelatedFile(self.label, "bad/path/to/file.txt", self.desc, validate=False)
+        self.assertTrue(os.path.isabs(file.path))
+
     def test_failedInit(self):
         with self.assertRaises(FileNotFoundError):
             LibAlexRelatedFile(self.label, "bad/path/to/file.txt", self.desc)
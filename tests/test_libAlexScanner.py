@@ -0,0 +1,267 @@
+# LibAlexandria: LibAlexandria Library Scanner Tests
+# Tests for the LibAlexandria Library Scanner.
+
+# Imports
+import os
+import asyncio
+import shutil
+import tempfile
+import time
+import unittest
+from collections import deque
+from concurrent.futures import Future
+
+from libAlexScanner import LibAlexScanner
+from libAlexLazyItem import LibAlexLazyItem
+from libAlexCheckpoint import LibAlexScanCheckpoint
+
+# Functions
+def buildLibrary(rootPath: str) -> list[str]:
+    """
+    Builds a small library of copied test assets.
+
+    rootPath: The directory to build the library in.
+
+    Returns the expected meta filepaths in path order.
+    """
+    assetDir = os.path.abspath(os.path.join(os.path.dirname(os.path.realpath(__file__)), "assets"))
+    itemDirs = [
+        os.path.join(rootPath, "b", "item"),
+        os.path.join(rootPath, "a"),
+        os.path.join(rootPath, "a", "nested", "item"),
+        os.path.join(rootPath, "c")
+    ]
+
+    for itemDir in itemDirs:
+        os.makedirs(itemDir, exist_ok=True)
+        shutil.copy(os.path.join(assetDir, "metaV2.json"), os.path.join(itemDir, "meta.json"))
+
+        for name in ("sourceFile.txt", "relatedFile.txt", "relatedFile2.txt"):
+            shutil.copy(os.path.join(assetDir, name), os.path.join(itemDir, name))
+
+    # Add a directory without an item
+    os.makedirs(os.path.join(rootPath, "empty"))
+
+    return [
+        os.path.join(rootPath, "a", "meta.json"),
+        os.path.join(rootPath, "a", "nested", "item", "meta.json"),
+        os.path.join(rootPath, "b", "item", "meta.json"),
+        os.path.join(rootPath, "c", "meta.json")
+    ]
+
+# Classes
+class TestLibAlexScanner(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = self.tempDir.name
+        self.expectedMetaPaths = buildLibrary(self.rootPath)
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_findMetaFiles(self):
+        scanner = LibAlexScanner(self.rootPath)
+        self.assertEqual(list(scanner.findMetaFiles()), self.expectedMetaPaths)
+
+    def test_findMetaFiles_missingRoot(self):
+        scanner = LibAlexScanner(os.path.join(self.rootPath, "missing"))
+        with self.assertRaises(FileNotFoundError):
+            list(scanner.findMetaFiles())
+
+    def test_scan_ordered(self):
+        scanner = LibAlexScanner(self.rootPath, workers=3, ordered=True)
+        items = list(scanner.scan())
+
+        self.assertEqual([item.metaFilepath for item in items], self.expectedMetaPaths)
+        self.assertTrue(all(item.title == "Lorem Ipsum" for item in items))
+
+    def test_scan_unordered(self):
+        scanner = LibAlexScanner(self.rootPath, workers=2, ordered=False)
+        items = list(scanner)
+
+        self.assertEqual(sorted(item.metaFilepath for item in items), self.expectedMetaPaths)
+
+    def test_scan_lazy(self):
+        scanner = LibAlexScanner(self.rootPath, workers=2, ordered=True, lazy=True)
+        items = list(scanner.scan())
+
+        self.assertTrue(all(isinstance(item, LibAlexLazyItem) and not item.isResolved for item in items))
+        self.assertEqual([len(item.relatedFiles) for item in items], [2] * len(self.expectedMetaPaths))
+
+    def test_scan_singleWorker(self):
+        scanner = LibAlexScanner(self.rootPath, workers=1, ordered=True)
+        self.assertEqual(len(list(scanner.scan())), len(self.expectedMetaPaths))
+
+    def test_scan_earlyClose(self):
+        scanner = LibAlexScanner(self.rootPath, workers=1, ordered=True)
+        items = scanner.scan()
+        self.assertEqual(next(items).metaFilepath, self.expectedMetaPaths[0])
+        items.close()
+
+    def test_scan_badItem(self):
+        with open(os.path.join(self.rootPath, "c", "meta.json"), "w") as metaFile:
+            metaFile.write("{ not json")
+
+        scanner = LibAlexScanner(self.rootPath, workers=2)
+        with self.assertRaises(ValueError):
+            list(scanner.scan())
+
+    def test_collect_unorderedFailure(self):
+        # Loaded items finished alongside a failure are yielded before it is raised
+        futures = [Future() for _ in range(3)]
+        futures[0].set_exception(ValueError("bad"))
+        futures[1].set_result("first")
+        futures[2].set_result("second")
+
+        scanner = LibAlexScanner(self.rootPath, ordered=False)
+        results = []
+        with self.assertRaises(ValueError):
+            for result in scanner._collect(deque(futures), 0):
+                results.append(result)
+
+        self.assertEqual(sorted(results), ["first", "second"])
+
+    def test_scan_collectErrors(self):
+        with open(os.path.join(self.rootPath, "c", "meta.json"), "w") as metaFile:
+            metaFile.write("{ not json")
+
+        os.remove(os.path.join(self.rootPath, "a", "sourceFile.txt"))
+
+        scanner = LibAlexScanner(self.rootPath, workers=2, collectErrors=True)
+        items = list(scanner.scan())
+
+        self.assertEqual(len(items), 2)
+        self.assertEqual(scanner.report.loaded, 2)
+        self.assertEqual(scanner.report.failed, 2)
+
+        byType = scanner.report.errorsByType()
+        self.assertEqual([e.metaPath for e in byType["ValueError"]], [self.expectedMetaPaths[3]])
+        self.assertEqual([e.metaPath for e in byType["FileNotFoundError"]], [self.expectedMetaPaths[0]])
+
+    def test_scan_collectErrors_malformed(self):
+        # Valid JSON in the wrong shape is reported like any other bad meta file
+        malformed = ['{"_infover": 2}', '[1]', '{"_infover": "2.0.0", "otherFiles": ["x"]}']
+        for metaPath, metaJson in zip(self.expectedMetaPaths, malformed):
+            with open(metaPath, "w") as metaFile:
+                metaFile.write(metaJson)
+
+        scanner = LibAlexScanner(self.rootPath, workers=2, collectErrors=True)
+        items = list(scanner.scan())
+
+        self.assertEqual([item.metaFilepath for item in items], [self.expectedMetaPaths[3]])
+        self.assertEqual(sorted(e.metaPath for e in scanner.report.errorsByType()["ValueError"]), self.expectedMetaPaths[:3])
+
+    def test_scan_collectErrors_badVersion(self):
+        # Empty and unparseable versions are reported like any other bad meta file
+        for metaPath, version in zip(self.expectedMetaPaths[:2], ("", "not a version")):
+            with open(metaPath, "w") as metaFile:
+                metaFile.write('{"_infover": "%s"}' % version)
+
+        scanner = LibAlexScanner(self.rootPath, workers=2, collectErrors=True)
+        items = list(scanner.scan())
+
+        self.assertEqual(sorted(item.metaFilepath for item in items), self.expectedMetaPaths[2:])
+        self.assertEqual(sorted(e.metaPath for e in scanner.report.errorsByType()["ValueError"]), self.expectedMetaPaths[:2])
+
+    def test_scan_checkpoint(self):
+        checkpointPath = os.path.join(self.rootPath, "scan.checkpoint")
+
+        # Interrupt a scan after two items
+        scanner = LibAlexScanner(self.rootPath, workers=1, ordered=True, checkpoint=LibAlexScanCheckpoint(checkpointPath, interval=1))
+        items = scanner.scan()
+        firstPaths = [next(items).metaFilepath, next(items).metaFilepath]
+        next(items)
+        items.close()
+        self.assertTrue(os.path.isfile(checkpointPath))
+
+        # Resume where it stopped
+        scanner = LibAlexScanner(self.rootPath, workers=1, ordered=True, checkpoint=LibAlexScanCheckpoint(checkpointPath))
+        restPaths = [item.metaFilepath for item in scanner.scan()]
+
+        self.assertEqual(firstPaths + restPaths, self.expectedMetaPaths)
+        self.assertEqual(scanner.report.resumed, 2)
+        self.assertFalse(os.path.exists(checkpointPath))
+
+class TestLibAlexScannerAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = self.tempDir.name
+        self.expectedMetaPaths = buildLibrary(self.rootPath)
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    async def test_scanAsync_ordered(self):
+        scanner = LibAlexScanner(self.rootPath, workers=2, ordered=True)
+        items = [item async for item in scanner.scanAsync()]
+
+        self.assertEqual([item.metaFilepath for item in items], self.expectedMetaPaths)
+
+    async def test_scanAsync_unordered(self):
+        scanner = LibAlexScanner(self.rootPath, workers=3)
+        items = [item async for item in scanner.scanAsync()]
+
+        self.assertEqual(sorted(item.metaFilepath for item in items), self.expectedMetaPaths)
+
+    async def test_scanAsync_earlyClose(self):
+        scanner = LibAlexScanner(self.rootPath, workers=1, ordered=True)
+        items = scanner.scanAsync()
+
+        self.assertEqual((await items.__anext__()).metaFilepath, self.expectedMetaPaths[0])
+        await items.aclose()
+
+    async def test_scanAsync_cancel(self):
+        scanner = LibAlexScanner(self.rootPath, workers=1)
+
+        async def consume():
+            async for _ in scanner.scanAsync():
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+    async def test_scanAsync_badItem(self):
+        with open(os.path.join(self.rootPath, "c", "meta.json"), "w") as metaFile:
+            metaFile.write("{ not json")
+
+        with self.assertRaises(ValueError):
+            [item async for item in LibAlexScanner(self.rootPath).scanAsync()]
+
+    async def test_scanAsync_unorderedFailure(self):
+        # Loaded items finished alongside a failure are yielded before it is raised
+        class SlowWalkScanner(LibAlexScanner):
+            @staticmethod
+            def _nextMetaFiles(metaPaths, count):
+                batch = LibAlexScanner._nextMetaFiles(metaPaths, count)
+                if not batch:
+                    # Let every load finish before the results are collected
+                    time.sleep(0.2)
+
+                return batch
+
+        with open(os.path.join(self.rootPath, "c", "meta.json"), "w") as metaFile:
+            metaFile.write("{ not json")
+
+        items = []
+        with self.assertRaises(ValueError):
+            async for item in SlowWalkScanner(self.rootPath, workers=4).scanAsync():
+                items.append(item)
+
+        self.assertEqual(len(items), 3)
+
+    async def test_scanAsync_collectErrors(self):
+        with open(os.path.join(self.rootPath, "c", "meta.json"), "w") as metaFile:
+            metaFile.write("{ not json")
+
+        scanner = LibAlexScanner(self.rootPath, collectErrors=True)
+        items = [item async for item in scanner.scanAsync()]
+
+        self.assertEqual(len(items), 3)
+        self.assertEqual([e.metaPath for e in scanner.report.errors], [self.expectedMetaPaths[3]])
+
+if __name__ == "__main__":
+    unittest.main()
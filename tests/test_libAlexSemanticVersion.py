@@ -2,6 +2,7 @@
 # Tests for the `SemanticVersion` class.
 
 # Imports
+import pickle
 import unittest
 
 from libAlexSemanticVersion import SemanticVersion
@@ -69,6 +70,54 @@ class TestSemanticVersion(unittest.TestCase):
         v = SemanticVersion("1.2.3")
         self.assertTrue(isinstance(repr(v), str))
 
+    def test_slots(self):
+        v = SemanticVersion("1.2.3")
+        self.assertFalse(hasattr(v, "__dict__"))
+
+    def test_immutable(self):
+        v = SemanticVersion("1.2.3")
+        with self.assertRaises(AttributeError):
+            v.major = 2
+
+    def test_hash(self):
+        self.assertEqual(len({SemanticVersion("1.2.3"), SemanticVersion("1.2.3"), SemanticVersion("1.2.4")}), 2)
+
+    def test_fromString(self):
+        v1 = SemanticVersion.fromString("1.2.3")
+        v2 = SemanticVersion.fromString("1.2.3")
+        self.assertIs(v1, v2)
+        self.assertEqual(v1, SemanticVersion("1.2.3"))
+
+    def test_pickle(self):
+        v = SemanticVersion("1.2.3-rc.1")
+        self.assertEqual(pickle.loads(pickle.dumps(v)), v)
+
+    def test_preReleasePrecedence(self):
+        ordered = [
+            "1.0.0-alpha",
+            "1.0.0-alpha.1",
+            "1.0.0-alpha.beta",
+            "1.0.0-beta",
+            "1.0.0-beta.2",
+            "1.0.0-beta.11",
+            "1.0.0-rc.1",
+            "1.0.0",
+            "1.0.1-0",
+            "1.0.1"
+        ]
+        versions = [SemanticVersion(s) for s in reversed(ordered)]
+        self.assertEqual([v.string for v in sorted(versions)], ordered)
+
+        for lower, higher in zip(ordered, ordered[1:]):
+            self.assertTrue(SemanticVersion(lower) < SemanticVersion(higher))
+
+    def test_metaDataPrecedence(self):
+        v1 = SemanticVersion("1.0.0+build.1")
+        v2 = SemanticVersion("1.0.0+build.2")
+        self.assertFalse(v1 < v2)
+        self.assertFalse(v1 > v2)
+        self.assertTrue(v1 != v2)
+
     def test_eq(self):
         v1 = SemanticVersion("1.2.3")
         v2 = SemanticVersion("1.2.3")
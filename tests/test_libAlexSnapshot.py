@@ -0,0 +1,169 @@
+# LibAlexandria: LibAlexandria Snapshot Tests
+# Tests for the memory-mapped binary snapshot.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+from libAlexItem import LibAlexItem
+from libAlexRelatedFile import LibAlexRelatedFile
+from libAlexSemanticVersion import SemanticVersion
+from libAlexSnapshot import LibAlexSnapshot
+
+# Classes
+class TestLibAlexSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = self.tempDir.name
+        self.snapshotPath = os.path.join(self.rootPath, "cache", "library.snapshot")
+
+        self.items = [
+            LibAlexItem(
+                version=SemanticVersion("2.0.0"),
+                title="Sonnets",
+                author="William Shakespeare",
+                date="1609",
+                metaFilepath=self.metaPath("sonnets"),
+                classification="PR",
+                flags=["poetry", "english"],
+                resolvedFlags=["shelf-a"],
+                relatedFiles=[
+                    LibAlexRelatedFile("Notes", os.path.join(self.rootPath, "sonnets", "notes.txt"), "Notes.", validate=False),
+                    LibAlexRelatedFile("Cover", os.path.join(self.rootPath, "sonnets", "cover.png"), "", id="cover", validate=False)
+                ]
+            ),
+            LibAlexItem(
+                version=SemanticVersion("1.0.0"),
+                title="Les Fleurs du mal",
+                author="Charles Baudelaire",
+                description="Poèmes.",
+                metaFilepath=self.metaPath("fleurs"),
+                classification="PQ",
+                flags=["poetry", "french"]
+            ),
+            LibAlexItem(
+                version=None,
+                title="Hamlet",
+                author="William Shakespeare",
+                metaFilepath=self.metaPath("hamlet"),
+                classification=None,
+                flags=[],
+                resolvedFlags=["drama"]
+            )
+        ]
+
+        self.assertEqual(LibAlexSnapshot.write(self.items, self.snapshotPath), 3)
+        self.snapshot = LibAlexSnapshot(self.snapshotPath)
+
+    def tearDown(self):
+        self.snapshot.close()
+        self.tempDir.cleanup()
+
+    def metaPath(self, name: str) -> str:
+        return os.path.join(self.rootPath, name, "meta.json")
+
+    def test_roundTrip(self):
+        self.assertEqual(len(self.snapshot), 3)
+        self.assertIn(self.metaPath("hamlet"), self.snapshot)
+        self.assertNotIn(self.metaPath("missing"), self.snapshot)
+
+        for item in self.items:
+            self.assertEqual(self.snapshot.getItem(item.metaFilepath).toRecord(), item.toRecord())
+
+        self.assertIsNone(self.snapshot.getItem(self.metaPath("missing")))
+
+    def test_rows(self):
+        self.assertEqual(self.snapshot.metaPaths(), sorted(item.metaFilepath for item in self.items))
+        self.assertEqual([item.title for item in self.snapshot], ["Les Fleurs du mal", "Hamlet", "Sonnets"])
+
+        with self.assertRaises(IndexError):
+            self.snapshot.item(3)
+
+    def test_value(self):
+        row = self.snapshot.row(self.metaPath("fleurs"))
+        self.assertEqual(self.snapshot.value(row, "description"), "Poèmes.")
+        self.assertEqual(self.snapshot.value(row, "version"), "1.0.0")
+        self.assertIsNone(self.snapshot.value(self.snapshot.row(self.metaPath("hamlet")), "version"))
+
+    def test_flagsOf(self):
+        for item in self.items:
+            self.assertEqual(self.snapshot.flagsOf(self.snapshot.row(item.metaFilepath)), item.getAllFlags())
+
+    def test_relatedFilesOf(self):
+        row = self.snapshot.row(self.metaPath("sonnets"))
+        self.assertEqual([rf.toRecord() for rf in self.snapshot.relatedFilesOf(row)], [rf.toRecord() for rf in self.items[0].relatedFiles])
+        self.assertIsNone(self.snapshot.relatedFilesOf(self.snapshot.row(self.metaPath("fleurs"))))
+
+    def test_withFlag(self):
+        self.assertEqual([self.snapshot.item(r).title for r in self.snapshot.withFlag("poetry")], ["Les Fleurs du mal", "Sonnets"])
+        self.assertEqual([self.snapshot.item(r).title for r in self.snapshot.withFlag("drama")], ["Hamlet"])
+        self.assertEqual([self.snapshot.item(r).title for r in self.snapshot.withFlag("PR")], ["Sonnets"])
+        self.assertEqual(self.snapshot.withFlag("missing"), [])
+
+    def test_withValue(self):
+        self.assertEqual([item.title for item in self.snapshot.items(self.snapshot.withValue("author", "William Shakespeare"))], ["Hamlet", "Sonnets"])
+        self.assertEqual(self.snapshot.withValue("classification", None), [self.snapshot.row(self.metaPath("hamlet"))])
+        self.assertEqual(self.snapshot.withValue("author", "Nobody"), [])
+
+    def test_write_replace(self):
+        self.snapshot.close()
+        LibAlexSnapshot.write(self.items[:1] + [LibAlexItem(title="The Sonnets", metaFilepath=self.metaPath("sonnets"))], self.snapshotPath)
+        self.snapshot = LibAlexSnapshot(self.snapshotPath)
+
+        self.assertEqual(len(self.snapshot), 1)
+        self.assertEqual(self.snapshot.getItem(self.metaPath("sonnets")).title, "The Sonnets")
+
+    def test_write_undecodablePaths(self):
+        # Filenames that are not valid UTF-8 arrive as surrogate escapes
+        names = ["caf\udce9", "café", "cafe", "caf\udcff"]
+        items = [LibAlexItem(title=name, metaFilepath=self.metaPath(name)) for name in names]
+
+        escapedPath = os.path.join(self.rootPath, "escaped.snapshot")
+        self.assertEqual(LibAlexSnapshot.write(items, escapedPath), 4)
+        with LibAlexSnapshot(escapedPath) as snapshot:
+            for name in names:
+                self.assertEqual(snapshot.getItem(self.metaPath(name)).title, name)
+
+            self.assertEqual(snapshot.withValue("title", "caf\udcff"), [snapshot.row(self.metaPath("caf\udcff"))])
+
+    def test_write_failure(self):
+        # Replacing a directory fails after the temporary file is written
+        blockedPath = os.path.join(self.rootPath, "blocked")
+        os.makedirs(os.path.join(blockedPath, "inside"))
+
+        with self.assertRaises(OSError):
+            LibAlexSnapshot.write(self.items, blockedPath)
+
+        self.assertEqual(sorted(os.listdir(self.rootPath)), ["blocked", "cache"])
+
+    def test_write_noPath(self):
+        with self.assertRaises(ValueError):
+            LibAlexSnapshot.write([LibAlexItem()], self.snapshotPath)
+
+    def test_write_empty(self):
+        emptyPath = os.path.join(self.rootPath, "empty.snapshot")
+        LibAlexSnapshot.write([], emptyPath)
+        with LibAlexSnapshot(emptyPath) as snapshot:
+            self.assertEqual(len(snapshot), 0)
+            self.assertEqual(snapshot.withFlag("poetry"), [])
+            self.assertIsNone(snapshot.row(self.metaPath("sonnets")))
+
+    def test_open_invalid(self):
+        invalidPath = os.path.join(self.rootPath, "invalid.snapshot")
+        with open(invalidPath, "wb") as invalidFile:
+            invalidFile.write(b"\0" * 64)
+
+        with self.assertRaises(ValueError):
+            LibAlexSnapshot(invalidPath)
+
+    def test_close(self):
+        # Built items outlive the mapping
+        item = self.snapshot.item(0)
+        self.snapshot.close()
+        self.snapshot.close()
+        self.assertEqual(item.title, "Les Fleurs du mal")
+
+# Console Execution
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+# LibAlexandria: LibAlexandria SQLite Store Tests
+# Tests for the SQLite catalog store.
+
+# Imports
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from libAlexItem import LibAlexItem
+from libAlexRelatedFile import LibAlexRelatedFile
+from libAlexSemanticVersion import SemanticVersion
+from libAlexSqliteStore import LibAlexSqliteStore
+
+# Classes
+class TestLibAlexSqliteStore(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = self.tempDir.name
+        self.dbPath = os.path.join(self.rootPath, "db", "catalog.db")
+
+        self.items = [
+            LibAlexItem(
+                version=SemanticVersion("2.0.0"),
+                title="Sonnets",
+                author="William Shakespeare",
+                metaFilepath=self.metaPath("sonnets"),
+                classification="PR",
+                flags=["poetry", "english"],
+                resolvedFlags=["shelf-a"],
+                relatedFiles=[
+                    LibAlexRelatedFile("Notes", os.path.join(self.rootPath, "sonnets", "notes.txt"), "Notes.", validate=False),
+                    LibAlexRelatedFile("Cover", os.path.join(self.rootPath, "sonnets", "cover.png"), "", id="cover", validate=False)
+                ]
+            ),
+            LibAlexItem(
+                version=SemanticVersion("1.0.0"),
+                title="Les Fleurs du mal",
+                author="Charles Baudelaire",
+                metaFilepath=self.metaPath("fleurs"),
+                classification="PQ",
+                flags=["poetry", "french"]
+            ),
+            LibAlexItem(
+                version=SemanticVersion("2.1.0-rc.1"),
+                title="Hamlet",
+                author="william shakespeare",
+                metaFilepath=self.metaPath("hamlet"),
+                classification="PR",
+                flags=[],
+                resolvedFlags=["drama"]
+            )
+        ]
+
+        self.store = LibAlexSqliteStore(self.dbPath, batchSize=2)
+        self.store.upsertItems(self.items)
+
+    def tearDown(self):
+        self.store.close()
+        self.tempDir.cleanup()
+
+    def metaPath(self, name: str) -> str:
+        return os.path.join(self.rootPath, name, "meta.json")
+
+    def test_roundTrip(self):
+        self.assertEqual(len(self.store), 3)
+        self.assertIn(self.metaPath("hamlet"), self.store)
+        self.assertNotIn(self.metaPath("missing"), self.store)
+
+        for item in self.items:
+            self.assertEqual(self.store.getItem(item.metaFilepath).toRecord(), item.toRecord())
+
+        self.assertIsNone(self.store.getItem(self.metaPath("missing")))
+
+    def test_reopen(self):
+        self.store.close()
+        self.store = LibAlexSqliteStore(self.dbPath)
+
+        self.assertEqual(self.store.metaPaths(), sorted(item.metaFilepath for item in self.items))
+        self.assertEqual([item.title for item in self.store], ["Les Fleurs du mal", "Hamlet", "Sonnets"])
+
+    def test_reopen_incompatible(self):
+        self.store.close()
+        with sqlite3.connect(self.dbPath) as connection:
+            connection.execute("UPDATE info SET value = '0.0.1' WHERE key = '_storever'")
+
+        with self.assertRaises(ValueError):
+            LibAlexSqliteStore(self.dbPath)
+
+        self.store = LibAlexSqliteStore(":memory:")
+
+    def test_upsert_replace(self):
+        self.items[0].title = "The Sonnets"
+        self.items[0].flags = ["poetry"]
+        self.items[0].relatedFiles = None
+        self.store.upsertItem(self.items[0])
+
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store.getItem(self.items[0].metaFilepath).toRecord(), self.items[0].toRecord())
+        self.assertEqual(self.store.count(flags=["english"]), 0)
+
+    def test_upsert_noPath(self):
+        with self.assertRaises(ValueError):
+            self.store.upsertItem(LibAlexItem())
+
+    def test_remove(self):
+        self.assertEqual(self.store.removeItems([self.metaPath("sonnets"), self.metaPath("missing")]), 1)
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.count(flags=["english"]), 0)
+
+        self.store.clear()
+        self.assertEqual(len(self.store), 0)
+
+    def test_find_flags(self):
+        self.assertEqual([item.title for item in self.store.find(flags=["poetry"])], ["Les Fleurs du mal", "Sonnets"])
+        self.assertEqual([item.title for item in self.store.find(flags=["poetry", "shelf-a"])], ["Sonnets"])
+        self.assertEqual([item.title for item in self.store.find(flags=["drama"])], ["Hamlet"])
+
+    def test_find_author(self):
+        self.assertEqual(self.store.count(author="WILLIAM SHAKESPEARE"), 2)
+
+    def test_find_classification(self):
+        self.assertEqual(self.store.count(classification="PR"), 2)
+        self.assertEqual(self.store.count(classification="P*"), 3)
+        self.assertEqual(self.store.count(classification="Q*"), 0)
+
+    def test_find_version(self):
+        self.assertEqual([item.title for item in self.store.find(low="2.0.0")], ["Hamlet", "Sonnets"])
+        self.assertEqual([item.title for item in self.store.find(high="2.1.0-rc.2")], ["Les Fleurs du mal", "Hamlet", "Sonnets"])
+        self.assertEqual([item.title for item in self.store.find(low="2.1.0-rc.1", includeLow=False)], [])
+        self.assertEqual(self.store.count(low="1.0.0", high="2.0.0", includeHigh=True), 2)
+
+        with self.assertRaises(ValueError):
+            self.store.count(low="later")
+
+    def test_find_page(self):
+        self.assertEqual([item.title for item in self.store.find(limit=2)], ["Les Fleurs du mal", "Hamlet"])
+        self.assertEqual([item.title for item in self.store.find(limit=2, offset=2)], ["Sonnets"])
+
+    def test_versionOrder(self):
+        versions = ["1.0.0-alpha", "1.0.0-alpha.1", "1.0.0-alpha.beta", "1.0.0-beta", "1.0.0-beta.2", "1.0.0-beta.11", "1.0.0-rc.1", "1.0.0", "1.2.0", "10.0.0"]
+        orders = [LibAlexSqliteStore._versionOrder(SemanticVersion(v)) for v in versions]
+        self.assertEqual(orders, sorted(orders))
+
+# Console Execution
+if __name__ == "__main__":
+    unittest.main()
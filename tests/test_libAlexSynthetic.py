@@ -0,0 +1,69 @@
+# LibAlexandria: Synthetic Libraries Tests
+# Tests for the synthetic LibAlexandria Library generator.
+
+# Imports
+import os
+import random
+import tempfile
+import unittest
+import warnings
+
+from libAlexSynthetic import buildMetaJson, generateLibrary
+from libAlexScanner import LibAlexScanner
+
+# Classes
+class TestLibAlexSynthetic(unittest.TestCase):
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.rootPath = self.tempDir.name
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+    def test_buildMetaJson(self):
+        v2 = buildMetaJson(1, random.Random(0), relatedFileCount=3)
+        self.assertTrue(v2["_infover"].startswith("2."))
+        self.assertEqual(len(v2["otherFiles"]), 3)
+
+        v1 = buildMetaJson(1, random.Random(0), v1=True)
+        self.assertEqual(v1["_infover"], "1.0.0")
+        self.assertEqual(v1["content"], "source.txt")
+
+    def test_generateLibrary(self):
+        metaPaths = generateLibrary(self.rootPath, itemCount=25, depth=2, fanout=3, relatedFileCount=1)
+
+        self.assertEqual(len(metaPaths), 25)
+        self.assertTrue(all(os.path.isfile(p) for p in metaPaths))
+        self.assertEqual(len(os.listdir(self.rootPath)), 3)
+
+        # Each item sits below two shelf levels
+        relPath = os.path.relpath(metaPaths[0], self.rootPath)
+        self.assertEqual(len(relPath.split(os.sep)), 4)
+
+        items = list(LibAlexScanner(self.rootPath))
+        self.assertEqual(len(items), 25)
+        self.assertTrue(all(len(item.relatedFiles) == 1 for item in items))
+
+    def test_generateLibrary_v1Mix(self):
+        generateLibrary(self.rootPath, itemCount=40, v1Ratio=0.5, seed=3)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            items = list(LibAlexScanner(self.rootPath))
+
+        v1Count = sum(1 for item in items if item.version.major == 1)
+        self.assertTrue(0 < v1Count < 40)
+
+    def test_generateLibrary_reproducible(self):
+        first = os.path.join(self.rootPath, "first")
+        second = os.path.join(self.rootPath, "second")
+        generateLibrary(first, itemCount=5, seed=7)
+        generateLibrary(second, itemCount=5, seed=7)
+
+        for firstPath in generateLibrary(first, itemCount=5, seed=7):
+            secondPath = os.path.join(second, os.path.relpath(firstPath, first))
+            with open(firstPath) as a, open(secondPath) as b:
+                self.assertEqual(a.read(), b.read())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# LibAlexandria: LibAlexandria Text Index Tests
+# Tests for the LibAlexandria Text Index.
+
+# Imports
+import os
+import tempfile
+import unittest
+
+import libAlexDefaults as laShared
+from libAlexItem import LibAlexItem
+from libAlexTextIndex import LibAlexTextIndex
+
+# Classes
+class TestLibAlexTextIndex(unittest.TestCase):
+    def setUp(self):
+        self.items = [
+            LibAlexItem(title="The Tempest", author="William Shakespeare", description="A play about a storm and an island."),
+            LibAlexItem(title="Sonnets", author="William Shakespeare", description="Poems about love and time."),
+            LibAlexItem(title="Ode to a Nightingale", author="John Keats", description="A poem about a nightingale."),
+            LibAlexItem(title="Les Misérables", author="Victor Hugo", description="A novel about justice.")
+        ]
+
+        self.index = LibAlexTextIndex()
+        for itemId, item in enumerate(self.items):
+            self.index.add(itemId, item)
+
+    def test_tokenize(self):
+        self.assertEqual(LibAlexTextIndex.tokenize("Les Misérables, Part I!"), ["les", "miserables", "part", "i"])
+        self.assertEqual(LibAlexTextIndex.tokenize(None), [])
+
+    def test_search(self):
+        results = self.index.search("shakespeare")
+        self.assertEqual(sorted(itemId for itemId, _ in results), [0, 1])
+
+        # Titles outweigh descriptions
+        results = self.index.search("nightingale")
+        self.assertEqual(results[0][0], 2)
+
+    def test_search_normalized(self):
+        self.assertEqual([itemId for itemId, _ in self.index.search("MISERABLES")], [3])
+
+    def test_search_ranking(self):
+        results = self.index.search("shakespeare tempest")
+        self.assertEqual([itemId for itemId, _ in results], [0, 1])
+        self.assertGreater(results[0][1], results[1][1])
+
+    def test_search_requireAll(self):
+        self.assertEqual([itemId for itemId, _ in self.index.search("william storm", requireAll=True)], [0])
+        self.assertEqual(self.index.search("william missing", requireAll=True), [])
+
+    def test_search_prefix(self):
+        self.assertEqual(sorted(itemId for itemId, _ in self.index.search("poe*")), [1, 2])
+        self.assertEqual(sorted(itemId for itemId, _ in self.index.search("john ke", prefix=True, requireAll=True)), [2])
+        self.assertEqual(self.index.termsWithPrefix("poe"), ["poem", "poems"])
+
+    def test_search_limit(self):
+        self.assertEqual(len(self.index.search("a", limit=1)), 1)
+
+    def test_update(self):
+        self.items[3].title = "Notre-Dame de Paris"
+        self.index.update(3, self.items[3])
+
+        self.assertEqual(self.index.search("miserables"), [])
+        self.assertEqual([itemId for itemId, _ in self.index.search("paris")], [3])
+
+    def test_remove(self):
+        self.assertTrue(self.index.remove(2))
+        self.assertFalse(self.index.remove(2))
+
+        self.assertEqual(self.index.search("keats"), [])
+        self.assertEqual(self.index.documentFrequency("keats"), 0)
+        self.assertEqual(len(self.index), 3)
+
+    def test_saveAndLoad(self):
+        with tempfile.TemporaryDirectory() as tempDir:
+            indexPath = os.path.join(tempDir, "text.json")
+            self.index.save(indexPath)
+            loaded = LibAlexTextIndex.load(indexPath)
+
+        self.assertEqual(len(loaded), len(self.index))
+        self.assertEqual(loaded.search("shakespeare love"), self.index.search("shakespeare love"))
+
+        # The loaded index can still be updated
+        loaded.remove(0)
+        self.assertEqual([itemId for itemId, _ in loaded.search("shakespeare")], [1])
+
+    def test_load_badFile(self):
+        with tempfile.TemporaryDirectory() as tempDir:
+            indexPath = os.path.join(tempDir, "text.json")
+            with open(indexPath, "w") as indexFile:
+                indexFile.write("{\"_indexver\": \"0.0.1\"}")
+
+            with self.assertRaises(ValueError):
+                LibAlexTextIndex.load(indexPath)
+
+    def test_load_malformed(self):
+        version = laShared.VER_TEXT_INDEX
+        malformed = [
+            "[1]",
+            '{"_indexver": "%s"}' % version,
+            '{"_indexver": "%s", "fieldWeights": {}, "k1": 1.2, "b": 0.75, "terms": ["a"], "postings": [], "lengths": []}' % version,
+            '{"_indexver": "%s", "fieldWeights": {}, "k1": 1.2, "b": 0.75, "terms": ["a"], "postings": [[[0], 1.0]], "lengths": []}' % version,
+            '{"_indexver": "%s", "fieldWeights": {}, "k1": 1.2, "b": 0.75, "terms": [], "postings": [], "lengths": [0, "long"]}' % version
+        ]
+        with tempfile.TemporaryDirectory() as tempDir:
+            indexPath = os.path.join(tempDir, "text.json")
+            for indexData in malformed:
+                with self.subTest(indexData=indexData):
+                    with open(indexPath, "w") as indexFile:
+                        indexFile.write(indexData)
+
+                    with self.assertRaises(ValueError):
+                        LibAlexTextIndex.load(indexPath)
+
+    def test_save_replace(self):
+        with tempfile.TemporaryDirectory() as tempDir:
+            # The mode of the replaced file is kept
+            indexPath = os.path.join(tempDir, "text.json")
+            self.index.save(indexPath)
+            os.chmod(indexPath, 0o600)
+            self.index.save(indexPath)
+            self.assertEqual(os.stat(indexPath).st_mode & 0o777, 0o600)
+
+            # A failed save leaves no temporary file behind
+            blockedPath = os.path.join(tempDir, "blocked")
+            os.makedirs(os.path.join(blockedPath, "inside"))
+            with self.assertRaises(OSError):
+                self.index.save(blockedPath)
+
+            self.assertEqual(sorted(os.listdir(tempDir)), ["blocked", "text.json"])
+
+if __name__ == "__main__":
+    unittest.main()
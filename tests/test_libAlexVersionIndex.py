@@ -0,0 +1,101 @@
+# LibAlexandria: LibAlexandria Version Index Tests
+# Tests for the LibAlexandria Version Index.
+
+# Imports
+import unittest
+
+from libAlexItem import LibAlexItem
+from libAlexSemanticVersion import SemanticVersion
+from libAlexVersionIndex import LibAlexVersionIndex
+
+# Classes
+class TestLibAlexVersionIndex(unittest.TestCase):
+    def setUp(self):
+        self.versions = ["1.0.0", "1.2.0", "2.0.0-rc.1", "2.0.0", "2.1.0", "1.0.0-alpha", "2.0.0+build.7", None]
+
+        self.index = LibAlexVersionIndex()
+        for itemId, version in enumerate(self.versions):
+            self.index.add(itemId, LibAlexItem(version=(SemanticVersion(version) if version is not None else None)))
+
+    def test_len(self):
+        self.assertEqual(len(self.index), len(self.versions))
+        self.assertIn(7, self.index)
+        self.assertNotIn(10, self.index)
+        self.assertEqual(self.index.unversioned(), [7])
+        self.assertIsNone(self.index.versionOf(7))
+        self.assertEqual(self.index.versionOf(1).string, "1.2.0")
+
+    def test_range(self):
+        self.assertEqual(self.index.range(), [5, 0, 1, 2, 3, 6, 4])
+        self.assertEqual(self.index.range(high="2.0.0"), [5, 0, 1, 2])
+        self.assertEqual(self.index.range(high="2.0.0", includeHigh=True), [5, 0, 1, 2, 3, 6])
+        self.assertEqual(self.index.range(low="1.0.0", high="2.0.0"), [0, 1, 2])
+        self.assertEqual(self.index.range(low="1.0.0", includeLow=False), [1, 2, 3, 6, 4])
+        self.assertEqual(self.index.range(low=SemanticVersion("3.0.0")), [])
+
+    def test_range_invalid(self):
+        with self.assertRaises(ValueError):
+            self.index.range(low="not a version")
+
+    def test_count(self):
+        self.assertEqual(self.index.count(), 7)
+        self.assertEqual(self.index.count(low="2.0.0", includeHigh=True), 3)
+        self.assertEqual(self.index.count(low="2.1.0", high="1.0.0"), 0)
+
+    def test_withMajor(self):
+        self.assertEqual(self.index.withMajor(1), [5, 0, 1])
+        self.assertEqual(self.index.withMajor(2, 0), [2, 3, 6])
+        self.assertEqual(self.index.withMajor(3), [])
+
+    def test_countBy(self):
+        self.assertEqual(self.index.countByMajor(), {1: 3, 2: 4})
+        self.assertEqual(self.index.countByMinor(), {(1, 0): 2, (1, 2): 1, (2, 0): 3, (2, 1): 1})
+
+    def test_lowestHighest(self):
+        self.assertEqual(self.index.lowest().string, "1.0.0-alpha")
+        self.assertEqual(self.index.highest().string, "2.1.0")
+        self.assertIsNone(LibAlexVersionIndex().lowest())
+
+    def test_update(self):
+        self.index.update(0, LibAlexItem(version=SemanticVersion("3.0.0")))
+
+        self.assertEqual(self.index.withMajor(1), [5, 1])
+        self.assertEqual(self.index.withMajor(3), [0])
+        self.assertEqual(self.index.countByMajor(), {1: 2, 2: 4, 3: 1})
+
+        self.index.update(7, LibAlexItem(version=SemanticVersion("0.1.0")))
+        self.assertEqual(self.index.unversioned(), [])
+        self.assertEqual(self.index.range(high="1.0.0-alpha"), [7])
+
+    def test_addMany(self):
+        index = LibAlexVersionIndex()
+        index.addMany((itemId, LibAlexItem(version=(SemanticVersion(v) if v is not None else None))) for itemId, v in enumerate(self.versions))
+
+        self.assertEqual(index.range(), self.index.range())
+        self.assertEqual(index.unversioned(), [7])
+        self.assertEqual(index.countByMinor(), self.index.countByMinor())
+
+        # Indexed and repeated ids keep their last version
+        index.addVersions([(0, SemanticVersion("3.0.0")), (8, SemanticVersion("0.1.0")), (8, SemanticVersion("0.2.0"))])
+        self.assertEqual(index.range(), [8, 5, 1, 2, 3, 6, 4, 0])
+        self.assertEqual(index.versionOf(8).string, "0.2.0")
+        self.assertEqual(len(index), 9)
+
+    def test_remove(self):
+        self.assertTrue(self.index.remove(1))
+        self.assertTrue(self.index.remove(7))
+        self.assertFalse(self.index.remove(1))
+
+        self.assertEqual(self.index.range(), [5, 0, 2, 3, 6, 4])
+        self.assertEqual(self.index.countByMinor()[(1, 0)], 2)
+        self.assertNotIn((1, 2), self.index.countByMinor())
+
+    def test_clear(self):
+        self.index.clear()
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index.range(), [])
+        self.assertEqual(self.index.countByMajor(), {})
+
+# Console Execution
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,9 @@
 # Imports
 import os
 import json
+import shutil
+import asyncio
+import tempfile
 import unittest
 from typing import Optional
 
@@ -130,6 +133,20 @@ class TestLibAlexItem(unittest.TestCase):
         for rf in self.item.relatedFiles:
             self.assertTrue(rf in self.relatedFiles)
 
+    def test_record(self):
+        item = LibAlexItem.fromRecord(self.item.toRecord())
+
+        self.assertEqual(item.toRecord(), self.item.toRecord())
+        self.assertEqual(item.toJson(), self.item.toJson())
+        self.assertEqual(item.resolvedFlags, self.resolvedFlags)
+        self.assertEqual(item.version, self.version)
+
+    def test_fromMetaFileAsync(self):
+        item = asyncio.run(LibAlexItem.fromMetaFileAsync(self.metaPathV2))
+
+        self.assertEqual(item.title, self.title)
+        self.assertEqual(item.metaFilepath, self.metaPathV2)
+
     def test_versionFromJson_success(self):
         with open(self.metaPathV2, "r") as file:
             data = json.load(file)
@@ -141,12 +158,29 @@ class TestLibAlexItem(unittest.TestCase):
         with self.assertRaises(ValueError):
             k = LibAlexItem.versionFromJson({"should": "fail"})
 
+    def test_fromJson_malformed(self):
+        malformed = [
+            [1],
+            {"_infover": 2},
+            {"_infover": ""},
+            {"_infover": "not a version"},
+            {"_infover": "2.0.0", "sourceFile": 5},
+            {"_infover": "2.0.0", "otherFiles": ["x"]},
+            {"_infover": "2.0.0", "otherFiles": [{"path": 5}]}
+        ]
+        for jsonData in malformed:
+            with self.subTest(jsonData=jsonData), self.assertRaises(ValueError):
+                LibAlexItem.fromJson(jsonData, directory=os.path.dirname(self.sourceFile), deferValidation=True)
+
     def test_str(self):
         self.assertTrue(isinstance(str(self.item), str))
 
     def test_repr(self):
         self.assertTrue(isinstance(repr(self.item), str))
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self.item, "__dict__"))
+
     def test_getAllFlags(self):
         allFlags = self.item.getAllFlags()
 
@@ -171,5 +205,28 @@ class TestLibAlexItem(unittest.TestCase):
 
         self.assertEqual(self.item.toJson(), expectedJson)
 
+    def test_toMetaFile(self):
+        with tempfile.TemporaryDirectory() as tempDir:
+            # Keep the content in a subdirectory
+            os.mkdir(os.path.join(tempDir, "content"))
+            shutil.copy(self.sourceFile, os.path.join(tempDir, "content", "sourceFile.txt"))
+
+            metaPath = os.path.join(tempDir, "meta.json")
+            with open(metaPath, "w") as file:
+                json.dump({"_infover": "2.0.0", "title": self.title, "sourceFile": "content/sourceFile.txt"}, file)
+
+            item = LibAlexItem.fromMetaFile(metaPath)
+            self.assertTrue(item.toMetaFile())
+            self.assertFalse(item.toMetaFile())
+            self.assertEqual([f for f in os.listdir(tempDir) if f.endswith(".tmp")], [])
+
+            reloaded = LibAlexItem.fromMetaFile(metaPath)
+            self.assertEqual(reloaded.sourceFile, item.sourceFile)
+            self.assertEqual(reloaded.toJson()["sourceFile"], "content/sourceFile.txt")
+
+    def test_toMetaFile_noPath(self):
+        with self.assertRaises(ValueError):
+            LibAlexItem(title=self.title).toMetaFile()
+
 if __name__ == "__main__":
     unittest.main()